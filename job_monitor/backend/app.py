@@ -19,7 +19,10 @@ from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from job_monitor.backend.cache_refresher import hot_key_refresher
 from job_monitor.backend.config import settings
+from job_monitor.backend.encoded_response import EncodedResponseMiddleware
+from job_monitor.backend.refresh_version import refresh_version_watcher
 from job_monitor.backend.routers import alerts, auth, billing, cluster_metrics, cost, filters, health, health_metrics, historical, job_tags, jobs, jobs_api, pipeline, reports
 from job_monitor.backend.scheduler import scheduler, setup_scheduler
 
@@ -99,7 +102,8 @@ async def warm_up_caches(app: FastAPI) -> None:
     """Pre-warm frequently accessed caches on startup.
 
     This runs in the background after the app starts to reduce
-    cold-start latency for the first users.
+    cold-start latency for the first users. Afterwards the hot-key
+    refresher keeps the most requested views warm.
     """
     logger.info("Starting cache warm-up task...")
 
@@ -121,6 +125,11 @@ async def warm_up_caches(app: FastAPI) -> None:
         except Exception as e:
             logger.warning(f"Failed to warm up filter presets: {e}")
 
+        # Fill the common dashboard views; the hot-key refresher keeps them warm after this
+        if settings.cache_hot_refresh_enabled:
+            refreshed = await hot_key_refresher.warm_up(ws)
+            logger.info(f"Warmed up {refreshed} dashboard response cache keys")
+
         logger.info("Cache warm-up complete")
 
     except Exception as e:
@@ -172,9 +181,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Start cache warm-up task in background (doesn't block startup)
     asyncio.create_task(warm_up_caches(app))
 
+    # Refresh hot response cache keys before they expire
+    refresher_task = None
+    if settings.cache_hot_refresh_enabled:
+        refresher_task = asyncio.create_task(hot_key_refresher.run(app))
+
+    # Follow the refresh job's version marker: re-load table snapshots and
+    # invalidate dependent response cache namespaces when it moves
+    version_task = None
+    if settings.use_cache:
+        version_task = asyncio.create_task(refresh_version_watcher.run(app))
+
     yield
 
     # Cleanup on shutdown
+    if refresher_task:
+        refresher_task.cancel()
+    if version_task:
+        version_task.cancel()
     scheduler.shutdown()
     logger.info("Scheduler shutdown")
 
@@ -198,6 +222,10 @@ app.add_middleware(
 # GZip compression for responses > 500 bytes (reduces bandwidth for large JSON responses)
 app.add_middleware(GZipMiddleware, minimum_size=500)
 
+# Pre-encoded responses for cache-backed endpoints (wraps GZip; compresses those itself)
+if settings.cache_encoded_responses_enabled:
+    app.add_middleware(EncodedResponseMiddleware)
+
 # API logging middleware for debugging
 app.add_middleware(APILoggingMiddleware)
 
@@ -1,21 +1,308 @@
 """Cache query module for pre-aggregated metrics.
 
 Provides functions to read from cache tables populated by the refresh-metrics-cache job.
+Health, cost, duration and alert reads are served from the in-memory
+snapshots in cache_snapshot.py once loaded, and query the tables otherwise.
 Falls back to live queries if cache tables don't exist or are stale.
 """
 
-import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 from typing import Any
 
+from job_monitor.backend.cache_snapshot import TableSnapshot, cache_snapshots
 from job_monitor.backend.config import settings
+from job_monitor.backend.result_decoder import ColumnarResult, decode_result, falsy_to, fill_null, has_rows
+from job_monitor.backend.statement_executor import TIMEOUT_CACHE, TIMEOUT_HEAVY, TIMEOUT_QUICK, statement_executor
 
 logger = logging.getLogger(__name__)
 
 # Cache staleness threshold (data older than this triggers a warning)
 CACHE_STALE_THRESHOLD = timedelta(hours=1)
 
+# Column layouts of the cache reader queries (SELECT order, Databricks type names)
+JOB_HEALTH_CACHE_COLUMNS = [
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("total_runs", "LONG"),
+    ("success_count", "LONG"),
+    ("success_rate", "DOUBLE"),
+    ("last_run_time", "TIMESTAMP"),
+    ("last_duration_seconds", "LONG"),
+    ("priority", "STRING"),
+    ("retry_count", "LONG"),
+    ("median_duration_seconds", "DOUBLE"),
+    ("p90_duration_seconds", "DOUBLE"),
+    ("avg_duration_seconds", "DOUBLE"),
+    ("max_duration_seconds", "DOUBLE"),
+    ("refreshed_at", "TIMESTAMP"),
+]
+
+# Streaming export layout: every health column plus the workspace (rows are not sorted)
+JOB_HEALTH_EXPORT_COLUMNS = [("workspace_id", "STRING"), *JOB_HEALTH_CACHE_COLUMNS]
+
+# Rows per batch when an export is streamed from the in-memory snapshot
+EXPORT_BATCH_ROWS = 1000
+
+COST_CACHE_COLUMNS = [
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("total_dbus_30d", "DOUBLE"),
+    ("current_7d_dbus", "DOUBLE"),
+    ("prev_7d_dbus", "DOUBLE"),
+    ("trend_7d_percent", "DOUBLE"),
+    ("sku_breakdown", "STRING"),
+    ("baseline_p90_dbus", "DOUBLE"),
+    ("is_anomaly", "BOOLEAN"),
+    ("refreshed_at", "TIMESTAMP"),
+]
+
+DAILY_HEALTH_COLUMNS = [
+    ("job_id", "STRING"),
+    ("total_runs", "LONG"),
+    ("success_count", "LONG"),
+    ("success_rate", "DOUBLE"),
+    ("priority", "STRING"),
+]
+
+RECENT_RUNS_COLUMNS = [
+    ("job_id", "STRING"),
+    ("run_id", "STRING"),
+    ("result_state", "STRING"),
+    ("start_time", "TIMESTAMP"),
+    ("end_time", "TIMESTAMP"),
+    ("duration_seconds", "LONG"),
+]
+
+JOB_DETAIL_COLUMNS = [
+    ("job_name", "STRING"),
+    ("median_duration_seconds", "DOUBLE"),
+    ("p90_duration_seconds", "DOUBLE"),
+    ("avg_duration_seconds", "DOUBLE"),
+    ("max_duration_seconds", "DOUBLE"),
+    ("run_count", "LONG"),
+    ("retry_count_7d", "LONG"),
+    ("failure_reasons", "STRING"),
+    ("run_id", "STRING"),
+    ("result_state", "STRING"),
+    ("start_time", "TIMESTAMP"),
+    ("end_time", "TIMESTAMP"),
+    ("duration_seconds", "LONG"),
+]
+
+JOB_DURATION_COLUMNS = [
+    ("job_id", "STRING"),
+    ("median_duration_seconds", "DOUBLE"),
+    ("p90_duration_seconds", "DOUBLE"),
+    ("avg_duration_seconds", "DOUBLE"),
+    ("max_duration_seconds", "DOUBLE"),
+    ("run_count", "LONG"),
+]
+
+# Runs per job kept in job_recent_runs (RECENT_RUNS_PER_JOB in the refresh job)
+RECENT_RUNS_CACHED = 10
+
+# recent_dbus_per_hour is read as JSON (to_json) so both result formats decode the same way
+CLUSTER_UTILIZATION_COLUMNS = [
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("runs_analyzed", "LONG"),
+    ("avg_dbus_per_hour", "DOUBLE"),
+    ("recent_dbus_per_hour", "STRING"),
+]
+
+# Per-run DBU/hour values kept per job in cluster_utilization_cache (UTILIZATION_RUNS_KEPT in the refresh job)
+UTILIZATION_RUNS_CACHED = 10
+
+REFRESH_LOG_COLUMNS = [
+    ("run_id", "STRING"),
+    ("refresh_version", "LONG"),
+    ("stage", "STRING"),
+    ("started_at", "TIMESTAMP"),
+    ("duration_seconds", "DOUBLE"),
+    ("rows_written", "LONG"),
+    ("input_rows", "LONG"),
+    ("input_bytes", "LONG"),
+    ("shuffle_read_bytes", "LONG"),
+    ("shuffle_write_bytes", "LONG"),
+    ("executor_run_time_ms", "LONG"),
+    ("status", "STRING"),
+    ("error", "STRING"),
+]
+
+# Refresh trend: compare the average of the last N runs with the N runs before,
+# and flag a slowdown above this percentage
+REFRESH_TREND_RUNS = 5
+REFRESH_SLOWDOWN_PERCENT = 25.0
+
+# workspace_id is BIGINT in the table but served as a string
+ALERTS_CACHE_COLUMNS = [
+    ("alert_id", "STRING"),
+    ("workspace_id", "STRING"),
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("category", "STRING"),
+    ("severity", "STRING"),
+    ("title", "STRING"),
+    ("description", "STRING"),
+    ("failure_reasons", "STRING"),
+    ("current_dbus", "DOUBLE"),
+    ("baseline_p90_dbus", "DOUBLE"),
+    ("cost_multiplier", "DOUBLE"),
+    ("refreshed_at", "TIMESTAMP"),
+]
+
+
+def workspace_predicate(workspace_id: str | None) -> str | None:
+    """Build the workspace_id predicate for a cache table query.
+
+    Cache tables are clustered by workspace_id (BIGINT), so the filter is
+    pushed into the query instead of filtering rows in Python.
+
+    Returns:
+        "" for no filter (None or 'all'), "workspace_id = <id>", or None
+        if the ID is not numeric (no cache table row can match)
+    """
+    if not workspace_id or workspace_id == "all":
+        return ""
+    if not str(workspace_id).isdigit():
+        return None
+    return f"workspace_id = {int(workspace_id)}"
+
+
+def team_predicate(team: str, column: str = "job_id") -> str:
+    """Build a predicate selecting the jobs tagged with ``team``.
+
+    Team tags are materialized in job_team_map by the refresh job, so a
+    team filter is a semi-join instead of a Jobs API call per job.
+
+    Args:
+        team: Team tag value
+        column: Job ID column of the filtered table
+
+    Returns:
+        "<column> IN (SELECT job_id FROM job_team_map WHERE team = '<team>')"
+    """
+    literal = team.replace("\\", "\\\\").replace("'", "\\'")
+    return (
+        f"{column} IN (SELECT job_id FROM {settings.cache_table_prefix}.job_team_map "
+        f"WHERE team = '{literal}')"
+    )
+
+
+# Sort rank of P1/P2/P3 priorities (ORDER BY CASE in the reader queries); others sort last
+PRIORITY_RANK = {"P1": 1, "P2": 2, "P3": 3}
+
+
+def _snapshot_positions(snapshot: TableSnapshot, workspace_id: str | None) -> list[int] | None:
+    """Row positions of a snapshot matching a workspace filter.
+
+    Returns:
+        All positions for no filter, the workspace's positions, or None
+        if the ID is not numeric (same contract as workspace_predicate)
+    """
+    workspace_filter = workspace_predicate(workspace_id)
+    if workspace_filter is None:
+        return None
+    if not workspace_filter:
+        return list(range(len(snapshot)))
+    return snapshot.positions("workspace_id", str(int(workspace_id)))
+
+
+def _normalize_job_health(cols: ColumnarResult) -> ColumnarResult:
+    """Apply the NULL defaults of job health records to decoded columns."""
+    cols.columns.update({
+        "job_id": falsy_to(cols["job_id"], ""),
+        "job_name": falsy_to(cols["job_name"], ""),
+        "total_runs": fill_null(cols["total_runs"], 0),
+        "success_count": fill_null(cols["success_count"], 0),
+        "success_rate": fill_null(cols["success_rate"], 0.0),
+        "last_duration_seconds": falsy_to(cols["last_duration_seconds"], None),
+        "priority": falsy_to(cols["priority"], None),
+        "retry_count": fill_null(cols["retry_count"], 0),
+        "median_duration_seconds": falsy_to(cols["median_duration_seconds"], None),
+        "p90_duration_seconds": falsy_to(cols["p90_duration_seconds"], None),
+        "avg_duration_seconds": falsy_to(cols["avg_duration_seconds"], None),
+        "max_duration_seconds": falsy_to(cols["max_duration_seconds"], None),
+    })
+    return cols
+
+
+def _job_health_records(cols: ColumnarResult) -> list[dict[str, Any]]:
+    """Normalize decoded job health columns into records."""
+    return _normalize_job_health(cols).to_dicts()
+
+
+def _cost_records(cols: ColumnarResult) -> list[dict[str, Any]]:
+    """Normalize decoded cost columns into records."""
+    cols.columns.update({
+        "job_id": falsy_to(cols["job_id"], ""),
+        "job_name": falsy_to(cols["job_name"], ""),
+        "total_dbus_30d": fill_null(cols["total_dbus_30d"], 0.0),
+        "current_7d_dbus": fill_null(cols["current_7d_dbus"], 0.0),
+        "prev_7d_dbus": fill_null(cols["prev_7d_dbus"], 0.0),
+        "trend_7d_percent": fill_null(cols["trend_7d_percent"], 0.0),
+        "sku_breakdown": fill_null(cols["sku_breakdown"], ""),
+        "baseline_p90_dbus": falsy_to(cols["baseline_p90_dbus"], None),
+        "is_anomaly": fill_null(cols["is_anomaly"], False),
+    })
+    return cols.to_dicts()
+
+
+def _alert_records(cols: ColumnarResult) -> list[dict[str, Any]]:
+    """Normalize decoded alert columns into records."""
+    cols.columns.update({
+        "alert_id": falsy_to(cols["alert_id"], ""),
+        "workspace_id": falsy_to(cols["workspace_id"], None),
+        "job_id": falsy_to(cols["job_id"], ""),
+        "job_name": falsy_to(cols["job_name"], ""),
+        "category": falsy_to(cols["category"], "failure"),
+        "severity": falsy_to(cols["severity"], "P3"),
+        "title": falsy_to(cols["title"], ""),
+        "description": falsy_to(cols["description"], ""),
+        "failure_reasons": falsy_to(cols["failure_reasons"], None),
+        "current_dbus": falsy_to(cols["current_dbus"], None),
+        "baseline_p90_dbus": falsy_to(cols["baseline_p90_dbus"], None),
+        "cost_multiplier": falsy_to(cols["cost_multiplier"], None),
+    })
+    return cols.to_dicts()
+
+
+def _job_health_from_snapshot(
+    snapshot: TableSnapshot, days: int, workspace_id: str | None
+) -> list[dict[str, Any]] | None:
+    """Serve query_job_health_cache from the in-memory snapshot."""
+    positions = _snapshot_positions(snapshot, workspace_id)
+    if positions is None:
+        return None
+    window = "7d" if days == 7 else "30d"
+    total_runs = snapshot.data[f"total_runs_{window}"]
+    success_rate = snapshot.data[f"success_rate_{window}"]
+    # Walk the priority index in rank order instead of sorting every row
+    selected = {p for p in positions if total_runs[p]}
+    ranked = sorted(snapshot.indexes["priority"], key=lambda p: PRIORITY_RANK.get(p, 4))
+    ordered = []
+    for priority in ranked:
+        group = [p for p in snapshot.positions("priority", priority) if p in selected]
+        group.sort(key=lambda p: (success_rate[p] is not None, success_rate[p] or 0.0))
+        ordered.extend(group)
+    if not ordered:
+        return None
+    names, source = _window_columns(JOB_HEALTH_CACHE_COLUMNS, window)
+    return _job_health_records(snapshot.select(ordered, source, dict(zip(source, names))))
+
+
+def _window_columns(columns: list[tuple[str, str]], window: str) -> tuple[list[str], list[str]]:
+    """Output names and job_health_cache source columns for a 7d/30d window."""
+    names = [name for name, _ in columns]
+    source = [
+        f"{name}_{window}" if name in ("total_runs", "success_count", "success_rate") else name
+        for name in names
+    ]
+    return names, source
+
 
 async def check_cache_exists(ws) -> bool:
     """Check if cache tables exist and are accessible."""
@@ -26,11 +313,11 @@ async def check_cache_exists(ws) -> bool:
     query = f"SELECT 1 FROM {table} LIMIT 1"
 
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=settings.warehouse_id,
-            statement=query,
-            wait_timeout="10s",
+            timeout=TIMEOUT_QUICK,
         )
         if result and result.status and not result.status.error:
             logger.info(f"[CACHE] Table {table} exists and is accessible")
@@ -52,15 +339,30 @@ async def get_cache_freshness(ws) -> tuple[bool, datetime | None]:
     if not ws or not settings.warehouse_id:
         return (False, None)
 
-    query = f"SELECT MAX(refreshed_at) as last_refresh FROM {settings.cache_table_prefix}.job_health_cache"
+    # Incremental refreshes only rewrite changed rows, so the last refresh
+    # time is also recorded in cache_watermarks (absent on older deployments)
+    prefix = settings.cache_table_prefix
+    queries = [
+        f"""
+        SELECT MAX(last_refresh) as last_refresh FROM (
+            SELECT MAX(refreshed_at) as last_refresh FROM {prefix}.job_health_cache
+            UNION ALL
+            SELECT MAX(refreshed_at) FROM {prefix}.cache_watermarks WHERE table_name = 'job_health_cache'
+        )
+        """,
+        f"SELECT MAX(refreshed_at) as last_refresh FROM {prefix}.job_health_cache",
+    ]
 
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
-            warehouse_id=settings.warehouse_id,
-            statement=query,
-            wait_timeout="10s",
-        )
+        for query in queries:
+            result = await statement_executor.execute(
+                ws,
+                query,
+                warehouse_id=settings.warehouse_id,
+                timeout=TIMEOUT_QUICK,
+            )
+            if not (result and result.status and result.status.error):
+                break
 
         if result and result.result and result.result.data_array:
             refreshed_at_str = result.result.data_array[0][0]
@@ -76,19 +378,37 @@ async def get_cache_freshness(ws) -> tuple[bool, datetime | None]:
         return (False, None)
 
 
-async def query_job_health_cache(ws, days: int = 7) -> list[dict[str, Any]] | None:
+async def query_job_health_cache(
+    ws, days: int = 7, workspace_id: str | None = None
+) -> list[dict[str, Any]] | None:
     """Query job health from cache table.
 
     Args:
         ws: WorkspaceClient
         days: Time window (7 or 30) - selects appropriate columns
+        workspace_id: Optional workspace ID to filter by. If None or 'all', returns all jobs.
 
     Returns:
         List of job health records, or None if cache unavailable
     """
-    if not settings.use_cache or not ws or not settings.warehouse_id:
+    if not settings.use_cache:
         return None
 
+    snapshot = cache_snapshots.get("job_health_cache")
+    if snapshot is not None:
+        jobs = _job_health_from_snapshot(snapshot, days, workspace_id)
+        if jobs:
+            logger.info(f"[CACHE_HIT] job_health_cache snapshot returned {len(jobs)} jobs ({days}d window)")
+        return jobs
+
+    if not ws or not settings.warehouse_id:
+        return None
+
+    workspace_filter = workspace_predicate(workspace_id)
+    if workspace_filter is None:
+        return None
+    workspace_clause = f"AND {workspace_filter}" if workspace_filter else ""
+
     # Select appropriate columns based on time window
     if days == 7:
         success_cols = "total_runs_7d as total_runs, success_count_7d as success_count, success_rate_7d as success_rate"
@@ -111,6 +431,7 @@ async def query_job_health_cache(ws, days: int = 7) -> list[dict[str, Any]] | No
         refreshed_at
     FROM {settings.cache_table_prefix}.job_health_cache
     WHERE total_runs_{days}d > 0
+    {workspace_clause}
     ORDER BY
         CASE
             WHEN priority = 'P1' THEN 1
@@ -122,37 +443,21 @@ async def query_job_health_cache(ws, days: int = 7) -> list[dict[str, Any]] | No
     """
 
     try:
-        logger.info(f"[CACHE] Querying job_health_cache for {days} days window")
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        logger.info(f"[CACHE] Querying job_health_cache for {days} days window" + (f" (workspace {workspace_id})" if workspace_filter else ""))
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=settings.warehouse_id,
-            statement=query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
+            fetch_all=True,
         )
 
         if result and result.status and result.status.error:
             logger.warning(f"[CACHE_MISS] job_health_cache query error: {result.status.error}")
             return None
 
-        if result and result.result and result.result.data_array:
-            jobs = []
-            for row in result.result.data_array:
-                jobs.append({
-                    "job_id": str(row[0]) if row[0] else "",
-                    "job_name": str(row[1]) if row[1] else "",
-                    "total_runs": int(row[2]) if row[2] else 0,
-                    "success_count": int(row[3]) if row[3] else 0,
-                    "success_rate": float(row[4]) if row[4] is not None else 0.0,
-                    "last_run_time": row[5],
-                    "last_duration_seconds": int(row[6]) if row[6] else None,
-                    "priority": row[7] if row[7] else None,
-                    "retry_count": int(row[8]) if row[8] else 0,
-                    "median_duration_seconds": float(row[9]) if row[9] else None,
-                    "p90_duration_seconds": float(row[10]) if row[10] else None,
-                    "avg_duration_seconds": float(row[11]) if row[11] else None,
-                    "max_duration_seconds": float(row[12]) if row[12] else None,
-                    "refreshed_at": row[13],
-                })
+        if has_rows(result):
+            jobs = _job_health_records(decode_result(result, JOB_HEALTH_CACHE_COLUMNS))
             logger.info(f"[CACHE_HIT] job_health_cache returned {len(jobs)} jobs ({days}d window)")
             return jobs
 
@@ -164,15 +469,143 @@ async def query_job_health_cache(ws, days: int = 7) -> list[dict[str, Any]] | No
         return None
 
 
-async def query_cost_cache(ws) -> list[dict[str, Any]] | None:
+async def _snapshot_export_batches(
+    snapshot: TableSnapshot, positions: list[int], days: int
+) -> AsyncIterator[ColumnarResult]:
+    """Yield a snapshot's health rows for one window in EXPORT_BATCH_ROWS batches."""
+    window = "7d" if days == 7 else "30d"
+    total_runs = snapshot.data[f"total_runs_{window}"]
+    names, source = _window_columns(JOB_HEALTH_EXPORT_COLUMNS, window)
+    rename = dict(zip(source, names))
+    for start in range(0, len(positions), EXPORT_BATCH_ROWS):
+        batch = [p for p in positions[start:start + EXPORT_BATCH_ROWS] if total_runs[p]]
+        if batch:
+            yield _normalize_job_health(snapshot.select(batch, source, rename))
+
+
+async def _result_export_batches(ws, result) -> AsyncIterator[ColumnarResult]:
+    """Yield the health rows of a deferred statement result chunk by chunk."""
+    async for chunk in statement_executor.iter_chunks(ws, result):
+        cols = decode_result(chunk, JOB_HEALTH_EXPORT_COLUMNS)
+        if cols:
+            yield _normalize_job_health(cols)
+
+
+async def open_job_health_export(
+    ws, days: int = 7, workspace_id: str | None = None
+) -> AsyncIterator[ColumnarResult] | None:
+    """Open a streaming read of every job health record.
+
+    Serves from the in-memory snapshot when loaded; otherwise runs one
+    job_health_cache query whose result chunks are downloaded one at a
+    time as the returned iterator is consumed. Either way memory use does
+    not grow with the number of jobs.
+
+    Args:
+        ws: WorkspaceClient
+        days: Time window (7 or 30) - selects appropriate columns
+        workspace_id: Optional workspace ID to filter by. If None or 'all', exports all jobs.
+
+    Returns:
+        Async iterator of ColumnarResult batches (JOB_HEALTH_EXPORT_COLUMNS),
+        or None if cache unavailable
+    """
+    if not settings.use_cache:
+        return None
+
+    snapshot = cache_snapshots.get("job_health_cache")
+    if snapshot is not None:
+        positions = _snapshot_positions(snapshot, workspace_id)
+        if positions is None:
+            return None
+        logger.info(f"[CACHE_HIT] Exporting job_health_cache snapshot ({len(positions)} rows, {days}d window)")
+        return _snapshot_export_batches(snapshot, positions, days)
+
+    if not ws or not settings.warehouse_id:
+        return None
+
+    workspace_filter = workspace_predicate(workspace_id)
+    if workspace_filter is None:
+        return None
+    workspace_clause = f"AND {workspace_filter}" if workspace_filter else ""
+    window = "7d" if days == 7 else "30d"
+
+    query = f"""
+    SELECT
+        CAST(workspace_id AS STRING) as workspace_id,
+        job_id,
+        job_name,
+        total_runs_{window} as total_runs,
+        success_count_{window} as success_count,
+        success_rate_{window} as success_rate,
+        last_run_time,
+        last_duration_seconds,
+        priority,
+        retry_count,
+        median_duration_seconds,
+        p90_duration_seconds,
+        avg_duration_seconds,
+        max_duration_seconds,
+        refreshed_at
+    FROM {settings.cache_table_prefix}.job_health_cache
+    WHERE total_runs_{window} > 0
+    {workspace_clause}
+    """
+
+    try:
+        logger.info(f"[CACHE] Exporting job_health_cache for {days} days window")
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=settings.warehouse_id,
+            timeout=TIMEOUT_HEAVY,
+            fetch_all=True,
+            defer_chunks=True,
+        )
+
+        if result and result.status and result.status.error:
+            logger.warning(f"[CACHE_MISS] job_health_cache export query error: {result.status.error}")
+            return None
+
+        return _result_export_batches(ws, result)
+
+    except Exception as e:
+        logger.warning(f"[CACHE_MISS] job_health_cache export query failed: {e}")
+        return None
+
+
+async def query_cost_cache(ws, workspace_id: str | None = None) -> list[dict[str, Any]] | None:
     """Query cost data from cache table.
 
+    Args:
+        ws: WorkspaceClient
+        workspace_id: Optional workspace ID to filter by. If None or 'all', returns all jobs.
+
     Returns:
         List of job cost records, or None if cache unavailable
     """
-    if not settings.use_cache or not ws or not settings.warehouse_id:
+    if not settings.use_cache:
         return None
 
+    snapshot = cache_snapshots.get("cost_cache")
+    if snapshot is not None:
+        positions = _snapshot_positions(snapshot, workspace_id)
+        if not positions:
+            return None
+        total_dbus = snapshot.data["total_dbus_30d"]
+        positions.sort(key=lambda p: (total_dbus[p] is None, -(total_dbus[p] or 0.0)))
+        jobs = _cost_records(snapshot.select(positions, [name for name, _ in COST_CACHE_COLUMNS]))
+        logger.info(f"[CACHE_HIT] cost_cache snapshot returned {len(jobs)} jobs")
+        return jobs
+
+    if not ws or not settings.warehouse_id:
+        return None
+
+    workspace_filter = workspace_predicate(workspace_id)
+    if workspace_filter is None:
+        return None
+    workspace_clause = f"WHERE {workspace_filter}" if workspace_filter else ""
+
     query = f"""
     SELECT
         job_id,
@@ -186,38 +619,26 @@ async def query_cost_cache(ws) -> list[dict[str, Any]] | None:
         is_anomaly,
         refreshed_at
     FROM {settings.cache_table_prefix}.cost_cache
+    {workspace_clause}
     ORDER BY total_dbus_30d DESC
-    LIMIT 500
     """
 
     try:
-        logger.info("[CACHE] Querying cost_cache")
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        logger.info("[CACHE] Querying cost_cache" + (f" (workspace {workspace_id})" if workspace_filter else ""))
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=settings.warehouse_id,
-            statement=query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
+            fetch_all=True,
         )
 
         if result and result.status and result.status.error:
             logger.warning(f"[CACHE_MISS] cost_cache query error: {result.status.error}")
             return None
 
-        if result and result.result and result.result.data_array:
-            jobs = []
-            for row in result.result.data_array:
-                jobs.append({
-                    "job_id": str(row[0]) if row[0] else "",
-                    "job_name": str(row[1]) if row[1] else "",
-                    "total_dbus_30d": float(row[2]) if row[2] else 0.0,
-                    "current_7d_dbus": float(row[3]) if row[3] else 0.0,
-                    "prev_7d_dbus": float(row[4]) if row[4] else 0.0,
-                    "trend_7d_percent": float(row[5]) if row[5] else 0.0,
-                    "sku_breakdown": str(row[6]) if row[6] else "",
-                    "baseline_p90_dbus": float(row[7]) if row[7] else None,
-                    "is_anomaly": bool(row[8]) if row[8] is not None else False,
-                    "refreshed_at": row[9],
-                })
+        if has_rows(result):
+            jobs = _cost_records(decode_result(result, COST_CACHE_COLUMNS))
             logger.info(f"[CACHE_HIT] cost_cache returned {len(jobs)} jobs")
             return jobs
 
@@ -229,6 +650,162 @@ async def query_cost_cache(ws) -> list[dict[str, Any]] | None:
         return None
 
 
+async def query_job_team_map(ws, workspace_id: str | None = None) -> dict[str, str] | None:
+    """Query the team tag of every tagged job from job_team_map.
+
+    Args:
+        ws: WorkspaceClient
+        workspace_id: Optional workspace ID to filter by. If None or 'all', returns all jobs.
+
+    Returns:
+        Dict mapping job_id -> team (untagged jobs omitted), or None if cache unavailable
+    """
+    if not settings.use_cache or not ws or not settings.warehouse_id:
+        return None
+
+    workspace_filter = workspace_predicate(workspace_id)
+    if workspace_filter is None:
+        return None
+    workspace_clause = f"AND {workspace_filter}" if workspace_filter else ""
+
+    query = f"""
+    SELECT job_id, team
+    FROM {settings.cache_table_prefix}.job_team_map
+    WHERE team IS NOT NULL {workspace_clause}
+    """
+
+    try:
+        logger.info("[CACHE] Querying job_team_map")
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=settings.warehouse_id,
+            timeout=TIMEOUT_CACHE,
+            fetch_all=True,
+        )
+
+        if result and result.status and result.status.error:
+            logger.warning(f"[CACHE_MISS] job_team_map query error: {result.status.error}")
+            return None
+
+        # No rows is a valid answer (no job carries a team tag), unlike a missing table
+        cols = decode_result(result, [("job_id", "STRING"), ("team", "STRING")])
+        team_map = dict(zip(cols["job_id"], cols["team"]))
+        logger.info(f"[CACHE_HIT] job_team_map returned {len(team_map)} tagged jobs")
+        return team_map
+
+    except Exception as e:
+        logger.warning(f"[CACHE_MISS] job_team_map query failed: {e}")
+        return None
+
+
+async def query_job_daily_health(
+    ws, days: int, workspace_id: str | None = None
+) -> list[dict[str, Any]] | None:
+    """Query per-job health for any window from the job_daily_stats rollup.
+
+    Sums the daily rows of the window (a few thousand small rows), so
+    windows other than the 7/30 days of job_health_cache are answered
+    without scanning the system tables. Priority follows the live query:
+    P1 if the last two runs failed, P2 if the last run failed, P3 for a
+    70-89.9% success rate.
+
+    Args:
+        ws: WorkspaceClient
+        days: Time window in days
+        workspace_id: Optional workspace ID to filter by. If None or 'all', returns all jobs.
+
+    Returns:
+        List of dicts with job_id, total_runs, success_count, success_rate
+        and priority, or None if the rollup is unavailable
+    """
+    if not settings.use_cache or not ws or not settings.warehouse_id:
+        return None
+
+    workspace_filter = workspace_predicate(workspace_id)
+    if workspace_filter is None:
+        return None
+    workspace_clause = f"AND {workspace_filter}" if workspace_filter else ""
+
+    query = f"""
+    WITH job_days AS (
+        SELECT
+            workspace_id,
+            job_id,
+            run_count,
+            success_count,
+            last_result_state,
+            -- The last run's predecessor: same day if it had 2+ runs, else the previous run day
+            COALESCE(
+                prev_result_state,
+                LEAD(last_result_state) OVER (PARTITION BY workspace_id, job_id ORDER BY stat_date DESC)
+            ) as prev_result_state,
+            ROW_NUMBER() OVER (PARTITION BY workspace_id, job_id ORDER BY stat_date DESC) as day_rank
+        FROM {settings.cache_table_prefix}.job_daily_stats
+        WHERE stat_date >= current_date() - INTERVAL {int(days)} DAYS
+          AND run_count > 0
+          {workspace_clause}
+    ),
+    job_totals AS (
+        SELECT
+            job_id,
+            SUM(run_count) as total_runs,
+            SUM(success_count) as success_count,
+            ROUND(100.0 * SUM(success_count) / SUM(run_count), 1) as success_rate,
+            MAX(CASE WHEN day_rank = 1 THEN last_result_state END) as last_state,
+            MAX(CASE WHEN day_rank = 1 THEN prev_result_state END) as prev_state
+        FROM job_days
+        GROUP BY workspace_id, job_id
+    )
+    SELECT
+        job_id,
+        total_runs,
+        success_count,
+        success_rate,
+        CASE
+            WHEN last_state IN ('FAILED', 'FAILURE') AND prev_state IN ('FAILED', 'FAILURE') THEN 'P1'
+            WHEN last_state IN ('FAILED', 'FAILURE') THEN 'P2'
+            WHEN success_rate BETWEEN 70 AND 89.9 THEN 'P3'
+            ELSE NULL
+        END as priority
+    FROM job_totals
+    """
+
+    try:
+        logger.info(f"[CACHE] Querying job_daily_stats for {days} days window")
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=settings.warehouse_id,
+            timeout=TIMEOUT_CACHE,
+            fetch_all=True,
+        )
+
+        if result and result.status and result.status.error:
+            logger.warning(f"[CACHE_MISS] job_daily_stats query error: {result.status.error}")
+            return None
+
+        if has_rows(result):
+            cols = decode_result(result, DAILY_HEALTH_COLUMNS)
+            cols.columns.update({
+                "job_id": falsy_to(cols["job_id"], ""),
+                "total_runs": fill_null(cols["total_runs"], 0),
+                "success_count": fill_null(cols["success_count"], 0),
+                "success_rate": fill_null(cols["success_rate"], 0.0),
+                "priority": falsy_to(cols["priority"], None),
+            })
+            jobs = cols.to_dicts()
+            logger.info(f"[CACHE_HIT] job_daily_stats returned {len(jobs)} jobs ({days}d window)")
+            return jobs
+
+        logger.info(f"[CACHE_MISS] job_daily_stats returned empty result ({days}d window)")
+        return None
+
+    except Exception as e:
+        logger.warning(f"[CACHE_MISS] job_daily_stats query failed: {e}")
+        return None
+
+
 async def query_alerts_cache(ws, workspace_id: str | None = None) -> list[dict[str, Any]] | None:
     """Query alerts from cache table.
 
@@ -239,14 +816,27 @@ async def query_alerts_cache(ws, workspace_id: str | None = None) -> list[dict[s
     Returns:
         List of alert records, or None if cache unavailable
     """
-    if not settings.use_cache or not ws or not settings.warehouse_id:
+    if not settings.use_cache:
         return None
 
-    # Build workspace filter clause
-    # workspace_id in cache table is BIGINT, not string - don't quote it
-    workspace_clause = ""
-    if workspace_id and workspace_id != "all":
-        workspace_clause = f"WHERE workspace_id = {workspace_id}"
+    snapshot = cache_snapshots.get("alerts_cache")
+    if snapshot is not None:
+        positions = _snapshot_positions(snapshot, workspace_id)
+        if not positions:
+            return None
+        severity = snapshot.data["severity"]
+        positions.sort(key=lambda p: PRIORITY_RANK.get(severity[p], 4))
+        alerts = _alert_records(snapshot.select(positions, [name for name, _ in ALERTS_CACHE_COLUMNS]))
+        logger.info(f"[CACHE_HIT] alerts_cache snapshot returned {len(alerts)} alerts")
+        return alerts
+
+    if not ws or not settings.warehouse_id:
+        return None
+
+    workspace_filter = workspace_predicate(workspace_id)
+    if workspace_filter is None:
+        return None
+    workspace_clause = f"WHERE {workspace_filter}" if workspace_filter else ""
 
     query = f"""
     SELECT
@@ -276,35 +866,20 @@ async def query_alerts_cache(ws, workspace_id: str | None = None) -> list[dict[s
 
     try:
         logger.info("[CACHE] Querying alerts_cache")
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=settings.warehouse_id,
-            statement=query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
+            fetch_all=True,
         )
 
         if result and result.status and result.status.error:
             logger.warning(f"[CACHE_MISS] alerts_cache query error: {result.status.error}")
             return None
 
-        if result and result.result and result.result.data_array:
-            alerts = []
-            for row in result.result.data_array:
-                alerts.append({
-                    "alert_id": str(row[0]) if row[0] else "",
-                    "workspace_id": str(row[1]) if row[1] else None,
-                    "job_id": str(row[2]) if row[2] else "",
-                    "job_name": str(row[3]) if row[3] else "",
-                    "category": str(row[4]) if row[4] else "failure",
-                    "severity": str(row[5]) if row[5] else "P3",
-                    "title": str(row[6]) if row[6] else "",
-                    "description": str(row[7]) if row[7] else "",
-                    "failure_reasons": str(row[8]) if row[8] else None,
-                    "current_dbus": float(row[9]) if row[9] else None,
-                    "baseline_p90_dbus": float(row[10]) if row[10] else None,
-                    "cost_multiplier": float(row[11]) if row[11] else None,
-                    "refreshed_at": row[12],
-                })
+        if has_rows(result):
+            alerts = _alert_records(decode_result(result, ALERTS_CACHE_COLUMNS))
             logger.info(f"[CACHE_HIT] alerts_cache returned {len(alerts)} alerts" + (f" for workspace {workspace_id}" if workspace_id else ""))
             return alerts
 
@@ -316,13 +891,176 @@ async def query_alerts_cache(ws, workspace_id: str | None = None) -> list[dict[s
         return None
 
 
+async def query_recent_runs_cache(
+    ws, job_ids: list[str], limit: int, workspace_id: str | None = None
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Query the last completed runs of several jobs from job_recent_runs.
+
+    A point lookup on the job_id clustering key instead of a window query
+    over 30 days of job_run_timeline.
+
+    Args:
+        ws: WorkspaceClient
+        job_ids: Job IDs to look up
+        limit: Runs per job, newest first (at most RECENT_RUNS_CACHED)
+        workspace_id: Optional workspace ID to filter by. If None or 'all', any workspace.
+
+    Returns:
+        Dict of job_id -> run dicts (jobs without runs are absent), or None
+        if the cache is unavailable or cannot serve the limit
+    """
+    if not settings.use_cache or not ws or not settings.warehouse_id:
+        return None
+    if limit > RECENT_RUNS_CACHED or not all(str(j).isdigit() for j in job_ids):
+        return None
+
+    workspace_filter = workspace_predicate(workspace_id)
+    if workspace_filter is None:
+        return None
+    workspace_clause = f"AND {workspace_filter}" if workspace_filter else ""
+    job_ids_sql = ", ".join(f"'{j}'" for j in job_ids)
+
+    query = f"""
+    SELECT job_id, run_id, result_state, start_time, end_time, duration_seconds
+    FROM {settings.cache_table_prefix}.job_recent_runs
+    WHERE job_id IN ({job_ids_sql})
+      AND run_rank <= {int(limit)}
+      {workspace_clause}
+    ORDER BY job_id, start_time DESC
+    """
+
+    try:
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=settings.warehouse_id,
+            timeout=TIMEOUT_CACHE,
+            fetch_all=True,
+        )
+
+        if result and result.status and result.status.error:
+            logger.warning(f"[CACHE_MISS] job_recent_runs query error: {result.status.error}")
+            return None
+
+        runs_by_job: dict[str, list[dict[str, Any]]] = {}
+        if has_rows(result):
+            for run in decode_result(result, RECENT_RUNS_COLUMNS).to_dicts():
+                runs = runs_by_job.setdefault(str(run["job_id"]), [])
+                # Same job ID in several workspaces: keep the newest `limit` runs
+                if len(runs) < limit:
+                    runs.append(run)
+        logger.info(f"[CACHE_HIT] job_recent_runs returned runs for {len(runs_by_job)}/{len(job_ids)} jobs")
+        return runs_by_job
+
+    except Exception as e:
+        logger.warning(f"[CACHE_MISS] job_recent_runs query failed: {e}")
+        return None
+
+
+async def query_job_detail_cache(ws, job_id: str) -> dict[str, Any] | None:
+    """Query everything the expanded health row shows for one job.
+
+    A single statement: the job_detail_cache row joined with the job's
+    job_recent_runs rows (both clustered by job_id).
+
+    Returns:
+        Dict with job_name, duration stats, run_count, retry_count_7d,
+        failure_reasons (list) and recent_runs (newest first), or None if
+        the job is not in the cache
+    """
+    if not settings.use_cache or not ws or not settings.warehouse_id:
+        return None
+    if not str(job_id).isdigit():
+        return None
+
+    prefix = settings.cache_table_prefix
+    query = f"""
+    SELECT
+        d.job_name,
+        d.median_duration_seconds,
+        d.p90_duration_seconds,
+        d.avg_duration_seconds,
+        d.max_duration_seconds,
+        d.run_count,
+        d.retry_count_7d,
+        d.failure_reasons,
+        r.run_id,
+        r.result_state,
+        r.start_time,
+        r.end_time,
+        r.duration_seconds
+    FROM {prefix}.job_detail_cache d
+    LEFT JOIN {prefix}.job_recent_runs r ON r.job_id = d.job_id
+    WHERE d.job_id = '{job_id}'
+    ORDER BY r.start_time DESC
+    """
+
+    try:
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=settings.warehouse_id,
+            timeout=TIMEOUT_CACHE,
+        )
+
+        if result and result.status and result.status.error:
+            logger.warning(f"[CACHE_MISS] job_detail_cache query error: {result.status.error}")
+            return None
+
+        if not has_rows(result):
+            logger.info(f"[CACHE_MISS] job_detail_cache has no row for job {job_id}")
+            return None
+
+        rows = decode_result(result, JOB_DETAIL_COLUMNS).to_dicts()
+        detail = rows[0]
+        runs = [
+            {key: row[key] for key in ("run_id", "result_state", "start_time", "end_time", "duration_seconds")}
+            for row in rows if row["run_id"]
+        ]
+        logger.info(f"[CACHE_HIT] job_detail_cache returned job {job_id} with {len(runs)} runs")
+        return {
+            "job_name": detail["job_name"],
+            "median_duration_seconds": detail["median_duration_seconds"],
+            "p90_duration_seconds": detail["p90_duration_seconds"],
+            "avg_duration_seconds": detail["avg_duration_seconds"],
+            "max_duration_seconds": detail["max_duration_seconds"],
+            "run_count": detail["run_count"] or 0,
+            "retry_count_7d": detail["retry_count_7d"] or 0,
+            "failure_reasons": [r for r in (detail["failure_reasons"] or "").split(",") if r],
+            "recent_runs": runs[:RECENT_RUNS_CACHED],
+        }
+
+    except Exception as e:
+        logger.warning(f"[CACHE_MISS] job_detail_cache query failed: {e}")
+        return None
+
+
 async def query_job_duration_cache(ws, job_id: str) -> dict[str, Any] | None:
     """Query duration stats for a specific job from cache.
 
     Returns:
         Duration stats dict, or None if not found in cache
     """
-    if not settings.use_cache or not ws or not settings.warehouse_id:
+    if not settings.use_cache:
+        return None
+
+    snapshot = cache_snapshots.get("job_health_cache")
+    if snapshot is not None:
+        positions = snapshot.positions("job_id", str(job_id))
+        if not positions:
+            return None
+        row = positions[0]
+        data = snapshot.data
+        return {
+            "job_id": str(job_id),
+            "median_duration_seconds": data["median_duration_seconds"][row] or None,
+            "p90_duration_seconds": data["p90_duration_seconds"][row] or None,
+            "avg_duration_seconds": data["avg_duration_seconds"][row] or None,
+            "max_duration_seconds": data["max_duration_seconds"][row] or None,
+            "run_count": data["total_runs_30d"][row] or 0,
+        }
+
+    if not ws or not settings.warehouse_id:
         return None
 
     query = f"""
@@ -338,22 +1076,22 @@ async def query_job_duration_cache(ws, job_id: str) -> dict[str, Any] | None:
     """
 
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=settings.warehouse_id,
-            statement=query,
-            wait_timeout="15s",
+            timeout=TIMEOUT_CACHE,
         )
 
-        if result and result.result and result.result.data_array:
-            row = result.result.data_array[0]
+        if has_rows(result):
+            row = decode_result(result, JOB_DURATION_COLUMNS).to_dicts()[0]
             return {
-                "job_id": str(row[0]),
-                "median_duration_seconds": float(row[1]) if row[1] else None,
-                "p90_duration_seconds": float(row[2]) if row[2] else None,
-                "avg_duration_seconds": float(row[3]) if row[3] else None,
-                "max_duration_seconds": float(row[4]) if row[4] else None,
-                "run_count": int(row[5]) if row[5] else 0,
+                "job_id": row["job_id"],
+                "median_duration_seconds": row["median_duration_seconds"] or None,
+                "p90_duration_seconds": row["p90_duration_seconds"] or None,
+                "avg_duration_seconds": row["avg_duration_seconds"] or None,
+                "max_duration_seconds": row["max_duration_seconds"] or None,
+                "run_count": row["run_count"] or 0,
             }
 
         return None
@@ -361,3 +1099,231 @@ async def query_job_duration_cache(ws, job_id: str) -> dict[str, Any] | None:
     except Exception as e:
         logger.warning(f"Duration cache query failed for {job_id}: {e}")
         return None
+
+
+async def query_cluster_utilization_cache(ws, job_id: str) -> list[float] | None:
+    """Query the recent per-run DBU/hour of a job from cluster_utilization_cache.
+
+    Args:
+        ws: WorkspaceClient
+        job_id: Job ID (numeric)
+
+    Returns:
+        DBU/hour of up to UTILIZATION_RUNS_CACHED most recent runs (newest
+        first), or None if the job is not cached or the cache is unavailable
+    """
+    if not settings.use_cache or not ws or not settings.warehouse_id:
+        return None
+    if not str(job_id).isdigit():
+        return None
+
+    # A job ID can exist in several workspaces; use the one that ran most recently
+    query = f"""
+    SELECT job_id, job_name, runs_analyzed, avg_dbus_per_hour, to_json(recent_dbus_per_hour)
+    FROM {settings.cache_table_prefix}.cluster_utilization_cache
+    WHERE job_id = '{job_id}'
+    ORDER BY last_run_time DESC
+    LIMIT 1
+    """
+
+    try:
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=settings.warehouse_id,
+            timeout=TIMEOUT_CACHE,
+        )
+
+        if result and result.status and result.status.error:
+            logger.warning(f"[CACHE_MISS] cluster_utilization_cache query error: {result.status.error}")
+            return None
+
+        if has_rows(result):
+            rates = json.loads(decode_result(result, CLUSTER_UTILIZATION_COLUMNS)["recent_dbus_per_hour"][0] or "[]")
+            logger.info(f"[CACHE_HIT] cluster_utilization_cache returned {len(rates)} runs for job {job_id}")
+            return rates
+
+        return None
+
+    except Exception as e:
+        logger.warning(f"[CACHE_MISS] cluster_utilization_cache query failed for {job_id}: {e}")
+        return None
+
+
+async def query_underutilized_jobs_cache(
+    ws,
+    workspace_id: str | None = None,
+    max_dbus_per_hour: float = 1.0,
+    min_runs: int = 3,
+    limit: int = 50,
+) -> list[dict[str, Any]] | None:
+    """Query jobs with a low 30-day average DBU/hour from cluster_utilization_cache.
+
+    Args:
+        ws: WorkspaceClient
+        workspace_id: Optional workspace ID to filter by. If None or 'all', returns all jobs.
+        max_dbus_per_hour: Only jobs averaging below this DBU/hour
+        min_runs: Minimum runs analyzed (a pattern needs several runs)
+        limit: Maximum jobs returned, most under-utilized first
+
+    Returns:
+        List of job records (job_id, job_name, runs_analyzed, avg_dbus_per_hour),
+        or None if cache unavailable
+    """
+    if not settings.use_cache or not ws or not settings.warehouse_id:
+        return None
+
+    workspace_filter = workspace_predicate(workspace_id)
+    if workspace_filter is None:
+        return None
+    workspace_clause = f"AND {workspace_filter}" if workspace_filter else ""
+
+    query = f"""
+    SELECT job_id, job_name, runs_analyzed, avg_dbus_per_hour
+    FROM {settings.cache_table_prefix}.cluster_utilization_cache
+    WHERE avg_dbus_per_hour < {float(max_dbus_per_hour)}
+        AND runs_analyzed >= {int(min_runs)}
+        {workspace_clause}
+    ORDER BY avg_dbus_per_hour ASC
+    LIMIT {int(limit)}
+    """
+
+    try:
+        logger.info("[CACHE] Querying cluster_utilization_cache for under-utilized jobs")
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=settings.warehouse_id,
+            timeout=TIMEOUT_CACHE,
+        )
+
+        if result and result.status and result.status.error:
+            logger.warning(f"[CACHE_MISS] cluster_utilization_cache query error: {result.status.error}")
+            return None
+
+        # No rows is a valid answer (no under-utilized jobs), unlike a missing table
+        cols = decode_result(result, CLUSTER_UTILIZATION_COLUMNS[:4])
+        cols.columns.update({
+            "job_id": falsy_to(cols["job_id"], ""),
+            "runs_analyzed": fill_null(cols["runs_analyzed"], 0),
+            "avg_dbus_per_hour": fill_null(cols["avg_dbus_per_hour"], 0.0),
+        })
+        jobs = cols.to_dicts()
+        logger.info(f"[CACHE_HIT] cluster_utilization_cache returned {len(jobs)} under-utilized jobs")
+        return jobs
+
+    except Exception as e:
+        logger.warning(f"[CACHE_MISS] cluster_utilization_cache query failed: {e}")
+        return None
+
+
+async def query_refresh_log(ws, runs: int = 20) -> list[dict[str, Any]] | None:
+    """Query the stage rows of the most recent refresh runs from refresh_log.
+
+    Args:
+        ws: WorkspaceClient
+        runs: Number of most recent runs to return
+
+    Returns:
+        Stage records (newest first, including each run's 'total' row), or
+        None if the log is unavailable (older refresh job deployments)
+    """
+    if not ws or not settings.warehouse_id:
+        return None
+
+    table = f"{settings.cache_table_prefix}.refresh_log"
+    query = f"""
+    SELECT {", ".join(name for name, _ in REFRESH_LOG_COLUMNS)}
+    FROM {table}
+    WHERE run_id IN (
+        SELECT run_id FROM {table}
+        WHERE stage = 'total'
+        ORDER BY started_at DESC
+        LIMIT {int(runs)}
+    )
+    ORDER BY started_at DESC, stage
+    """
+
+    try:
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=settings.warehouse_id,
+            timeout=TIMEOUT_CACHE,
+        )
+
+        if result and result.status and result.status.error:
+            logger.warning(f"[CACHE] refresh_log query error: {result.status.error}")
+            return None
+
+        return decode_result(result, REFRESH_LOG_COLUMNS).to_dicts()
+
+    except Exception as e:
+        logger.warning(f"[CACHE] refresh_log query failed: {e}")
+        return None
+
+
+def _change_percent(recent: list[float], previous: list[float]) -> float | None:
+    """Percent change between the averages of two samples (None if either is empty)."""
+    if not recent or not previous:
+        return None
+    before = sum(previous) / len(previous)
+    if not before:
+        return None
+    return round((sum(recent) / len(recent) - before) / before * 100, 1)
+
+
+def summarize_refresh_log(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """Group refresh_log rows into runs and compute the duration trend.
+
+    The trend compares the last REFRESH_TREND_RUNS runs with the runs
+    before them, for the whole refresh and per stage, along with the
+    change in input rows scanned (fleet growth).
+
+    Returns:
+        Dict with "runs" (newest first, stages nested) and "trend"
+    """
+    runs: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        run = runs.setdefault(row["run_id"], {"run_id": row["run_id"], "stages": []})
+        if row["stage"] == "total":
+            run.update({k: v for k, v in row.items() if k not in ("run_id", "stage")})
+        else:
+            run["stages"].append({k: v for k, v in row.items() if k != "run_id"})
+    ordered = sorted(
+        (run for run in runs.values() if run.get("started_at") is not None),
+        key=lambda run: run["started_at"],
+        reverse=True,
+    )
+
+    recent = ordered[:REFRESH_TREND_RUNS]
+    previous = ordered[REFRESH_TREND_RUNS:2 * REFRESH_TREND_RUNS]
+
+    def durations(sample: list[dict], stage: str | None = None) -> list[float]:
+        if stage is None:
+            return [run["duration_seconds"] for run in sample if run.get("duration_seconds") is not None]
+        return [
+            s["duration_seconds"] for run in sample for s in run["stages"]
+            if s["stage"] == stage and s["duration_seconds"] is not None
+        ]
+
+    stage_names = sorted({s["stage"] for run in recent for s in run["stages"]})
+    recent_durations = durations(recent)
+    change = _change_percent(recent_durations, durations(previous))
+    trend = {
+        "runs_compared": [len(recent), len(previous)],
+        "avg_duration_seconds": (
+            round(sum(recent_durations) / len(recent_durations), 1) if recent_durations else None
+        ),
+        "duration_change_percent": change,
+        "input_rows_change_percent": _change_percent(
+            [run["input_rows"] for run in recent if run.get("input_rows") is not None],
+            [run["input_rows"] for run in previous if run.get("input_rows") is not None],
+        ),
+        "stages": {
+            stage: _change_percent(durations(recent, stage), durations(previous, stage))
+            for stage in stage_names
+        },
+        "slowing": change is not None and change >= REFRESH_SLOWDOWN_PERCENT,
+    }
+    return {"runs": ordered, "trend": trend}
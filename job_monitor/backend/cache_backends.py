@@ -0,0 +1,321 @@
+"""Shared second-tier (L2) backends for the response cache.
+
+The in-memory ``response_cache`` is per process. With several uvicorn
+workers or app replicas each process would recompute the same expensive
+queries, so ``ResponseCache`` can be given an L2 backend that all of
+them share:
+
+- ``SQLiteBackend``: a local file store (WAL + mmap) shared by the
+  workers of one host
+- ``RedisBackend``: any Redis-protocol server, shared across replicas
+
+Values are pickled (and zlib-compressed when large). Only the app itself
+writes to the backend, so the store must not be shared with untrusted
+writers.
+
+Cross-process invalidation uses an append-only invalidation log with a
+monotonic sequence number. ``ResponseCache`` polls
+``invalidations_since(seq)`` and drops matching in-memory entries, so an
+invalidation in one process (e.g. a new filter preset) reaches all the
+others within the poll interval.
+"""
+
+import dataclasses
+import logging
+import pickle
+import re
+import sqlite3
+import struct
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Payloads larger than this are zlib-compressed
+COMPRESS_MIN_BYTES = 1024
+# Invalidation log entries kept; readers further behind drop everything
+INVALIDATION_LOG_SIZE = 1000
+
+_RAW = b"P"
+_COMPRESSED = b"Z"
+
+# Invalidation kinds
+INVALIDATE_KEY = "key"
+INVALIDATE_PREFIX = "prefix"
+
+
+def serialize(value: Any) -> bytes:
+    """Serialize a cache value (pickle, zlib-compressed when large)."""
+    # Memoized filter views and indexes of a CachedDataset are rebuilt on demand
+    if dataclasses.is_dataclass(value) and hasattr(value, "_views"):
+        value = dataclasses.replace(value, _views={}, _indexes={})
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(payload) >= COMPRESS_MIN_BYTES:
+        return _COMPRESSED + zlib.compress(payload, 1)
+    return _RAW + payload
+
+
+def deserialize(data: bytes) -> Any:
+    """Inverse of ``serialize``."""
+    marker, payload = data[:1], data[1:]
+    if marker == _COMPRESSED:
+        payload = zlib.decompress(payload)
+    elif marker != _RAW:
+        raise ValueError(f"Unknown cache payload marker: {marker!r}")
+    return pickle.loads(payload)
+
+
+@dataclass
+class BackendEntry:
+    """Serialized value with the timing of the entry that wrote it."""
+    payload: bytes
+    expires_at: float
+    stale_until: float
+    created_at: float
+
+
+class CacheBackend(ABC):
+    """Interface of a shared L2 cache store."""
+
+    name = "backend"
+
+    @abstractmethod
+    def get(self, key: str) -> BackendEntry | None:
+        """Get an entry (None if absent or past its stale window)."""
+
+    @abstractmethod
+    def set(self, key: str, entry: BackendEntry) -> None:
+        """Store an entry."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete one key."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete all keys starting with prefix ("" deletes everything)."""
+
+    @abstractmethod
+    def publish_invalidation(self, kind: str, value: str) -> int:
+        """Append an invalidation to the shared log.
+
+        Args:
+            kind: INVALIDATE_KEY or INVALIDATE_PREFIX
+            value: Key or key prefix
+
+        Returns:
+            Sequence number of the log entry
+        """
+
+    @abstractmethod
+    def latest_invalidation(self) -> int:
+        """Sequence number of the newest invalidation (0 if none)."""
+
+    @abstractmethod
+    def invalidations_since(self, seq: int) -> tuple[int, list[tuple[int, str, str]]]:
+        """Read invalidations newer than seq.
+
+        Returns:
+            Tuple of (latest seq, [(seq, kind, value), ...]). A reader that
+            fell behind the retained log gets a single ("prefix", "") entry.
+        """
+
+
+class SQLiteBackend(CacheBackend):
+    """File-backed store shared by the worker processes of one host."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str, mmap_bytes: int = 256 * 1024 * 1024):
+        """Open (and create) the store.
+
+        Args:
+            path: Database file path
+            mmap_bytes: SQLite mmap_size; reads are served from the page cache
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_bytes)}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, payload BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, stale_until REAL NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS invalidations ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, value TEXT NOT NULL)"
+        )
+        self._writes = 0
+
+    def get(self, key: str) -> BackendEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at, stale_until, created_at FROM entries "
+                "WHERE key = ? AND stale_until >= ?",
+                (key, time.time()),
+            ).fetchone()
+        return BackendEntry(*row) if row else None
+
+    def set(self, key: str, entry: BackendEntry) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, payload, expires_at, stale_until, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, entry.payload, entry.expires_at, entry.stale_until, entry.created_at),
+            )
+            self._writes += 1
+            # Prune dead rows now and then instead of on every write
+            if self._writes % 100 == 0:
+                self._conn.execute("DELETE FROM entries WHERE stale_until < ?", (time.time(),))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+
+    def publish_invalidation(self, kind: str, value: str) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO invalidations (kind, value) VALUES (?, ?)", (kind, value)
+            )
+            seq = cursor.lastrowid
+            self._conn.execute(
+                "DELETE FROM invalidations WHERE seq <= ?", (seq - INVALIDATION_LOG_SIZE,)
+            )
+        return seq
+
+    def latest_invalidation(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM invalidations").fetchone()[0]
+
+    def invalidations_since(self, seq: int) -> tuple[int, list[tuple[int, str, str]]]:
+        with self._lock:
+            latest = self._conn.execute(
+                "SELECT COALESCE(MAX(seq), 0), COALESCE(MIN(seq), 0) FROM invalidations"
+            ).fetchone()
+            latest_seq, oldest_seq = latest
+            if latest_seq <= seq:
+                return max(latest_seq, seq), []
+            if seq and oldest_seq > seq + 1:
+                return latest_seq, [(latest_seq, INVALIDATE_PREFIX, "")]
+            rows = self._conn.execute(
+                "SELECT seq, kind, value FROM invalidations WHERE seq > ? ORDER BY seq", (seq,)
+            ).fetchall()
+        return latest_seq, [tuple(r) for r in rows]
+
+
+_ENTRY_HEADER = struct.Struct("!ddd")
+
+
+class RedisBackend(CacheBackend):
+    """Store on a Redis-protocol server, shared across replicas.
+
+    Works with any client exposing the redis-py methods used here (get,
+    set, delete, scan_iter, incr, rpush, lrange, ltrim).
+    """
+
+    name = "redis"
+
+    def __init__(self, client=None, url: str | None = None, namespace: str = "job_monitor"):
+        """Connect to the server.
+
+        Args:
+            client: Existing Redis-protocol client
+            url: Server URL (redis://...), used when no client is given
+            namespace: Prefix for all keys written by this app
+        """
+        if client is None:
+            if redis is None:
+                raise ImportError("redis package is required for the Redis cache backend")
+            client = redis.Redis.from_url(url)
+        self._client = client
+        self._ns = f"{namespace}:cache:"
+        self._seq_key = f"{namespace}:invalidations:seq"
+        self._log_key = f"{namespace}:invalidations:log"
+
+    def get(self, key: str) -> BackendEntry | None:
+        data = self._client.get(self._ns + key)
+        if not data:
+            return None
+        expires_at, stale_until, created_at = _ENTRY_HEADER.unpack_from(data)
+        if stale_until < time.time():
+            return None
+        return BackendEntry(data[_ENTRY_HEADER.size:], expires_at, stale_until, created_at)
+
+    def set(self, key: str, entry: BackendEntry) -> None:
+        ttl_ms = max(1, int((entry.stale_until - time.time()) * 1000))
+        header = _ENTRY_HEADER.pack(entry.expires_at, entry.stale_until, entry.created_at)
+        self._client.set(self._ns + key, header + entry.payload, px=ttl_ms)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._ns + key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", self._ns + prefix) + "*"
+        keys = list(self._client.scan_iter(match=pattern))
+        if keys:
+            self._client.delete(*keys)
+
+    def publish_invalidation(self, kind: str, value: str) -> int:
+        seq = int(self._client.incr(self._seq_key))
+        self._client.rpush(self._log_key, f"{seq}|{kind}|{value}")
+        self._client.ltrim(self._log_key, -INVALIDATION_LOG_SIZE, -1)
+        return seq
+
+    def latest_invalidation(self) -> int:
+        return int(self._client.get(self._seq_key) or 0)
+
+    def invalidations_since(self, seq: int) -> tuple[int, list[tuple[int, str, str]]]:
+        latest_seq = self.latest_invalidation()
+        if latest_seq <= seq:
+            return max(latest_seq, seq), []
+        if seq and latest_seq - seq > INVALIDATION_LOG_SIZE:
+            return latest_seq, [(latest_seq, INVALIDATE_PREFIX, "")]
+        entries = []
+        for raw in self._client.lrange(self._log_key, -(latest_seq - seq), -1):
+            raw = raw.decode() if isinstance(raw, bytes) else raw
+            entry_seq, kind, value = raw.split("|", 2)
+            if int(entry_seq) > seq:
+                entries.append((int(entry_seq), kind, value))
+        return latest_seq, sorted(entries)
+
+
+def create_backend(kind: str | None, path: str = "", url: str = "") -> CacheBackend | None:
+    """Create the configured L2 backend, or None when disabled/unavailable.
+
+    Args:
+        kind: "sqlite", "redis" or "none"/empty
+        path: SQLite file path
+        url: Redis URL
+    """
+    kind = (kind or "none").lower()
+    try:
+        if kind == "sqlite":
+            return SQLiteBackend(path)
+        if kind == "redis":
+            return RedisBackend(url=url)
+    except Exception as e:
+        logger.warning(f"[RESPONSE_CACHE] L2 backend '{kind}' unavailable, using memory only: {e}")
+        return None
+    if kind != "none":
+        logger.warning(f"[RESPONSE_CACHE] Unknown L2 backend '{kind}', using memory only")
+    return None
@@ -0,0 +1,210 @@
+"""Proactive refresh of hot response-cache keys.
+
+Stale-while-revalidate keeps expired entries servable, but the first
+request after expiry still serves stale data and only then triggers the
+refresh. For the dashboard's common views this module refreshes entries
+*before* they expire, so first-page loads stay at cache-hit speed.
+
+Which keys are refreshed is driven by observed traffic: the response
+cache keeps decayed read counts per key, and each cycle the refresher
+takes the top-N most read keys among the known views (REFRESH_TARGETS)
+and recomputes those that are missing or expire within the lead time.
+Refreshes run under a small concurrency budget with the service
+principal client, so they never compete with user requests for more
+than a couple of warehouse slots.
+
+Usage:
+    from job_monitor.backend.cache_refresher import hot_key_refresher
+
+    asyncio.create_task(hot_key_refresher.run(app))
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from job_monitor.backend.config import settings
+from job_monitor.backend.response_cache import ResponseCache, namespace_for, response_cache
+
+logger = logging.getLogger(__name__)
+
+# Seconds between refresh cycles
+REFRESH_INTERVAL_SECONDS = 15
+# Refresh entries expiring within this many seconds
+REFRESH_LEAD_SECONDS = 45
+# Read counts are halved every cycle so hotness tracks recent traffic
+ACCESS_DECAY_FACTOR = 0.5
+
+
+@dataclass(frozen=True)
+class RefreshTarget:
+    """A cache key the refresher knows how to recompute.
+
+    ``loader`` takes a WorkspaceClient and recomputes the value by calling
+    the endpoint function, which stores it in the response cache.
+    """
+
+    key: str
+    loader: Callable[[Any], Awaitable[Any]]
+
+
+def default_targets() -> list[RefreshTarget]:
+    """Common dashboard views (first pages share one dataset entry per view)."""
+    # Imported lazily: routers import the response cache at module level
+    from job_monitor.backend.routers.alerts import ALERT_CATEGORIES, _dataset_key, get_alerts
+    from job_monitor.backend.routers.cost import get_cost_summary
+    from job_monitor.backend.routers.health_metrics import get_health_metrics, get_health_summary
+    from job_monitor.backend.routers.jobs_api import get_active_runs_summary
+
+    return [
+        RefreshTarget("health_metrics:7:current", lambda ws: get_health_metrics(days=7, ws=ws)),
+        RefreshTarget("health_metrics:30:current", lambda ws: get_health_metrics(days=30, ws=ws)),
+        RefreshTarget("health_summary:7:current", lambda ws: get_health_summary(days=7, ws=ws)),
+        RefreshTarget("health_summary:30:current", lambda ws: get_health_summary(days=30, ws=ws)),
+        RefreshTarget(_dataset_key("all", ALERT_CATEGORIES), lambda ws: get_alerts(ws=ws)),
+        RefreshTarget("cost_summary:30:False:all", lambda ws: get_cost_summary(ws=ws)),
+        RefreshTarget("active_runs_all", lambda ws: get_active_runs_summary(ws=ws)),
+    ]
+
+
+class HotKeyRefresher:
+    """Refreshes the hottest known response-cache keys before they expire."""
+
+    def __init__(
+        self,
+        cache: ResponseCache = response_cache,
+        targets: list[RefreshTarget] | None = None,
+        top_n: int = 8,
+        max_concurrency: int = 2,
+        lead_seconds: float = REFRESH_LEAD_SECONDS,
+        interval_seconds: float = REFRESH_INTERVAL_SECONDS,
+    ):
+        """Initialize refresher.
+
+        Args:
+            cache: Response cache to refresh
+            targets: Known refreshable keys (defaults to default_targets())
+            top_n: Max number of hot keys considered per cycle
+            max_concurrency: Max refreshes running at once
+            lead_seconds: Refresh entries expiring within this window
+            interval_seconds: Time between cycles
+        """
+        self._cache = cache
+        self._targets = targets
+        self._top_n = top_n
+        self._max_concurrency = max_concurrency
+        self._lead_seconds = lead_seconds
+        self._interval = interval_seconds
+        self._cycles = 0
+        self._refreshes = 0
+        self._last_cycle_at: float | None = None
+        self._last_refreshed: list[str] = []
+
+    @property
+    def targets(self) -> dict[str, RefreshTarget]:
+        """Known refresh targets by key."""
+        if self._targets is None:
+            self._targets = default_targets()
+        return {t.key: t for t in self._targets}
+
+    def hot(self, namespaces: set[str] | None = None) -> list[RefreshTarget]:
+        """Select the top-N most read targets, optionally within some namespaces.
+
+        Only keys that were actually read count as hot, so views nobody
+        opens are never refreshed.
+        """
+        targets = self.targets
+        return [
+            targets[key]
+            for key, count in self._cache.hot_keys()
+            if key in targets and count > 0
+            and (namespaces is None or namespace_for(key) in namespaces)
+        ][: self._top_n]
+
+    def due(self) -> list[RefreshTarget]:
+        """Select hot targets that are missing or about to expire."""
+        due = []
+        for target in self.hot():
+            remaining = self._cache.ttl_remaining(target.key)
+            if remaining is None or remaining <= self._lead_seconds:
+                due.append(target)
+        return due
+
+    async def refresh_targets(self, ws, targets: list[RefreshTarget]) -> int:
+        """Refresh targets under the concurrency budget.
+
+        Returns:
+            Number of targets refreshed
+        """
+        if not targets:
+            return 0
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _refresh(target: RefreshTarget) -> None:
+            async with semaphore:
+                await self._cache.refresh(target.key, lambda: target.loader(ws))
+
+        await asyncio.gather(*(_refresh(t) for t in targets))
+        self._refreshes += len(targets)
+        self._last_refreshed = [t.key for t in targets]
+        logger.info(f"[CACHE_REFRESH] Refreshed {len(targets)} hot keys: {self._last_refreshed}")
+        return len(targets)
+
+    async def refresh_once(self, ws) -> int:
+        """Run one refresh cycle.
+
+        Returns:
+            Number of keys refreshed
+        """
+        due = self.due()
+        refreshed = await self.refresh_targets(ws, due)
+        self._cache.decay_access_counts(ACCESS_DECAY_FACTOR)
+        self._cycles += 1
+        self._last_cycle_at = time.time()
+        return refreshed
+
+    async def warm_up(self, ws) -> int:
+        """Fill all known targets once (used at startup before traffic exists)."""
+        return await self.refresh_targets(ws, list(self.targets.values()))
+
+    async def run(self, app) -> None:
+        """Refresh loop; uses the service principal client from app state."""
+        logger.info(
+            f"[CACHE_REFRESH] Hot-key refresher started "
+            f"(top_n={self._top_n}, concurrency={self._max_concurrency}, interval={self._interval}s)"
+        )
+        while True:
+            await asyncio.sleep(self._interval)
+            ws = getattr(app.state, "workspace_client", None)
+            if not ws:
+                continue
+            try:
+                await self.refresh_once(ws)
+            except Exception as e:
+                logger.warning(f"[CACHE_REFRESH] Refresh cycle failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Get refresher statistics.
+
+        Returns:
+            Dict with cycles, refreshes, last cycle time and last refreshed keys
+        """
+        return {
+            "top_n": self._top_n,
+            "max_concurrency": self._max_concurrency,
+            "lead_seconds": self._lead_seconds,
+            "cycles": self._cycles,
+            "refreshes": self._refreshes,
+            "last_cycle_at": self._last_cycle_at,
+            "last_refreshed": list(self._last_refreshed),
+        }
+
+
+# Global refresher instance
+hot_key_refresher = HotKeyRefresher(
+    top_n=settings.cache_hot_refresh_top_n,
+    max_concurrency=settings.cache_hot_refresh_concurrency,
+)
@@ -0,0 +1,286 @@
+"""In-memory indexed snapshots of the Delta cache tables.
+
+The cache tables only change when the refresh-metrics-cache job runs
+(every 10-15 minutes), yet every health, summary, duration and alert read
+used to re-read and re-parse a whole table on the warehouse - and the
+duration reader ran one statement per job_id. This module keeps one
+columnar copy of each snapshot table in memory, with row-position indexes
+by job_id, priority/severity and workspace_id, so those reads become dict
+lookups and list scans.
+
+``sync`` checks each table's version (MAX(refreshed_at) and row count,
+one statement for all tables) and re-loads a table only when its version
+moved. It is driven by the refresh-version watcher (refresh_version.py),
+which calls it when the refresh job publishes a new version. Readers in
+cache.py serve from a snapshot when one is loaded and fall back to their
+SQL query otherwise.
+
+Usage:
+    from job_monitor.backend.cache_snapshot import cache_snapshots
+
+    await cache_snapshots.sync(ws)
+    snapshot = cache_snapshots.get("job_health_cache")
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from job_monitor.backend.config import settings
+from job_monitor.backend.result_decoder import ColumnarResult, decode_result
+from job_monitor.backend.statement_executor import TIMEOUT_CACHE, TIMEOUT_HEAVY, statement_executor
+
+logger = logging.getLogger(__name__)
+
+# Stop serving a snapshot whose version could not be checked for this long
+SNAPSHOT_MAX_UNCHECKED_SECONDS = 900
+
+
+@dataclass(frozen=True)
+class SnapshotTable:
+    """A cache table kept in memory.
+
+    ``columns`` are the full table layout (Databricks type names);
+    workspace_id is loaded as a string so it matches request parameters.
+    """
+
+    name: str
+    columns: list[tuple[str, str]]
+    indexes: tuple[str, ...]
+
+
+SNAPSHOT_TABLES = [
+    SnapshotTable(
+        "job_health_cache",
+        [
+            ("workspace_id", "STRING"),
+            ("job_id", "STRING"),
+            ("job_name", "STRING"),
+            ("total_runs_7d", "LONG"),
+            ("success_count_7d", "LONG"),
+            ("success_rate_7d", "DOUBLE"),
+            ("total_runs_30d", "LONG"),
+            ("success_count_30d", "LONG"),
+            ("success_rate_30d", "DOUBLE"),
+            ("last_run_time", "TIMESTAMP"),
+            ("last_duration_seconds", "LONG"),
+            ("priority", "STRING"),
+            ("retry_count", "LONG"),
+            ("median_duration_seconds", "DOUBLE"),
+            ("p90_duration_seconds", "DOUBLE"),
+            ("avg_duration_seconds", "DOUBLE"),
+            ("max_duration_seconds", "DOUBLE"),
+            ("refreshed_at", "TIMESTAMP"),
+        ],
+        ("job_id", "priority", "workspace_id"),
+    ),
+    SnapshotTable(
+        "cost_cache",
+        [
+            ("workspace_id", "STRING"),
+            ("job_id", "STRING"),
+            ("job_name", "STRING"),
+            ("total_dbus_30d", "DOUBLE"),
+            ("current_7d_dbus", "DOUBLE"),
+            ("prev_7d_dbus", "DOUBLE"),
+            ("trend_7d_percent", "DOUBLE"),
+            ("sku_breakdown", "STRING"),
+            ("baseline_p90_dbus", "DOUBLE"),
+            ("is_anomaly", "BOOLEAN"),
+            ("refreshed_at", "TIMESTAMP"),
+        ],
+        ("job_id", "workspace_id"),
+    ),
+    SnapshotTable(
+        "alerts_cache",
+        [
+            ("alert_id", "STRING"),
+            ("workspace_id", "STRING"),
+            ("job_id", "STRING"),
+            ("job_name", "STRING"),
+            ("category", "STRING"),
+            ("severity", "STRING"),
+            ("title", "STRING"),
+            ("description", "STRING"),
+            ("failure_reasons", "STRING"),
+            ("current_dbus", "DOUBLE"),
+            ("baseline_p90_dbus", "DOUBLE"),
+            ("cost_multiplier", "DOUBLE"),
+            ("refreshed_at", "TIMESTAMP"),
+        ],
+        ("job_id", "severity", "workspace_id"),
+    ),
+]
+
+
+class TableSnapshot:
+    """Columnar copy of one cache table with row-position indexes."""
+
+    def __init__(self, name: str, data: ColumnarResult, version: tuple, indexes: tuple[str, ...] = ()):
+        """Build indexes over the loaded columns.
+
+        Args:
+            name: Cache table name
+            data: Decoded table contents
+            version: (max refreshed_at, row count) the data was loaded at
+            indexes: Columns to index by value
+        """
+        self.name = name
+        self.data = data
+        self.version = version
+        self.loaded_at = time.time()
+        self.indexes: dict[str, dict[Any, list[int]]] = {}
+        for column in indexes:
+            index: dict[Any, list[int]] = {}
+            for position, value in enumerate(data.get(column)):
+                index.setdefault(value, []).append(position)
+            self.indexes[column] = index
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def positions(self, column: str, value: Any) -> list[int]:
+        """Row positions whose indexed ``column`` equals ``value``."""
+        return self.indexes[column].get(value, [])
+
+    def select(self, positions: list[int], names: list[str], rename: dict[str, str] | None = None) -> ColumnarResult:
+        """Gather ``names`` at ``positions`` into a new ColumnarResult.
+
+        Args:
+            positions: Row positions, in output order
+            names: Source columns to gather
+            rename: Optional source -> output column names
+        """
+        rename = rename or {}
+        columns = [[self.data[name][p] for p in positions] for name in names]
+        return ColumnarResult([rename.get(name, name) for name in names], columns)
+
+
+class CacheSnapshots:
+    """Holds table snapshots and re-loads them when the refresh version moves."""
+
+    def __init__(
+        self,
+        tables: list[SnapshotTable] | None = None,
+        max_unchecked_seconds: float = SNAPSHOT_MAX_UNCHECKED_SECONDS,
+    ):
+        """Initialize snapshot store.
+
+        Args:
+            tables: Tables to keep in memory (defaults to SNAPSHOT_TABLES)
+            max_unchecked_seconds: Snapshots not confirmed current for this long are not served
+        """
+        self._tables = {t.name: t for t in (tables or SNAPSHOT_TABLES)}
+        self._max_unchecked = max_unchecked_seconds
+        self._snapshots: dict[str, TableSnapshot] = {}
+        self._lock = asyncio.Lock()
+        self._checked_at: float | None = None
+        self._checks = 0
+        self._loads = 0
+
+    def get(self, name: str) -> TableSnapshot | None:
+        """Get a table snapshot, or None if not loaded or no longer confirmed current."""
+        snapshot = self._snapshots.get(name)
+        if snapshot is None or self._checked_at is None:
+            return None
+        if time.time() - self._checked_at > self._max_unchecked:
+            return None
+        return snapshot
+
+    def confirm(self) -> None:
+        """Mark the loaded snapshots current (the refresh version did not move)."""
+        if self._snapshots:
+            self._checked_at = time.time()
+
+    def clear(self) -> None:
+        """Drop all snapshots (readers fall back to SQL)."""
+        self._snapshots.clear()
+        self._checked_at = None
+
+    async def _execute(self, ws, query: str, timeout: int):
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=settings.warehouse_id,
+            timeout=timeout,
+            fetch_all=True,
+        )
+        if result and result.status and result.status.error:
+            raise RuntimeError(result.status.error)
+        return result
+
+    async def fetch_versions(self, ws) -> dict[str, tuple]:
+        """Read (max refreshed_at, row count) for every table in one statement."""
+        query = "\nUNION ALL\n".join(
+            f"SELECT '{name}' AS table_name, CAST(MAX(refreshed_at) AS STRING) AS version, COUNT(*) AS row_count "
+            f"FROM {settings.cache_table_prefix}.{name}"
+            for name in self._tables
+        )
+        result = await self._execute(ws, query, timeout=TIMEOUT_CACHE)
+        cols = decode_result(result, [("table_name", "STRING"), ("version", "STRING"), ("row_count", "LONG")])
+        return {
+            name: (version, row_count)
+            for name, version, row_count in zip(cols["table_name"], cols["version"], cols["row_count"])
+        }
+
+    async def load(self, ws, name: str, version: tuple) -> TableSnapshot:
+        """Load a whole table into a new snapshot."""
+        table = self._tables[name]
+        query = f"SELECT {', '.join(c for c, _ in table.columns)} FROM {settings.cache_table_prefix}.{name}"
+        result = await self._execute(ws, query, timeout=TIMEOUT_HEAVY)
+        snapshot = TableSnapshot(name, decode_result(result, table.columns), version, table.indexes)
+        self._snapshots[name] = snapshot
+        self._loads += 1
+        logger.info(f"[CACHE_SNAPSHOT] Loaded {name}: {len(snapshot)} rows (refreshed_at {version[0]})")
+        return snapshot
+
+    async def sync(self, ws) -> list[str]:
+        """Check versions and re-load tables whose version changed.
+
+        Returns:
+            Names of the tables re-loaded
+        """
+        if not settings.use_cache or not ws or not settings.warehouse_id:
+            return []
+        async with self._lock:
+            versions = await self.fetch_versions(ws)
+            loaded = []
+            for name, version in versions.items():
+                current = self._snapshots.get(name)
+                if current is not None and current.version == version:
+                    continue
+                if version[0] is None:
+                    # Empty table: nothing to serve, readers use SQL
+                    self._snapshots.pop(name, None)
+                    continue
+                await self.load(ws, name, version)
+                loaded.append(name)
+            self._checks += 1
+            self._checked_at = time.time()
+            return loaded
+
+    def stats(self) -> dict[str, Any]:
+        """Get snapshot statistics.
+
+        Returns:
+            Dict with check/load counts and per-table version and row count
+        """
+        return {
+            "checks": self._checks,
+            "loads": self._loads,
+            "checked_at": self._checked_at,
+            "tables": {
+                name: {
+                    "rows": len(snapshot),
+                    "refreshed_at": snapshot.version[0],
+                    "loaded_at": snapshot.loaded_at,
+                }
+                for name, snapshot in self._snapshots.items()
+            },
+        }
+
+
+# Global snapshot store
+cache_snapshots = CacheSnapshots()
@@ -55,6 +55,21 @@ class Settings(BaseSettings):
     cache_schema: str = _yaml_config.get("cache", {}).get("schema", "cache")
     cache_refresh_cron: str = _yaml_config.get("cache", {}).get("refresh_cron", "0 */15 * * * ?")
     use_cache: bool = _yaml_config.get("cache", {}).get("enabled", True)
+    cache_hot_refresh_enabled: bool = _yaml_config.get("cache", {}).get("hot_refresh", {}).get("enabled", True)
+    cache_hot_refresh_top_n: int = _yaml_config.get("cache", {}).get("hot_refresh", {}).get("top_n", 8)
+    cache_hot_refresh_concurrency: int = _yaml_config.get("cache", {}).get("hot_refresh", {}).get("max_concurrency", 2)
+    # Keep indexed in-memory copies of the cache tables, re-loaded when refreshed_at moves
+    cache_snapshot_enabled: bool = _yaml_config.get("cache", {}).get("snapshot", {}).get("enabled", True)
+    # Serve cache-backed GET endpoints from pre-encoded, pre-compressed bytes with ETags
+    cache_encoded_responses_enabled: bool = _yaml_config.get("cache", {}).get("encoded_responses", {}).get("enabled", True)
+    # Shared L2 response cache: "none", "sqlite" (per host) or "redis" (across replicas)
+    cache_l2_backend: str = _yaml_config.get("cache", {}).get("l2", {}).get("backend", "none")
+    cache_l2_path: str = _yaml_config.get("cache", {}).get("l2", {}).get("path", "/tmp/job_monitor/response_cache.sqlite")
+    cache_l2_url: str = _yaml_config.get("cache", {}).get("l2", {}).get("url", "")
+
+    # SQL statement executor settings (from config.yaml sql section)
+    sql_max_concurrency: int = _yaml_config.get("sql", {}).get("max_concurrency", 8)
+    sql_default_timeout: float = _yaml_config.get("sql", {}).get("default_timeout_seconds", 50)
 
     # Mock data settings (for development/demos)
     # Override enabled with USE_MOCK_DATA=true environment variable
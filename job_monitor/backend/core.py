@@ -5,6 +5,8 @@ from typing import Annotated
 
 from fastapi import Header, Request
 
+from job_monitor.backend.workspace_client_pool import identity_from_claims, workspace_client_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,10 +23,11 @@ def get_user_ws(
     request: Request,
     token: Annotated[str | None, Header(alias="X-Forwarded-Access-Token")] = None,
 ):
-    """Create a WorkspaceClient from the user's OBO token.
+    """Get a WorkspaceClient for the user's OBO token.
 
-    This creates a client that acts on behalf of the authenticated user,
-    using the OAuth token forwarded by the Databricks App platform.
+    The client acts on behalf of the authenticated user, using the OAuth
+    token forwarded by the Databricks App platform. Clients are pooled per
+    token (see workspace_client_pool), so repeat requests reuse them.
 
     Returns None if no token is available.
     """
@@ -32,14 +35,7 @@ def get_user_ws(
         logger.debug("No X-Forwarded-Access-Token header found")
         return None
 
-    from databricks.sdk import WorkspaceClient
-    from job_monitor.backend.config import settings
-
-    logger.info(f"Creating user OBO WorkspaceClient (token length: {len(token)})")
-    return WorkspaceClient(
-        host=settings.databricks_host,
-        token=token,
-    )
+    return workspace_client_pool.get(token)
 
 
 def get_ws_prefer_user(
@@ -57,30 +53,12 @@ def get_ws_prefer_user(
 
     Returns None if neither is available.
     """
-    # Log what we received
-    logger.info(f"get_ws_prefer_user: X-Forwarded-Access-Token present = {token is not None}")
-    if token:
-        logger.info(f"get_ws_prefer_user: Token length = {len(token)}")
-
-    # Try user OBO first
+    # Try user OBO first (pooled client; identity comes from cached JWT claims)
     if token:
         try:
-            from databricks.sdk import WorkspaceClient
-            from job_monitor.backend.config import settings
-
-            logger.info("=== USING USER OBO TOKEN ===")
-            logger.info(f"OBO token for host: {settings.databricks_host}")
-            # Use token explicitly to avoid auth conflicts
-            ws = WorkspaceClient(
-                host=settings.databricks_host,
-                token=token,
-            )
-            # Verify the token works by getting current user
-            try:
-                current_user = ws.current_user.me()
-                logger.info(f"OBO authenticated as: {current_user.user_name}")
-            except Exception as e:
-                logger.warning(f"Could not verify OBO user: {e}")
+            ws = workspace_client_pool.get(token)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Using user OBO token for {workspace_client_pool.identity(token)}")
             return ws
         except ValueError as ve:
             if "more than one authorization method" in str(ve):
@@ -91,13 +69,8 @@ def get_ws_prefer_user(
     # Fall back to service principal (already initialized at startup)
     ws = request.app.state.workspace_client
     if ws:
-        logger.info("=== USING SERVICE PRINCIPAL (no user token available) ===")
-        # Log SP identity for debugging
-        try:
-            current_user = ws.current_user.me()
-            logger.info(f"Service Principal identity: {current_user.user_name}")
-        except Exception as e:
-            logger.warning(f"Could not get SP identity: {e}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Using service principal: {workspace_client_pool.service_principal_identity(ws)}")
     else:
         logger.warning("No WorkspaceClient available (no user token, no SP)")
     return ws
@@ -113,30 +86,11 @@ def get_current_user(
     returns a placeholder.
     """
     if token:
-        # In production, decode JWT to get user email
-        # The token is a JWT issued by Databricks OAuth
-        try:
-            import base64
-            import json
-
-            # JWT structure: header.payload.signature
-            parts = token.split(".")
-            if len(parts) >= 2:
-                # Decode the payload (add padding if needed)
-                payload = parts[1]
-                padding = 4 - len(payload) % 4
-                if padding != 4:
-                    payload += "=" * padding
-                decoded = base64.urlsafe_b64decode(payload)
-                claims = json.loads(decoded)
-
-                # Extract email from standard claims
-                email = claims.get("email") or claims.get("sub") or claims.get("preferred_username")
-                if email:
-                    return email
-        except Exception:
-            # If decoding fails, fall back to placeholder
-            pass
+        # In production, the token is a JWT issued by Databricks OAuth;
+        # claims are decoded once per pooled client
+        email = identity_from_claims(workspace_client_pool.claims(token))
+        if email:
+            return email
         return "authenticated-user@databricks.com"
 
     return "local-dev-user"
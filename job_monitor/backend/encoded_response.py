@@ -0,0 +1,268 @@
+"""Pre-encoded, pre-compressed responses for response-cache backed endpoints.
+
+A response cache hit still costs a pydantic -> JSON serialization and a
+GZip pass on every request. For the dashboard's read endpoints
+(ENCODED_PATHS) this middleware keeps the finished bytes instead:
+
+- JSON body, plus gzip and (if the ``brotli`` package is installed)
+  brotli variants, compressed once when the response is built
+- a strong ETag of the JSON body; ``If-None-Match`` gets a 304
+
+Encoded responses are stored in ``response_cache`` under
+``encoded:{path}?{sorted query}``. While an endpoint builds a response,
+the response cache records which entries it read or wrote; the encoded
+response is only reused while every one of those entries is still the
+same, unexpired version. Responses built from stale entries, from no
+cached entries (mock mode, live calls) or with a non-200 status are
+never stored.
+
+Usage:
+    app.add_middleware(EncodedResponseMiddleware)
+"""
+
+import gzip
+import hashlib
+import logging
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from job_monitor.backend.response_cache import ResponseCache, _dependencies, response_cache, track_dependencies
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# GET endpoints whose responses are a pure function of query params and cached entries
+ENCODED_PATHS = frozenset({
+    "/api/health-metrics",
+    "/api/health-metrics/summary",
+    "/api/alerts",
+    "/api/costs/summary",
+    "/api/costs/anomalies",
+    "/api/historical/costs",
+    "/api/historical/success-rate",
+    "/api/historical/sla-breaches",
+})
+
+ENCODED_KEY_PREFIX = "encoded:"
+
+# Same threshold as the app's GZipMiddleware
+COMPRESS_MIN_BYTES = 500
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def encoded_key(path: str, query_string: str) -> str:
+    """Cache key of an encoded response (query params sorted)."""
+    query = urlencode(sorted(parse_qsl(query_string, keep_blank_values=True)))
+    return f"{ENCODED_KEY_PREFIX}{path}?{query}"
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Parse an Accept-Encoding header into the accepted codings (q > 0)."""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return etag in tags
+
+
+@dataclass
+class EncodedResponse:
+    """Serialized JSON body with its compressed variants and ETag.
+
+    ``dependencies`` are the (key, created_at) versions of the response
+    cache entries the body was built from.
+    """
+    body: bytes
+    etag: str
+    gzip: bytes | None = None
+    br: bytes | None = None
+    dependencies: tuple[tuple[str, float], ...] = ()
+
+    @classmethod
+    def encode(cls, body: bytes, dependencies: tuple[tuple[str, float], ...] = ()) -> "EncodedResponse":
+        """Hash and compress a JSON body once."""
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        gzipped = compressed_br = None
+        if len(body) >= COMPRESS_MIN_BYTES:
+            gzipped = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+            if brotli is not None:
+                compressed_br = brotli.compress(body, quality=BROTLI_QUALITY)
+        return cls(body=body, etag=etag, gzip=gzipped, br=compressed_br, dependencies=dependencies)
+
+    def variant(self, accept_encoding: str) -> tuple[bytes, str | None]:
+        """Pick the smallest variant the client accepts.
+
+        Returns:
+            Tuple of (body bytes, Content-Encoding or None)
+        """
+        accepted = accepted_encodings(accept_encoding)
+        if self.br is not None and "br" in accepted:
+            return self.br, "br"
+        if self.gzip is not None and ("gzip" in accepted or "*" in accepted):
+            return self.gzip, "gzip"
+        return self.body, None
+
+    def is_current(self, cache: ResponseCache) -> bool:
+        """Check that every entry the body was built from is unchanged and fresh."""
+        return bool(self.dependencies) and all(
+            cache.current_version(key) == created_at for key, created_at in self.dependencies
+        )
+
+
+class EncodedResponseStats:
+    """Thread-safe counters of the encoded response middleware."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._counts = {"hits": 0, "misses": 0, "not_modified": 0, "stored": 0}
+
+    def count(self, name: str) -> None:
+        """Increment one counter."""
+        with self._lock:
+            self._counts[name] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get encoded response statistics.
+
+        Returns:
+            Dict with hits, misses, 304s, stored responses and brotli availability
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        total = counts["hits"] + counts["misses"]
+        return {
+            **counts,
+            "hit_rate_percent": round(counts["hits"] / total * 100, 1) if total else 0,
+            "brotli": brotli is not None,
+        }
+
+
+# Global counters (the middleware instance itself is created by Starlette)
+encoded_response_stats = EncodedResponseStats()
+
+
+class EncodedResponseMiddleware:
+    """ASGI middleware serving ENCODED_PATHS from pre-encoded bytes.
+
+    Must be added after GZipMiddleware (i.e. wrap it): requests for
+    encoded paths reach the app without Accept-Encoding, and this
+    middleware compresses the body itself.
+    """
+
+    def __init__(self, app, cache: ResponseCache = response_cache, paths: frozenset[str] = ENCODED_PATHS):
+        self.app = app
+        self._cache = cache
+        self._paths = paths
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in self._paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        accept_encoding = headers.get("accept-encoding", "")
+        if_none_match = headers.get("if-none-match", "")
+        key = encoded_key(scope["path"], scope.get("query_string", b"").decode("latin-1"))
+
+        cached = await self._cache.aget(key)
+        if isinstance(cached, EncodedResponse) and cached.is_current(self._cache):
+            encoded_response_stats.count("hits")
+            await self._send(send, cached, accept_encoding, if_none_match, "HIT")
+            return
+
+        # Build the response uncompressed, recording the cache entries it uses
+        inner_scope = dict(scope)
+        inner_scope["headers"] = [(k, v) for k, v in scope["headers"] if k.lower() != b"accept-encoding"]
+        start: dict[str, Any] | None = None
+        chunks: list[bytes] = []
+
+        async def capture(message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        deps, token = track_dependencies()
+        try:
+            await self.app(inner_scope, receive, capture)
+        finally:
+            _dependencies.reset(token)
+
+        if start is None:
+            return
+        body = b"".join(chunks)
+        content_type = dict(start.get("headers", [])).get(b"content-type", b"")
+        if start["status"] != 200 or not content_type.startswith(b"application/json"):
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        encoded_response_stats.count("misses")
+        encoded = EncodedResponse.encode(body, tuple(dict((k, c) for k, c, _ in deps).items()))
+        if deps and not any(is_stale for _, _, is_stale in deps):
+            self._store(key, encoded)
+        await self._send(send, encoded, accept_encoding, if_none_match, "MISS")
+
+    def _store(self, key: str, encoded: EncodedResponse) -> None:
+        """Cache an encoded response until its first dependency expires."""
+        remaining = [self._cache.ttl_remaining(k) for k, _ in encoded.dependencies]
+        if any(r is None for r in remaining):
+            return
+        ttl = int(min(remaining))
+        if ttl <= 0:
+            return
+        self._cache.set(key, encoded, ttl_seconds=ttl)
+        encoded_response_stats.count("stored")
+        logger.debug(
+            f"[ENCODED_RESPONSE] Stored {key} ({len(encoded.body)} bytes, gzip: {len(encoded.gzip or b'')})"
+        )
+
+    async def _send(
+        self, send, encoded: EncodedResponse, accept_encoding: str, if_none_match: str, status: str
+    ) -> None:
+        """Write an encoded response (or 304) straight to the socket."""
+        headers = [
+            (b"etag", encoded.etag.encode()),
+            (b"vary", b"Accept-Encoding"),
+            (b"cache-control", b"private, no-cache"),
+            (b"x-response-cache", status.encode()),
+        ]
+        if if_none_match and etag_matches(if_none_match, encoded.etag):
+            encoded_response_stats.count("not_modified")
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        body, content_encoding = encoded.variant(accept_encoding)
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        if content_encoding:
+            headers.append((b"content-encoding", content_encoding.encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,147 @@
+"""Streaming encoders for bulk dataset exports.
+
+Bulk consumers (notebooks, the MCP server) read whole datasets instead of
+paging through the dashboard endpoints. The readers in cache.py yield a
+dataset as ColumnarResult batches; the encoders here turn each batch into
+bytes as it arrives, so a StreamingResponse sends the export without ever
+holding more than one batch:
+
+- ``ndjson``: one JSON object per line
+- ``csv``: header row, then one row per record
+- ``arrow``: Arrow IPC stream, one record batch per input batch
+  (requires the optional ``pyarrow`` package)
+
+Usage:
+    from job_monitor.backend.export_stream import encode_export
+
+    body = encode_export("ndjson", batches, JOB_HEALTH_EXPORT_COLUMNS)
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES["ndjson"])
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+
+from job_monitor.backend.result_decoder import ColumnarResult
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pa_ipc = None
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+EXPORT_EXTENSIONS = {"ndjson": "ndjson", "csv": "csv", "arrow": "arrows"}
+
+# Arrow IPC output needs the optional pyarrow package
+ARROW_AVAILABLE = pa is not None
+
+
+def _iso(value):
+    """Render dates and timestamps as ISO strings, other values unchanged."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _rows(cols: ColumnarResult, names: list[str]):
+    """Iterate the rows of a batch in ``names`` order."""
+    return zip(*(cols.get(name) for name in names))
+
+
+async def ndjson_stream(batches: AsyncIterator[ColumnarResult], names: list[str]) -> AsyncIterator[bytes]:
+    """Encode batches as newline-delimited JSON."""
+    async for cols in batches:
+        lines = [
+            json.dumps(dict(zip(names, row)), default=_iso)
+            for row in _rows(cols, names)
+        ]
+        if not lines:
+            continue
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def csv_stream(batches: AsyncIterator[ColumnarResult], names: list[str]) -> AsyncIterator[bytes]:
+    """Encode batches as CSV (header first, NULLs as empty fields)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    yield buffer.getvalue().encode()
+    async for cols in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_iso(v) for v in row] for row in _rows(cols, names))
+        yield buffer.getvalue().encode()
+
+
+def arrow_schema(columns: list[tuple[str, str]]):
+    """Arrow schema for (name, Databricks type name) columns."""
+    types = {
+        "LONG": pa.int64(),
+        "INT": pa.int32(),
+        "DOUBLE": pa.float64(),
+        "BOOLEAN": pa.bool_(),
+        "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+        "DATE": pa.date32(),
+    }
+    return pa.schema([(name, types.get(type_name, pa.string())) for name, type_name in columns])
+
+
+async def arrow_stream(
+    batches: AsyncIterator[ColumnarResult], columns: list[tuple[str, str]]
+) -> AsyncIterator[bytes]:
+    """Encode batches as an Arrow IPC stream."""
+    schema = arrow_schema(columns)
+    sink = io.BytesIO()
+    writer = pa_ipc.new_stream(sink, schema)
+
+    def drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    yield drain()
+    async for cols in batches:
+        arrays = []
+        for field in schema:
+            values = cols.get(field.name)
+            if pa.types.is_timestamp(field.type) or pa.types.is_date(field.type):
+                # Unparsed timestamp strings can't be cast; export them as NULL
+                values = [v if isinstance(v, (datetime, date)) else None for v in values]
+            arrays.append(pa.array(values, type=field.type))
+        writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        yield drain()
+    writer.close()
+    yield drain()
+
+
+def encode_export(
+    export_format: str, batches: AsyncIterator[ColumnarResult], columns: list[tuple[str, str]]
+) -> AsyncIterator[bytes]:
+    """Encode an export in ``export_format`` (ndjson, csv or arrow).
+
+    Args:
+        export_format: Key of EXPORT_MEDIA_TYPES
+        batches: Dataset batches
+        columns: (name, Databricks type name) of the exported columns, in output order
+
+    Raises:
+        RuntimeError: For arrow when pyarrow is not installed
+    """
+    names = [name for name, _ in columns]
+    if export_format == "arrow":
+        if not ARROW_AVAILABLE:
+            raise RuntimeError("Arrow export requires pyarrow (pip install 'job-monitor[arrow]')")
+        return arrow_stream(batches, columns)
+    if export_format == "csv":
+        return csv_stream(batches, names)
+    return ndjson_stream(batches, names)
@@ -0,0 +1,302 @@
+"""In-memory indexes for server-side search, filter and sort of job health.
+
+``/api/health-metrics`` caches the full sorted job list per window and
+workspace (a CachedDataset). Filtering and re-sorting that list per
+request is a full scan plus a sort; this module indexes it once per
+dataset instead:
+
+- Bitmaps (Python ints, bit p = dataset position p) per priority, so set
+  filters are ORs and combined filters are ANDs of whole bitmaps
+- Sorted columns (success rate, runs, last run time, ...) with prefix
+  bitmaps every BITMAP_BLOCK positions: a range filter is two bisects and
+  one AND of prefix bitmaps plus at most two partial blocks
+- Per-column ranks, so any multi-key sort is one sort of the positions,
+  memoized per sort spec
+
+A query then costs a few bitmap operations plus a walk of the sort order
+that stops at the end of the requested page.
+
+Usage:
+    index = dataset.indexed("health", JobHealthIndex)
+    positions, total, counts = index.search(query, page, page_size)
+"""
+
+import fnmatch
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+# Sorted-column positions covered by each prefix bitmap
+BITMAP_BLOCK = 1024
+# Sort orders and name searches memoized per index
+MAX_CACHED_ORDERS = 16
+MAX_CACHED_SEARCHES = 64
+
+# Priority filter values ("healthy" = no priority flag) and their sort rank
+PRIORITY_RANK = {"P1": 1, "P2": 2, "P3": 3, "healthy": 4}
+
+# Sortable keys (sort=key or sort=-key for descending)
+SORT_KEYS = frozenset({
+    "job_name",
+    "job_id",
+    "priority",
+    "success_rate",
+    "total_runs",
+    "last_run_time",
+    "last_duration_seconds",
+    "retry_count",
+})
+
+
+def bitmap(positions, size: int) -> int:
+    """Build a bitmap (bit p set for each position p)."""
+    buf = bytearray((size + 7) // 8)
+    for p in positions:
+        buf[p >> 3] |= 1 << (p & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _epoch(value: Any) -> float | None:
+    """Seconds since the epoch of a timestamp (naive timestamps are UTC)."""
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def parse_sort(spec: str | None) -> tuple[tuple[str, bool], ...]:
+    """Parse "key,-key2" into ((key, descending), ...).
+
+    Raises:
+        ValueError: For a key not in SORT_KEYS
+    """
+    keys = []
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        descending = part.startswith("-")
+        key = part.lstrip("+-")
+        if key not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key '{key}' (allowed: {', '.join(sorted(SORT_KEYS))})")
+        keys.append((key, descending))
+    return tuple(keys)
+
+
+@dataclass(frozen=True)
+class HealthQuery:
+    """Search, filter and sort parameters of a health-metrics request."""
+
+    search: str | None = None
+    priorities: frozenset[str] | None = None
+    min_success_rate: float | None = None
+    max_success_rate: float | None = None
+    min_runs: int | None = None
+    min_last_run_age_hours: float | None = None
+    max_last_run_age_hours: float | None = None
+    sort: tuple[tuple[str, bool], ...] = ()
+
+    @property
+    def active(self) -> bool:
+        """Whether any parameter differs from the dataset's default view."""
+        return any(value not in (None, ()) for value in vars(self).values())
+
+
+class SortedColumn:
+    """Dataset positions ordered by one column, with prefix bitmaps and ranks."""
+
+    def __init__(self, values: list):
+        """Sort positions by value (NULLs excluded) and build the bitmaps.
+
+        Args:
+            values: Column value per dataset position (None for NULL)
+        """
+        size = len(values)
+        self.size = size
+        self.order = sorted((p for p in range(size) if values[p] is not None), key=values.__getitem__)
+        self.keys = [values[p] for p in self.order]
+
+        # prefix[b] = bitmap of order[:b * BITMAP_BLOCK]
+        buf = bytearray((size + 7) // 8)
+        self.prefix = [0]
+        for start in range(0, len(self.order), BITMAP_BLOCK):
+            for p in self.order[start:start + BITMAP_BLOCK]:
+                buf[p >> 3] |= 1 << (p & 7)
+            self.prefix.append(int.from_bytes(buf, "little"))
+
+        # Equal values share a rank; NULLs rank after every value
+        self.rank = [len(self.order)] * size
+        rank, previous = -1, object()
+        for p, key in zip(self.order, self.keys):
+            if key != previous:
+                rank, previous = rank + 1, key
+            self.rank[p] = rank
+        self.null_rank = len(self.order)
+
+    def _slice_bits(self, i: int, j: int) -> int:
+        """Bitmap of order[i:j]."""
+        first_full = -(-i // BITMAP_BLOCK)
+        last_full = j // BITMAP_BLOCK
+        if first_full >= last_full:
+            return bitmap(self.order[i:j], self.size)
+        bits = self.prefix[last_full] & ~self.prefix[first_full]
+        head = self.order[i:first_full * BITMAP_BLOCK]
+        tail = self.order[last_full * BITMAP_BLOCK:j]
+        if head or tail:
+            bits |= bitmap(head + tail, self.size)
+        return bits
+
+    def range(self, low: Any = None, high: Any = None) -> int:
+        """Bitmap of positions with low <= value <= high (None bounds are open; NULLs never match)."""
+        i = 0 if low is None else bisect_left(self.keys, low)
+        j = len(self.keys) if high is None else bisect_right(self.keys, high)
+        if i >= j:
+            return 0
+        return self._slice_bits(i, j)
+
+
+class JobHealthIndex:
+    """Indexes over one health dataset (list of JobHealthOut, in dataset order)."""
+
+    def __init__(self, items: list):
+        """Build priority bitmaps and sorted columns.
+
+        Args:
+            items: JobHealthOut items of the dataset
+        """
+        self.size = len(items)
+        self.all_bits = (1 << self.size) - 1
+        self.names = [(item.job_name or "").lower() for item in items]
+        self.job_ids = [item.job_id for item in items]
+
+        groups: dict[str, list[int]] = {key: [] for key in PRIORITY_RANK}
+        for p, item in enumerate(items):
+            groups[item.priority or "healthy"].append(p)
+        self.priority_bits = {key: bitmap(positions, self.size) for key, positions in groups.items()}
+
+        self.columns = {
+            "job_name": SortedColumn(self.names),
+            "job_id": SortedColumn(self.job_ids),
+            "priority": SortedColumn([PRIORITY_RANK[item.priority or "healthy"] for item in items]),
+            "success_rate": SortedColumn([item.success_rate for item in items]),
+            "total_runs": SortedColumn([item.total_runs for item in items]),
+            "last_run_time": SortedColumn([_epoch(item.last_run_time) for item in items]),
+            "last_duration_seconds": SortedColumn([item.last_duration_seconds for item in items]),
+            "retry_count": SortedColumn([item.retry_count for item in items]),
+        }
+        self._orders: OrderedDict[tuple, list[int]] = OrderedDict()
+        self._searches: OrderedDict[str, int] = OrderedDict()
+
+    def _search_bits(self, pattern: str) -> int:
+        """Bitmap of jobs whose name or ID matches ``pattern``.
+
+        Case-insensitive substring match; ``*`` and ``?`` make it a glob
+        over the whole name.
+        """
+        pattern = pattern.strip().lower()
+        bits = self._searches.get(pattern)
+        if bits is not None:
+            self._searches.move_to_end(pattern)
+            return bits
+        if "*" in pattern or "?" in pattern:
+            matches = (
+                p for p, name in enumerate(self.names)
+                if fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(self.job_ids[p], pattern)
+            )
+        else:
+            matches = (p for p, name in enumerate(self.names) if pattern in name or pattern in self.job_ids[p])
+        bits = bitmap(matches, self.size)
+        self._searches[pattern] = bits
+        if len(self._searches) > MAX_CACHED_SEARCHES:
+            self._searches.popitem(last=False)
+        return bits
+
+    def filter_bits(self, query: HealthQuery, now: float | None = None) -> int:
+        """Bitmap of the dataset positions matching every filter of ``query``."""
+        bits = self.all_bits
+        if query.search:
+            bits &= self._search_bits(query.search)
+        if query.priorities:
+            selected = 0
+            for priority in query.priorities:
+                selected |= self.priority_bits.get(priority, 0)
+            bits &= selected
+        if query.min_success_rate is not None or query.max_success_rate is not None:
+            bits &= self.columns["success_rate"].range(query.min_success_rate, query.max_success_rate)
+        if query.min_runs is not None:
+            bits &= self.columns["total_runs"].range(query.min_runs, None)
+        if query.min_last_run_age_hours is not None or query.max_last_run_age_hours is not None:
+            now = time.time() if now is None else now
+            newest = None if query.min_last_run_age_hours is None else now - query.min_last_run_age_hours * 3600
+            oldest = None if query.max_last_run_age_hours is None else now - query.max_last_run_age_hours * 3600
+            bits &= self.columns["last_run_time"].range(oldest, newest)
+        return bits
+
+    def order(self, sort: tuple[tuple[str, bool], ...]) -> list[int] | range:
+        """Dataset positions in ``sort`` order (dataset order breaks ties; NULLs last)."""
+        if not sort:
+            return range(self.size)
+        order = self._orders.get(sort)
+        if order is not None:
+            self._orders.move_to_end(sort)
+            return order
+        if len(sort) == 1 and not sort[0][1]:
+            column = self.columns[sort[0][0]]
+            order = column.order + [p for p in range(self.size) if column.rank[p] == column.null_rank]
+        else:
+            # Fold the keys into one integer per position (ranks in [0, null_rank]) and sort on it
+            composite = [0] * self.size
+            for key, descending in sort:
+                column = self.columns[key]
+                base, null_rank, top = column.null_rank + 1, column.null_rank, column.null_rank - 1
+                if descending:
+                    composite = [c * base + (null_rank if r == null_rank else top - r)
+                                 for c, r in zip(composite, column.rank)]
+                else:
+                    composite = [c * base + r for c, r in zip(composite, column.rank)]
+            order = sorted(range(self.size), key=composite.__getitem__)
+        self._orders[sort] = order
+        if len(self._orders) > MAX_CACHED_ORDERS:
+            self._orders.popitem(last=False)
+        return order
+
+    def search(
+        self, query: HealthQuery, page: int, page_size: int, now: float | None = None
+    ) -> tuple[list[int], int, dict[str, int]]:
+        """Evaluate a query and return one page of it.
+
+        Args:
+            query: Filters and sort keys
+            page: Page number (1-indexed)
+            page_size: Items per page
+            now: Reference time for last-run age filters (defaults to now)
+
+        Returns:
+            Tuple of (page positions in order, matching total, priority counts of the matches)
+        """
+        bits = self.filter_bits(query, now)
+        total = bits.bit_count()
+        counts = {
+            "p1_count": (bits & self.priority_bits["P1"]).bit_count(),
+            "p2_count": (bits & self.priority_bits["P2"]).bit_count(),
+            "p3_count": (bits & self.priority_bits["P3"]).bit_count(),
+            "healthy_count": (bits & self.priority_bits["healthy"]).bit_count(),
+        }
+
+        start = (page - 1) * page_size
+        positions: list[int] = []
+        if start < total:
+            flags = bits.to_bytes((self.size + 7) // 8, "little")
+            seen = 0
+            for p in self.order(query.sort):
+                if flags[p >> 3] >> (p & 7) & 1:
+                    if seen >= start:
+                        positions.append(p)
+                        if len(positions) == page_size:
+                            break
+                    seen += 1
+        return positions, total, counts
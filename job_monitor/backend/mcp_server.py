@@ -63,6 +63,23 @@ async def _call_api(path: str, method: str = "GET", **kwargs) -> dict:
         return {"error": True, "status_code": 500, "detail": str(e)[:500]}
 
 
+async def _call_api_text(path: str, **kwargs) -> str:
+    """Call a streaming GET endpoint in-process and return its body as text.
+
+    Returns the body on success, or a JSON error string on failure.
+    """
+    _ensure_app_state()
+    transport = httpx.ASGITransport(app=fastapi_app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get(path, **kwargs)
+            if resp.is_success:
+                return resp.text
+            return _json({"error": True, "status_code": resp.status_code, "detail": resp.text[:500]})
+    except Exception as e:
+        return _json({"error": True, "status_code": 500, "detail": str(e)[:500]})
+
+
 def _json(data: dict) -> str:
     """Serialize response data to JSON string for MCP tool return."""
     return json.dumps(data, indent=2, default=str)
@@ -113,20 +130,53 @@ async def get_active_jobs_summary() -> str:
 async def get_health_metrics(
     days: int = 30,
     workspace_id: str | None = None,
+    search: str | None = None,
+    priority: list[str] | None = None,
+    sort: str | None = None,
 ) -> str:
     """Get job health metrics with success rates and priority flags (P1/P2/P3).
 
     Args:
         days: Time window in days (7-90, default 30).
         workspace_id: Filter by workspace ID (omit for all workspaces).
+        search: Job name or ID substring, or a glob with * and ? (optional).
+        priority: Only these priorities: P1, P2, P3, healthy (optional).
+        sort: Comma-separated sort keys, '-' for descending, e.g. "-retry_count,job_name" (optional).
     """
     params: dict = {"days": days}
     if workspace_id:
         params["workspace_id"] = workspace_id
+    if search:
+        params["search"] = search
+    if priority:
+        params["priority"] = priority
+    if sort:
+        params["sort"] = sort
     result = await _call_api("/api/health-metrics", params=params)
     return _json(result)
 
 
+@mcp.tool()
+async def export_job_health(
+    days: int = 30,
+    workspace_id: str | None = None,
+) -> str:
+    """Get every job's health record (no paging) as newline-delimited JSON.
+
+    Use this instead of get_health_metrics for fleet-wide analysis. Each
+    line holds workspace_id, success rates, priority, retries and duration
+    statistics of one job.
+
+    Args:
+        days: Time window in days (7 or 30, default 30).
+        workspace_id: Filter by workspace ID (omit for all workspaces).
+    """
+    params: dict = {"days": days, "format": "ndjson"}
+    if workspace_id:
+        params["workspace_id"] = workspace_id
+    return await _call_api_text("/api/health-metrics/export", params=params)
+
+
 @mcp.tool()
 async def get_health_metrics_summary(
     days: int = 30,
@@ -201,7 +251,7 @@ async def get_cost_summary(
         days: Time window in days (7-90, default 30).
         workspace_id: Filter by workspace ID (omit for all workspaces).
     """
-    params: dict = {"days": days}
+    params: dict = {"days": days, "include_teams": True}
     if workspace_id:
         params["workspace_id"] = workspace_id
     result = await _call_api("/api/costs/summary", params=params)
@@ -198,6 +198,7 @@ class JobHealthListOut(BaseModel):
     page_size: int = 50
     has_more: bool = False
     from_cache: bool = False  # True if served from cache table
+    stale: bool = False  # True if served past TTL while being refreshed
     # Priority counts for summary stats (computed from full dataset)
     p1_count: int = 0
     p2_count: int = 0
@@ -219,6 +220,7 @@ class JobHealthSummaryOut(BaseModel):
     healthy_count: int  # Healthy - 90%+ success
     window_days: int  # 7 or 30
     from_cache: bool = False
+    stale: bool = False  # True if served past TTL while being refreshed
     avg_success_rate: float = 0.0  # Average success rate across all jobs
 
 
@@ -363,6 +365,7 @@ class CostSummaryOut(BaseModel):
     page: int = 1
     page_size: int = 50
     has_more: bool = False
+    stale: bool = False  # True if served past TTL while being refreshed
 
 
 # Cluster Utilization models for Phase 4
@@ -0,0 +1,217 @@
+"""Refresh-version change detection driving response cache invalidation.
+
+The Delta cache tables change only when the refresh-metrics-cache job
+runs, which bumps a version marker in the single-row ``refresh_version``
+table when it finishes. This module polls that marker (a one-row point
+read) and, when it moves:
+
+1. re-syncs the in-memory table snapshots (cache_snapshot.py),
+2. rebuilds the hot keys of the dependent response-cache namespaces
+   (health, alerts, cost, historical) in place, so readers never miss,
+3. drops the remaining entries of those namespaces that predate the new
+   version.
+
+While the marker is being read successfully, responses built from the
+Delta cache are stored with ``ttl()`` (an hour) instead of blind 2-10
+minute TTLs: they stay valid until the data actually changes. If the
+marker cannot be read (older refresh job, warehouse down) the normal TTLs
+apply and snapshots re-sync on every poll from their own table versions.
+
+Usage:
+    from job_monitor.backend.refresh_version import refresh_version_watcher
+
+    asyncio.create_task(refresh_version_watcher.run(app))
+    response_cache.set(key, dataset, refresh_version_watcher.ttl(TTL_STANDARD))
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from job_monitor.backend.cache_refresher import HotKeyRefresher, hot_key_refresher
+from job_monitor.backend.cache_snapshot import CacheSnapshots, cache_snapshots
+from job_monitor.backend.config import settings
+from job_monitor.backend.response_cache import ResponseCache, response_cache
+from job_monitor.backend.result_decoder import decode_result, has_rows
+from job_monitor.backend.statement_executor import TIMEOUT_QUICK, statement_executor
+
+logger = logging.getLogger(__name__)
+
+# Seconds between version polls
+VERSION_POLL_SECONDS = 30
+# Response cache namespaces computed from the Delta cache tables
+DEPENDENT_NAMESPACES = frozenset({"health", "alerts", "cost", "historical"})
+# TTL of Delta-cache responses while the version is tracked (the version, not the TTL, expires them)
+TTL_UNTIL_REFRESH = 3600
+# Go back to blind TTLs if the version could not be read for this long
+VERSION_MAX_UNCHECKED_SECONDS = 300
+
+
+class RefreshVersionWatcher:
+    """Polls the refresh version and invalidates dependent caches when it moves."""
+
+    def __init__(
+        self,
+        cache: ResponseCache = response_cache,
+        snapshots: CacheSnapshots | None = cache_snapshots,
+        refresher: HotKeyRefresher | None = hot_key_refresher,
+        namespaces: frozenset[str] = DEPENDENT_NAMESPACES,
+        interval_seconds: float = VERSION_POLL_SECONDS,
+    ):
+        """Initialize watcher.
+
+        Args:
+            cache: Response cache to invalidate
+            snapshots: Snapshot store to re-sync (None if snapshots are disabled)
+            refresher: Hot-key refresher used to rebuild hot keys (None to only invalidate)
+            namespaces: Response cache namespaces that depend on the cache tables
+            interval_seconds: Time between polls
+        """
+        self._cache = cache
+        self._snapshots = snapshots
+        self._refresher = refresher
+        self._namespaces = namespaces
+        self._interval = interval_seconds
+        self._version: int | None = None
+        self._checked_at: float | None = None
+        self._changes = 0
+        self._invalidated = 0
+        self._rebuilt = 0
+        self._last_change_at: float | None = None
+
+    @property
+    def version(self) -> int | None:
+        """Last refresh version seen."""
+        return self._version
+
+    @property
+    def tracking(self) -> bool:
+        """Whether the version is being read successfully."""
+        return (
+            self._version is not None
+            and self._checked_at is not None
+            and time.time() - self._checked_at <= VERSION_MAX_UNCHECKED_SECONDS
+        )
+
+    def ttl(self, default: int) -> int:
+        """TTL for a response built from the Delta cache tables.
+
+        Args:
+            default: TTL used when the version is not tracked
+
+        Returns:
+            TTL_UNTIL_REFRESH while tracking, else ``default``
+        """
+        return max(default, TTL_UNTIL_REFRESH) if self.tracking else default
+
+    async def fetch_version(self, ws) -> int | None:
+        """Read the current refresh version.
+
+        Returns:
+            The version, or None if the marker is missing or unreadable
+        """
+        query = f"SELECT version FROM {settings.cache_table_prefix}.refresh_version WHERE name = 'metrics_cache'"
+        try:
+            result = await statement_executor.execute(
+                ws,
+                query,
+                warehouse_id=settings.warehouse_id,
+                timeout=TIMEOUT_QUICK,
+            )
+            if result and result.status and result.status.error:
+                logger.debug(f"[CACHE_VERSION] refresh_version query error: {result.status.error}")
+                return None
+            if not has_rows(result):
+                return None
+            return decode_result(result, [("version", "LONG")])["version"][0]
+        except Exception as e:
+            logger.debug(f"[CACHE_VERSION] refresh_version query failed: {e}")
+            return None
+
+    async def on_change(self, ws) -> None:
+        """Re-sync snapshots, rebuild hot dependent keys, then drop the rest."""
+        started = time.time()
+        if self._snapshots is not None:
+            await self._snapshots.sync(ws)
+        rebuilt = 0
+        if self._refresher is not None:
+            rebuilt = await self._refresher.refresh_targets(ws, self._refresher.hot(self._namespaces))
+        invalidated = sum(
+            self._cache.invalidate_namespace(namespace, created_before=started)
+            for namespace in self._namespaces
+        )
+        self._rebuilt += rebuilt
+        self._invalidated += invalidated
+        logger.info(
+            f"[CACHE_VERSION] Refresh version {self._version}: rebuilt {rebuilt} hot keys, "
+            f"invalidated {invalidated} entries in {sorted(self._namespaces)}"
+        )
+
+    async def check(self, ws) -> bool:
+        """Poll the version once and react if it moved.
+
+        Returns:
+            True if the version changed since the last poll
+        """
+        if not settings.use_cache or not ws or not settings.warehouse_id:
+            return False
+        version = await self.fetch_version(ws)
+        if version is None:
+            # No marker: snapshots fall back to their own per-table version check
+            if self._snapshots is not None:
+                await self._snapshots.sync(ws)
+            return False
+
+        previous = self._version
+        self._version = version
+        self._checked_at = time.time()
+        if previous is None:
+            # First poll: nothing cached yet depends on an older version
+            if self._snapshots is not None:
+                await self._snapshots.sync(ws)
+            return False
+        if version == previous:
+            if self._snapshots is not None:
+                self._snapshots.confirm()
+            return False
+
+        self._changes += 1
+        self._last_change_at = self._checked_at
+        await self.on_change(ws)
+        return True
+
+    async def run(self, app) -> None:
+        """Poll loop; uses the service principal client from app state."""
+        logger.info(f"[CACHE_VERSION] Refresh version watcher started (interval={self._interval}s)")
+        while True:
+            ws = getattr(app.state, "workspace_client", None)
+            if ws:
+                try:
+                    await self.check(ws)
+                except Exception as e:
+                    logger.warning(f"[CACHE_VERSION] Version check failed: {e}")
+            await asyncio.sleep(self._interval)
+
+    def stats(self) -> dict[str, Any]:
+        """Get watcher statistics.
+
+        Returns:
+            Dict with current version, tracking state and change counters
+        """
+        return {
+            "version": self._version,
+            "tracking": self.tracking,
+            "checked_at": self._checked_at,
+            "changes": self._changes,
+            "last_change_at": self._last_change_at,
+            "rebuilt": self._rebuilt,
+            "invalidated": self._invalidated,
+        }
+
+
+# Global watcher; snapshots and hot-key rebuilds follow their config switches
+refresh_version_watcher = RefreshVersionWatcher(
+    snapshots=cache_snapshots if settings.cache_snapshot_enabled else None,
+    refresher=hot_key_refresher if settings.cache_hot_refresh_enabled else None,
+)
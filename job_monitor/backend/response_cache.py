@@ -9,55 +9,482 @@ Usage:
     @router.get("/expensive-endpoint")
     async def get_data():
         cache_key = "expensive_data"
-        cached = response_cache.get(cache_key)
+        cached = await response_cache.aget(cache_key)
         if cached:
             return cached
 
         result = await expensive_operation()
         response_cache.set(cache_key, result, ttl_seconds=300)
         return result
+
+Stale-while-revalidate: entries set with ``stale_ttl`` stay servable for
+that long after expiry. ``get_swr`` returns them flagged as stale, and
+``revalidate`` recomputes them in one background task per key:
+
+    value, stale = await response_cache.aget_swr(cache_key)
+    if value is not None:
+        if stale:
+            response_cache.revalidate(cache_key, lambda: get_data())
+        return value
+
+Paginated endpoints cache a CachedDataset (the full sorted item list plus
+its aggregates) under a key without page/page_size, and build each page
+response by slicing it:
+
+    dataset = response_cache.get("health_metrics:7:all")
+    items, has_more = dataset.page(page, page_size)
+
+With an L2 backend, coroutines use ``aget``/``aget_swr`` so L1 misses
+read L2 in a worker thread, and ``set`` from a coroutine queues the L2
+write on a single background writer; ``get``/``get_swr`` stay for
+synchronous callers.
 """
 
+import asyncio
+import contextvars
 import logging
+import sys
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from threading import Lock
 from typing import Any
 
+from pydantic import BaseModel
+
+from job_monitor.backend.cache_backends import (
+    INVALIDATE_KEY,
+    INVALIDATE_PREFIX,
+    BackendEntry,
+    CacheBackend,
+    create_backend,
+    deserialize,
+    serialize,
+)
+from job_monitor.backend.config import settings
+
 logger = logging.getLogger(__name__)
 
 
+# Response cache namespaces, matched by cache key prefix (text before the first ':')
+NAMESPACE_PREFIXES = {
+    "health_metrics": "health",
+    "health_summary": "health",
+    "alerts": "alerts",
+    "cost_summary": "cost",
+    "cost_anomalies": "cost",
+    "historical": "historical",
+    "batch_runs": "historical",
+    "active_runs_all": "active_runs",
+    "job_runs": "active_runs",
+    "encoded": "encoded",
+}
+DEFAULT_NAMESPACE = "default"
+
+MB = 1024 * 1024
+
+# How often other processes' invalidations are checked (seconds)
+INVALIDATION_POLL_SECONDS = 1.0
+# Lists and tuples longer than this are sized from an evenly spaced sample
+SIZE_SAMPLE = 64
+
+
+@dataclass(frozen=True)
+class NamespaceQuota:
+    """Per-namespace limits so one endpoint cannot evict another's entries."""
+    max_entries: int
+    max_bytes: int
+
+
+# Per-namespace quotas (entries, approximate serialized bytes)
+NAMESPACE_QUOTAS = {
+    "health": NamespaceQuota(max_entries=50, max_bytes=64 * MB),
+    "alerts": NamespaceQuota(max_entries=50, max_bytes=32 * MB),
+    "cost": NamespaceQuota(max_entries=50, max_bytes=64 * MB),
+    "historical": NamespaceQuota(max_entries=100, max_bytes=32 * MB),
+    "active_runs": NamespaceQuota(max_entries=200, max_bytes=16 * MB),
+    "encoded": NamespaceQuota(max_entries=300, max_bytes=64 * MB),
+    DEFAULT_NAMESPACE: NamespaceQuota(max_entries=100, max_bytes=16 * MB),
+}
+
+
+def namespace_for(key: str) -> str:
+    """Get the namespace of a cache key from its prefix."""
+    return NAMESPACE_PREFIXES.get(key.split(":", 1)[0], DEFAULT_NAMESPACE)
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value in bytes.
+
+    Pydantic models are measured by their JSON size; containers are walked
+    recursively, and long lists are extrapolated from SIZE_SAMPLE of their
+    items so sizing a large dataset stays cheap on every ``set()``. This
+    is a relative measure for quota accounting, not an exact count of
+    Python object overhead.
+    """
+    if isinstance(value, CachedDataset):
+        return estimate_size(value.items) + estimate_size(value.aggregates)
+    if isinstance(value, BaseModel):
+        try:
+            return len(value.model_dump_json())
+        except Exception:
+            return sys.getsizeof(value)
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)) and len(value) > SIZE_SAMPLE:
+        step = len(value) / SIZE_SAMPLE
+        sample = sum(estimate_size(value[int(i * step)]) for i in range(SIZE_SAMPLE))
+        return sys.getsizeof(value) + sample * len(value) // SIZE_SAMPLE
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+# Key being recomputed by the current revalidation task; reads of it miss
+_revalidating_key: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "response_cache_revalidating_key", default=None
+)
+
+# Entries read or written while building the current HTTP response, as
+# (key, created_at, is_stale); see encoded_response
+_dependencies: contextvars.ContextVar[list[tuple[str, float, bool]] | None] = contextvars.ContextVar(
+    "response_cache_dependencies", default=None
+)
+
+
+def track_dependencies() -> tuple[list[tuple[str, float, bool]], contextvars.Token]:
+    """Start recording the cache entries the current request depends on.
+
+    Returns:
+        Tuple of (list filled with (key, created_at, is_stale), token for
+        ``_dependencies.reset``)
+    """
+    deps: list[tuple[str, float, bool]] = []
+    return deps, _dependencies.set(deps)
+
+
+def _record_dependency(key: str, created_at: float, is_stale: bool) -> None:
+    """Record a cache read/write for the response being built, if tracked."""
+    deps = _dependencies.get()
+    if deps is not None:
+        deps.append((key, created_at, is_stale))
+
+
 @dataclass
 class CacheEntry:
-    """Cache entry with value and expiration time."""
+    """Cache entry with value, expiration time and accounted size.
+
+    ``stale_until`` is when the entry stops being servable as stale
+    (equal to ``expires_at`` when stale-while-revalidate is not used).
+    """
     value: Any
     expires_at: float
     created_at: float
+    namespace: str = DEFAULT_NAMESPACE
+    size_bytes: int = 0
+    stale_until: float = 0.0
+
+
+@dataclass
+class _NamespaceState:
+    """LRU order, byte total and counters of one namespace."""
+    keys: OrderedDict[str, None] = field(default_factory=OrderedDict)
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def paginate(items: list, page: int, page_size: int) -> tuple[list, bool]:
+    """Slice one page out of a list.
+
+    Args:
+        items: Full sorted list
+        page: Page number (1-indexed)
+        page_size: Items per page
+
+    Returns:
+        Tuple of (page items, has_more)
+    """
+    start_idx = (page - 1) * page_size
+    end_idx = start_idx + page_size
+    return items[start_idx:end_idx], end_idx < len(items)
+
+
+@dataclass
+class CachedDataset:
+    """Fully materialized, sorted dataset shared by every page of an endpoint.
+
+    Cached once per window/workspace; pages and filters are served from it
+    by slicing instead of re-querying, re-sorting and re-counting.
+    """
+    items: list
+    aggregates: dict[str, Any] = field(default_factory=dict)
+    from_cache: bool = False
+    _views: dict[Any, "CachedDataset"] = field(default_factory=dict, repr=False)
+    _indexes: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def total(self) -> int:
+        """Number of items in the dataset."""
+        return len(self.items)
+
+    def page(self, page: int, page_size: int) -> tuple[list, bool]:
+        """Get one page of items and whether more pages follow."""
+        return paginate(self.items, page, page_size)
+
+    def view(
+        self,
+        key: Any,
+        predicate: Callable[[Any], bool],
+        count: Callable[[list], dict[str, Any]] | None = None,
+    ) -> "CachedDataset":
+        """Get a filtered sub-dataset, computed once per filter key.
+
+        Filtering keeps the dataset's sort order, so views can be paged the
+        same way as the dataset itself.
+
+        Args:
+            key: Hashable filter identity (e.g. sorted filter values)
+            predicate: Item filter
+            count: Optional function computing the view's aggregates
+
+        Returns:
+            Memoized CachedDataset for the filter
+        """
+        view = self._views.get(key)
+        if view is None:
+            items = [item for item in self.items if predicate(item)]
+            view = CachedDataset(
+                items=items,
+                aggregates=count(items) if count else {},
+                from_cache=self.from_cache,
+            )
+            self._views[key] = view
+        return view
+
+    def indexed(self, name: str, build: Callable[[list], Any]) -> Any:
+        """Get an index over the dataset's items, built once per name.
+
+        Args:
+            name: Index identity
+            build: Builds the index from the items
+
+        Returns:
+            Memoized index (lives and expires with the dataset)
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            index = build(self.items)
+            self._indexes[name] = index
+        return index
 
 
 class ResponseCache:
-    """Thread-safe in-memory cache with TTL support.
+    """Thread-safe in-memory LRU cache with TTL support.
 
     Features:
     - TTL-based expiration
-    - Automatic cleanup of expired entries
+    - O(1) LRU eviction (OrderedDict, no sorting)
+    - Memory-bounded: max entries and approximate total bytes
+    - Per-namespace quotas and hit/miss/eviction counters
+    - Stale-while-revalidate with a max-staleness bound
+    - Optional shared L2 backend (SQLite/Redis) with cross-process invalidation
     - Thread-safe operations
-    - Memory-bounded (max entries limit)
     """
 
-    def __init__(self, max_entries: int = 100, default_ttl: int = 300):
+    def __init__(
+        self,
+        max_entries: int = 500,
+        default_ttl: int = 300,
+        max_bytes: int = 256 * MB,
+        quotas: dict[str, NamespaceQuota] | None = None,
+        backend: CacheBackend | None = None,
+    ):
         """Initialize cache.
 
         Args:
             max_entries: Maximum number of cache entries (LRU eviction)
             default_ttl: Default TTL in seconds (5 minutes)
+            max_bytes: Maximum approximate size of all entries
+            quotas: Per-namespace limits (defaults to NAMESPACE_QUOTAS)
+            backend: Shared L2 store (see cache_backends), None for memory only
         """
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = Lock()
         self._max_entries = max_entries
+        self._max_bytes = max_bytes
         self._default_ttl = default_ttl
+        self._quotas = quotas if quotas is not None else NAMESPACE_QUOTAS
+        self._namespaces: dict[str, _NamespaceState] = {}
+        self._bytes = 0
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._stale_hits = 0
+        self._revalidations = 0
+        self._revalidation_errors = 0
+        self._refreshing: dict[str, asyncio.Task] = {}
+        # Decayed read counts per key, used to pick hot keys for proactive refresh
+        self._access: dict[str, float] = {}
+        # Shared L2 backend and cross-process invalidation state
+        self._backend: CacheBackend | None = None
+        self._l2_hits = 0
+        self._l2_misses = 0
+        self._l2_errors = 0
+        self._invalidation_seq = 0
+        self._next_invalidation_poll = 0.0
+        self._own_invalidations: set[int] = set()
+        # Single background thread for L2 writes made from the event loop (FIFO keeps them ordered)
+        self._l2_writer: ThreadPoolExecutor | None = None
+        if backend is not None:
+            self.set_backend(backend)
+
+    def _namespace(self, name: str) -> _NamespaceState:
+        """Get (or create) namespace state (must be called with lock held)."""
+        state = self._namespaces.get(name)
+        if state is None:
+            state = self._namespaces[name] = _NamespaceState()
+        return state
+
+    def _quota(self, name: str) -> NamespaceQuota:
+        """Get the quota of a namespace."""
+        return self._quotas.get(name) or self._quotas.get(
+            DEFAULT_NAMESPACE, NamespaceQuota(self._max_entries, self._max_bytes)
+        )
+
+    def _remove(self, key: str) -> CacheEntry:
+        """Remove an entry and its accounting (must be called with lock held)."""
+        entry = self._cache.pop(key)
+        state = self._namespace(entry.namespace)
+        del state.keys[key]
+        state.bytes -= entry.size_bytes
+        self._bytes -= entry.size_bytes
+        return entry
+
+    def _evict(self, key: str) -> None:
+        """Evict an entry and count it (must be called with lock held)."""
+        entry = self._remove(key)
+        self._evictions += 1
+        self._namespace(entry.namespace).evictions += 1
+        logger.debug(f"[RESPONSE_CACHE] EVICT: {key} ({entry.namespace}, {entry.size_bytes} bytes)")
+
+    def _lookup(self, key: str, allow_stale: bool) -> tuple[Any | None, bool]:
+        """Look up an entry in memory, then in the L2 backend (blocking).
+
+        Returns:
+            Tuple of (value, is_stale)
+        """
+        if _revalidating_key.get() == key:
+            # The revalidation task must recompute, not read the stale value
+            return None, False
+
+        self._poll_invalidations()
+        found, value, is_stale, stale_value, now = self._lookup_local(key, allow_stale)
+        if found:
+            return value, is_stale
+        shared = self._backend_get(key) if self._backend is not None else (None, None)
+        return self._lookup_done(key, allow_stale, stale_value, now, *shared)
+
+    async def _alookup(self, key: str, allow_stale: bool) -> tuple[Any | None, bool]:
+        """Like ``_lookup``, with L2 round-trips run in a worker thread.
+
+        Returns:
+            Tuple of (value, is_stale)
+        """
+        if _revalidating_key.get() == key:
+            return None, False
+
+        if self._backend is not None and time.time() >= self._next_invalidation_poll:
+            await asyncio.to_thread(self._poll_invalidations)
+        found, value, is_stale, stale_value, now = self._lookup_local(key, allow_stale)
+        if found:
+            return value, is_stale
+        shared = await asyncio.to_thread(self._backend_get, key) if self._backend is not None else (None, None)
+        return self._lookup_done(key, allow_stale, stale_value, now, *shared)
+
+    def _lookup_local(
+        self, key: str, allow_stale: bool
+    ) -> tuple[bool, Any | None, bool, CacheEntry | None, float]:
+        """Look up an entry in memory.
+
+        Returns:
+            Tuple of (found, value, is_stale, stale entry kept for after L2, lookup time)
+        """
+        stale_value = None
+        with self._lock:
+            self._access[key] = self._access.get(key, 0.0) + 1
+            entry = self._cache.get(key)
+            state = self._namespace(entry.namespace if entry else namespace_for(key))
+            now = time.time()
+            if entry is not None and now > entry.stale_until:
+                # Entry expired past any stale window, remove it
+                self._remove(key)
+                logger.debug(f"[RESPONSE_CACHE] EXPIRED: {key}")
+                entry = None
+
+            if entry is not None:
+                if now <= entry.expires_at:
+                    self._record_hit(key, entry, state, now, is_stale=False)
+                    return True, entry.value, False, None, now
+                if allow_stale:
+                    stale_value = entry
+        # In-memory miss or stale: another process may hold a fresher value
+        return False, None, False, stale_value, now
+
+    def _lookup_done(
+        self,
+        key: str,
+        allow_stale: bool,
+        stale_value: CacheEntry | None,
+        now: float,
+        value: Any,
+        shared: BackendEntry | None,
+    ) -> tuple[Any | None, bool]:
+        """Finish a lookup with the L2 result (value, shared are None on an L2 miss).
+
+        Returns:
+            Tuple of (value, is_stale)
+        """
+        if shared is not None and (now <= shared.expires_at or (allow_stale and stale_value is None)):
+            entry = self._store_local(key, value, shared.expires_at, shared.stale_until, shared.created_at)
+            with self._lock:
+                self._l2_hits += 1
+                if entry is not None:
+                    self._record_hit(key, entry, self._namespace(entry.namespace), now, is_stale=now > entry.expires_at)
+            return value, now > shared.expires_at
+
+        with self._lock:
+            state = self._namespace(namespace_for(key))
+            if stale_value is not None:
+                self._record_hit(key, stale_value, state, now, is_stale=True)
+                return stale_value.value, True
+            self._misses += 1
+            state.misses += 1
+            return None, False
+
+    def _record_hit(
+        self, key: str, entry: CacheEntry, state: _NamespaceState, now: float, is_stale: bool
+    ) -> None:
+        """Count a hit and refresh LRU position (must be called with lock held)."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            state.keys.move_to_end(key)
+        self._hits += 1
+        state.hits += 1
+        _record_dependency(key, entry.created_at, is_stale)
+        age_ms = int((now - entry.created_at) * 1000)
+        if is_stale:
+            self._stale_hits += 1
+            logger.info(f"[RESPONSE_CACHE] STALE_HIT: {key} (age: {age_ms}ms)")
+        else:
+            logger.info(f"[RESPONSE_CACHE] HIT: {key} (age: {age_ms}ms)")
 
     def get(self, key: str) -> Any | None:
         """Get cached value if exists and not expired.
@@ -68,46 +495,352 @@ class ResponseCache:
         Returns:
             Cached value or None if not found/expired
         """
+        return self._lookup(key, allow_stale=False)[0]
+
+    def get_swr(self, key: str) -> tuple[Any | None, bool]:
+        """Get cached value, including expired values still in their stale window.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value or None, is_stale). Callers serving a stale
+            value should call ``revalidate`` for the key.
+        """
+        return self._lookup(key, allow_stale=True)
+
+    async def aget(self, key: str) -> Any | None:
+        """Async ``get``: an L1 miss reads the L2 backend in a worker thread.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found/expired
+        """
+        return (await self._alookup(key, allow_stale=False))[0]
+
+    async def aget_swr(self, key: str) -> tuple[Any | None, bool]:
+        """Async ``get_swr``: an L1 miss reads the L2 backend in a worker thread.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value or None, is_stale)
+        """
+        return await self._alookup(key, allow_stale=True)
+
+    def _start_refresh(
+        self, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> tuple[asyncio.Task, bool]:
+        """Get the in-flight refresh task for a key, starting one if needed.
+
+        Returns:
+            Tuple of (task, whether it was started by this call)
+        """
+        with self._lock:
+            task = self._refreshing.get(key)
+            if task is not None and not task.done():
+                return task, False
+
+        async def _run() -> None:
+            _revalidating_key.set(key)
+            # The refresh outlives the request that triggered it
+            _dependencies.set(None)
+            started = time.time()
+            try:
+                await loader()
+                logger.info(f"[RESPONSE_CACHE] REVALIDATED: {key} ({time.time() - started:.1f}s)")
+            except Exception as e:
+                with self._lock:
+                    self._revalidation_errors += 1
+                logger.warning(f"[RESPONSE_CACHE] REVALIDATE_FAILED: {key}: {e}")
+            finally:
+                with self._lock:
+                    if self._refreshing.get(key) is asyncio.current_task():
+                        del self._refreshing[key]
+
+        task = asyncio.get_running_loop().create_task(_run())
+        with self._lock:
+            self._refreshing[key] = task
+            self._revalidations += 1
+        return task, True
+
+    def revalidate(self, key: str, loader: Callable[[], Awaitable[Any]]) -> bool:
+        """Recompute a key in the background (at most one task per key).
+
+        The loader is expected to store the fresh value with ``set`` (as
+        endpoint functions do); reads of ``key`` inside it miss so that it
+        recomputes instead of returning the stale entry.
+
+        Args:
+            key: Cache key being refreshed
+            loader: Zero-argument coroutine function that recomputes the value
+
+        Returns:
+            True if a new background task was started
+        """
+        try:
+            _, started = self._start_refresh(key, loader)
+        except RuntimeError:
+            logger.debug(f"[RESPONSE_CACHE] No running event loop to revalidate {key}")
+            return False
+        return started
+
+    async def refresh(self, key: str, loader: Callable[[], Awaitable[Any]]) -> None:
+        """Recompute a key and wait for it (joins an in-flight revalidation).
+
+        Errors are logged and counted, never raised.
+        """
+        task, _ = self._start_refresh(key, loader)
+        await asyncio.shield(task)
+
+    def current_version(self, key: str) -> float | None:
+        """Creation time of a fresh in-memory entry, or None if absent/expired.
+
+        Counts as a read for hot-key tracking, so keys served through
+        derived (e.g. pre-encoded) responses keep being refreshed.
+        """
         with self._lock:
+            self._access[key] = self._access.get(key, 0.0) + 1
             entry = self._cache.get(key)
-            if entry is None:
-                self._misses += 1
+            if entry is None or time.time() > entry.expires_at:
                 return None
+            return entry.created_at
 
-            if time.time() > entry.expires_at:
-                # Entry expired, remove it
-                del self._cache[key]
-                self._misses += 1
-                logger.debug(f"[RESPONSE_CACHE] EXPIRED: {key}")
+    def ttl_remaining(self, key: str) -> float | None:
+        """Seconds until a key expires (negative once stale), or None if absent."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
+            return entry.expires_at - time.time()
 
-            self._hits += 1
-            age_ms = int((time.time() - entry.created_at) * 1000)
-            logger.info(f"[RESPONSE_CACHE] HIT: {key} (age: {age_ms}ms)")
-            return entry.value
+    def hot_keys(self, limit: int | None = None) -> list[tuple[str, float]]:
+        """Get the most frequently read keys with their decayed read counts."""
+        with self._lock:
+            ranked = sorted(self._access.items(), key=lambda kv: kv[1], reverse=True)
+        return ranked[:limit] if limit is not None else ranked
+
+    def decay_access_counts(self, factor: float = 0.5, min_count: float = 0.1) -> None:
+        """Age read counts so hotness reflects recent traffic.
+
+        Args:
+            factor: Multiplier applied to every count
+            min_count: Counts decayed below this are dropped
+        """
+        with self._lock:
+            self._access = {
+                k: v * factor for k, v in self._access.items() if v * factor >= min_count
+            }
 
-    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int | None = None,
+        stale_ttl: int = 0,
+    ) -> None:
         """Set cache value with TTL.
 
+        Evicts least recently used entries of the same namespace when its
+        quota is exceeded, then global LRU entries when the cache is full.
+        Values larger than their namespace quota are not cached.
+
         Args:
             key: Cache key
             value: Value to cache
             ttl_seconds: TTL in seconds (uses default if None)
+            stale_ttl: Seconds after expiry the value may still be served
+                by ``get_swr`` while it is revalidated (0 disables SWR)
         """
         ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
         now = time.time()
+        entry = self._store_local(key, value, now + ttl, now + ttl + stale_ttl, now)
+        if entry is None:
+            return
+        logger.info(f"[RESPONSE_CACHE] SET: {key} (ttl: {ttl}s, {entry.size_bytes} bytes)")
+        _record_dependency(key, entry.created_at, False)
+        if self._backend is not None:
+            self._run_l2(self._backend_set, key, entry)
 
-        with self._lock:
-            # Evict oldest entries if at capacity
-            if len(self._cache) >= self._max_entries:
-                self._evict_oldest()
+    def _store_local(
+        self, key: str, value: Any, expires_at: float, stale_until: float, created_at: float
+    ) -> CacheEntry | None:
+        """Store a value in memory, enforcing quotas.
 
-            self._cache[key] = CacheEntry(
+        Returns:
+            The stored entry, or None if the value exceeds its quota
+        """
+        namespace = namespace_for(key)
+        quota = self._quota(namespace)
+        size_bytes = estimate_size(value)
+
+        if size_bytes > quota.max_bytes or size_bytes > self._max_bytes:
+            logger.warning(
+                f"[RESPONSE_CACHE] SKIP: {key} ({size_bytes} bytes exceeds {namespace} quota)"
+            )
+            with self._lock:
+                if key in self._cache:
+                    self._remove(key)
+            return None
+
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+
+            state = self._namespace(namespace)
+            # Namespace quota: evict this namespace's LRU entries only
+            while state.keys and (
+                len(state.keys) >= quota.max_entries
+                or state.bytes + size_bytes > quota.max_bytes
+            ):
+                self._evict(next(iter(state.keys)))
+            # Global bounds: evict the overall LRU entries
+            while self._cache and (
+                len(self._cache) >= self._max_entries
+                or self._bytes + size_bytes > self._max_bytes
+            ):
+                self._evict(next(iter(self._cache)))
+
+            entry = CacheEntry(
                 value=value,
-                expires_at=now + ttl,
-                created_at=now,
+                expires_at=expires_at,
+                created_at=created_at,
+                namespace=namespace,
+                size_bytes=size_bytes,
+                stale_until=stale_until,
+            )
+            self._cache[key] = entry
+            state.keys[key] = None
+            state.bytes += size_bytes
+            self._bytes += size_bytes
+            return entry
+
+    # ----- L2 backend -----
+
+    def set_backend(self, backend: CacheBackend | None) -> None:
+        """Attach (or detach) a shared L2 backend.
+
+        Invalidations published before attaching are skipped: this
+        process has nothing cached from before.
+        """
+        seq = 0
+        if backend is not None:
+            try:
+                seq = backend.latest_invalidation()
+            except Exception as e:
+                logger.warning(f"[RESPONSE_CACHE] L2 backend unavailable: {e}")
+        with self._lock:
+            self._backend = backend
+            self._invalidation_seq = seq
+            self._next_invalidation_poll = 0.0
+
+    def _backend_error(self, action: str, key: str, error: Exception) -> None:
+        """Count and log an L2 failure; the cache keeps working from memory."""
+        with self._lock:
+            self._l2_errors += 1
+        logger.warning(f"[RESPONSE_CACHE] L2 {action} failed for {key}: {error}")
+
+    def _run_l2(self, fn: Callable[..., None], *args: Any) -> None:
+        """Run an L2 write off the event loop.
+
+        Called from a coroutine, the write is queued on the background
+        writer so serialization and the round-trip never block requests;
+        called from plain (sync) code, it runs inline.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            fn(*args)
+            return
+        with self._lock:
+            if self._l2_writer is None:
+                self._l2_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="response-cache-l2")
+            writer = self._l2_writer
+        writer.submit(fn, *args)
+
+    def flush_backend_writes(self) -> None:
+        """Block until queued L2 writes have been applied."""
+        with self._lock:
+            writer = self._l2_writer
+        if writer is not None:
+            writer.submit(lambda: None).result()
+
+    def _backend_get(self, key: str) -> tuple[Any, BackendEntry | None]:
+        """Read and deserialize a key from L2."""
+        try:
+            shared = self._backend.get(key)
+            if shared is None:
+                with self._lock:
+                    self._l2_misses += 1
+                return None, None
+            return deserialize(shared.payload), shared
+        except Exception as e:
+            self._backend_error("get", key, e)
+            return None, None
+
+    def _backend_set(self, key: str, entry: CacheEntry) -> None:
+        """Serialize and write an entry to L2."""
+        try:
+            payload = serialize(entry.value)
+            self._backend.set(
+                key, BackendEntry(payload, entry.expires_at, entry.stale_until, entry.created_at)
             )
-            logger.info(f"[RESPONSE_CACHE] SET: {key} (ttl: {ttl}s)")
+        except Exception as e:
+            self._backend_error("set", key, e)
+
+    def _publish(self, kind: str, value: str) -> None:
+        """Delete from L2 and tell other processes to drop their copies."""
+        if self._backend is None:
+            return
+        # Same queue as the writes, so a queued set can't land after its invalidation
+        self._run_l2(self._publish_now, kind, value)
+
+    def _publish_now(self, kind: str, value: str) -> None:
+        """Apply an invalidation to L2 (blocking)."""
+        try:
+            if kind == INVALIDATE_KEY:
+                self._backend.delete(value)
+            else:
+                self._backend.delete_prefix(value)
+            seq = self._backend.publish_invalidation(kind, value)
+            with self._lock:
+                self._own_invalidations.add(seq)
+        except Exception as e:
+            self._backend_error("invalidate", value, e)
+
+    def _poll_invalidations(self) -> None:
+        """Apply invalidations published by other processes (throttled)."""
+        if self._backend is None:
+            return
+        now = time.time()
+        with self._lock:
+            if now < self._next_invalidation_poll:
+                return
+            self._next_invalidation_poll = now + INVALIDATION_POLL_SECONDS
+            since = self._invalidation_seq
+        try:
+            latest, entries = self._backend.invalidations_since(since)
+        except Exception as e:
+            self._backend_error("poll", "invalidations", e)
+            return
+
+        with self._lock:
+            self._invalidation_seq = max(self._invalidation_seq, latest)
+            for seq, kind, value in entries:
+                if seq in self._own_invalidations:
+                    self._own_invalidations.discard(seq)
+                    continue
+                if kind == INVALIDATE_KEY:
+                    keys = [value] if value in self._cache else []
+                else:
+                    keys = [k for k in self._cache if k.startswith(value)]
+                for key in keys:
+                    self._remove(key)
+                if keys:
+                    logger.info(f"[RESPONSE_CACHE] REMOTE_INVALIDATE: {kind} {value!r} ({len(keys)} entries)")
 
     def invalidate(self, key: str) -> bool:
         """Remove specific entry from cache.
@@ -119,11 +852,12 @@ class ResponseCache:
             True if entry was removed, False if not found
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            removed = key in self._cache
+            if removed:
+                self._remove(key)
                 logger.info(f"[RESPONSE_CACHE] INVALIDATE: {key}")
-                return True
-            return False
+        self._publish(INVALIDATE_KEY, key)
+        return removed
 
     def invalidate_pattern(self, prefix: str) -> int:
         """Remove all entries matching a prefix.
@@ -137,37 +871,51 @@ class ResponseCache:
         with self._lock:
             keys_to_remove = [k for k in self._cache if k.startswith(prefix)]
             for key in keys_to_remove:
-                del self._cache[key]
+                self._remove(key)
             if keys_to_remove:
                 logger.info(f"[RESPONSE_CACHE] INVALIDATE_PATTERN: {prefix} ({len(keys_to_remove)} entries)")
-            return len(keys_to_remove)
+        self._publish(INVALIDATE_PREFIX, prefix)
+        return len(keys_to_remove)
+
+    def invalidate_namespace(self, namespace: str, created_before: float | None = None) -> int:
+        """Remove the entries of a namespace.
+
+        Args:
+            namespace: Namespace whose entries are removed
+            created_before: Only remove entries created before this time
+                (keeps entries that were just rebuilt)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            state = self._namespace(namespace)
+            keys = [
+                k for k in state.keys
+                if created_before is None or self._cache[k].created_at < created_before
+            ]
+            for key in keys:
+                self._remove(key)
+            if keys:
+                logger.info(f"[RESPONSE_CACHE] INVALIDATE_NAMESPACE: {namespace} ({len(keys)} entries)")
+        for key in keys:
+            self._publish(INVALIDATE_KEY, key)
+        return len(keys)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            for state in self._namespaces.values():
+                state.keys.clear()
+                state.bytes = 0
+            self._bytes = 0
             logger.info(f"[RESPONSE_CACHE] CLEAR: removed {count} entries")
-
-    def _evict_oldest(self) -> None:
-        """Evict oldest entries to make room (must be called with lock held)."""
-        if not self._cache:
-            return
-
-        # Sort by creation time and remove oldest 10%
-        sorted_keys = sorted(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].created_at
-        )
-        evict_count = max(1, len(sorted_keys) // 10)
-
-        for key in sorted_keys[:evict_count]:
-            del self._cache[key]
-
-        logger.debug(f"[RESPONSE_CACHE] EVICT: removed {evict_count} oldest entries")
+        self._publish(INVALIDATE_PREFIX, "")
 
     def cleanup_expired(self) -> int:
-        """Remove all expired entries.
+        """Remove all expired entries (past their stale window).
 
         Returns:
             Number of entries removed
@@ -176,10 +924,10 @@ class ResponseCache:
         with self._lock:
             expired_keys = [
                 k for k, v in self._cache.items()
-                if now > v.expires_at
+                if now > v.stale_until
             ]
             for key in expired_keys:
-                del self._cache[key]
+                self._remove(key)
 
             if expired_keys:
                 logger.info(f"[RESPONSE_CACHE] CLEANUP: removed {len(expired_keys)} expired entries")
@@ -189,17 +937,47 @@ class ResponseCache:
         """Get cache statistics.
 
         Returns:
-            Dict with hits, misses, size, hit_rate
+            Dict with hits, misses, size, hit_rate, bytes, evictions,
+            stale-while-revalidate counters and per-namespace counters
         """
         with self._lock:
             total = self._hits + self._misses
             hit_rate = (self._hits / total * 100) if total > 0 else 0
+            namespaces = {}
+            for name, state in sorted(self._namespaces.items()):
+                quota = self._quota(name)
+                ns_total = state.hits + state.misses
+                namespaces[name] = {
+                    "hits": state.hits,
+                    "misses": state.misses,
+                    "evictions": state.evictions,
+                    "size": len(state.keys),
+                    "bytes": state.bytes,
+                    "max_entries": quota.max_entries,
+                    "max_bytes": quota.max_bytes,
+                    "hit_rate_percent": round(state.hits / ns_total * 100, 1) if ns_total else 0,
+                }
             return {
                 "hits": self._hits,
                 "misses": self._misses,
                 "size": len(self._cache),
                 "max_size": self._max_entries,
                 "hit_rate_percent": round(hit_rate, 1),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "evictions": self._evictions,
+                "stale_hits": self._stale_hits,
+                "revalidations": self._revalidations,
+                "revalidation_errors": self._revalidation_errors,
+                "revalidating": sum(1 for t in self._refreshing.values() if not t.done()),
+                "l2": {
+                    "backend": self._backend.name if self._backend else None,
+                    "hits": self._l2_hits,
+                    "misses": self._l2_misses,
+                    "errors": self._l2_errors,
+                    "invalidation_seq": self._invalidation_seq,
+                },
+                "namespaces": namespaces,
             }
 
 
@@ -208,7 +986,14 @@ class ResponseCache:
 # - Alerts: 2 minutes (needs some freshness)
 # - Health metrics: 5 minutes (can be slightly stale)
 # - Costs: 10 minutes (rarely changes quickly)
-response_cache = ResponseCache(max_entries=50, default_ttl=300)
+# Entry/byte bounds are shared; per-namespace quotas (NAMESPACE_QUOTAS) keep
+# paginated health/alerts entries from evicting cost and historical results.
+response_cache = ResponseCache(
+    max_entries=500,
+    default_ttl=300,
+    max_bytes=256 * MB,
+    backend=create_backend(settings.cache_l2_backend, settings.cache_l2_path, settings.cache_l2_url),
+)
 
 
 # Convenience TTL constants
@@ -216,3 +1001,4 @@ TTL_LIVE = 60        # 1 minute - for running jobs, current alerts
 TTL_FAST = 120       # 2 minutes - for alerts
 TTL_STANDARD = 300   # 5 minutes - for health metrics
 TTL_SLOW = 600       # 10 minutes - for costs, historical
+TTL_MAX_STALE = 1800  # 30 minutes - how long expired entries are served while revalidating
@@ -0,0 +1,372 @@
+"""Typed columnar decoding of Statement Execution API results.
+
+The JSON_ARRAY result format returns every value as a string (or None).
+Instead of casting cell by cell with ad-hoc ``int()``/``float()`` calls,
+this module transposes ``data_array`` once and applies a single converter
+per column, chosen from ``result.manifest.schema``. Callers then work on
+whole columns (lists of typed values) and only zip them back into rows or
+models at the very end.
+
+Results fetched with ``statement_executor.execute(..., fetch_all=True)``
+may carry an Arrow table instead of ``data_array``; ``decode_result``,
+``has_rows`` and ``result_rows`` handle both shapes.
+
+When ``pyarrow`` is installed, Arrow results are decoded with one cast
+per column instead of a Python conversion per cell, and so are the
+numeric columns of JSON_ARRAY results; values Arrow refuses to cast
+(e.g. "12.0" for an INT) fall back to the per-cell converters. ARRAY,
+MAP and STRUCT columns are returned as JSON text in both formats.
+
+Usage:
+    from job_monitor.backend.result_decoder import decode_result
+
+    cols = decode_result(result, JOB_COLUMNS)
+    for job_id, runs in zip(cols["job_id"], fill_null(cols["total_runs"], 0)):
+        ...
+
+The optional ``schema`` argument is the expected (name, type) list in
+SELECT order. An explicit type pins the Python type an API model expects
+(e.g. a BIGINT workspace_id served as a string); a type of None defers to
+the type reported in the manifest. Without a schema, names and types come
+from the manifest alone.
+"""
+
+import json
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pc = None
+
+# Databricks SQL type names (ColumnInfoTypeName values) grouped by decoder
+INT_TYPES = frozenset({"BYTE", "SHORT", "INT", "LONG"})
+FLOAT_TYPES = frozenset({"FLOAT", "DOUBLE", "DECIMAL"})
+BOOL_TYPES = frozenset({"BOOLEAN"})
+TIMESTAMP_TYPES = frozenset({"TIMESTAMP", "TIMESTAMP_NTZ"})
+DATE_TYPES = frozenset({"DATE"})
+STRING_TYPES = frozenset({"STRING", "CHAR", "BINARY", "INTERVAL"})
+NESTED_TYPES = frozenset({"ARRAY", "MAP", "STRUCT"})
+
+
+def _to_int(value: Any) -> int:
+    """Convert to int, accepting "12", 12, 12.0 and "12.0"."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return int(float(value))
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert Databricks "true"/"false" strings (or bools) to bool."""
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() == "true"
+
+
+def _to_datetime(value: Any) -> datetime | str:
+    """Parse an ISO timestamp; unparseable values are passed through."""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return value
+
+
+def _to_date(value: Any) -> date | str:
+    """Parse an ISO date; unparseable values are passed through."""
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return value
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoding of the scalar types found inside nested Arrow values."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+def _to_json_text(value: Any) -> str:
+    """Render an ARRAY/MAP/STRUCT value as JSON text.
+
+    JSON_ARRAY results already carry nested values as JSON strings; Arrow
+    results carry lists, dicts and (for maps) lists of key/value pairs.
+    """
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, default=_json_default)
+
+
+def _identity(value: Any) -> Any:
+    """Pass values of unknown type through unchanged."""
+    return value
+
+
+def converter_for(type_name: str | None) -> Callable[[Any], Any]:
+    """Get the value converter for a Databricks SQL type name."""
+    if not type_name:
+        return _identity
+    type_name = type_name.upper()
+    if type_name in INT_TYPES:
+        return _to_int
+    if type_name in FLOAT_TYPES:
+        return float
+    if type_name in BOOL_TYPES:
+        return _to_bool
+    if type_name in TIMESTAMP_TYPES:
+        return _to_datetime
+    if type_name in DATE_TYPES:
+        return _to_date
+    if type_name in STRING_TYPES:
+        return str
+    if type_name in NESTED_TYPES:
+        return _to_json_text
+    return _identity
+
+
+def _manifest_columns(result) -> list[tuple[str | None, str | None]] | None:
+    """Read (name, type_name) pairs from result.manifest.schema if present."""
+    manifest = getattr(result, "manifest", None)
+    schema = getattr(manifest, "schema", None) if manifest else None
+    columns = getattr(schema, "columns", None) if schema else None
+    if not isinstance(columns, (list, tuple)):
+        return None
+
+    pairs = []
+    for col in columns:
+        name = getattr(col, "name", None)
+        type_name = getattr(col, "type_name", None)
+        type_name = getattr(type_name, "value", type_name)
+        pairs.append((
+            name if isinstance(name, str) else None,
+            type_name if isinstance(type_name, str) else None,
+        ))
+    return pairs
+
+
+def _arrow_table(result):
+    """Get the Arrow table attached by ``statement_executor`` (fetch_all), if any."""
+    table = getattr(result, "arrow_table", None)
+    if pa is not None and isinstance(table, pa.Table):
+        return table
+    return None
+
+
+def has_rows(result) -> bool:
+    """Check whether a StatementResponse carries at least one row."""
+    if not result:
+        return False
+    table = _arrow_table(result)
+    if table is not None:
+        return table.num_rows > 0
+    return bool(result.result and result.result.data_array)
+
+
+def result_rows(result) -> list:
+    """Get all rows of a result as sequences, whatever the result format.
+
+    Inline/JSON results return ``data_array`` as is; Arrow results are
+    converted column by column and zipped into row tuples.
+    """
+    if not result:
+        return []
+    table = _arrow_table(result)
+    if table is not None:
+        return list(zip(*(column.to_pylist() for column in table.columns)))
+    if result.result and result.result.data_array:
+        return result.result.data_array
+    return []
+
+
+def _decode_column(values: Iterable[Any], convert: Callable[[Any], Any]) -> list[Any]:
+    """Apply a converter to a column, keeping NULLs as None."""
+    if convert is _identity:
+        return list(values)
+    return [None if v is None else convert(v) for v in values]
+
+
+def _arrow_target(type_name: str):
+    """Arrow type a column is cast to in one pass (None: no vectorized cast)."""
+    if type_name in INT_TYPES:
+        return pa.int64()
+    if type_name in FLOAT_TYPES:
+        return pa.float64()
+    if type_name in DATE_TYPES:
+        return pa.date32()
+    return None
+
+
+def _is_text(arrow_type) -> bool:
+    """Whether an Arrow type holds strings."""
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+
+def _decode_arrow_column(column, type_name: str | None) -> list[Any]:
+    """Decode one Arrow column with whole-column casts.
+
+    Args:
+        column: pyarrow Array or ChunkedArray
+        type_name: Databricks SQL type name (None keeps Arrow's own type)
+
+    Returns:
+        Column as a list of Python values, NULLs as None
+    """
+    kind = (type_name or "").upper()
+    arrow_type = column.type
+    if not kind:
+        return column.to_pylist()
+
+    target = _arrow_target(kind)
+    if target is not None:
+        if not arrow_type.equals(target):
+            try:
+                # Safe cast: truncation, overflow and unparseable strings raise
+                column = pc.cast(column, target)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                return _decode_column(column.to_pylist(), converter_for(kind))
+        return column.to_pylist()
+    if kind in BOOL_TYPES:
+        if pa.types.is_boolean(arrow_type):
+            return column.to_pylist()
+        if _is_text(arrow_type):
+            return pc.equal(pc.utf8_lower(column), "true").to_pylist()
+    if kind in STRING_TYPES and _is_text(arrow_type):
+        return column.to_pylist()
+    if kind in TIMESTAMP_TYPES and pa.types.is_timestamp(arrow_type):
+        return column.to_pylist()
+    if (kind in NESTED_TYPES or kind in STRING_TYPES) and pa.types.is_nested(arrow_type):
+        # Nested values read as text (ARRAY/MAP/STRUCT, or pinned to STRING) become JSON, not reprs
+        values = column.to_pylist()
+        if pa.types.is_map(arrow_type):
+            values = [None if v is None else dict(v) for v in values]
+        return _decode_column(values, _to_json_text)
+    return _decode_column(column.to_pylist(), converter_for(kind))
+
+
+def _decode_json_column(values: Sequence[Any], type_name: str | None) -> list[Any]:
+    """Decode one JSON_ARRAY column (strings or None).
+
+    Numeric columns go through one Arrow cast when pyarrow is installed;
+    everything else uses the per-cell converter (building date objects
+    through Arrow is slower than parsing them directly).
+    """
+    kind = (type_name or "").upper()
+    if pa is not None and (kind in INT_TYPES or kind in FLOAT_TYPES):
+        try:
+            column = pa.array(values, type=pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # Not all strings (already typed values): use the converter
+        else:
+            return _decode_arrow_column(column, kind)
+    return _decode_column(values, converter_for(type_name))
+
+
+class ColumnarResult:
+    """Decoded result: column name -> list of typed values."""
+
+    def __init__(self, names: list[str], columns: list[list[Any]]):
+        self.names = names
+        self.columns = dict(zip(names, columns))
+        self.num_rows = len(columns[0]) if columns else 0
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __bool__(self) -> bool:
+        return self.num_rows > 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __getitem__(self, name: str) -> list[Any]:
+        return self.columns[name]
+
+    def get(self, name: str, default: Any = None) -> list[Any]:
+        """Get a column, or a column filled with ``default`` if absent."""
+        if name in self.columns:
+            return self.columns[name]
+        return [default] * self.num_rows
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Materialize rows as dicts (one pass over all columns)."""
+        names = self.names
+        return [dict(zip(names, row)) for row in zip(*(self.columns[n] for n in names))]
+
+
+def decode_result(result, schema: Sequence[tuple[str, str]] | None = None) -> ColumnarResult:
+    """Decode a StatementResponse into typed columns.
+
+    Args:
+        result: StatementResponse (JSON_ARRAY rows or an attached Arrow table)
+        schema: Expected (name, type_name) pairs in SELECT order; a None
+            type_name uses the manifest type for that column
+
+    Returns:
+        ColumnarResult (empty if the result has no rows)
+    """
+    manifest = _manifest_columns(result) or []
+    table = _arrow_table(result)
+    data = None
+    if table is None and result is not None and getattr(result, "result", None) is not None:
+        data = result.result.data_array
+
+    width = len(schema) if schema else len(manifest)
+    if not width and table is not None:
+        width = table.num_columns
+    if not width and data:
+        width = len(data[0])
+    names = []
+    types = []
+    for i in range(width):
+        hint_name, hint_type = schema[i] if schema and i < len(schema) else (None, None)
+        manifest_name, manifest_type = manifest[i] if i < len(manifest) else (None, None)
+        names.append(hint_name or manifest_name or f"col_{i}")
+        types.append(hint_type or manifest_type)
+
+    if table is not None:
+        # Arrow columns are already typed; casts only normalize (e.g. Decimal -> float)
+        columns = [
+            _decode_arrow_column(table.column(i), types[i])
+            if i < table.num_columns else [None] * table.num_rows
+            for i in range(width)
+        ]
+        return ColumnarResult(names, columns)
+
+    if not data:
+        return ColumnarResult(names, [[] for _ in names])
+
+    # Pad short rows with NULLs so the transpose keeps every column
+    if any(len(row) < width for row in data):
+        data = [list(row) + [None] * (width - len(row)) for row in data]
+
+    # Single transpose of the row-major data_array, then one decode per column
+    raw_columns = list(zip(*data))
+    columns = [_decode_json_column(raw_columns[i], types[i]) for i in range(width)]
+    return ColumnarResult(names, columns)
+
+
+def fill_null(values: list[Any], default: Any) -> list[Any]:
+    """Replace NULL (None) values in a column with a default."""
+    return [default if v is None else v for v in values]
+
+
+def falsy_to(values: list[Any], default: Any) -> list[Any]:
+    """Replace NULL and falsy values (0, "") in a column with a default.
+
+    Matches the ``x if x else default`` handling of the original row parsers.
+    """
+    return [v if v else default for v in values]
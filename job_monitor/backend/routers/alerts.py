@@ -14,6 +14,7 @@ Supports cache-first loading for fast response times.
 """
 
 import asyncio
+import json
 import logging
 import traceback
 from datetime import datetime, timedelta
@@ -23,11 +24,15 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 logger = logging.getLogger(__name__)
 
-from job_monitor.backend.cache import query_alerts_cache
+from job_monitor.backend.cache import query_alerts_cache, query_underutilized_jobs_cache
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws_prefer_user
+from job_monitor.backend.encoded_response import ENCODED_KEY_PREFIX
 from job_monitor.backend.mock_data import get_mock_alerts, is_mock_mode
-from job_monitor.backend.response_cache import response_cache, TTL_FAST
+from job_monitor.backend.refresh_version import refresh_version_watcher
+from job_monitor.backend.response_cache import CachedDataset, response_cache, TTL_FAST
+from job_monitor.backend.result_decoder import decode_result, falsy_to, fill_null, has_rows
+from job_monitor.backend.statement_executor import TIMEOUT_LIVE, statement_executor
 from job_monitor.backend.models import (
     Alert,
     AlertCategory,
@@ -40,6 +45,55 @@ router = APIRouter(prefix="/api/alerts", tags=["alerts"])
 # In-memory acknowledgment store with 24-hour TTL
 _acknowledged: dict[str, datetime] = {}  # condition_key -> acknowledged_at
 
+# Alert categories generated by the live path
+ALERT_CATEGORIES = ("failure", "sla", "cost", "cluster")
+
+# Category / severity strings stored in the alerts cache table
+_CATEGORY_MAP = {
+    "failure": AlertCategory.FAILURE,
+    "sla": AlertCategory.SLA,
+    "cost": AlertCategory.COST,
+    "cluster": AlertCategory.CLUSTER,
+}
+_SEVERITY_MAP = {
+    "P1": AlertSeverity.P1,
+    "P2": AlertSeverity.P2,
+    "P3": AlertSeverity.P3,
+}
+
+# Column layouts of the live alert queries (SELECT order, Databricks type names)
+FAILURE_ALERT_COLUMNS = [
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("total_runs", "LONG"),
+    ("success_count", "LONG"),
+    ("success_rate", "DOUBLE"),
+    ("last_run_time", "TIMESTAMP"),
+    ("last_result", "STRING"),
+    ("prev_result", "STRING"),
+    ("failure_reasons", "ARRAY"),
+]
+
+COST_SPIKE_COLUMNS = [
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("total_dbus", "DOUBLE"),
+    ("p90_dbus", "DOUBLE"),
+    ("multiplier", "DOUBLE"),
+]
+
+BUDGET_USAGE_COLUMNS = [
+    ("job_id", "STRING"),
+    ("month_dbus", "DOUBLE"),
+]
+
+UNDERUTILIZED_JOB_COLUMNS = [
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("avg_dbus_per_hour", "DOUBLE"),
+    ("runs_analyzed", "LONG"),
+]
+
 
 def _is_acknowledged(condition_key: str) -> tuple[bool, datetime | None]:
     """Check if alert condition was acknowledged within 24-hour TTL.
@@ -205,11 +259,11 @@ async def _generate_failure_alerts(ws, warehouse_id: str, workspace_id: str | No
 
     try:
         logger.info(f"[alerts._generate_failure_alerts] Executing SQL on warehouse {warehouse_id}")
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=warehouse_id,
-            statement=query,
-            wait_timeout="50s",
+            timeout=TIMEOUT_LIVE,
         )
         logger.info(f"[alerts._generate_failure_alerts] SQL completed, status: {result.status.state if result and result.status else 'None'}")
         if result and result.status and result.status.error:
@@ -220,16 +274,21 @@ async def _generate_failure_alerts(ws, warehouse_id: str, workspace_id: str | No
                 logger.warning("[alerts._generate_failure_alerts] Permission denied - will use mock data")
                 return None  # Signal to use mock data
 
-        if result and result.result and result.result.data_array:
-            logger.info(f"[alerts._generate_failure_alerts] Found {len(result.result.data_array)} failure rows")
-            for row in result.result.data_array:
-                job_id = str(row[0]) if row[0] else ""
-                job_name = str(row[1]) if row[1] else f"job-{job_id}"
-                success_rate = float(row[4]) if row[4] is not None else 100.0
-                last_run_time = row[5]
-                last_result = row[6]
-                prev_result = row[7]
-                failure_reasons = row[8] if row[8] else []
+        if has_rows(result):
+            cols = decode_result(result, FAILURE_ALERT_COLUMNS)
+            logger.info(f"[alerts._generate_failure_alerts] Found {len(cols)} failure rows")
+            for job_id, job_name, success_rate, last_run_time, last_result, prev_result, reasons in zip(
+                falsy_to(cols["job_id"], ""),
+                cols["job_name"],
+                fill_null(cols["success_rate"], 100.0),
+                cols["last_run_time"],
+                cols["last_result"],
+                cols["prev_result"],
+                cols["failure_reasons"],
+            ):
+                job_name = job_name or f"job-{job_id}"
+                # COLLECT_SET arrives as JSON text
+                failure_reasons = json.loads(reasons) if reasons else []
 
                 # Determine severity and type
                 if last_result == "FAILED" and prev_result == "FAILED":
@@ -262,7 +321,7 @@ async def _generate_failure_alerts(ws, warehouse_id: str, workspace_id: str | No
                     severity=severity,
                     title=title,
                     description=description,
-                    remediation=_generate_failure_remediation(failure_reasons if isinstance(failure_reasons, list) else []),
+                    remediation=_generate_failure_remediation(failure_reasons),
                     created_at=datetime.now(),
                     acknowledged=is_ack,
                     acknowledged_at=ack_time,
@@ -429,20 +488,23 @@ async def _generate_cost_alerts(ws, warehouse_id: str, workspace_id: str | None
     """
 
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            spike_query,
             warehouse_id=warehouse_id,
-            statement=spike_query,
-            wait_timeout="50s",
+            timeout=TIMEOUT_LIVE,
         )
 
-        if result and result.result and result.result.data_array:
-            for row in result.result.data_array:
-                job_id = str(row[0]) if row[0] else ""
-                job_name = str(row[1]) if row[1] else f"job-{job_id}"
-                total_dbus = float(row[2]) if row[2] else 0
-                p90_dbus = float(row[3]) if row[3] else 0
-                multiplier = float(row[4]) if row[4] else 0
+        if has_rows(result):
+            cols = decode_result(result, COST_SPIKE_COLUMNS)
+            for job_id, job_name, total_dbus, p90_dbus, multiplier in zip(
+                falsy_to(cols["job_id"], ""),
+                cols["job_name"],
+                falsy_to(cols["total_dbus"], 0.0),
+                falsy_to(cols["p90_dbus"], 0.0),
+                falsy_to(cols["multiplier"], 0.0),
+            ):
+                job_name = job_name or f"job-{job_id}"
 
                 condition_key = f"cost_{job_id}_spike"
                 is_ack, ack_time = _is_acknowledged(condition_key)
@@ -496,15 +558,20 @@ async def _generate_cost_alerts(ws, warehouse_id: str, workspace_id: str | None
             HAVING SUM(usage_quantity) > 0
             """
 
-            result = await asyncio.to_thread(
-                ws.statement_execution.execute_statement,
+            result = await statement_executor.execute(
+                ws,
+                budget_query,
                 warehouse_id=warehouse_id,
-                statement=budget_query,
-                wait_timeout="50s",
+                timeout=TIMEOUT_LIVE,
             )
 
-            if result and result.result and result.result.data_array:
-                usage_map = {str(row[0]): float(row[1]) for row in result.result.data_array if row[0]}
+            if has_rows(result):
+                cols = decode_result(result, BUDGET_USAGE_COLUMNS)
+                usage_map = {
+                    job_id: month_dbus
+                    for job_id, month_dbus in zip(cols["job_id"], fill_null(cols["month_dbus"], 0.0))
+                    if job_id
+                }
 
                 for job_id, job_name, budget in jobs_with_budget:
                     month_usage = usage_map.get(job_id, 0)
@@ -550,10 +617,52 @@ async def _generate_cost_alerts(ws, warehouse_id: str, workspace_id: str | None
     return alerts
 
 
+def _cluster_alert(job_id: str, job_name: str, avg_dbus_per_hour: float, runs_analyzed: int) -> Alert | None:
+    """Build an over-provisioning alert for a job, or None if not over-provisioned."""
+    # Map DBU/hour to utilization (same heuristic as cluster_metrics)
+    if avg_dbus_per_hour < 1:
+        utilization = 20.0
+    elif avg_dbus_per_hour < 2:
+        utilization = 40.0
+    else:
+        return None  # Not over-provisioned
+
+    condition_key = f"cluster_{job_id}_overprov"
+    is_ack, ack_time = _is_acknowledged(condition_key)
+
+    return Alert(
+        id=f"cluster_{job_id}_overprov",
+        job_id=job_id,
+        job_name=job_name,
+        category=AlertCategory.CLUSTER,
+        severity=AlertSeverity.P3,
+        title=f"Over-provisioned (~{utilization:.0f}% utilization)",
+        description=f"Cluster running at ~{utilization:.0f}% utilization across {runs_analyzed} recent runs. Resources may be underutilized.",
+        remediation=_generate_cluster_remediation(utilization, runs_analyzed),
+        created_at=datetime.now(),
+        acknowledged=is_ack,
+        acknowledged_at=ack_time,
+        condition_key=condition_key,
+    )
+
+
 async def _generate_cluster_alerts(ws, warehouse_id: str, workspace_id: str | None = None) -> list[Alert]:
     """Generate over-provisioning alerts from cluster metrics."""
     alerts = []
 
+    # Precomputed per-job utilization (cluster_utilization_cache) replaces the fleet-wide scan
+    if settings.use_cache:
+        cached_jobs = await query_underutilized_jobs_cache(ws, workspace_id)
+        if cached_jobs is not None:
+            for job in cached_jobs:
+                alert = _cluster_alert(
+                    job["job_id"], job["job_name"] or f"job-{job['job_id']}",
+                    job["avg_dbus_per_hour"], job["runs_analyzed"],
+                )
+                if alert:
+                    alerts.append(alert)
+            return alerts
+
     # Build workspace filter clause
     # workspace_id in system tables is BIGINT, not string - don't quote it
     workspace_clause = ""
@@ -641,45 +750,24 @@ async def _generate_cluster_alerts(ws, warehouse_id: str, workspace_id: str | No
     """
 
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=warehouse_id,
-            statement=query,
-            wait_timeout="50s",
+            timeout=TIMEOUT_LIVE,
         )
 
-        if result and result.result and result.result.data_array:
-            for row in result.result.data_array:
-                job_id = str(row[0]) if row[0] else ""
-                job_name = str(row[1]) if row[1] else f"job-{job_id}"
-                avg_dbus_per_hour = float(row[2]) if row[2] else 0
-                runs_analyzed = int(row[3]) if row[3] else 0
-
-                # Map DBU/hour to utilization (same heuristic as cluster_metrics)
-                if avg_dbus_per_hour < 1:
-                    utilization = 20.0
-                elif avg_dbus_per_hour < 2:
-                    utilization = 40.0
-                else:
-                    continue  # Not over-provisioned
-
-                condition_key = f"cluster_{job_id}_overprov"
-                is_ack, ack_time = _is_acknowledged(condition_key)
-
-                alerts.append(Alert(
-                    id=f"cluster_{job_id}_overprov",
-                    job_id=job_id,
-                    job_name=job_name,
-                    category=AlertCategory.CLUSTER,
-                    severity=AlertSeverity.P3,
-                    title=f"Over-provisioned (~{utilization:.0f}% utilization)",
-                    description=f"Cluster running at ~{utilization:.0f}% utilization across {runs_analyzed} recent runs. Resources may be underutilized.",
-                    remediation=_generate_cluster_remediation(utilization, runs_analyzed),
-                    created_at=datetime.now(),
-                    acknowledged=is_ack,
-                    acknowledged_at=ack_time,
-                    condition_key=condition_key,
-                ))
+        if has_rows(result):
+            cols = decode_result(result, UNDERUTILIZED_JOB_COLUMNS)
+            for job_id, job_name, avg_dbus_per_hour, runs_analyzed in zip(
+                falsy_to(cols["job_id"], ""),
+                cols["job_name"],
+                falsy_to(cols["avg_dbus_per_hour"], 0.0),
+                falsy_to(cols["runs_analyzed"], 0),
+            ):
+                alert = _cluster_alert(job_id, job_name or f"job-{job_id}", avg_dbus_per_hour, runs_analyzed)
+                if alert:
+                    alerts.append(alert)
 
     except Exception:
         pass
@@ -712,6 +800,92 @@ def _sort_alerts(alerts: list[Alert]) -> list[Alert]:
     return sorted(alerts, key=lambda a: severity_order.get(a.severity.value, 99))
 
 
+def _count_by_severity(alerts: list[Alert]) -> dict[str, int]:
+    """Count alerts per severity."""
+    by_severity = {"P1": 0, "P2": 0, "P3": 0}
+    for alert in alerts:
+        by_severity[alert.severity.value] = by_severity.get(alert.severity.value, 0) + 1
+    return by_severity
+
+
+def _dataset_key(ws_filter: str, categories) -> str:
+    """Response cache key of the alert dataset for a workspace and category set."""
+    return f"alerts:{ws_filter}:{','.join(sorted(categories))}"
+
+
+def _alert_from_cache_row(row: dict) -> Alert:
+    """Build an Alert from an alerts_cache row."""
+    condition_key = row["alert_id"]
+    is_ack, ack_time = _is_acknowledged(condition_key)
+    return Alert(
+        id=row["alert_id"],
+        job_id=row["job_id"],
+        job_name=row["job_name"],
+        category=_CATEGORY_MAP.get(row["category"], AlertCategory.FAILURE),
+        severity=_SEVERITY_MAP.get(row["severity"], AlertSeverity.P3),
+        title=row["title"],
+        description=row["description"],
+        remediation=_generate_failure_remediation(
+            row["failure_reasons"].split(",") if row["failure_reasons"] else []
+        ) if row["category"] == "failure" else _generate_cost_remediation(
+            "spike", row["cost_multiplier"], row["baseline_p90_dbus"]
+        ) if row["category"] == "cost" else "Review job configuration.",
+        created_at=datetime.now(),
+        acknowledged=is_ack,
+        acknowledged_at=ack_time,
+        condition_key=condition_key,
+    )
+
+
+def _with_current_ack(alert: Alert) -> Alert:
+    """Return the alert with its current acknowledgment state.
+
+    Cached datasets outlive acknowledgments, so the state is re-read when
+    a page is served.
+    """
+    is_ack, ack_time = _is_acknowledged(alert.condition_key)
+    if is_ack == alert.acknowledged and ack_time == alert.acknowledged_at:
+        return alert
+    return alert.model_copy(update={"acknowledged": is_ack, "acknowledged_at": ack_time})
+
+
+def _page_from_dataset(
+    dataset: CachedDataset,
+    severity: list[str] | None,
+    category: list[str] | None,
+    acknowledged: bool | None,
+    page: int,
+    page_size: int,
+) -> AlertListOut:
+    """Filter and paginate a cached alert dataset.
+
+    Severity/category views are memoized on the dataset; the acknowledged
+    filter depends on in-memory state and is applied per request.
+    """
+    severity_set = frozenset(s.upper() for s in severity) if severity else None
+    category_set = frozenset(c.lower() for c in category) if category else None
+    if severity_set or category_set:
+        dataset = dataset.view(
+            (severity_set, category_set),
+            lambda a: (not severity_set or a.severity.value in severity_set)
+            and (not category_set or a.category.value in category_set),
+            _count_by_severity,
+        )
+    if acknowledged is not None:
+        items = [a for a in dataset.items if _is_acknowledged(a.condition_key)[0] == acknowledged]
+        dataset = CachedDataset(items=items, aggregates=_count_by_severity(items))
+
+    paginated_alerts, has_more = dataset.page(page, page_size)
+    return AlertListOut(
+        alerts=[_with_current_ack(a) for a in paginated_alerts],
+        total=dataset.total,
+        by_severity=dict(dataset.aggregates),
+        page=page,
+        page_size=page_size,
+        has_more=has_more,
+    )
+
+
 @router.get("", response_model=AlertListOut)
 async def get_alerts(
     severity: Annotated[
@@ -773,15 +947,17 @@ async def get_alerts(
         logger.warning("Warehouse ID not configured - falling back to mock alerts")
         return get_mock_alerts()
 
-    # Build cache key from request parameters (include pagination for per-page caching)
-    ws_filter = workspace_id if workspace_id else "all"
-    cache_key = f"alerts:{','.join(sorted(category or ['all']))}:{','.join(sorted(severity or ['all']))}:{acknowledged}:{ws_filter}:p{page}:{page_size}"
-
     # Check in-memory response cache first (fastest)
-    cached_response = response_cache.get(cache_key)
-    if cached_response:
-        logger.info(f"[RESPONSE_CACHE] Returning cached alerts response")
-        return cached_response
+    # The full deduplicated, sorted alert list is cached per workspace (and per
+    # generated category set); filters and pages are sliced from it
+    ws_filter = workspace_id if workspace_id else "all"
+    requested_categories = {c.lower() for c in category} if category else set(ALERT_CATEGORIES)
+    dataset = await response_cache.aget(_dataset_key(ws_filter, ALERT_CATEGORIES))
+    if dataset is None and requested_categories != set(ALERT_CATEGORIES):
+        dataset = await response_cache.aget(_dataset_key(ws_filter, requested_categories))
+    if dataset is not None:
+        logger.info(f"[RESPONSE_CACHE] Returning cached alerts (ws={ws_filter}, page={page})")
+        return _page_from_dataset(dataset, severity, category, acknowledged, page, page_size)
 
     # Try Delta table cache for fast response
     # Delta cache now supports workspace filtering via workspace_id column
@@ -791,84 +967,18 @@ async def get_alerts(
         cached_alerts = await query_alerts_cache(ws, workspace_id)
         if cached_alerts:
             logger.info(f"[CACHE_HIT] alerts: returning {len(cached_alerts)} alerts from cache")
-            all_alerts = []
-            for row in cached_alerts:
-                # Check acknowledgment status
-                condition_key = row["alert_id"]
-                is_ack, ack_time = _is_acknowledged(condition_key)
-
-                # Map category string to enum
-                cat_map = {
-                    "failure": AlertCategory.FAILURE,
-                    "sla": AlertCategory.SLA,
-                    "cost": AlertCategory.COST,
-                    "cluster": AlertCategory.CLUSTER,
-                }
-                sev_map = {
-                    "P1": AlertSeverity.P1,
-                    "P2": AlertSeverity.P2,
-                    "P3": AlertSeverity.P3,
-                }
-
-                all_alerts.append(Alert(
-                    id=row["alert_id"],
-                    job_id=row["job_id"],
-                    job_name=row["job_name"],
-                    category=cat_map.get(row["category"], AlertCategory.FAILURE),
-                    severity=sev_map.get(row["severity"], AlertSeverity.P3),
-                    title=row["title"],
-                    description=row["description"],
-                    remediation=_generate_failure_remediation(
-                        row["failure_reasons"].split(",") if row["failure_reasons"] else []
-                    ) if row["category"] == "failure" else _generate_cost_remediation(
-                        "spike", row["cost_multiplier"], row["baseline_p90_dbus"]
-                    ) if row["category"] == "cost" else "Review job configuration.",
-                    created_at=datetime.now(),
-                    acknowledged=is_ack,
-                    acknowledged_at=ack_time,
-                    condition_key=condition_key,
-                ))
+            all_alerts = _sort_alerts([_alert_from_cache_row(row) for row in cached_alerts])
+            dataset = CachedDataset(items=all_alerts, aggregates=_count_by_severity(all_alerts), from_cache=True)
 
-            # Apply filters and return
-            if severity:
-                severity_set = {s.upper() for s in severity}
-                all_alerts = [a for a in all_alerts if a.severity.value in severity_set]
-            if category:
-                category_set = {c.lower() for c in category}
-                all_alerts = [a for a in all_alerts if a.category.value in category_set]
-            if acknowledged is not None:
-                all_alerts = [a for a in all_alerts if a.acknowledged == acknowledged]
-
-            all_alerts = _sort_alerts(all_alerts)
-            by_severity = {"P1": 0, "P2": 0, "P3": 0}
-            for alert in all_alerts:
-                by_severity[alert.severity.value] = by_severity.get(alert.severity.value, 0) + 1
-
-            # Paginate after filtering and sorting
-            total_alerts = len(all_alerts)
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_alerts = all_alerts[start_idx:end_idx]
-            has_more = end_idx < total_alerts
-
-            result = AlertListOut(
-                alerts=paginated_alerts,
-                total=total_alerts,
-                by_severity=by_severity,
-                page=page,
-                page_size=page_size,
-                has_more=has_more,
-            )
-            # Cache in response cache for instant subsequent requests
-            response_cache.set(cache_key, result, TTL_FAST)
-            logger.info(f"[RESPONSE_CACHE] Cached alerts from Delta cache ({len(paginated_alerts)}/{total_alerts} alerts, page {page})")
-            return result
+            # Cache the dataset in response cache for instant subsequent requests (until the next refresh)
+            response_cache.set(_dataset_key(ws_filter, ALERT_CATEGORIES), dataset, refresh_version_watcher.ttl(TTL_FAST))
+            logger.info(f"[RESPONSE_CACHE] Cached alerts dataset from Delta cache ({dataset.total} alerts)")
+            return _page_from_dataset(dataset, severity, category, acknowledged, page, page_size)
 
         logger.info("[CACHE_MISS] alerts: falling back to live query")
 
     # Determine which alert categories to generate
     # If category filter is specified, only run those queries (major perf optimization)
-    requested_categories = {c.lower() for c in category} if category else {"failure", "sla", "cost", "cluster"}
     logger.info(f"[alerts] Generating alerts for categories: {requested_categories}")
 
     # Build list of coroutines to run based on requested categories
@@ -903,51 +1013,18 @@ async def get_alerts(
         logger.warning("Permission error detected in alert generation - falling back to mock alerts")
         return get_mock_alerts()
 
-    # Combine all results
+    # Combine all results, deduplicate and sort once for the whole dataset
     all_alerts = []
     for result in results:
         all_alerts.extend(result)
-    all_alerts = _deduplicate_alerts(all_alerts)
-
-    # Apply severity filter
-    if severity:
-        severity_set = {s.upper() for s in severity}
-        all_alerts = [a for a in all_alerts if a.severity.value in severity_set]
-
-    # Category filter already applied by selective query execution
-
-    if acknowledged is not None:
-        all_alerts = [a for a in all_alerts if a.acknowledged == acknowledged]
-
-    # Sort by severity
-    all_alerts = _sort_alerts(all_alerts)
-
-    # Calculate by_severity counts (from full filtered list, not paginated)
-    by_severity = {"P1": 0, "P2": 0, "P3": 0}
-    for alert in all_alerts:
-        by_severity[alert.severity.value] = by_severity.get(alert.severity.value, 0) + 1
-
-    # Paginate after filtering and sorting
-    total_alerts = len(all_alerts)
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_alerts = all_alerts[start_idx:end_idx]
-    has_more = end_idx < total_alerts
-
-    result = AlertListOut(
-        alerts=paginated_alerts,
-        total=total_alerts,
-        by_severity=by_severity,
-        page=page,
-        page_size=page_size,
-        has_more=has_more,
-    )
+    all_alerts = _sort_alerts(_deduplicate_alerts(all_alerts))
+    dataset = CachedDataset(items=all_alerts, aggregates=_count_by_severity(all_alerts))
 
-    # Cache the response for 2 minutes
-    response_cache.set(cache_key, result, TTL_FAST)
-    logger.info(f"[RESPONSE_CACHE] Cached alerts response ({len(paginated_alerts)}/{total_alerts} alerts, page {page})")
+    # Cache the dataset for 2 minutes; filters and pages are sliced from it
+    response_cache.set(_dataset_key(ws_filter, requested_categories), dataset, TTL_FAST)
+    logger.info(f"[RESPONSE_CACHE] Cached alerts dataset ({dataset.total} alerts, categories={sorted(requested_categories)})")
 
-    return result
+    return _page_from_dataset(dataset, severity, category, acknowledged, page, page_size)
 
 
 @router.post("/{alert_id}/acknowledge", response_model=Alert)
@@ -993,6 +1070,8 @@ async def acknowledge_alert(
     # Store acknowledgment
     now = datetime.now()
     _acknowledged[matching_alert.condition_key] = now
+    # Pre-encoded alert lists carry the old ack state
+    response_cache.invalidate_pattern(f"{ENCODED_KEY_PREFIX}{router.prefix}")
 
     # Return updated alert
     return Alert(
@@ -6,7 +6,7 @@ records. Databricks billing system uses negative quantities for corrections,
 and this pattern ensures fully retracted items are excluded.
 """
 
-import asyncio
+import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
@@ -14,17 +14,21 @@ from fastapi import APIRouter, Depends, Query
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws
 from job_monitor.backend.models import BillingByJobOut, BillingUsageOut
+from job_monitor.backend.result_decoder import has_rows, result_rows
+from job_monitor.backend.statement_executor import TIMEOUT_LIVE, StatementTimeoutError, statement_executor
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["billing"])
 
 
 def _parse_billing_usage(result) -> list[BillingUsageOut]:
     """Parse statement execution result into BillingUsageOut models."""
-    if not result or not result.result or not result.result.data_array:
+    if not has_rows(result):
         return []
 
     usage_records = []
-    for row in result.result.data_array:
+    for row in result_rows(result):
         usage_records.append(
             BillingUsageOut(
                 usage_date=str(row[0]),  # Convert DATE to string
@@ -39,11 +43,11 @@ def _parse_billing_usage(result) -> list[BillingUsageOut]:
 
 def _parse_billing_by_job(result) -> list[BillingByJobOut]:
     """Parse statement execution result into BillingByJobOut models."""
-    if not result or not result.result or not result.result.data_array:
+    if not has_rows(result):
         return []
 
     records = []
-    for row in result.result.data_array:
+    for row in result_rows(result):
         records.append(
             BillingByJobOut(
                 job_id=str(row[0]),
@@ -99,15 +103,20 @@ async def list_billing_usage(
     GROUP BY usage_date, usage_metadata.job_id, usage_metadata.cluster_id, sku_name
     HAVING SUM(usage_quantity) != 0
     ORDER BY usage_date DESC, total_dbus DESC
-    LIMIT 1000
     """
 
-    result = await asyncio.to_thread(
-        ws.statement_execution.execute_statement,
-        warehouse_id=warehouse_id,
-        statement=query,
-        wait_timeout="30s",
-    )
+    # Full result set: all chunks are fetched via external links
+    try:
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=warehouse_id,
+            timeout=TIMEOUT_LIVE,
+            fetch_all=True,
+        )
+    except StatementTimeoutError as e:
+        logger.warning(f"Billing usage query timed out after {e.timeout}s - returning no records")
+        return []
 
     return _parse_billing_usage(result)
 
@@ -154,15 +163,20 @@ async def list_billing_by_job(
     GROUP BY usage_metadata.job_id, sku_name
     HAVING SUM(usage_quantity) != 0
     ORDER BY total_dbus DESC
-    LIMIT 1000
     """
 
-    result = await asyncio.to_thread(
-        ws.statement_execution.execute_statement,
-        warehouse_id=warehouse_id,
-        statement=query,
-        wait_timeout="30s",
-    )
+    # Full result set: all chunks are fetched via external links
+    try:
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=warehouse_id,
+            timeout=TIMEOUT_LIVE,
+            fetch_all=True,
+        )
+    except StatementTimeoutError as e:
+        logger.warning(f"Billing by-job query timed out after {e.timeout}s - returning no records")
+        return []
 
     return _parse_billing_by_job(result)
 
@@ -8,12 +8,12 @@ Note: Direct CPU/memory metrics are not available in Databricks system tables.
 This implementation uses DBU consumption as a proxy for utilization.
 """
 
-import asyncio
 import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
+from job_monitor.backend.cache import query_cluster_utilization_cache
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws_prefer_user
 from job_monitor.backend.mock_data import (
@@ -22,6 +22,7 @@ from job_monitor.backend.mock_data import (
     is_mock_mode,
 )
 from job_monitor.backend.models import ClusterUtilization
+from job_monitor.backend.statement_executor import TIMEOUT_LIVE, statement_executor
 
 logger = logging.getLogger(__name__)
 
@@ -79,48 +80,18 @@ def _generate_recommendation(avg_utilization: float) -> str | None:
         return "Consider using smaller node types"
 
 
-def _parse_utilization_result(result, job_id: str, runs: int) -> ClusterUtilization:
-    """Parse SQL result into ClusterUtilization model.
+def _utilization_from_rates(job_id: str, rates: list[float | None], runs: int) -> ClusterUtilization:
+    """Build ClusterUtilization from the DBU/hour of the most recent runs.
 
-    Expected columns:
-    0: run_id
-    1: run_duration_seconds
-    2: total_dbus
-    3: dbus_per_hour
+    Args:
+        job_id: Job ID
+        rates: DBU/hour per analyzed run (newest first, None if unknown)
+        runs: Number of runs requested (over-provisioning needs that many)
     """
-    if not result or not result.result or not result.result.data_array:
-        return ClusterUtilization(
-            job_id=job_id,
-            driver_cpu_percent=None,
-            driver_memory_percent=None,
-            worker_cpu_percent=None,
-            worker_memory_percent=None,
-            is_over_provisioned=False,
-            recommendation=None,
-            runs_analyzed=0,
-        )
-
-    rows = result.result.data_array
-    runs_analyzed = len(rows)
-
-    if runs_analyzed == 0:
-        return ClusterUtilization(
-            job_id=job_id,
-            driver_cpu_percent=None,
-            driver_memory_percent=None,
-            worker_cpu_percent=None,
-            worker_memory_percent=None,
-            is_over_provisioned=False,
-            recommendation=None,
-            runs_analyzed=0,
-        )
+    runs_analyzed = len(rates)
 
     # Calculate average DBUs per hour across runs
-    dbus_per_hour_list = []
-    for row in rows:
-        dbu_rate = float(row[3]) if row[3] is not None else None
-        if dbu_rate is not None and dbu_rate > 0:
-            dbus_per_hour_list.append(dbu_rate)
+    dbus_per_hour_list = [rate for rate in rates if rate is not None and rate > 0]
 
     if not dbus_per_hour_list:
         return ClusterUtilization(
@@ -157,8 +128,7 @@ def _parse_utilization_result(result, job_id: str, runs: int) -> ClusterUtilizat
     if runs_analyzed >= runs and avg_utilization < 40:
         # Verify all runs show low utilization
         low_util_count = 0
-        for row in rows:
-            dbu_rate = float(row[3]) if row[3] is not None else None
+        for dbu_rate in rates:
             if dbu_rate is not None:
                 _, worker_util = _calculate_utilization_from_dbus(dbu_rate)
                 if worker_util is not None and worker_util < 40:
@@ -181,6 +151,20 @@ def _parse_utilization_result(result, job_id: str, runs: int) -> ClusterUtilizat
     )
 
 
+def _parse_utilization_result(result, job_id: str, runs: int) -> ClusterUtilization:
+    """Parse SQL result into ClusterUtilization model.
+
+    Expected columns:
+    0: run_id
+    1: run_duration_seconds
+    2: total_dbus
+    3: dbus_per_hour
+    """
+    rows = result.result.data_array if result and result.result and result.result.data_array else []
+    rates = [float(row[3]) if row[3] is not None else None for row in rows]
+    return _utilization_from_rates(job_id, rates, runs)
+
+
 @router.get("/{job_id}", response_model=ClusterUtilization)
 async def get_cluster_utilization(
     job_id: str,
@@ -221,6 +205,12 @@ async def get_cluster_utilization(
     if not warehouse_id:
         raise HTTPException(status_code=503, detail="Warehouse ID not configured")
 
+    # Per-run DBU/hour precomputed by the refresh job (one indexed lookup)
+    if settings.use_cache:
+        cached_rates = await query_cluster_utilization_cache(ws, job_id)
+        if cached_rates is not None:
+            return _utilization_from_rates(job_id, cached_rates[:runs], runs)
+
     # Query billing data for DBU consumption patterns across recent runs
     # Using proxy calculation: DBUs per hour normalized against typical rates
     # Note: run_duration_seconds can be 0 for serverless jobs, so we calculate
@@ -275,11 +265,11 @@ async def get_cluster_utilization(
 
     try:
         logger.info(f"[cluster_metrics] Querying utilization for job {job_id}")
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=warehouse_id,
-            statement=query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_LIVE,
         )
 
         # Check for permission errors in the result
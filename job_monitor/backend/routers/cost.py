@@ -20,11 +20,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 logger = logging.getLogger(__name__)
 
-from job_monitor.backend.cache import query_cost_cache
+from job_monitor.backend.cache import query_cost_cache, query_job_team_map
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws_prefer_user
 from job_monitor.backend.mock_data import get_mock_cost_summary, is_mock_mode
-from job_monitor.backend.response_cache import response_cache, TTL_SLOW
+from job_monitor.backend.refresh_version import refresh_version_watcher
+from job_monitor.backend.response_cache import CachedDataset, response_cache, TTL_MAX_STALE, TTL_SLOW
+from job_monitor.backend.result_decoder import decode_result, falsy_to, fill_null, has_rows, result_rows
+from job_monitor.backend.statement_executor import TIMEOUT_LIVE, statement_executor
 from job_monitor.backend.models import (
     CostAnomalyOut,
     CostBySkuOut,
@@ -59,6 +62,50 @@ def _categorize_sku(sku_name: str) -> str:
         return "Other"
 
 
+# Column layout of the live cost query (SELECT order, Databricks type names)
+JOB_COST_COLUMNS = [
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("total_dbus_30d", "DOUBLE"),
+    ("current_7d_dbus", "DOUBLE"),
+    ("prev_7d_dbus", "DOUBLE"),
+    ("sku_breakdown", "STRING"),
+    ("p90_dbus", "DOUBLE"),
+]
+
+# Column layout of the zombie job query
+ZOMBIE_JOB_COLUMNS = [
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("total_dbus", "DOUBLE"),
+    ("run_count", "LONG"),
+    ("success_count", "LONG"),
+]
+
+
+def _parse_sku_breakdown(sku_breakdown: str | None, total_dbus: float) -> list[CostBySkuOut]:
+    """Parse an aggregated "sku1:dbus1,sku2:dbus2,..." string into SKU rows."""
+    cost_by_sku = []
+    if not sku_breakdown or total_dbus <= 0:
+        return cost_by_sku
+
+    for part in str(sku_breakdown).split(","):
+        if ":" in part:
+            sku_name, dbus_str = part.split(":", 1)
+            try:
+                sku_dbus = float(dbus_str)
+                cost_by_sku.append(
+                    CostBySkuOut(
+                        sku_category=_categorize_sku(sku_name),
+                        total_dbus=sku_dbus,
+                        percentage=round((sku_dbus / total_dbus) * 100, 1),
+                    )
+                )
+            except ValueError:
+                pass
+    return cost_by_sku
+
+
 def _parse_job_costs(result, dbu_rate: float) -> list[JobCostOut]:
     """Parse statement execution result into JobCostOut models.
 
@@ -70,74 +117,54 @@ def _parse_job_costs(result, dbu_rate: float) -> list[JobCostOut]:
     4: prev_7d_dbus
     5: sku_breakdown (JSON string or structured)
     6: p90_dbus
+
+    Decodes the result into typed columns once and derives trend, anomaly
+    and dollar cost column-wise before building the models.
     """
-    if not result or not result.result or not result.result.data_array:
+    if not has_rows(result):
         return []
 
-    jobs = []
-    for row in result.result.data_array:
-        job_id = str(row[0]) if row[0] else ""
-        job_name = str(row[1]) if row[1] else f"job-{job_id}"
-        total_dbus = float(row[2]) if row[2] else 0.0
-        current_7d = float(row[3]) if row[3] else 0.0
-        prev_7d = float(row[4]) if row[4] else 0.0
-        p90_dbus = float(row[6]) if row[6] else None
-
-        # Calculate 7-day trend
-        if prev_7d > 0:
-            trend = ((current_7d - prev_7d) / prev_7d) * 100
-        else:
-            trend = 0.0 if current_7d == 0 else 100.0
-
-        # Check for anomaly (cost spike > 2x p90)
-        is_anomaly = False
-        if p90_dbus and current_7d > 0:
-            is_anomaly = current_7d > (2 * p90_dbus)
-
-        # Calculate dollar cost if rate is set
-        cost_dollars = total_dbus * dbu_rate if dbu_rate > 0 else None
-
-        # Parse SKU breakdown (row[5] contains aggregated SKU data)
-        # Format: "sku1:dbus1,sku2:dbus2,..."
-        cost_by_sku = []
-        if row[5] and total_dbus > 0:
-            sku_parts = str(row[5]).split(",")
-            for part in sku_parts:
-                if ":" in part:
-                    sku_name, dbus_str = part.split(":", 1)
-                    try:
-                        sku_dbus = float(dbus_str)
-                        category = _categorize_sku(sku_name)
-                        pct = (sku_dbus / total_dbus) * 100 if total_dbus > 0 else 0
-                        cost_by_sku.append(
-                            CostBySkuOut(
-                                sku_category=category,
-                                total_dbus=sku_dbus,
-                                percentage=round(pct, 1),
-                            )
-                        )
-                    except ValueError:
-                        pass
-
-        jobs.append(
-            JobCostOut(
-                job_id=job_id,
-                job_name=job_name,
-                team=None,  # Will be populated via Jobs API lookup
-                total_dbus_30d=total_dbus,
-                total_cost_dollars=cost_dollars,
-                cost_by_sku=cost_by_sku,
-                trend_7d_percent=round(trend, 1),
-                is_anomaly=is_anomaly,
-                baseline_p90_dbus=p90_dbus,
-            )
+    cols = decode_result(result, JOB_COST_COLUMNS)
+    job_ids = falsy_to(cols["job_id"], "")
+    job_names = [name or f"job-{job_id}" for name, job_id in zip(cols["job_name"], job_ids)]
+    total_dbus = fill_null(cols["total_dbus_30d"], 0.0)
+    current_7d = fill_null(cols["current_7d_dbus"], 0.0)
+    prev_7d = fill_null(cols["prev_7d_dbus"], 0.0)
+    p90_dbus = falsy_to(cols["p90_dbus"], None)
+
+    # 7-day trend: 0 when both windows are empty, 100% for brand-new spend
+    trends = [
+        ((cur - prev) / prev) * 100 if prev > 0 else (0.0 if cur == 0 else 100.0)
+        for cur, prev in zip(current_7d, prev_7d)
+    ]
+    # Anomaly: cost spike > 2x p90
+    anomalies = [bool(p90 and cur > 0 and cur > 2 * p90) for cur, p90 in zip(current_7d, p90_dbus)]
+    # Dollar cost if rate is set
+    cost_dollars = [dbus * dbu_rate if dbu_rate > 0 else None for dbus in total_dbus]
+
+    return [
+        JobCostOut(
+            job_id=job_id,
+            job_name=job_name,
+            team=None,  # Will be populated via Jobs API lookup
+            total_dbus_30d=dbus,
+            total_cost_dollars=dollars,
+            cost_by_sku=_parse_sku_breakdown(skus, dbus),
+            trend_7d_percent=round(trend, 1),
+            is_anomaly=is_anomaly,
+            baseline_p90_dbus=p90,
+        )
+        for job_id, job_name, dbus, dollars, skus, trend, is_anomaly, p90 in zip(
+            job_ids, job_names, total_dbus, cost_dollars, cols["sku_breakdown"], trends, anomalies, p90_dbus
         )
+    ]
 
-    return jobs
 
+async def _get_job_teams(ws, job_ids: list[str], workspace_id: str | None = None) -> dict[str, str]:
+    """Lookup team tags for jobs.
 
-async def _get_job_teams(ws, job_ids: list[str]) -> dict[str, str]:
-    """Lookup team tags for jobs via Jobs API.
+    Reads the job_team_map cache table (one statement) and falls back to
+    one Jobs API call per job when the table is unavailable.
 
     Returns a dict mapping job_id -> team name.
     Jobs without team tags are not included.
@@ -145,6 +172,13 @@ async def _get_job_teams(ws, job_ids: list[str]) -> dict[str, str]:
     if not ws or not job_ids:
         return {}
 
+    if settings.use_cache:
+        cached_teams = await query_job_team_map(ws, workspace_id)
+        if cached_teams is not None:
+            wanted = set(job_ids)
+            return {job_id: team for job_id, team in cached_teams.items() if job_id in wanted}
+        logger.info("[CACHE_MISS] job_team_map unavailable, looking up team tags via Jobs API")
+
     team_map = {}
     team_tag_key = settings.team_tag_key
 
@@ -170,13 +204,29 @@ async def _get_job_teams(ws, job_ids: list[str]) -> dict[str, str]:
     return team_map
 
 
+def _page_from_dataset(
+    dataset: CachedDataset, page: int, page_size: int, stale: bool = False
+) -> CostSummaryOut:
+    """Slice one page of jobs out of a cached cost summary dataset."""
+    paginated_jobs, has_more = dataset.page(page, page_size)
+    return CostSummaryOut(
+        jobs=paginated_jobs,
+        total_jobs_count=dataset.total,
+        page=page,
+        page_size=page_size,
+        has_more=has_more,
+        stale=stale,
+        **dataset.aggregates,
+    )
+
+
 @router.get("/summary", response_model=CostSummaryOut)
 async def get_cost_summary(
     days: Annotated[
         int, Query(ge=7, le=90, description="Time window in days")
     ] = 30,
     include_teams: Annotated[
-        bool, Query(description="Include team tags lookup (adds 20-30s)")
+        bool, Query(description="Include team tags (from job_team_map; Jobs API lookup adds 20-30s without it)")
     ] = False,
     workspace_id: Annotated[
         str | None,
@@ -218,49 +268,36 @@ async def get_cost_summary(
 
     # Check in-memory response cache first (fastest path)
     ws_filter = workspace_id if workspace_id else "all"
-    cache_key = f"cost_summary:{days}:{include_teams}:{ws_filter}:p{page}:{page_size}"
-    cached_response = response_cache.get(cache_key)
-    if cached_response:
-        logger.info(f"[RESPONSE_CACHE] Returning cached cost summary ({days}d, ws={ws_filter}, page={page})")
-        return cached_response
+    # The full job list and rollups are cached once; pages are sliced from it
+    cache_key = f"cost_summary:{days}:{include_teams}:{ws_filter}"
+    # Expired datasets are served (stale=True) while one background task refreshes them
+    cached_dataset, stale = await response_cache.aget_swr(cache_key)
+    if cached_dataset:
+        logger.info(f"[RESPONSE_CACHE] Returning cached cost summary ({days}d, ws={ws_filter}, page={page}, stale={stale})")
+        if stale:
+            response_cache.revalidate(cache_key, lambda: get_cost_summary(
+                days=days, include_teams=include_teams, workspace_id=workspace_id, ws=ws
+            ))
+        return _page_from_dataset(cached_dataset, page, page_size, stale=stale)
 
     dbu_rate = settings.dbu_rate
 
-    # Try Delta table cache for fast response
-    # NOTE: Delta cache doesn't support workspace filtering, so skip it when workspace_id is specified
-    use_delta_cache = settings.use_cache and (not workspace_id or workspace_id == "all")
-    if use_delta_cache:
-        logger.info("[CACHE] Attempting Delta cache lookup for costs/summary (no workspace filter)")
-        cached_data = await query_cost_cache(ws)
+    # Try Delta table cache for fast response (workspace filter is pushed into the query)
+    if settings.use_cache:
+        logger.info("[CACHE] Attempting Delta cache lookup for costs/summary")
+        cached_data = await query_cost_cache(ws, workspace_id)
         if cached_data:
             logger.info(f"[CACHE_HIT] costs/summary: returning {len(cached_data)} jobs from cache")
 
             # Parse cached data into JobCostOut models
             jobs = []
             for row in cached_data:
-                # Parse SKU breakdown
-                cost_by_sku = []
-                if row["sku_breakdown"] and row["total_dbus_30d"] > 0:
-                    sku_parts = row["sku_breakdown"].split(",")
-                    for part in sku_parts:
-                        if ":" in part:
-                            sku_name, dbus_str = part.split(":", 1)
-                            try:
-                                sku_dbus = float(dbus_str)
-                                category = _categorize_sku(sku_name)
-                                pct = (sku_dbus / row["total_dbus_30d"]) * 100
-                                cost_by_sku.append(CostBySkuOut(
-                                    sku_category=category,
-                                    total_dbus=sku_dbus,
-                                    percentage=round(pct, 1),
-                                ))
-                            except ValueError:
-                                pass
+                cost_by_sku = _parse_sku_breakdown(row["sku_breakdown"], row["total_dbus_30d"])
 
                 jobs.append(JobCostOut(
                     job_id=row["job_id"],
                     job_name=row["job_name"],
-                    team=None,  # Will be populated via Jobs API
+                    team=None,  # Populated from job_team_map if include_teams
                     total_dbus_30d=row["total_dbus_30d"],
                     total_cost_dollars=row["total_dbus_30d"] * dbu_rate if dbu_rate > 0 else None,
                     cost_by_sku=cost_by_sku,
@@ -269,10 +306,10 @@ async def get_cost_summary(
                     baseline_p90_dbus=row["baseline_p90_dbus"],
                 ))
 
-            # Lookup team tags only if requested (adds 20-30s)
+            # Lookup team tags only if requested
             if include_teams:
                 job_ids = [j.job_id for j in jobs]
-                team_map = await _get_job_teams(ws, job_ids)
+                team_map = await _get_job_teams(ws, job_ids, workspace_id)
                 for job in jobs:
                     job.team = team_map.get(job.job_id)
 
@@ -313,34 +350,23 @@ async def get_cost_summary(
             ]
 
             total_dbus = sum(j.total_dbus_30d for j in jobs)
-            total_jobs_count = len(jobs)
-
-            # Paginate jobs list
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_jobs = jobs[start_idx:end_idx]
-            has_more = end_idx < total_jobs_count
-
-            result = CostSummaryOut(
-                jobs=paginated_jobs,
-                teams=teams,
-                anomalies=anomalies,
-                total_dbus_30d=total_dbus,
-                total_cost_dollars=total_dbus * dbu_rate if dbu_rate > 0 else None,
-                dbu_rate=dbu_rate,
-                total_jobs_count=total_jobs_count,
-                page=page,
-                page_size=page_size,
-                has_more=has_more,
+            dataset = CachedDataset(
+                items=jobs,
+                aggregates={
+                    "teams": teams,
+                    "anomalies": anomalies,
+                    "total_dbus_30d": total_dbus,
+                    "total_cost_dollars": total_dbus * dbu_rate if dbu_rate > 0 else None,
+                    "dbu_rate": dbu_rate,
+                },
+                from_cache=True,
             )
-            # Cache in response cache for instant subsequent requests
-            response_cache.set(cache_key, result, TTL_SLOW)
-            logger.info(f"[RESPONSE_CACHE] Cached cost summary from Delta cache (page {page}, {len(paginated_jobs)} of {total_jobs_count} jobs)")
-            return result
+            # Cache the dataset in response cache for instant subsequent pages (until the next refresh)
+            response_cache.set(cache_key, dataset, refresh_version_watcher.ttl(TTL_SLOW), stale_ttl=TTL_MAX_STALE)
+            logger.info(f"[RESPONSE_CACHE] Cached cost summary dataset from Delta cache ({dataset.total} jobs)")
+            return _page_from_dataset(dataset, page, page_size)
 
         logger.info("[CACHE_MISS] costs/summary: falling back to live query")
-    elif workspace_id:
-        logger.info(f"[CACHE_SKIP] Skipping Delta cache - workspace filter active: {workspace_id}")
 
     # Build workspace filter clause
     # workspace_id in system tables is BIGINT, not string - don't quote it
@@ -410,23 +436,22 @@ async def get_cost_summary(
     LEFT JOIN job_names jn ON jt.job_id = jn.job_id AND jn.rn = 1
     LEFT JOIN job_p90 jp ON jt.job_id = jp.job_id
     ORDER BY jt.total_dbus_30d DESC
-    LIMIT 500
     """
 
     logger.info(f"[cost.get_cost_summary] Executing SQL on warehouse {warehouse_id}, days={days}")
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=warehouse_id,
-            statement=query,
-            wait_timeout="50s",
+            timeout=TIMEOUT_LIVE,
+            fetch_all=True,
         )
         logger.info(f"[cost.get_cost_summary] SQL completed, status: {result.status.state if result and result.status else 'None'}")
         if result and result.status and result.status.error:
             logger.error(f"[cost.get_cost_summary] SQL error: {result.status.error}")
         if result and result.result:
-            row_count = len(result.result.data_array) if result.result.data_array else 0
-            logger.info(f"[cost.get_cost_summary] Result row count: {row_count}")
+            logger.info(f"[cost.get_cost_summary] Result row count: {len(result_rows(result))}")
     except Exception as e:
         logger.error(f"[cost.get_cost_summary] SQL execution failed: {e}")
         logger.error(f"[cost.get_cost_summary] Traceback: {traceback.format_exc()}")
@@ -435,10 +460,10 @@ async def get_cost_summary(
     jobs = _parse_job_costs(result, dbu_rate)
     logger.info(f"[cost.get_cost_summary] Parsed {len(jobs)} jobs")
 
-    # Lookup team tags for jobs only if requested (adds 20-30s)
+    # Lookup team tags for jobs only if requested
     if include_teams:
         job_ids = [j.job_id for j in jobs]
-        team_map = await _get_job_teams(ws, job_ids)
+        team_map = await _get_job_teams(ws, job_ids, workspace_id)
         # Apply team tags to jobs
         for job in jobs:
             job.team = team_map.get(job.job_id)
@@ -504,33 +529,22 @@ async def get_cost_summary(
 
     # Calculate totals
     total_dbus = sum(j.total_dbus_30d for j in jobs)
-    total_cost = total_dbus * dbu_rate if dbu_rate > 0 else None
-    total_jobs_count = len(jobs)
-
-    # Paginate jobs list
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_jobs = jobs[start_idx:end_idx]
-    has_more = end_idx < total_jobs_count
-
-    result = CostSummaryOut(
-        jobs=paginated_jobs,
-        teams=teams,
-        anomalies=anomalies,
-        total_dbus_30d=total_dbus,
-        total_cost_dollars=total_cost,
-        dbu_rate=dbu_rate,
-        total_jobs_count=total_jobs_count,
-        page=page,
-        page_size=page_size,
-        has_more=has_more,
+    dataset = CachedDataset(
+        items=jobs,
+        aggregates={
+            "teams": teams,
+            "anomalies": anomalies,
+            "total_dbus_30d": total_dbus,
+            "total_cost_dollars": total_dbus * dbu_rate if dbu_rate > 0 else None,
+            "dbu_rate": dbu_rate,
+        },
     )
 
-    # Cache the response for 10 minutes
-    response_cache.set(cache_key, result, TTL_SLOW)
-    logger.info(f"[RESPONSE_CACHE] Cached cost summary (page {page}, {len(paginated_jobs)} of {total_jobs_count} jobs, {days}d)")
+    # Cache the dataset for 10 minutes; every page is sliced from it
+    response_cache.set(cache_key, dataset, TTL_SLOW, stale_ttl=TTL_MAX_STALE)
+    logger.info(f"[RESPONSE_CACHE] Cached cost summary dataset ({dataset.total} jobs, {days}d)")
 
-    return result
+    return _page_from_dataset(dataset, page, page_size)
 
 
 @router.get("/by-team", response_model=list[TeamCostOut])
@@ -552,8 +566,8 @@ async def get_costs_by_team(
     Returns:
         List of team cost summaries
     """
-    # Reuse summary endpoint logic
-    summary = await get_cost_summary(days=days, ws=ws)
+    # Reuse summary endpoint logic (team tags come from job_team_map)
+    summary = await get_cost_summary(days=days, include_teams=True, ws=ws)
     return summary.teams
 
 
@@ -588,7 +602,7 @@ async def get_cost_anomalies(
 
     # Check response cache first
     cache_key = f"cost_anomalies:{days}"
-    cached = response_cache.get(cache_key)
+    cached = await response_cache.aget(cache_key)
     if cached:
         return cached
 
@@ -641,24 +655,27 @@ async def get_cost_anomalies(
     """
 
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            zombie_query,
             warehouse_id=warehouse_id,
-            statement=zombie_query,
-            wait_timeout="50s",
+            timeout=TIMEOUT_LIVE,
         )
 
-        if result and result.result and result.result.data_array:
+        if has_rows(result):
+            cols = decode_result(result, ZOMBIE_JOB_COLUMNS)
+            job_ids = falsy_to(cols["job_id"], "")
             # Get team tags for zombie jobs
-            zombie_job_ids = [str(row[0]) for row in result.result.data_array if row[0]]
-            team_map = await _get_job_teams(ws, zombie_job_ids)
-
-            for row in result.result.data_array:
-                job_id = str(row[0]) if row[0] else ""
-                job_name = str(row[1]) if row[1] else f"job-{job_id}"
-                total_dbus = float(row[2]) if row[2] else 0.0
-                run_count = int(row[3]) if row[3] else 0
-                success_count = int(row[4]) if row[4] else 0
+            team_map = await _get_job_teams(ws, [job_id for job_id in job_ids if job_id])
+
+            for job_id, job_name, total_dbus, run_count, success_count in zip(
+                job_ids,
+                cols["job_name"],
+                falsy_to(cols["total_dbus"], 0.0),
+                falsy_to(cols["run_count"], 0),
+                falsy_to(cols["success_count"], 0),
+            ):
+                job_name = job_name or f"job-{job_id}"
 
                 # Skip if already in anomalies (cost spike)
                 if any(a.job_id == job_id for a in anomalies):
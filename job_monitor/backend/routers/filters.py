@@ -1,7 +1,6 @@
 """Filter presets API - persisted to Delta table."""
 
 import logging
-import time
 from datetime import datetime
 from typing import Literal
 
@@ -10,12 +9,15 @@ from pydantic import BaseModel
 
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws_prefer_user, get_current_user
+from job_monitor.backend.response_cache import response_cache
+from job_monitor.backend.statement_executor import TIMEOUT_CACHE, statement_executor
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/filters", tags=["filters"])
 
-# Simple in-memory cache for filter presets (they rarely change)
-_presets_cache: dict = {"data": None, "timestamp": 0}
+# Filter presets are cached in the shared response cache (they rarely change);
+# invalidation on create/update/delete reaches every worker process
+PRESETS_CACHE_KEY = "filter_presets"
 PRESETS_CACHE_TTL = 60  # 60 seconds cache for presets
 
 # Table name for filter presets
@@ -53,10 +55,11 @@ async def ensure_presets_table(ws) -> bool:
     try:
         # First, ensure the schema exists
         create_schema_sql = f"CREATE SCHEMA IF NOT EXISTS {settings.cache_catalog}.{settings.cache_schema}"
-        schema_result = ws.statement_execution.execute_statement(
+        schema_result = await statement_executor.execute(
+            ws,
+            create_schema_sql,
             warehouse_id=settings.warehouse_id,
-            statement=create_schema_sql,
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
         )
         if schema_result.status.state.value not in ("SUCCEEDED", "CLOSED"):
             error_msg = schema_result.status.error.message if schema_result.status.error else "Unknown error"
@@ -78,10 +81,11 @@ async def ensure_presets_table(ws) -> bool:
             is_shared BOOLEAN
         ) USING DELTA
         """
-        result = ws.statement_execution.execute_statement(
+        result = await statement_executor.execute(
+            ws,
+            create_sql,
             warehouse_id=settings.warehouse_id,
-            statement=create_sql,
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
         )
 
         # Log the result status
@@ -94,10 +98,11 @@ async def ensure_presets_table(ws) -> bool:
 
         # Try to add job_name_patterns column if it doesn't exist (for migration)
         try:
-            ws.statement_execution.execute_statement(
+            await statement_executor.execute(
+                ws,
+                f"ALTER TABLE {PRESETS_TABLE} ADD COLUMN job_name_patterns STRING",
                 warehouse_id=settings.warehouse_id,
-                statement=f"ALTER TABLE {PRESETS_TABLE} ADD COLUMN job_name_patterns STRING",
-                wait_timeout="30s",
+                timeout=TIMEOUT_CACHE,
             )
             logger.info("Added job_name_patterns column to presets table")
         except Exception:
@@ -114,13 +119,11 @@ async def get_filter_presets(
     ws=Depends(get_ws_prefer_user),
 ) -> list[FilterPreset]:
     """Get all saved filter presets."""
-    global _presets_cache
-
     # Check cache first
-    now = time.time()
-    if _presets_cache["data"] is not None and (now - _presets_cache["timestamp"]) < PRESETS_CACHE_TTL:
+    cached = await response_cache.aget(PRESETS_CACHE_KEY)
+    if cached is not None:
         logger.debug("Returning cached filter presets")
-        return _presets_cache["data"]
+        return cached
 
     if not ws:
         logger.warning("No workspace client available for filter presets")
@@ -131,10 +134,11 @@ async def get_filter_presets(
         await ensure_presets_table(ws)
 
         # Query presets
-        result = ws.statement_execution.execute_statement(
+        result = await statement_executor.execute(
+            ws,
+            f"SELECT * FROM {PRESETS_TABLE} WHERE is_shared = true ORDER BY created_at DESC",
             warehouse_id=settings.warehouse_id,
-            statement=f"SELECT * FROM {PRESETS_TABLE} WHERE is_shared = true ORDER BY created_at DESC",
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
         )
 
         # Log query result status
@@ -171,8 +175,7 @@ async def get_filter_presets(
             ))
 
         # Update cache
-        _presets_cache["data"] = presets
-        _presets_cache["timestamp"] = time.time()
+        response_cache.set(PRESETS_CACHE_KEY, presets, PRESETS_CACHE_TTL)
         logger.debug(f"Cached {len(presets)} filter presets")
 
         return presets
@@ -183,10 +186,8 @@ async def get_filter_presets(
 
 
 def invalidate_presets_cache():
-    """Invalidate the presets cache when data changes."""
-    global _presets_cache
-    _presets_cache["data"] = None
-    _presets_cache["timestamp"] = 0
+    """Invalidate the presets cache when data changes (in all processes)."""
+    response_cache.invalidate(PRESETS_CACHE_KEY)
     logger.debug("Filter presets cache invalidated")
 
 
@@ -231,10 +232,11 @@ async def create_filter_preset(
         )
         """
 
-        result = ws.statement_execution.execute_statement(
+        result = await statement_executor.execute(
+            ws,
+            insert_sql,
             warehouse_id=settings.warehouse_id,
-            statement=insert_sql,
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
         )
 
         # Check if INSERT actually succeeded
@@ -296,17 +298,19 @@ async def update_filter_preset(
         WHERE id = '{preset_id}'
         """
 
-        ws.statement_execution.execute_statement(
+        await statement_executor.execute(
+            ws,
+            update_sql,
             warehouse_id=settings.warehouse_id,
-            statement=update_sql,
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
         )
 
         # Fetch the original created_at/created_by
-        result = ws.statement_execution.execute_statement(
+        result = await statement_executor.execute(
+            ws,
+            f"SELECT created_at, created_by FROM {PRESETS_TABLE} WHERE id = '{preset_id}'",
             warehouse_id=settings.warehouse_id,
-            statement=f"SELECT created_at, created_by FROM {PRESETS_TABLE} WHERE id = '{preset_id}'",
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
         )
 
         created_at = datetime.now()
@@ -350,10 +354,11 @@ async def delete_filter_preset(
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        ws.statement_execution.execute_statement(
+        await statement_executor.execute(
+            ws,
+            f"DELETE FROM {PRESETS_TABLE} WHERE id = '{preset_id}'",
             warehouse_id=settings.warehouse_id,
-            statement=f"DELETE FROM {PRESETS_TABLE} WHERE id = '{preset_id}'",
-            wait_timeout="30s",
+            timeout=TIMEOUT_CACHE,
         )
         # Invalidate cache so next GET returns fresh data
         invalidate_presets_cache()
@@ -17,11 +17,22 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Header, Request
 
-from job_monitor.backend.cache import check_cache_exists, get_cache_freshness
+from job_monitor.backend.cache import (
+    check_cache_exists,
+    get_cache_freshness,
+    query_refresh_log,
+    summarize_refresh_log,
+)
+from job_monitor.backend.cache_refresher import hot_key_refresher
+from job_monitor.backend.cache_snapshot import cache_snapshots
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws_prefer_user
+from job_monitor.backend.encoded_response import encoded_response_stats
 from job_monitor.backend.mock_data import is_auto_fallback_enabled, is_mock_mode
+from job_monitor.backend.refresh_version import refresh_version_watcher
 from job_monitor.backend.response_cache import response_cache
+from job_monitor.backend.statement_executor import TIMEOUT_QUICK, statement_executor
+from job_monitor.backend.workspace_client_pool import workspace_client_pool
 
 router = APIRouter(tags=["health"])
 logger = logging.getLogger(__name__)
@@ -50,10 +61,11 @@ async def check_sql_warehouse(ws, warehouse_id: str) -> dict:
 
     start_time = time.time()
     try:
-        result = ws.statement_execution.execute_statement(
+        result = await statement_executor.execute(
+            ws,
+            "SELECT 1 as health_check",
             warehouse_id=warehouse_id,
-            statement="SELECT 1 as health_check",
-            wait_timeout="10s",
+            timeout=TIMEOUT_QUICK,
         )
         latency_ms = int((time.time() - start_time) * 1000)
 
@@ -75,15 +87,14 @@ async def check_sql_warehouse(ws, warehouse_id: str) -> dict:
             return {"status": "unhealthy", "error": error_msg[:100], "latency_ms": latency_ms}
 
 
-async def check_obo_auth(token: str | None, host: str | None) -> dict:
+async def check_obo_auth(token: str | None) -> dict:
     """Verify OBO user token is valid and can authenticate."""
     if not token:
         return {"status": "not_configured", "note": "OBO not enabled or local dev"}
 
     try:
-        from databricks.sdk import WorkspaceClient
-
-        obo_ws = WorkspaceClient(host=host, token=token)
+        # Pooled client; me() is still called here to verify the token is live
+        obo_ws = workspace_client_pool.get(token)
         user = obo_ws.current_user.me()
         email = user.emails[0].value if user.emails else user.user_name
         return {
@@ -105,10 +116,11 @@ async def check_system_tables(ws, warehouse_id: str) -> dict:
 
     start_time = time.time()
     try:
-        result = ws.statement_execution.execute_statement(
+        result = await statement_executor.execute(
+            ws,
+            "SELECT 1 FROM system.lakeflow.job_run_timeline LIMIT 1",
             warehouse_id=warehouse_id,
-            statement="SELECT 1 FROM system.lakeflow.job_run_timeline LIMIT 1",
-            wait_timeout="30s",
+            timeout=TIMEOUT_QUICK,
         )
         latency_ms = int((time.time() - start_time) * 1000)
 
@@ -136,10 +148,11 @@ async def check_cache_tables(ws, warehouse_id: str, catalog: str, schema: str) -
 
     start_time = time.time()
     try:
-        result = ws.statement_execution.execute_statement(
+        result = await statement_executor.execute(
+            ws,
+            f"SELECT 1 FROM {catalog}.{schema}.job_health_cache LIMIT 1",
             warehouse_id=warehouse_id,
-            statement=f"SELECT 1 FROM {catalog}.{schema}.job_health_cache LIMIT 1",
-            wait_timeout="10s",
+            timeout=TIMEOUT_QUICK,
         )
         latency_ms = int((time.time() - start_time) * 1000)
 
@@ -201,9 +214,7 @@ async def health_check(
         # Determine which client to use for SQL checks
         if token:
             try:
-                from databricks.sdk import WorkspaceClient
-
-                ws = WorkspaceClient(host=settings.databricks_host, token=token)
+                ws = workspace_client_pool.get(token)
             except Exception:
                 ws = sp_client
         else:
@@ -211,7 +222,7 @@ async def health_check(
 
         # Run checks in parallel for speed
         warehouse_task = check_sql_warehouse(ws, settings.warehouse_id)
-        obo_task = check_obo_auth(token, settings.databricks_host)
+        obo_task = check_obo_auth(token)
 
         warehouse_result, obo_result = await asyncio.gather(
             warehouse_task, obo_task, return_exceptions=True
@@ -258,6 +269,10 @@ async def health_check(
     # Response cache stats
     checks["response_cache"] = response_cache.stats()
 
+    # SQL executor concurrency and latency stats
+    checks["sql_executor"] = statement_executor.stats()
+    checks["workspace_clients"] = workspace_client_pool.stats()
+
     return {
         "status": overall,
         "checks": checks,
@@ -335,10 +350,15 @@ async def cache_status(
             "reason": "Cache tables not found. Run the refresh-metrics-cache job to create them.",
             "cache_enabled": settings.use_cache,
             "cache_table_prefix": settings.cache_table_prefix,
+            # In-memory cache works without Delta tables; per-namespace counters included
+            "response_cache": response_cache.stats(),
         }
 
-    # Check freshness
-    is_fresh, refreshed_at = await get_cache_freshness(ws)
+    # Check freshness and recent refresh run history
+    (is_fresh, refreshed_at), refresh_log = await asyncio.gather(
+        get_cache_freshness(ws),
+        query_refresh_log(ws),
+    )
 
     return {
         "status": "healthy" if is_fresh else "stale",
@@ -348,5 +368,12 @@ async def cache_status(
         "cache_enabled": settings.use_cache,
         "cache_table_prefix": settings.cache_table_prefix,
         "message": "Cache is fresh and ready" if is_fresh else "Cache exists but may be stale (>1 hour old)",
+        # Per-stage refresh durations and trend (None before the refresh job writes refresh_log)
+        "refresh_history": summarize_refresh_log(refresh_log) if refresh_log is not None else None,
         "response_cache": response_cache.stats(),
+        "hot_key_refresher": hot_key_refresher.stats(),
+        "snapshots": cache_snapshots.stats(),
+        "refresh_version": refresh_version_watcher.stats(),
+        "encoded_responses": encoded_response_stats.stats(),
+        "sql_executor": statement_executor.stats(),
     }
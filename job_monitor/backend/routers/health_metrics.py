@@ -4,6 +4,7 @@ Provides:
 - Job health summary with priority flags (P1/P2/P3)
 - Duration statistics (median, p90, avg, max) for specific jobs
 - Expanded job details for dashboard row expansion
+- Streaming NDJSON/CSV/Arrow export of every job's health record
 
 Supports:
 - Cache-first queries for fast loading (from pre-aggregated Delta tables)
@@ -15,20 +16,40 @@ Enable mock mode with USE_MOCK_DATA=true or automatically on permission errors.
 
 import asyncio
 import logging
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-
-from job_monitor.backend.cache import query_job_duration_cache, query_job_health_cache
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+from job_monitor.backend.cache import (
+    JOB_HEALTH_EXPORT_COLUMNS,
+    open_job_health_export,
+    query_job_daily_health,
+    query_job_detail_cache,
+    query_job_duration_cache,
+    query_job_health_cache,
+    query_recent_runs_cache,
+)
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws_prefer_user
+from job_monitor.backend.export_stream import ARROW_AVAILABLE, EXPORT_EXTENSIONS, EXPORT_MEDIA_TYPES, encode_export
+from job_monitor.backend.health_index import PRIORITY_RANK, HealthQuery, JobHealthIndex, parse_sort
 from job_monitor.backend.mock_data import (
     get_mock_duration_stats,
     get_mock_health_metrics,
     get_mock_job_details,
     is_mock_mode,
 )
-from job_monitor.backend.response_cache import response_cache, TTL_STANDARD
+from job_monitor.backend.refresh_version import refresh_version_watcher
+from job_monitor.backend.response_cache import CachedDataset, response_cache, TTL_MAX_STALE, TTL_STANDARD
+from job_monitor.backend.result_decoder import ColumnarResult, decode_result, falsy_to, fill_null, has_rows, result_rows
+from job_monitor.backend.statement_executor import (
+    TIMEOUT_HEAVY,
+    TIMEOUT_LIVE,
+    StatementTimeoutError,
+    statement_executor,
+)
 from job_monitor.backend.models import (
     DurationStatsOut,
     JobExpandedOut,
@@ -42,6 +63,55 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["health-metrics"])
 
+# Runs shown when a job row is expanded
+RECENT_RUNS_LIMIT = 10
+
+# Validates a whole decoded result in one call instead of one model construction per row
+_JOB_HEALTH_LIST = TypeAdapter(list[JobHealthOut])
+
+
+# Column layout of the live health query (SELECT order, Databricks type names)
+JOB_HEALTH_COLUMNS = [
+    ("job_id", "STRING"),
+    ("job_name", "STRING"),
+    ("total_runs", "LONG"),
+    ("success_count", "LONG"),
+    ("success_rate", "DOUBLE"),
+    ("last_run_time", "TIMESTAMP"),
+    ("last_duration_seconds", "LONG"),
+    ("priority", "STRING"),
+    ("retry_count", "LONG"),
+]
+
+# Live health summary counts
+HEALTH_SUMMARY_COLUMNS = [
+    ("total_count", "LONG"),
+    ("p1_count", "LONG"),
+    ("p2_count", "LONG"),
+    ("p3_count", "LONG"),
+    ("healthy_count", "LONG"),
+    ("avg_success_rate", "DOUBLE"),
+]
+
+# Live 30-day duration statistics of one job
+DURATION_STATS_COLUMNS = [
+    ("median_duration_seconds", "DOUBLE"),
+    ("p90_duration_seconds", "DOUBLE"),
+    ("avg_duration_seconds", "DOUBLE"),
+    ("max_duration_seconds", "DOUBLE"),
+    ("run_count", "LONG"),
+]
+
+# Live recent runs of one job (the row layout _parse_job_runs reads)
+RECENT_RUN_COLUMNS = [
+    ("run_id", "STRING"),
+    ("job_id", "STRING"),
+    ("start_time", "TIMESTAMP"),
+    ("end_time", "TIMESTAMP"),
+    ("duration_seconds", "LONG"),
+    ("result_state", "STRING"),
+]
+
 
 def _parse_job_health(result) -> list[JobHealthOut]:
     """Parse statement execution result into JobHealthOut models.
@@ -57,36 +127,28 @@ def _parse_job_health(result) -> list[JobHealthOut]:
     7: priority
     8: retry_count
     """
-    if not result or not result.result or not result.result.data_array:
+    if not has_rows(result):
         return []
 
-    jobs = []
-    for row in result.result.data_array:
-        # Handle NULL values and type conversions
-        job_id = str(row[0]) if row[0] else ""
-        job_name = str(row[1]) if row[1] else f"job-{job_id}"
-        total_runs = int(row[2]) if row[2] else 0
-        success_count = int(row[3]) if row[3] else 0
-        success_rate = float(row[4]) if row[4] is not None else 0.0
-        last_run_time = row[5]  # datetime from SQL
-        last_duration = int(row[6]) if row[6] else None
-        priority = row[7] if row[7] else None
-        retry_count = int(row[8]) if row[8] else 0
-
-        jobs.append(
-            JobHealthOut(
-                job_id=job_id,
-                job_name=job_name,
-                total_runs=total_runs,
-                success_count=success_count,
-                success_rate=success_rate,
-                last_run_time=last_run_time,
-                last_duration_seconds=last_duration,
-                priority=priority,
-                retry_count=retry_count,
-            )
-        )
-    return jobs
+    # Decode typed columns once, then apply NULL defaults per column
+    cols = decode_result(result, JOB_HEALTH_COLUMNS)
+    job_ids = falsy_to(cols["job_id"], "")
+    job_names = [name or f"job-{job_id}" for name, job_id in zip(cols["job_name"], job_ids)]
+
+    return _JOB_HEALTH_LIST.validate_python(ColumnarResult(
+        [name for name, _ in JOB_HEALTH_COLUMNS],
+        [
+            job_ids,
+            job_names,
+            fill_null(cols["total_runs"], 0),
+            fill_null(cols["success_count"], 0),
+            fill_null(cols["success_rate"], 0.0),
+            cols["last_run_time"],
+            falsy_to(cols["last_duration_seconds"], None),
+            falsy_to(cols["priority"], None),
+            fill_null(cols["retry_count"], 0),
+        ],
+    ).to_dicts())
 
 
 def _sort_by_priority(jobs: list[JobHealthOut]) -> list[JobHealthOut]:
@@ -114,47 +176,109 @@ def _compute_priority_counts(jobs: list[JobHealthOut]) -> dict:
     }
 
 
-def _paginate_from_cache(
-    cache_data: list[dict], days: int, page: int, page_size: int
-) -> JobHealthListOut:
-    """Convert cache data to paginated JobHealthListOut.
+def _dataset_from_cache(cache_data: list[dict]) -> CachedDataset:
+    """Build the sorted health dataset (with priority counts) from cache rows.
 
-    Used for cache fallback when live queries fail or timeout.
+    Rows come from the Delta cache already sorted by priority.
     """
-    all_jobs = [
-        JobHealthOut(
-            job_id=row["job_id"],
-            job_name=row["job_name"],
-            total_runs=row["total_runs"],
-            success_count=row["success_count"],
-            success_rate=row["success_rate"],
-            last_run_time=row["last_run_time"],
-            last_duration_seconds=row["last_duration_seconds"],
-            priority=row["priority"],
-            retry_count=row["retry_count"],
-        )
-        for row in cache_data
-    ]
-    total_count = len(all_jobs)
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_jobs = all_jobs[start_idx:end_idx]
+    # Cache rows carry extra fields (durations, workspace); the model ignores them
+    all_jobs = _JOB_HEALTH_LIST.validate_python(cache_data)
+    return CachedDataset(items=all_jobs, aggregates=_compute_priority_counts(all_jobs), from_cache=True)
+
+
+def _health_query(
+    search: str | None,
+    priority: list[str] | None,
+    min_success_rate: float | None,
+    max_success_rate: float | None,
+    min_runs: int | None,
+    min_last_run_age_hours: float | None,
+    max_last_run_age_hours: float | None,
+    sort: str | None,
+) -> HealthQuery:
+    """Validate the search/filter/sort parameters of /health-metrics.
+
+    Raises:
+        HTTPException: 422 for an unknown priority or sort key
+    """
+    priorities = None
+    if priority:
+        by_name = {key.lower(): key for key in PRIORITY_RANK}
+        unknown = [p for p in priority if p.lower() not in by_name]
+        if unknown:
+            raise HTTPException(
+                status_code=422,
+                detail=f"priority must be one of {', '.join(PRIORITY_RANK)} (got {', '.join(unknown)})",
+            )
+        priorities = frozenset(by_name[p.lower()] for p in priority)
+    try:
+        sort_keys = parse_sort(sort)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return HealthQuery(
+        search=(search or "").strip() or None,
+        priorities=priorities,
+        min_success_rate=min_success_rate,
+        max_success_rate=max_success_rate,
+        min_runs=min_runs,
+        min_last_run_age_hours=min_last_run_age_hours,
+        max_last_run_age_hours=max_last_run_age_hours,
+        sort=sort_keys,
+    )
 
-    # Compute priority counts from full dataset
-    counts = _compute_priority_counts(all_jobs)
 
+def _page_from_dataset(
+    dataset: CachedDataset,
+    days: int,
+    page: int,
+    page_size: int,
+    stale: bool = False,
+    query: HealthQuery | None = None,
+) -> JobHealthListOut:
+    """Slice one page out of a cached health dataset.
+
+    With an active query, the page, total and priority counts come from
+    the dataset's JobHealthIndex (built on first use, reused until the
+    dataset expires) and cover only the matching jobs.
+    """
+    if query is not None and query.active:
+        index = dataset.indexed("health", JobHealthIndex)
+        positions, total, counts = index.search(query, page, page_size)
+        return JobHealthListOut(
+            jobs=[dataset.items[p] for p in positions],
+            window_days=days,
+            total_count=total,
+            page=page,
+            page_size=page_size,
+            has_more=page * page_size < total,
+            from_cache=dataset.from_cache,
+            stale=stale,
+            **counts,
+        )
+    paginated_jobs, has_more = dataset.page(page, page_size)
     return JobHealthListOut(
         jobs=paginated_jobs,
         window_days=days,
-        total_count=total_count,
+        total_count=dataset.total,
         page=page,
         page_size=page_size,
-        has_more=end_idx < total_count,
-        from_cache=True,
-        **counts,
+        has_more=has_more,
+        from_cache=dataset.from_cache,
+        stale=stale,
+        **dataset.aggregates,
     )
 
 
+def _paginate_from_cache(
+    cache_data: list[dict], days: int, page: int, page_size: int, query: HealthQuery | None = None
+) -> JobHealthListOut:
+    """Convert cache data to paginated JobHealthListOut.
+
+    Used for cache fallback when live queries fail or timeout.
+    """
+    return _page_from_dataset(_dataset_from_cache(cache_data), days, page, page_size, query=query)
+
+
 @router.get("/health-metrics", response_model=JobHealthListOut)
 async def get_health_metrics(
     days: Annotated[
@@ -173,6 +297,38 @@ async def get_health_metrics(
         int,
         Query(description="Number of jobs per page", ge=10, le=500),
     ] = 50,
+    search: Annotated[
+        str | None,
+        Query(description="Case-insensitive substring of the job name or ID (* and ? for a glob)"),
+    ] = None,
+    priority: Annotated[
+        list[str] | None,
+        Query(description="Filter by priority (P1, P2, P3, healthy)"),
+    ] = None,
+    min_success_rate: Annotated[
+        float | None,
+        Query(description="Minimum success rate (%)", ge=0, le=100),
+    ] = None,
+    max_success_rate: Annotated[
+        float | None,
+        Query(description="Maximum success rate (%)", ge=0, le=100),
+    ] = None,
+    min_runs: Annotated[
+        int | None,
+        Query(description="Minimum number of runs in the window", ge=0),
+    ] = None,
+    min_last_run_age_hours: Annotated[
+        float | None,
+        Query(description="Only jobs whose last run is at least this many hours old", ge=0),
+    ] = None,
+    max_last_run_age_hours: Annotated[
+        float | None,
+        Query(description="Only jobs that ran within this many hours", ge=0),
+    ] = None,
+    sort: Annotated[
+        str | None,
+        Query(description="Comma-separated sort keys, '-' prefix for descending (e.g. -success_rate,job_name)"),
+    ] = None,
     ws=Depends(get_ws_prefer_user),
 ) -> JobHealthListOut:
     """Get job health metrics with priority flags and retry counts.
@@ -195,8 +351,15 @@ async def get_health_metrics(
     2. Live system table queries (slow, real-time)
     3. Mock data (when permissions unavailable)
 
+    Search, filters and sort keys are evaluated server-side against an
+    in-memory index of the cached dataset (see health_index.py); total_count
+    and the priority counts then cover only the matching jobs.
+
     Args:
         days: Time window for metrics (7 or 30 days)
+        search: Job name/ID pattern (optional)
+        priority: Filter by P1, P2, P3, healthy (optional)
+        sort: Sort keys replacing the default priority order (optional)
         ws: WorkspaceClient dependency
 
     Returns:
@@ -205,11 +368,18 @@ async def get_health_metrics(
     # Validate days parameter (query params come as strings, so we need manual validation)
     if days not in (7, 30):
         raise HTTPException(status_code=422, detail="days must be 7 or 30")
+    query = _health_query(
+        search, priority, min_success_rate, max_success_rate, min_runs,
+        min_last_run_age_hours, max_last_run_age_hours, sort,
+    )
 
     # Check for mock data mode
     if is_mock_mode():
         logger.info(f"Mock mode enabled - returning mock health metrics for {days} days")
         mock_result = get_mock_health_metrics(days)
+        if query.active:
+            mock_dataset = CachedDataset(items=mock_result.jobs)
+            return _page_from_dataset(mock_dataset, days, page, page_size, query=query)
         # Apply pagination to mock data
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
@@ -225,13 +395,16 @@ async def get_health_metrics(
         )
 
     # Check in-memory response cache first (fastest path)
-    # Include workspace_id and pagination in cache key
+    # The full sorted dataset is cached per window/workspace; pages are sliced from it
     ws_filter = workspace_id if workspace_id else "current"
-    cache_key = f"health_metrics:{days}:{ws_filter}:p{page}:s{page_size}"
-    cached_response = response_cache.get(cache_key)
-    if cached_response:
-        logger.info(f"[RESPONSE_CACHE] Returning cached health metrics ({days}d, ws={ws_filter}, page={page})")
-        return cached_response
+    cache_key = f"health_metrics:{days}:{ws_filter}"
+    # Expired datasets are served (stale=True) while one background task refreshes them
+    cached_dataset, stale = await response_cache.aget_swr(cache_key)
+    if cached_dataset:
+        logger.info(f"[RESPONSE_CACHE] Returning cached health metrics ({days}d, ws={ws_filter}, page={page}, stale={stale})")
+        if stale:
+            response_cache.revalidate(cache_key, lambda: get_health_metrics(days=days, workspace_id=workspace_id, ws=ws))
+        return _page_from_dataset(cached_dataset, days, page, page_size, stale=stale, query=query)
 
     logger.info(f"get_health_metrics called with days={days}")
     logger.info(f"WorkspaceClient available: {ws is not None}")
@@ -248,55 +421,19 @@ async def get_health_metrics(
         logger.error("WAREHOUSE_ID not configured - returning 503")
         raise HTTPException(status_code=503, detail="Warehouse ID not configured")
 
-    # Try Delta table cache first for fast response
-    # NOTE: Delta cache doesn't support workspace filtering, so skip it when workspace_id is specified
-    use_delta_cache = settings.use_cache and (not workspace_id or workspace_id == "all")
+    # Try Delta table cache first for fast response (workspace filter is pushed into the query)
     delta_cache_data = None
-    if use_delta_cache:
-        logger.info("[CACHE] Attempting Delta cache lookup for health-metrics (no workspace filter)")
-        delta_cache_data = await query_job_health_cache(ws, days)
+    if settings.use_cache:
+        logger.info("[CACHE] Attempting Delta cache lookup for health-metrics")
+        delta_cache_data = await query_job_health_cache(ws, days, workspace_id)
         if delta_cache_data:
             logger.info(f"[CACHE_HIT] health-metrics: {len(delta_cache_data)} jobs from Delta cache")
-            all_jobs = [
-                JobHealthOut(
-                    job_id=row["job_id"],
-                    job_name=row["job_name"],
-                    total_runs=row["total_runs"],
-                    success_count=row["success_count"],
-                    success_rate=row["success_rate"],
-                    last_run_time=row["last_run_time"],
-                    last_duration_seconds=row["last_duration_seconds"],
-                    priority=row["priority"],
-                    retry_count=row["retry_count"],
-                )
-                for row in delta_cache_data
-            ]
-            # Apply pagination
-            total_count = len(all_jobs)
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_jobs = all_jobs[start_idx:end_idx]
-
-            # Compute priority counts from full dataset
-            counts = _compute_priority_counts(all_jobs)
-
-            result = JobHealthListOut(
-                jobs=paginated_jobs,
-                window_days=days,
-                total_count=total_count,
-                page=page,
-                page_size=page_size,
-                has_more=end_idx < total_count,
-                from_cache=True,
-                **counts,
-            )
-            # Cache in response cache for instant subsequent requests
-            response_cache.set(cache_key, result, TTL_STANDARD)
-            logger.info(f"[RESPONSE_CACHE] Cached page {page} from Delta cache ({len(paginated_jobs)}/{total_count} jobs)")
-            return result
+            dataset = _dataset_from_cache(delta_cache_data)
+            # Cache the dataset in response cache for instant subsequent pages (until the next refresh)
+            response_cache.set(cache_key, dataset, refresh_version_watcher.ttl(TTL_STANDARD), stale_ttl=TTL_MAX_STALE)
+            logger.info(f"[RESPONSE_CACHE] Cached health dataset from Delta cache ({dataset.total} jobs)")
+            return _page_from_dataset(dataset, days, page, page_size, query=query)
         logger.info("[CACHE_MISS] health-metrics: falling back to live query")
-    elif workspace_id:
-        logger.info(f"[CACHE_SKIP] Skipping Delta cache - workspace filter active: {workspace_id}")
 
     # Build workspace filter clause
     # If workspace_id='all' or None, don't filter by workspace
@@ -311,7 +448,7 @@ async def get_health_metrics(
 
     # SQL query using CTEs for consecutive failure detection
     # Pattern from 02-RESEARCH.md with LAG window function
-    query = f"""
+    sql = f"""
     WITH latest_jobs AS (
         -- SCD2 pattern: Get latest version of each job
         SELECT *,
@@ -400,28 +537,22 @@ async def get_health_metrics(
 
     try:
         logger.info(f"Executing SQL query on warehouse {warehouse_id}")
-        logger.debug(f"SQL Query:\n{query}")
-        # Max allowed wait_timeout is 50s - use async polling for longer queries
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
-            warehouse_id=warehouse_id,
-            statement=query,
-            wait_timeout="50s",
-        )
-
-        # If query is still pending after initial wait, poll for completion
-        if result and result.status and result.status.state.value in ("PENDING", "RUNNING"):
-            statement_id = result.statement_id
-            logger.info(f"Query still {result.status.state.value}, polling for completion (statement_id: {statement_id})")
-            for attempt in range(6):  # Poll up to 6 times (additional 60s total)
-                await asyncio.sleep(10)  # Wait 10s between polls
-                result = await asyncio.to_thread(
-                    ws.statement_execution.get_statement,
-                    statement_id=statement_id,
-                )
-                logger.info(f"Poll {attempt + 1}: status = {result.status.state.value if result.status else 'None'}")
-                if result.status and result.status.state.value not in ("PENDING", "RUNNING"):
-                    break
+        logger.debug(f"SQL Query:\n{sql}")
+        # The executor polls past the 50s wait_timeout cap; on timeout fall back to cache
+        try:
+            result = await statement_executor.execute(
+                ws,
+                sql,
+                warehouse_id=warehouse_id,
+                timeout=TIMEOUT_HEAVY,
+                fetch_all=True,
+            )
+        except StatementTimeoutError as e:
+            logger.warning(f"Health metrics query timed out after {e.timeout}s - trying cache fallback")
+            if delta_cache_data:
+                logger.info("[CACHE_FALLBACK] Using Delta cache after query timeout")
+                return _paginate_from_cache(delta_cache_data, days, page, page_size, query=query)
+            return JobHealthListOut(jobs=[], window_days=days, total_count=0, page=page, page_size=page_size)
         logger.info(f"SQL query completed, status: {result.status if result else 'None'}")
 
         # Log detailed result info and handle incomplete queries
@@ -436,21 +567,13 @@ async def get_health_metrics(
                     # Try cache fallback before mock data
                     if delta_cache_data:
                         logger.info("[CACHE_FALLBACK] Using Delta cache after permission error")
-                        return _paginate_from_cache(delta_cache_data, days, page, page_size)
+                        return _paginate_from_cache(delta_cache_data, days, page, page_size, query=query)
                     return get_mock_health_metrics(days)
-            # Check if query is still pending/running - use cache fallback
-            if result.status and result.status.state.value in ("PENDING", "RUNNING"):
-                logger.warning(f"Query still {result.status.state.value} after timeout - trying cache fallback")
-                # Try cache fallback
-                if delta_cache_data:
-                    logger.info("[CACHE_FALLBACK] Using Delta cache after query timeout")
-                    return _paginate_from_cache(delta_cache_data, days, page, page_size)
-                return JobHealthListOut(jobs=[], window_days=days, total_count=0, page=page, page_size=page_size)
             if result.result:
-                row_count = len(result.result.data_array) if result.result.data_array else 0
-                logger.info(f"Result row count: {row_count}")
-                if result.result.data_array and row_count > 0:
-                    logger.info(f"First row sample: {result.result.data_array[0]}")
+                rows = result_rows(result)
+                logger.info(f"Result row count: {len(rows)}")
+                if rows:
+                    logger.info(f"First row sample: {rows[0]}")
             else:
                 logger.warning("Result object exists but result.result is None")
         else:
@@ -462,7 +585,7 @@ async def get_health_metrics(
         # Try cache fallback before mock data
         if delta_cache_data:
             logger.warning("[CACHE_FALLBACK] SQL execution failed - using Delta cache")
-            return _paginate_from_cache(delta_cache_data, days, page, page_size)
+            return _paginate_from_cache(delta_cache_data, days, page, page_size, query=query)
         logger.warning("SQL execution failed - falling back to mock data")
         return get_mock_health_metrics(days)
 
@@ -471,31 +594,77 @@ async def get_health_metrics(
     # Apply secondary sort to ensure consistent ordering
     sorted_jobs = _sort_by_priority(jobs)
 
-    # Compute priority counts from full dataset
-    counts = _compute_priority_counts(sorted_jobs)
+    # Compute priority counts once for the full dataset
+    dataset = CachedDataset(items=sorted_jobs, aggregates=_compute_priority_counts(sorted_jobs))
 
-    # Apply pagination
-    total_count = len(sorted_jobs)
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_jobs = sorted_jobs[start_idx:end_idx]
+    # Cache the dataset for 5 minutes; every page is sliced from it
+    response_cache.set(cache_key, dataset, TTL_STANDARD, stale_ttl=TTL_MAX_STALE)
+    logger.info(f"[RESPONSE_CACHE] Cached health dataset ({dataset.total} jobs, {days}d)")
 
-    result_obj = JobHealthListOut(
-        jobs=paginated_jobs,
-        window_days=days,
-        total_count=total_count,
-        page=page,
-        page_size=page_size,
-        has_more=end_idx < total_count,
-        from_cache=False,
-        **counts,
-    )
+    return _page_from_dataset(dataset, days, page, page_size, query=query)
 
-    # Cache the response for 5 minutes
-    response_cache.set(cache_key, result_obj, TTL_STANDARD)
-    logger.info(f"[RESPONSE_CACHE] Cached page {page} ({len(paginated_jobs)}/{total_count} jobs, {days}d)")
 
-    return result_obj
+async def _mock_export_batches(days: int):
+    """Yield the mock health jobs as one export batch."""
+    jobs = [job.model_dump() for job in get_mock_health_metrics(days).jobs]
+    names = [name for name, _ in JOB_HEALTH_EXPORT_COLUMNS]
+    yield ColumnarResult(names, [[job.get(name) for job in jobs] for name in names])
+
+
+@router.get("/health-metrics/export")
+async def export_health_metrics(
+    format: Annotated[
+        Literal["ndjson", "csv", "arrow"],
+        Query(description="ndjson, csv or arrow (Arrow IPC stream)"),
+    ] = "ndjson",
+    days: Annotated[
+        int,
+        Query(description="Time window: 7 or 30 days"),
+    ] = 7,
+    workspace_id: Annotated[
+        str | None,
+        Query(description="Filter by workspace ID (omit or 'all' for all workspaces)"),
+    ] = None,
+    ws=Depends(get_ws_prefer_user),
+) -> StreamingResponse:
+    """Stream every job's health record for bulk consumers.
+
+    Unlike /health-metrics, the whole dataset is sent in one response,
+    unsorted, with workspace_id and the duration statistics. Rows are
+    encoded batch by batch straight from the job_health_cache snapshot or
+    query result, so memory use does not grow with the number of jobs.
+
+    Args:
+        format: Output encoding
+        days: Time window for metrics (7 or 30 days)
+        workspace_id: Optional workspace ID filter
+        ws: WorkspaceClient dependency
+
+    Returns:
+        StreamingResponse with one record per job
+    """
+    if days not in (7, 30):
+        raise HTTPException(status_code=422, detail="days must be 7 or 30")
+    if format == "arrow" and not ARROW_AVAILABLE:
+        raise HTTPException(status_code=501, detail="Arrow export requires pyarrow (pip install 'job-monitor[arrow]')")
+
+    if is_mock_mode():
+        logger.info(f"Mock mode enabled - exporting mock health metrics for {days} days")
+        batches = _mock_export_batches(days)
+    else:
+        if not ws or not settings.warehouse_id:
+            raise HTTPException(status_code=503, detail="Databricks connection not available")
+        batches = await open_job_health_export(ws, days, workspace_id)
+        if batches is None:
+            raise HTTPException(status_code=503, detail="Job health cache not available for export")
+
+    body = encode_export(format, batches, JOB_HEALTH_EXPORT_COLUMNS)
+    filename = f"job_health_{days}d.{EXPORT_EXTENSIONS[format]}"
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get("/health-metrics/summary", response_model=JobHealthSummaryOut)
@@ -512,7 +681,7 @@ async def get_health_summary(
     Typical response time: <1s (vs 11-16s for full health-metrics with job list)
 
     Args:
-        days: Time window for analysis (7 or 30 days recommended)
+        days: Time window for analysis (1-90 days; 7 and 30 are served from job_health_cache)
         workspace_id: Optional workspace ID filter ("all" to skip filtering)
         ws: WorkspaceClient dependency
 
@@ -521,16 +690,15 @@ async def get_health_summary(
     """
     from job_monitor.backend.models import JobHealthSummaryOut
 
-    # Validate days parameter
-    if days not in (7, 30):
-        days = 7
-
     # Check response cache first
     ws_filter = workspace_id if workspace_id else "current"
     cache_key = f"health_summary:{days}:{ws_filter}"
-    cached = response_cache.get(cache_key)
+    cached, stale = await response_cache.aget_swr(cache_key)
     if cached:
-        logger.info(f"[RESPONSE_CACHE] Returning cached health summary ({days}d, ws={ws_filter})")
+        logger.info(f"[RESPONSE_CACHE] Returning cached health summary ({days}d, ws={ws_filter}, stale={stale})")
+        if stale:
+            response_cache.revalidate(cache_key, lambda: get_health_summary(days=days, workspace_id=workspace_id, ws=ws))
+            return cached.model_copy(update={"stale": True})
         return cached
 
     # Handle mock mode
@@ -551,9 +719,13 @@ async def get_health_summary(
     if not settings.warehouse_id:
         raise HTTPException(status_code=503, detail="Warehouse ID not configured")
 
-    # Fast path: Use Delta cache when no workspace filter (much faster)
-    if settings.use_cache and (not workspace_id or workspace_id == "all"):
-        cache_data = await query_job_health_cache(ws, days)
+    # Fast path: Use Delta cache (much faster); job_health_cache holds the
+    # 7/30-day windows, any other window is summed from the daily rollup
+    if settings.use_cache:
+        if days in (7, 30):
+            cache_data = await query_job_health_cache(ws, days, workspace_id)
+        else:
+            cache_data = await query_job_daily_health(ws, days, workspace_id)
         if cache_data:
             # Compute counts from cached data
             p1 = sum(1 for j in cache_data if j.get("priority") == "P1")
@@ -573,7 +745,7 @@ async def get_health_summary(
                 from_cache=True,
                 avg_success_rate=round(avg_rate, 1),
             )
-            response_cache.set(cache_key, summary, TTL_STANDARD)
+            response_cache.set(cache_key, summary, refresh_version_watcher.ttl(TTL_STANDARD), stale_ttl=TTL_MAX_STALE)
             logger.info(f"[SUMMARY_CACHE] Fast path: {total} jobs from Delta cache")
             return summary
 
@@ -644,27 +816,27 @@ async def get_health_summary(
     """
 
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=settings.warehouse_id,
-            statement=query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_LIVE,
         )
 
-        if result and result.result and result.result.data_array:
-            row = result.result.data_array[0]
+        if has_rows(result):
+            row = decode_result(result, HEALTH_SUMMARY_COLUMNS).to_dicts()[0]
             summary = JobHealthSummaryOut(
-                total_count=int(row[0]) if row[0] else 0,
-                p1_count=int(row[1]) if row[1] else 0,
-                p2_count=int(row[2]) if row[2] else 0,
-                p3_count=int(row[3]) if row[3] else 0,
-                healthy_count=int(row[4]) if row[4] else 0,
+                total_count=row["total_count"] or 0,
+                p1_count=row["p1_count"] or 0,
+                p2_count=row["p2_count"] or 0,
+                p3_count=row["p3_count"] or 0,
+                healthy_count=row["healthy_count"] or 0,
                 window_days=days,
                 from_cache=False,
-                avg_success_rate=float(row[5]) if row[5] else 0.0,
+                avg_success_rate=row["avg_success_rate"] or 0.0,
             )
             # Cache for 5 minutes
-            response_cache.set(cache_key, summary, TTL_STANDARD)
+            response_cache.set(cache_key, summary, TTL_STANDARD, stale_ttl=TTL_MAX_STALE)
             logger.info(f"[SUMMARY] Returned counts: total={summary.total_count}, p1={summary.p1_count}, p2={summary.p2_count}")
             return summary
 
@@ -684,7 +856,7 @@ async def get_health_summary(
 
 def _parse_duration_stats(result, job_id: str) -> DurationStatsOut:
     """Parse statement execution result into DurationStatsOut model."""
-    if not result or not result.result or not result.result.data_array:
+    if not has_rows(result):
         return DurationStatsOut(
             job_id=job_id,
             median_duration_seconds=None,
@@ -696,29 +868,49 @@ def _parse_duration_stats(result, job_id: str) -> DurationStatsOut:
             has_sufficient_data=False,
         )
 
-    row = result.result.data_array[0]
-    run_count = int(row[4]) if row[4] else 0
+    row = decode_result(result, DURATION_STATS_COLUMNS).to_dicts()[0]
+    run_count = row["run_count"] or 0
 
     return DurationStatsOut(
         job_id=job_id,
-        median_duration_seconds=float(row[0]) if row[0] else None,
-        p90_duration_seconds=float(row[1]) if row[1] else None,
-        avg_duration_seconds=float(row[2]) if row[2] else None,
-        max_duration_seconds=float(row[3]) if row[3] else None,
+        median_duration_seconds=row["median_duration_seconds"] or None,
+        p90_duration_seconds=row["p90_duration_seconds"] or None,
+        avg_duration_seconds=row["avg_duration_seconds"] or None,
+        max_duration_seconds=row["max_duration_seconds"] or None,
         run_count=run_count,
-        baseline_30d_median=float(row[0]) if row[0] else None,  # 30-day median IS the baseline
+        baseline_30d_median=row["median_duration_seconds"] or None,  # 30-day median IS the baseline
         has_sufficient_data=run_count >= 5,
     )
 
 
-def _parse_job_runs(result, baseline_median: float | None) -> list[JobRunDetailOut]:
-    """Parse statement execution result into JobRunDetailOut models."""
-    if not result or not result.result or not result.result.data_array:
-        return []
+def _duration_stats_from_cache(job_id: str, cached: dict) -> DurationStatsOut:
+    """Build DurationStatsOut from a job_health_cache / job_detail_cache record."""
+    run_count = cached["run_count"] or 0
+    return DurationStatsOut(
+        job_id=job_id,
+        median_duration_seconds=cached["median_duration_seconds"],
+        p90_duration_seconds=cached["p90_duration_seconds"],
+        avg_duration_seconds=cached["avg_duration_seconds"],
+        max_duration_seconds=cached["max_duration_seconds"],
+        run_count=run_count,
+        baseline_30d_median=cached["median_duration_seconds"],
+        has_sufficient_data=run_count >= 5,
+    )
+
 
+def _cached_run_rows(job_id: str, runs: list[dict]) -> list[tuple]:
+    """Convert cached run dicts to the row layout of the live recent runs query."""
+    return [
+        (run["run_id"], job_id, run["start_time"], run["end_time"], run["duration_seconds"], run["result_state"])
+        for run in runs
+    ]
+
+
+def _parse_job_runs(rows: list, baseline_median: float | None) -> list[JobRunDetailOut]:
+    """Parse typed (run_id, job_id, start, end, duration, state) rows into JobRunDetailOut models."""
     runs = []
-    for row in result.result.data_array:
-        duration = int(row[4]) if row[4] else None
+    for row in rows:
+        duration = row[4] or None
 
         # Anomaly detection: duration > 2x baseline median
         is_anomaly = False
@@ -727,8 +919,8 @@ def _parse_job_runs(result, baseline_median: float | None) -> list[JobRunDetailO
 
         runs.append(
             JobRunDetailOut(
-                run_id=str(row[0]),
-                job_id=str(row[1]),
+                run_id=row[0],
+                job_id=row[1],
                 start_time=row[2],
                 end_time=row[3] if row[3] else None,
                 duration_seconds=duration,
@@ -739,6 +931,28 @@ def _parse_job_runs(result, baseline_median: float | None) -> list[JobRunDetailO
     return runs
 
 
+async def _fetch_recent_runs(ws, job_id: str, runs_query: str) -> list:
+    """Get a job's last runs from the job_recent_runs cache, else live.
+
+    Returns:
+        (run_id, job_id, start, end, duration, state) rows, newest first
+    """
+    cached = await query_recent_runs_cache(ws, [job_id], RECENT_RUNS_LIMIT)
+    if cached is not None:
+        return _cached_run_rows(job_id, cached.get(job_id, []))
+
+    result = await statement_executor.execute(
+        ws,
+        runs_query,
+        warehouse_id=settings.warehouse_id,
+        timeout=TIMEOUT_LIVE,
+    )
+    if not has_rows(result):
+        return []
+    cols = decode_result(result, RECENT_RUN_COLUMNS)
+    return list(zip(*(cols[name] for name, _ in RECENT_RUN_COLUMNS)))
+
+
 @router.get("/health-metrics/{job_id}/duration", response_model=DurationStatsOut)
 async def get_duration_stats(
     job_id: str,
@@ -773,17 +987,7 @@ async def get_duration_stats(
         cached = await query_job_duration_cache(ws, job_id)
         if cached:
             logger.info(f"Duration stats cache hit for {job_id}")
-            run_count = cached["run_count"] or 0
-            return DurationStatsOut(
-                job_id=job_id,
-                median_duration_seconds=cached["median_duration_seconds"],
-                p90_duration_seconds=cached["p90_duration_seconds"],
-                avg_duration_seconds=cached["avg_duration_seconds"],
-                max_duration_seconds=cached["max_duration_seconds"],
-                run_count=run_count,
-                baseline_30d_median=cached["median_duration_seconds"],
-                has_sufficient_data=run_count >= 5,
-            )
+            return _duration_stats_from_cache(job_id, cached)
 
     # Use PERCENTILE_CONT for accurate percentile calculations
     query = f"""
@@ -800,12 +1004,16 @@ async def get_duration_stats(
       AND result_state IS NOT NULL
     """
 
-    result = await asyncio.to_thread(
-        ws.statement_execution.execute_statement,
-        warehouse_id=warehouse_id,
-        statement=query,
-        wait_timeout="30s",
-    )
+    try:
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=warehouse_id,
+            timeout=TIMEOUT_LIVE,
+        )
+    except StatementTimeoutError as e:
+        logger.warning(f"Duration stats query for {job_id} timed out after {e.timeout}s")
+        result = None
 
     return _parse_duration_stats(result, job_id)
 
@@ -842,6 +1050,22 @@ async def get_job_details(
     if not warehouse_id:
         return get_mock_job_details(job_id)
 
+    # Single indexed lookup on job_detail_cache; live queries only for jobs missing from it
+    if settings.use_cache:
+        cached = await query_job_detail_cache(ws, job_id)
+        if cached:
+            duration_stats = _duration_stats_from_cache(job_id, cached)
+            return JobExpandedOut(
+                job_id=job_id,
+                job_name=cached["job_name"] or "Unknown",
+                recent_runs=_parse_job_runs(
+                    _cached_run_rows(job_id, cached["recent_runs"]), duration_stats.baseline_30d_median
+                ),
+                duration_stats=duration_stats,
+                retry_count_7d=cached["retry_count_7d"],
+                failure_reasons=cached["failure_reasons"],
+            )
+
     # Run all queries in parallel for better performance
     # Note: run_duration_seconds can be 0 for serverless jobs, so we calculate
     # effective duration from timestamps as fallback
@@ -870,7 +1094,7 @@ async def get_job_details(
     WHERE effective_duration > 0
     """
 
-    # 2. Recent runs query (last 10)
+    # 2. Recent runs (last 10): job_recent_runs cache lookup, this query on a miss
     # Calculate effective duration for serverless jobs where run_duration_seconds = 0
     runs_query = f"""
     SELECT run_id, job_id, period_start_time, period_end_time,
@@ -884,7 +1108,7 @@ async def get_job_details(
     WHERE job_id = '{job_id}'
       AND period_start_time >= current_date() - INTERVAL 30 DAYS
     ORDER BY period_start_time DESC
-    LIMIT 10
+    LIMIT {RECENT_RUNS_LIMIT}
     """
 
     # 3. Job name query (SCD2 pattern for latest version)
@@ -923,62 +1147,72 @@ async def get_job_details(
     """
 
     # Execute all queries in parallel
-    stats_result, runs_result, name_result, retry_result, reasons_result = await asyncio.gather(
-        asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+    stats_result, run_rows, name_result, retry_result, reasons_result = await asyncio.gather(
+        statement_executor.execute(
+            ws,
+            stats_query,
             warehouse_id=warehouse_id,
-            statement=stats_query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_LIVE,
         ),
-        asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        _fetch_recent_runs(ws, job_id, runs_query),
+        statement_executor.execute(
+            ws,
+            job_name_query,
             warehouse_id=warehouse_id,
-            statement=runs_query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_LIVE,
         ),
-        asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        statement_executor.execute(
+            ws,
+            retry_query,
             warehouse_id=warehouse_id,
-            statement=job_name_query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_LIVE,
         ),
-        asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        statement_executor.execute(
+            ws,
+            failure_reasons_query,
             warehouse_id=warehouse_id,
-            statement=retry_query,
-            wait_timeout="30s",
-        ),
-        asyncio.to_thread(
-            ws.statement_execution.execute_statement,
-            warehouse_id=warehouse_id,
-            statement=failure_reasons_query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_LIVE,
         ),
+        return_exceptions=True,
     )
 
+    # A slow or failing section degrades to empty instead of failing the whole row
+    sections = ("duration stats", "recent runs", "job name", "retry count", "failure reasons")
+    results = [stats_result, run_rows, name_result, retry_result, reasons_result]
+    for i, (section, value) in enumerate(zip(sections, results)):
+        if isinstance(value, StatementTimeoutError):
+            logger.warning(f"Job details {section} query for {job_id} timed out after {value.timeout}s")
+            results[i] = None
+        elif isinstance(value, Exception):
+            logger.warning(f"Job details {section} query for {job_id} failed: {value}")
+            results[i] = None
+    stats_result, run_rows, name_result, retry_result, reasons_result = results
+    run_rows = run_rows or []
+
     # Parse duration stats
     duration_stats = _parse_duration_stats(stats_result, job_id)
 
     # Parse recent runs with anomaly detection based on baseline
-    recent_runs = _parse_job_runs(runs_result, duration_stats.baseline_30d_median)
+    recent_runs = _parse_job_runs(run_rows, duration_stats.baseline_30d_median)
 
     # Extract job name
     job_name = "Unknown"
-    if name_result and name_result.result and name_result.result.data_array:
-        job_name = str(name_result.result.data_array[0][0]) or "Unknown"
+    if has_rows(name_result):
+        job_name = decode_result(name_result, [("name", "STRING")])["name"][0] or "Unknown"
 
     # Extract retry count
     retry_count = 0
-    if retry_result and retry_result.result and retry_result.result.data_array:
-        retry_count = int(retry_result.result.data_array[0][0] or 0)
+    if has_rows(retry_result):
+        retry_count = decode_result(retry_result, [("retry_count", "LONG")])["retry_count"][0] or 0
         # Ensure non-negative (edge case when all runs are on different days)
         retry_count = max(0, retry_count)
 
     # Extract failure reasons
     failure_reasons = []
-    if reasons_result and reasons_result.result and reasons_result.result.data_array:
+    if has_rows(reasons_result):
         failure_reasons = [
-            str(row[0]) for row in reasons_result.result.data_array if row[0]
+            reason for reason in decode_result(reasons_result, [("termination_code", "STRING")])["termination_code"]
+            if reason
         ]
 
     return JobExpandedOut(
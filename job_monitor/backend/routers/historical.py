@@ -8,18 +8,24 @@ Provides:
 Performance optimizations:
 - Response caching with 5-minute TTL for all historical endpoints
 - Cache key includes all query parameters for accurate cache hits
+- Daily and weekly series are summed from the job_daily_stats rollup
+  (hourly series still query the system tables)
+- Team filters are semi-joins on the job_team_map cache table
+- Sparkline runs are point lookups on the job_recent_runs cache table
 """
 
-import asyncio
 import logging
 from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
+from job_monitor.backend.cache import query_recent_runs_cache, team_predicate
 from job_monitor.backend.config import get_settings
 from job_monitor.backend.core import get_ws_prefer_user
-from job_monitor.backend.response_cache import response_cache
+from job_monitor.backend.response_cache import response_cache, TTL_MAX_STALE
+from job_monitor.backend.result_decoder import has_rows, result_rows
+from job_monitor.backend.statement_executor import TIMEOUT_LIVE, statement_executor
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +52,7 @@ class HistoricalResponse(BaseModel):
     current_total: float
     previous_total: float
     change_percent: float
+    stale: bool = False  # True if served past TTL while being refreshed
 
 
 def _get_granularity(days: int) -> tuple[str, Literal["hourly", "daily", "weekly"]]:
@@ -58,19 +65,108 @@ def _get_granularity(days: int) -> tuple[str, Literal["hourly", "daily", "weekly
         return "WEEK", "weekly"
 
 
-async def _execute_query(ws, warehouse_id: str, query: str) -> list[dict]:
-    """Execute SQL query and return results as list of dicts."""
+def _iso(value) -> str | None:
+    """Render a timestamp (ISO string or datetime from Arrow results) as a string."""
+    if not value:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _rollup_query(
+    table: str, value_sql: str, row_filter: str, interval: str, days: int, filter_sql: str,
+    columns: tuple[str, str],
+) -> str:
+    """Build a current vs previous period query over the job_daily_stats rollup.
+
+    Returns the same period/current/previous rows as the system table
+    queries, for DAY or WEEK buckets.
+
+    Args:
+        table: Fully qualified job_daily_stats table
+        value_sql: Aggregate of the rollup columns per bucket
+        row_filter: Condition selecting the rollup rows that count
+        interval: DATE_TRUNC unit (DAY or WEEK)
+        days: Window length
+        filter_sql: Extra "AND ..." filters on rollup columns
+        columns: Output names of the current and previous values
+    """
+    current_col, previous_col = columns
+    return f"""
+    WITH current_period AS (
+        SELECT
+            DATE_TRUNC('{interval}', stat_date) as period,
+            {value_sql} as value
+        FROM {table}
+        WHERE stat_date >= current_date() - INTERVAL {days} DAYS
+          AND {row_filter}
+          {filter_sql}
+        GROUP BY DATE_TRUNC('{interval}', stat_date)
+    ),
+    previous_period AS (
+        SELECT
+            DATE_TRUNC('{interval}', stat_date + INTERVAL {days} DAYS) as period,
+            {value_sql} as value
+        FROM {table}
+        WHERE stat_date >= current_date() - INTERVAL {days * 2} DAYS
+          AND stat_date < current_date() - INTERVAL {days} DAYS
+          AND {row_filter}
+          {filter_sql}
+        GROUP BY DATE_TRUNC('{interval}', stat_date + INTERVAL {days} DAYS)
+    )
+    SELECT
+        COALESCE(c.period, p.period) as period,
+        COALESCE(c.value, 0) as {current_col},
+        COALESCE(p.value, 0) as {previous_col}
+    FROM current_period c
+    FULL OUTER JOIN previous_period p ON c.period = p.period
+    ORDER BY period
+    """
+
+
+async def _query_rollup(ws, settings, granularity: str, **query_args) -> list[dict] | None:
+    """Answer a historical series from job_daily_stats when possible.
+
+    An empty result is a valid empty series (e.g. a team or job filter
+    with no runs), not a reason to scan the system tables.
+
+    Returns:
+        Rows like the system table query, or None if the rollup can't
+        answer it (hourly buckets, cache disabled, table missing or query
+        failed)
+    """
+    if not settings.use_cache or granularity == "hourly":
+        return None
+    table = f"{settings.cache_table_prefix}.job_daily_stats"
+    rows = await _run_query(ws, settings.warehouse_id, _rollup_query(table, **query_args))
+    if rows is None:
+        logger.info("[CACHE_MISS] job_daily_stats query failed, querying system tables")
+        return None
+    logger.info(f"[CACHE_HIT] Historical series from job_daily_stats ({len(rows)} points)")
+    return rows
+
+
+async def _execute_query(ws, warehouse_id: str, query: str, fetch_all: bool = False) -> list[dict]:
+    """Execute SQL query and return results as list of dicts (empty on failure).
+
+    Set fetch_all for queries whose result can exceed the first inline chunk.
+    """
+    return await _run_query(ws, warehouse_id, query, fetch_all) or []
+
+
+async def _run_query(ws, warehouse_id: str, query: str, fetch_all: bool = False) -> list[dict] | None:
+    """Execute SQL query and return results as list of dicts, or None on failure."""
     import logging
     from databricks.sdk.service.sql import StatementState
 
     logger = logging.getLogger(__name__)
 
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=warehouse_id,
-            statement=query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_LIVE,
+            fetch_all=fetch_all,
         )
 
         if result.status.state != StatementState.SUCCEEDED:
@@ -78,17 +174,17 @@ async def _execute_query(ws, warehouse_id: str, query: str) -> list[dict]:
                 f"Historical query failed with state {result.status.state}: "
                 f"{result.status.error.message if result.status.error else 'Unknown error'}"
             )
-            return []
+            return None
 
-        if not result.manifest or not result.result or not result.result.data_array:
+        if not result.manifest or not has_rows(result):
             logger.debug("Historical query returned no data")
             return []
 
         columns = [col.name for col in result.manifest.schema.columns]
-        return [dict(zip(columns, row)) for row in result.result.data_array]
+        return [dict(zip(columns, row)) for row in result_rows(result)]
     except Exception as e:
         logger.error(f"Historical query execution error: {e}")
-        return []
+        return None
 
 
 @router.get("/costs", response_model=HistoricalResponse)
@@ -101,14 +197,19 @@ async def get_historical_costs(
 ) -> HistoricalResponse:
     """Get historical cost data with auto-granularity and previous period comparison.
 
-    Results are cached for 5 minutes to improve response times.
+    Results are cached for 5 minutes to improve response times. Expired
+    results are served (stale=True) while they are refreshed in the background.
     """
     # Check cache first
     cache_key = f"historical:costs:{days}:{team}:{job_id}:{workspace_id}"
-    cached = response_cache.get(cache_key)
+    cached, stale = await response_cache.aget_swr(cache_key)
     if cached:
-        logger.debug(f"[CACHE_HIT] Historical costs ({days}d)")
-        return HistoricalResponse(**cached)
+        logger.debug(f"[CACHE_HIT] Historical costs ({days}d, stale={stale})")
+        if stale:
+            response_cache.revalidate(cache_key, lambda: get_historical_costs(
+                days=days, team=team, job_id=job_id, workspace_id=workspace_id, ws=ws
+            ))
+        return HistoricalResponse(**{**cached, "stale": stale})
 
     settings = get_settings()
 
@@ -131,13 +232,21 @@ async def get_historical_costs(
             raise HTTPException(status_code=422, detail="workspace_id must be numeric")
         filters.append(f"AND workspace_id = {workspace_id}")
     if team:
-        filters.append(
-            f"AND usage_metadata.job_id IN (SELECT job_id FROM job_team_map WHERE team = '{team}')"
-        )
+        filters.append(f"AND {team_predicate(team, 'usage_metadata.job_id')}")
     if job_id:
         filters.append(f"AND usage_metadata.job_id = '{job_id}'")
     filter_sql = " ".join(filters)
 
+    rows = await _query_rollup(
+        ws, settings, granularity,
+        value_sql="SUM(dbus)",
+        row_filter="dbus IS NOT NULL",
+        interval=interval,
+        days=days,
+        filter_sql=filter_sql.replace("usage_metadata.job_id", "job_id"),
+        columns=("current_dbus", "previous_dbus"),
+    )
+
     query = f"""
     WITH current_period AS (
         SELECT
@@ -169,7 +278,8 @@ async def get_historical_costs(
     ORDER BY period
     """
 
-    rows = await _execute_query(ws, settings.warehouse_id, query)
+    if rows is None:
+        rows = await _execute_query(ws, settings.warehouse_id, query)
 
     data = [
         HistoricalDataPoint(
@@ -197,7 +307,7 @@ async def get_historical_costs(
     )
 
     # Cache the result
-    response_cache.set(cache_key, result.model_dump(), HISTORICAL_CACHE_TTL)
+    response_cache.set(cache_key, result.model_dump(), HISTORICAL_CACHE_TTL, stale_ttl=TTL_MAX_STALE)
     logger.info(f"[CACHE_SET] Historical costs ({days}d, {len(data)} points)")
 
     return result
@@ -213,14 +323,19 @@ async def get_historical_success_rate(
 ) -> HistoricalResponse:
     """Get historical success rate with auto-granularity and previous period comparison.
 
-    Results are cached for 5 minutes to improve response times.
+    Results are cached for 5 minutes to improve response times. Expired
+    results are served (stale=True) while they are refreshed in the background.
     """
     # Check cache first
     cache_key = f"historical:success-rate:{days}:{team}:{job_id}:{workspace_id}"
-    cached = response_cache.get(cache_key)
+    cached, stale = await response_cache.aget_swr(cache_key)
     if cached:
-        logger.debug(f"[CACHE_HIT] Historical success-rate ({days}d)")
-        return HistoricalResponse(**cached)
+        logger.debug(f"[CACHE_HIT] Historical success-rate ({days}d, stale={stale})")
+        if stale:
+            response_cache.revalidate(cache_key, lambda: get_historical_success_rate(
+                days=days, team=team, job_id=job_id, workspace_id=workspace_id, ws=ws
+            ))
+        return HistoricalResponse(**{**cached, "stale": stale})
 
     settings = get_settings()
 
@@ -242,16 +357,28 @@ async def get_historical_success_rate(
         if not workspace_id.isdigit():
             raise HTTPException(status_code=422, detail="workspace_id must be numeric")
         filters.append(f"AND workspace_id = {workspace_id}")
+    if team:
+        filters.append(f"AND {team_predicate(team)}")
     if job_id:
         filters.append(f"AND job_id = '{job_id}'")
     filter_sql = " ".join(filters)
 
-    # System tables use SUCCEEDED (not SUCCESS) for successful runs
+    rows = await _query_rollup(
+        ws, settings, granularity,
+        value_sql="SUM(success_count) * 100.0 / SUM(run_count)",
+        row_filter="run_count > 0",
+        interval=interval,
+        days=days,
+        filter_sql=filter_sql,
+        columns=("current_rate", "previous_rate"),
+    )
+
+    # Successful runs are SUCCEEDED or SUCCESS, as in the job_daily_stats rollup
     query = f"""
     WITH current_period AS (
         SELECT
             DATE_TRUNC('{interval}', period_start_time) as period,
-            COUNT(CASE WHEN UPPER(result_state) = 'SUCCEEDED' THEN 1 END) * 100.0 / COUNT(*) as success_rate
+            COUNT(CASE WHEN UPPER(result_state) IN ('SUCCESS', 'SUCCEEDED') THEN 1 END) * 100.0 / COUNT(*) as success_rate
         FROM system.lakeflow.job_run_timeline
         WHERE period_start_time >= current_date() - INTERVAL {days} DAYS
           AND result_state IS NOT NULL
@@ -261,7 +388,7 @@ async def get_historical_success_rate(
     previous_period AS (
         SELECT
             DATE_TRUNC('{interval}', period_start_time + INTERVAL {days} DAYS) as period,
-            COUNT(CASE WHEN UPPER(result_state) = 'SUCCEEDED' THEN 1 END) * 100.0 / COUNT(*) as success_rate
+            COUNT(CASE WHEN UPPER(result_state) IN ('SUCCESS', 'SUCCEEDED') THEN 1 END) * 100.0 / COUNT(*) as success_rate
         FROM system.lakeflow.job_run_timeline
         WHERE period_start_time >= current_date() - INTERVAL {days * 2} DAYS
           AND period_start_time < current_date() - INTERVAL {days} DAYS
@@ -278,7 +405,8 @@ async def get_historical_success_rate(
     ORDER BY period
     """
 
-    rows = await _execute_query(ws, settings.warehouse_id, query)
+    if rows is None:
+        rows = await _execute_query(ws, settings.warehouse_id, query)
 
     data = [
         HistoricalDataPoint(
@@ -302,7 +430,7 @@ async def get_historical_success_rate(
     )
 
     # Cache the result
-    response_cache.set(cache_key, result.model_dump(), HISTORICAL_CACHE_TTL)
+    response_cache.set(cache_key, result.model_dump(), HISTORICAL_CACHE_TTL, stale_ttl=TTL_MAX_STALE)
     logger.info(f"[CACHE_SET] Historical success-rate ({days}d, {len(data)} points)")
 
     return result
@@ -318,14 +446,19 @@ async def get_historical_sla_breaches(
 ) -> HistoricalResponse:
     """Get historical SLA breach count with auto-granularity and previous period comparison.
 
-    Results are cached for 5 minutes to improve response times.
+    Results are cached for 5 minutes to improve response times. Expired
+    results are served (stale=True) while they are refreshed in the background.
     """
     # Check cache first
     cache_key = f"historical:sla-breaches:{days}:{team}:{job_id}:{workspace_id}"
-    cached = response_cache.get(cache_key)
+    cached, stale = await response_cache.aget_swr(cache_key)
     if cached:
-        logger.debug(f"[CACHE_HIT] Historical sla-breaches ({days}d)")
-        return HistoricalResponse(**cached)
+        logger.debug(f"[CACHE_HIT] Historical sla-breaches ({days}d, stale={stale})")
+        if stale:
+            response_cache.revalidate(cache_key, lambda: get_historical_sla_breaches(
+                days=days, team=team, job_id=job_id, workspace_id=workspace_id, ws=ws
+            ))
+        return HistoricalResponse(**{**cached, "stale": stale})
 
     settings = get_settings()
 
@@ -346,10 +479,24 @@ async def get_historical_sla_breaches(
         if not workspace_id.isdigit():
             raise HTTPException(status_code=422, detail="workspace_id must be numeric")
         filters.append(f"AND workspace_id = {workspace_id}")
+    if team:
+        filters.append(f"AND {team_predicate(team)}")
     if job_id:
         filters.append(f"AND job_id = '{job_id}'")
     filter_sql = " ".join(filters)
 
+    # Failures are counted as proxy for SLA breaches (the rollup's
+    # sla_breach_count only covers jobs with an SLA tag)
+    rows = await _query_rollup(
+        ws, settings, granularity,
+        value_sql="SUM(failure_count)",
+        row_filter="failure_count > 0",
+        interval=interval,
+        days=days,
+        filter_sql=filter_sql,
+        columns=("current_count", "previous_count"),
+    )
+
     # This query counts failures as proxy for SLA breaches
     # In production, would join with SLA targets from job tags
     query = f"""
@@ -383,7 +530,8 @@ async def get_historical_sla_breaches(
     ORDER BY period
     """
 
-    rows = await _execute_query(ws, settings.warehouse_id, query)
+    if rows is None:
+        rows = await _execute_query(ws, settings.warehouse_id, query)
 
     data = [
         HistoricalDataPoint(
@@ -411,13 +559,13 @@ async def get_historical_sla_breaches(
     )
 
     # Cache the result
-    response_cache.set(cache_key, result.model_dump(), HISTORICAL_CACHE_TTL)
+    response_cache.set(cache_key, result.model_dump(), HISTORICAL_CACHE_TTL, stale_ttl=TTL_MAX_STALE)
     logger.info(f"[CACHE_SET] Historical sla-breaches ({days}d, {len(data)} points)")
 
     return result
 
 
-# --- Sparkline data endpoint (batch recent runs from system tables) ---
+# --- Sparkline data endpoint (batch recent runs) ---
 
 
 class RecentRunOut(BaseModel):
@@ -440,44 +588,10 @@ class BatchRunsResponse(BaseModel):
     runs_by_job: dict[str, list[RecentRunOut]]
 
 
-@router.post("/batch-runs", response_model=BatchRunsResponse)
-async def get_batch_recent_runs(
-    request: BatchRunsRequest,
-    workspace_id: Annotated[str | None, Query()] = None,
-    ws=Depends(get_ws_prefer_user),
-) -> BatchRunsResponse:
-    """Batch fetch recent completed runs for multiple jobs from system tables.
-
-    This endpoint provides sparkline data for the Running Jobs page.
-    Uses system tables (5-15 min latency) which works with user's OBO permissions.
-
-    Only returns completed runs (with result_state) for sparkline display.
-
-    Args:
-        request: BatchRunsRequest with job_ids list and optional limit
-        workspace_id: Optional workspace filter
-        ws: User OBO WorkspaceClient
-
-    Returns:
-        BatchRunsResponse with recent runs keyed by job_id
-    """
-    settings = get_settings()
-
-    if not ws or not settings.warehouse_id:
-        return BatchRunsResponse(runs_by_job={})
-
-    # Limit batch size
-    job_ids = request.job_ids[:100]
-    if not job_ids:
-        return BatchRunsResponse(runs_by_job={})
-
-    # Check cache first
-    cache_key = f"batch_runs:{','.join(str(j) for j in sorted(job_ids))}:{request.limit}:{workspace_id or 'all'}"
-    cached = response_cache.get(cache_key)
-    if cached:
-        logger.info(f"[CACHE_HIT] Batch runs for {len(job_ids)} jobs")
-        return BatchRunsResponse(**cached)
-
+async def _live_recent_runs(
+    ws, warehouse_id: str, job_ids: list[int], limit: int, workspace_id: str | None
+) -> dict[str, list[RecentRunOut]]:
+    """Fetch recent completed runs per job from job_run_timeline."""
     logger.info(f"[BATCH_RUNS] Fetching runs for {len(job_ids)} jobs from system tables")
 
     # Build SQL query
@@ -516,11 +630,12 @@ async def get_batch_recent_runs(
     )
     SELECT job_id, run_id, result_state, start_time, end_time
     FROM ranked_runs
-    WHERE rn <= {request.limit}
+    WHERE rn <= {limit}
     ORDER BY job_id, rn
     """
 
-    rows = await _execute_query(ws, settings.warehouse_id, query)
+    # Up to 100 jobs x limit runs can exceed the first inline chunk
+    rows = await _execute_query(ws, warehouse_id, query, fetch_all=True)
 
     # Build response dict
     runs_by_job: dict[str, list[RecentRunOut]] = {}
@@ -549,14 +664,76 @@ async def get_batch_recent_runs(
         run = RecentRunOut(
             run_id=int(row["run_id"]),
             result_state=row["result_state"],
-            start_time=str(start_time) if start_time else None,
-            end_time=str(end_time) if end_time else None,
+            start_time=_iso(start_time),
+            end_time=_iso(end_time),
             duration_seconds=duration_seconds,
         )
         if job_id not in runs_by_job:
             runs_by_job[job_id] = []
         runs_by_job[job_id].append(run)
 
+    return runs_by_job
+
+
+@router.post("/batch-runs", response_model=BatchRunsResponse)
+async def get_batch_recent_runs(
+    request: BatchRunsRequest,
+    workspace_id: Annotated[str | None, Query()] = None,
+    ws=Depends(get_ws_prefer_user),
+) -> BatchRunsResponse:
+    """Batch fetch recent completed runs for multiple jobs from system tables.
+
+    This endpoint provides sparkline data for the Running Jobs page.
+    Reads the job_recent_runs cache table (last 10 completed runs per job,
+    updated by the cache refresh job); falls back to system tables (5-15 min
+    latency) which works with user's OBO permissions.
+
+    Only returns completed runs (with result_state) for sparkline display.
+
+    Args:
+        request: BatchRunsRequest with job_ids list and optional limit
+        workspace_id: Optional workspace filter
+        ws: User OBO WorkspaceClient
+
+    Returns:
+        BatchRunsResponse with recent runs keyed by job_id
+    """
+    settings = get_settings()
+
+    if not ws or not settings.warehouse_id:
+        return BatchRunsResponse(runs_by_job={})
+
+    # Limit batch size
+    job_ids = request.job_ids[:100]
+    if not job_ids:
+        return BatchRunsResponse(runs_by_job={})
+
+    # Check cache first
+    cache_key = f"batch_runs:{','.join(str(j) for j in sorted(job_ids))}:{request.limit}:{workspace_id or 'all'}"
+    cached = await response_cache.aget(cache_key)
+    if cached:
+        logger.info(f"[CACHE_HIT] Batch runs for {len(job_ids)} jobs")
+        return BatchRunsResponse(**cached)
+
+    # Point lookups on the job_recent_runs cache table, else the system tables
+    cached_runs = await query_recent_runs_cache(ws, [str(j) for j in job_ids], request.limit, workspace_id)
+    if cached_runs is not None:
+        runs_by_job = {
+            job_id: [
+                RecentRunOut(
+                    run_id=int(run["run_id"]),
+                    result_state=run["result_state"],
+                    start_time=_iso(run["start_time"]),
+                    end_time=_iso(run["end_time"]),
+                    duration_seconds=run["duration_seconds"],
+                )
+                for run in runs
+            ]
+            for job_id, runs in cached_runs.items()
+        }
+    else:
+        runs_by_job = await _live_recent_runs(ws, settings.warehouse_id, job_ids, request.limit, workspace_id)
+
     # Ensure all requested jobs have an entry
     for job_id in job_ids:
         job_id_str = str(job_id)
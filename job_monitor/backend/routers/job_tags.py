@@ -13,6 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws
 from job_monitor.backend.models import JobTagsOut, TagUpdateRequest, TagUpdateResponse
+from job_monitor.backend.statement_executor import TIMEOUT_LIVE, statement_executor
 
 router = APIRouter(prefix="/api/jobs", tags=["job-tags"])
 
@@ -67,11 +68,11 @@ async def _get_p90_duration(ws, job_id: str, warehouse_id: str) -> int | None:
     """
 
     try:
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            query,
             warehouse_id=warehouse_id,
-            statement=query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_LIVE,
         )
 
         if result and result.result and result.result.data_array:
@@ -1,6 +1,6 @@
 """Jobs router for system.lakeflow table queries."""
 
-import asyncio
+import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
@@ -8,6 +8,10 @@ from fastapi import APIRouter, Depends, Query
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws
 from job_monitor.backend.models import JobOut, JobRunListOut
+from job_monitor.backend.result_decoder import has_rows, result_rows
+from job_monitor.backend.statement_executor import TIMEOUT_LIVE, StatementTimeoutError, statement_executor
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["jobs"])
 
@@ -34,11 +38,11 @@ def _parse_job_runs(result) -> list[JobRunListOut]:
 
 def _parse_jobs(result) -> list[JobOut]:
     """Parse statement execution result into JobOut models."""
-    if not result or not result.result or not result.result.data_array:
+    if not has_rows(result):
         return []
 
     jobs = []
-    for row in result.result.data_array:
+    for row in result_rows(result):
         jobs.append(
             JobOut(
                 job_id=str(row[0]),
@@ -85,12 +89,16 @@ async def list_job_runs(
     LIMIT 1000
     """
 
-    result = await asyncio.to_thread(
-        ws.statement_execution.execute_statement,
-        warehouse_id=warehouse_id,
-        statement=query,
-        wait_timeout="30s",
-    )
+    try:
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=warehouse_id,
+            timeout=TIMEOUT_LIVE,
+        )
+    except StatementTimeoutError as e:
+        logger.warning(f"Job runs query timed out after {e.timeout}s - returning no records")
+        return []
 
     return _parse_job_runs(result)
 
@@ -135,15 +143,20 @@ async def list_jobs(
     FROM latest_jobs
     WHERE rn = 1
     ORDER BY name
-    LIMIT 1000
     """
 
-    result = await asyncio.to_thread(
-        ws.statement_execution.execute_statement,
-        warehouse_id=warehouse_id,
-        statement=query,
-        wait_timeout="30s",
-    )
+    # Full job list: all chunks are fetched via external links
+    try:
+        result = await statement_executor.execute(
+            ws,
+            query,
+            warehouse_id=warehouse_id,
+            timeout=TIMEOUT_LIVE,
+            fetch_all=True,
+        )
+    except StatementTimeoutError as e:
+        logger.warning(f"Jobs query timed out after {e.timeout}s - returning no records")
+        return []
 
     return _parse_jobs(result)
 
@@ -200,7 +200,7 @@ async def batch_job_runs_api(
         """Fetch runs for a single job with caching."""
         # Check cache first
         cache_key = f"job_runs:{job_id}:{request.limit}"
-        cached = response_cache.get(cache_key)
+        cached = await response_cache.aget(cache_key)
         if cached:
             return (job_id, cached)
 
@@ -274,7 +274,7 @@ async def list_job_runs_api(
 
     # Check cache first (60s TTL for job history)
     cache_key = f"job_runs:{job_id}:{limit}"
-    cached = response_cache.get(cache_key)
+    cached = await response_cache.aget(cache_key)
     if cached:
         logger.debug(f"[CACHE_HIT] Job runs for {job_id}")
         return cached
@@ -308,7 +308,7 @@ async def _fetch_active_runs_cached(ws) -> tuple[list, float]:
     Returns (runs_list, cache_timestamp) tuple.
     """
     cache_key = "active_runs_all"
-    cached = response_cache.get(cache_key)
+    cached = await response_cache.aget(cache_key)
     if cached:
         logger.info(f"[CACHE_HIT] Active runs from cache ({len(cached['runs'])} runs)")
         return cached["runs"], cached["timestamp"]
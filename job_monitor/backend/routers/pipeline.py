@@ -19,6 +19,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from job_monitor.backend.config import settings
 from job_monitor.backend.core import get_ws
 from job_monitor.backend.models import ColumnChange, RowCountDelta, SchemaDrift
+from job_monitor.backend.statement_executor import TIMEOUT_LIVE, statement_executor
 
 router = APIRouter(prefix="/api/pipeline", tags=["pipeline"])
 
@@ -102,11 +103,11 @@ async def _get_job_output_tables_from_lineage(ws, job_id: str, warehouse_id: str
         LIMIT 20
         """
 
-        result = await asyncio.to_thread(
-            ws.statement_execution.execute_statement,
+        result = await statement_executor.execute(
+            ws,
+            lineage_query,
             warehouse_id=warehouse_id,
-            statement=lineage_query,
-            wait_timeout="30s",
+            timeout=TIMEOUT_LIVE,
         )
 
         if result and result.result and result.result.data_array:
@@ -255,11 +256,11 @@ async def get_row_count_deltas(
 
         try:
             # Get current row count
-            row_result = await asyncio.to_thread(
-                ws.statement_execution.execute_statement,
+            row_result = await statement_executor.execute(
+                ws,
+                row_count_query,
                 warehouse_id=warehouse_id,
-                statement=row_count_query,
-                wait_timeout="30s",
+                timeout=TIMEOUT_LIVE,
             )
 
             current_count = 0
@@ -271,11 +272,11 @@ async def get_row_count_deltas(
             baseline_count = current_count  # Default baseline to current if no history
 
             try:
-                history_result = await asyncio.to_thread(
-                    ws.statement_execution.execute_statement,
+                history_result = await statement_executor.execute(
+                    ws,
+                    history_query,
                     warehouse_id=warehouse_id,
-                    statement=history_query,
-                    wait_timeout="30s",
+                    timeout=TIMEOUT_LIVE,
                 )
 
                 if history_result and history_result.result and history_result.result.data_array:
@@ -392,11 +393,11 @@ async def get_schema_drift(
         """
 
         try:
-            schema_result = await asyncio.to_thread(
-                ws.statement_execution.execute_statement,
+            schema_result = await statement_executor.execute(
+                ws,
+                schema_query,
                 warehouse_id=warehouse_id,
-                statement=schema_query,
-                wait_timeout="30s",
+                timeout=TIMEOUT_LIVE,
             )
 
             if not schema_result or not schema_result.result or not schema_result.result.data_array:
@@ -211,7 +211,7 @@ async def generate_weekly_cost_report():
         from job_monitor.backend.routers.cost import get_cost_anomalies, get_cost_summary
 
         # Get cost data for last 7 days
-        cost_summary = await get_cost_summary(days=7, ws=ws)
+        cost_summary = await get_cost_summary(days=7, include_teams=True, ws=ws)
         anomalies = await get_cost_anomalies(days=7, ws=ws)
 
         week_start = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
@@ -325,7 +325,7 @@ async def generate_monthly_executive_report():
         from job_monitor.backend.routers.health_metrics import get_health_metrics
 
         # Get data for last 30 days
-        cost_summary = await get_cost_summary(days=30, ws=ws)
+        cost_summary = await get_cost_summary(days=30, include_teams=True, ws=ws)
         health = await get_health_metrics(days=30, ws=ws)
 
         month = datetime.now().strftime("%B %Y")
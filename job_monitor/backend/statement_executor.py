@@ -0,0 +1,609 @@
+"""Central async executor for SQL Statement Execution API calls.
+
+Every warehouse query in the backend goes through this module instead of
+calling ``ws.statement_execution.execute_statement`` directly. It owns:
+
+- Submission with a short server-side wait (keeps default-executor threads free)
+- Async polling with exponential backoff for statements still running
+- Per-warehouse concurrency limits (a burst of dashboard loads queues here
+  instead of flooding the warehouse or exhausting the thread pool)
+- Single-flight coalescing: concurrent identical read queries share one
+  execution instead of each hitting the warehouse
+- Complete large results: ``fetch_all=True`` requests the EXTERNAL_LINKS
+  disposition (ARROW_STREAM when pyarrow is installed, JSON_ARRAY
+  otherwise) and downloads every chunk in parallel; with
+  ``defer_chunks=True`` the chunks are instead read one at a time by
+  ``iter_chunks`` (streaming exports)
+- Overall timeouts with best-effort cancellation of abandoned statements
+- Error classification (permission, not found, warehouse, syntax, ...)
+- Latency and queue-depth statistics for /api/health
+
+Usage:
+    from job_monitor.backend.statement_executor import TIMEOUT_LIVE, statement_executor
+
+    result = await statement_executor.execute(ws, query, timeout=TIMEOUT_LIVE)
+    if result.status and result.status.error:
+        ...
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+import httpx
+from databricks.sdk.service.sql import Disposition, Format
+
+from job_monitor.backend.config import settings
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pa_ipc = None
+
+logger = logging.getLogger(__name__)
+
+# Statement states that mean the warehouse is still working on the query
+PENDING_STATES = ("PENDING", "RUNNING")
+
+# Error classes returned by classify_error()
+ERROR_PERMISSION = "permission"
+ERROR_NOT_FOUND = "not_found"
+ERROR_WAREHOUSE = "warehouse_unavailable"
+ERROR_SYNTAX = "syntax"
+ERROR_TIMEOUT = "timeout"
+ERROR_OTHER = "other"
+
+# Number of recent latencies kept per warehouse for percentile stats
+LATENCY_WINDOW = 200
+
+# Statement prefixes that are safe to coalesce (reads only, never DML/DDL)
+COALESCE_PREFIXES = ("SELECT", "WITH")
+
+# Max parallel downloads of EXTERNAL_LINKS result chunks per statement
+CHUNK_DOWNLOAD_CONCURRENCY = 8
+
+
+@dataclass
+class ResultChunk:
+    """One downloaded chunk of a statement result.
+
+    Shaped like a StatementResponse (``manifest``, ``arrow_table`` and
+    ``result.data_array``) so result_decoder helpers read it directly.
+    """
+
+    manifest: Any
+    arrow_table: Any = None
+    data_array: list | None = None
+
+    @property
+    def result(self) -> "ResultChunk":
+        return self
+
+
+class StatementTimeoutError(Exception):
+    """Raised when a statement does not finish within its timeout."""
+
+    def __init__(self, statement_id: str | None, timeout: float):
+        self.statement_id = statement_id
+        self.timeout = timeout
+        super().__init__(f"Statement {statement_id or '<unsubmitted>'} did not finish within {timeout:.0f}s")
+
+
+def classify_error(error: Any) -> str:
+    """Classify a statement error (status.error object, exception or message).
+
+    Returns one of the ERROR_* constants so routers can decide between
+    cache fallback, mock data, or surfacing the error.
+    """
+    if error is None:
+        return ERROR_OTHER
+    if isinstance(error, (StatementTimeoutError, asyncio.TimeoutError)):
+        return ERROR_TIMEOUT
+
+    message = getattr(error, "message", None) or str(error)
+    msg = str(message).upper()
+
+    if (
+        "INSUFFICIENT_PERMISSIONS" in msg
+        or "PERMISSION_DENIED" in msg
+        or "USE SCHEMA" in msg
+        or "DOES NOT HAVE PERMISSION" in msg
+    ):
+        return ERROR_PERMISSION
+    if "WAREHOUSE" in msg and ("NOT_FOUND" in msg or "STOPPED" in msg or "NOT RUNNING" in msg):
+        return ERROR_WAREHOUSE
+    if "DOES NOT HAVE ANY RUNNING CLUSTERS" in msg:
+        return ERROR_WAREHOUSE
+    if "TABLE_OR_VIEW_NOT_FOUND" in msg or "DOES NOT EXIST" in msg or "SCHEMA_NOT_FOUND" in msg:
+        return ERROR_NOT_FOUND
+    if "PARSE_SYNTAX_ERROR" in msg or "UNRESOLVED_COLUMN" in msg:
+        return ERROR_SYNTAX
+    if "TIMEOUT" in msg or "TIMED OUT" in msg:
+        return ERROR_TIMEOUT
+    return ERROR_OTHER
+
+
+def _state_value(result) -> str | None:
+    """Extract the statement state string from a StatementResponse."""
+    status = getattr(result, "status", None)
+    state = getattr(status, "state", None) if status else None
+    if state is None:
+        return None
+    value = getattr(state, "value", state)
+    return value if isinstance(value, str) else None
+
+
+def normalize_statement(statement: str) -> str:
+    """Normalize SQL text for coalescing (collapse whitespace)."""
+    return " ".join(statement.split())
+
+
+def _is_coalescable(normalized: str) -> bool:
+    """Only read-only statements are shared between callers."""
+    return normalized[:6].upper().startswith(COALESCE_PREFIXES)
+
+
+def _format_wait(seconds: float) -> str:
+    """Format a server-side wait_timeout (API accepts 0s or 5s-50s)."""
+    return f"{round(min(max(seconds, 5), 50))}s"
+
+
+@dataclass
+class _WarehouseStats:
+    """Per-warehouse counters (guarded by StatementExecutor._lock)."""
+
+    in_flight: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    coalesced: int = 0
+    errors_by_class: dict[str, int] = field(default_factory=dict)
+    latencies_ms: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    queue_wait_ms: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+
+class StatementExecutor:
+    """Async SQL statement executor with per-warehouse concurrency control.
+
+    Features:
+    - Bounded concurrency per warehouse (asyncio semaphore)
+    - Short blocking submit, then async polling with backoff
+    - Timeout with statement cancellation
+    - Single-flight coalescing of identical in-flight SELECTs
+    - Latency, queue depth and error-class statistics
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        submit_wait_seconds: float = 10,
+        poll_initial_seconds: float = 0.5,
+        poll_max_seconds: float = 5.0,
+        default_timeout: float = 50,
+    ):
+        """Initialize executor.
+
+        Args:
+            max_concurrency: Max statements in flight per warehouse
+            submit_wait_seconds: Server-side wait on submission (5-50s)
+            poll_initial_seconds: First poll delay for long-running statements
+            poll_max_seconds: Upper bound for the backoff delay
+            default_timeout: Overall timeout when callers don't pass one
+        """
+        self._max_concurrency = max_concurrency
+        self._submit_wait = submit_wait_seconds
+        self._poll_initial = poll_initial_seconds
+        self._poll_max = poll_max_seconds
+        self._default_timeout = default_timeout
+        self._lock = Lock()
+        self._stats: dict[str, _WarehouseStats] = {}
+        # warehouse_id -> (event loop, semaphore); semaphores are loop-bound
+        self._semaphores: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+        # (warehouse_id, normalized statement, fetch_all) -> in-flight task on its event loop
+        self._inflight: dict[tuple[str, str, bool], asyncio.Task] = {}
+
+    def _semaphore(self, warehouse_id: str) -> asyncio.Semaphore:
+        """Get the semaphore for a warehouse on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._semaphores.get(warehouse_id)
+            if entry is None or entry[0] is not loop:
+                entry = (loop, asyncio.Semaphore(self._max_concurrency))
+                self._semaphores[warehouse_id] = entry
+            return entry[1]
+
+    def _warehouse_stats(self, warehouse_id: str) -> _WarehouseStats:
+        """Get stats bucket for a warehouse (must be called with lock held)."""
+        stats = self._stats.get(warehouse_id)
+        if stats is None:
+            stats = _WarehouseStats()
+            self._stats[warehouse_id] = stats
+        return stats
+
+    async def execute(
+        self,
+        ws,
+        statement: str,
+        *,
+        warehouse_id: str | None = None,
+        timeout: float | None = None,
+        coalesce: bool = True,
+        fetch_all: bool = False,
+        defer_chunks: bool = False,
+    ):
+        """Execute a SQL statement and wait for a terminal state.
+
+        Statement-level failures (e.g. permission errors) are returned in
+        ``result.status.error`` exactly as the SDK reports them, so callers
+        keep their existing error handling. Transport exceptions propagate.
+
+        Identical SELECT/WITH statements already in flight on the same
+        warehouse are coalesced: later callers await the first execution
+        and receive the same response object. Results are shared the same
+        way ``response_cache`` entries are, i.e. not per user.
+
+        Args:
+            ws: WorkspaceClient
+            statement: SQL text
+            warehouse_id: Target warehouse (defaults to settings.warehouse_id)
+            timeout: Overall timeout in seconds including queueing and chunk downloads
+            coalesce: Share an identical in-flight execution (reads only)
+            fetch_all: Fetch every result chunk via EXTERNAL_LINKS instead of
+                the first inline chunk. With pyarrow the rows are attached as
+                ``result.arrow_table`` (read them with result_decoder helpers);
+                otherwise ``result.result.data_array`` holds all rows.
+            defer_chunks: With fetch_all, return as soon as the statement
+                succeeds without downloading anything; read the chunks one
+                at a time with ``iter_chunks`` (never coalesced)
+
+        Returns:
+            StatementResponse in a terminal state
+
+        Raises:
+            StatementTimeoutError: If the statement is still running at the deadline
+        """
+        warehouse_id = warehouse_id or settings.warehouse_id
+        timeout = timeout if timeout is not None else self._default_timeout
+
+        if defer_chunks:
+            return await self._execute(ws, statement, warehouse_id, timeout, fetch_all, download=False)
+
+        normalized = normalize_statement(statement)
+        if not coalesce or not _is_coalescable(normalized):
+            return await self._execute(ws, statement, warehouse_id, timeout, fetch_all)
+
+        key = (warehouse_id, normalized, fetch_all)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._inflight.get(key)
+            if task is not None and not task.done() and task.get_loop() is loop:
+                stats = self._warehouse_stats(warehouse_id)
+                stats.coalesced += 1
+                leader = False
+            else:
+                task = loop.create_task(self._execute(ws, statement, warehouse_id, timeout, fetch_all))
+                self._inflight[key] = task
+                leader = True
+
+        if leader:
+            task.add_done_callback(lambda t, k=key: self._forget_inflight(k, t))
+        else:
+            logger.debug(f"[SQL_EXECUTOR] Coalesced identical in-flight statement on warehouse {warehouse_id}")
+        # Shield so one caller disconnecting doesn't cancel the shared execution
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: tuple[str, str, bool], task: asyncio.Task) -> None:
+        """Drop a finished execution from the in-flight map."""
+        with self._lock:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+        if not task.cancelled():
+            # Mark exception as retrieved when every awaiting caller went away
+            task.exception()
+
+    async def _execute(
+        self, ws, statement: str, warehouse_id: str, timeout: float, fetch_all: bool = False, download: bool = True,
+    ):
+        """Execute one statement under the warehouse semaphore, record stats, then download its chunks."""
+        started = time.monotonic()
+        deadline = started + timeout
+
+        with self._lock:
+            stats = self._warehouse_stats(warehouse_id)
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+
+        semaphore = self._semaphore(warehouse_id)
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                stats.queued -= 1
+                stats.timeouts += 1
+            logger.warning(f"[SQL_EXECUTOR] Queue wait exceeded {timeout:.0f}s on warehouse {warehouse_id}")
+            raise StatementTimeoutError(None, timeout)
+
+        acquired = time.monotonic()
+        with self._lock:
+            stats.queued -= 1
+            stats.in_flight += 1
+            stats.submitted += 1
+            stats.queue_wait_ms.append((acquired - started) * 1000)
+
+        try:
+            result = await self._run(ws, statement, warehouse_id, deadline, timeout, fetch_all)
+        except StatementTimeoutError:
+            with self._lock:
+                stats.timeouts += 1
+                stats.errors_by_class[ERROR_TIMEOUT] = stats.errors_by_class.get(ERROR_TIMEOUT, 0) + 1
+            raise
+        except Exception as e:
+            with self._lock:
+                stats.failed += 1
+                error_class = classify_error(e)
+                stats.errors_by_class[error_class] = stats.errors_by_class.get(error_class, 0) + 1
+            raise
+        finally:
+            semaphore.release()
+            with self._lock:
+                stats.in_flight -= 1
+
+        latency_ms = (time.monotonic() - acquired) * 1000
+        error = getattr(getattr(result, "status", None), "error", None)
+        with self._lock:
+            stats.latencies_ms.append(latency_ms)
+            if _state_value(result) in ("FAILED", "CANCELED", "CLOSED") and error is not None:
+                stats.failed += 1
+                error_class = classify_error(error)
+                stats.errors_by_class[error_class] = stats.errors_by_class.get(error_class, 0) + 1
+            else:
+                stats.succeeded += 1
+
+        logger.debug(f"[SQL_EXECUTOR] Statement finished in {latency_ms:.0f}ms on warehouse {warehouse_id}")
+
+        # Presigned-URL downloads never touch the warehouse, so they run after its slot is released
+        if fetch_all and download and _state_value(result) == "SUCCEEDED":
+            try:
+                await self._fetch_chunks(ws, result, deadline, timeout)
+            except StatementTimeoutError:
+                with self._lock:
+                    stats.timeouts += 1
+                    stats.errors_by_class[ERROR_TIMEOUT] = stats.errors_by_class.get(ERROR_TIMEOUT, 0) + 1
+                raise
+        return result
+
+    async def _run(
+        self, ws, statement: str, warehouse_id: str, deadline: float, timeout: float, fetch_all: bool = False,
+    ):
+        """Submit the statement and poll until it leaves PENDING/RUNNING."""
+        remaining = deadline - time.monotonic()
+        options = {}
+        if fetch_all:
+            options = {
+                "disposition": Disposition.EXTERNAL_LINKS,
+                "format": Format.ARROW_STREAM if pa is not None else Format.JSON_ARRAY,
+            }
+        result = await asyncio.to_thread(
+            ws.statement_execution.execute_statement,
+            warehouse_id=warehouse_id,
+            statement=statement,
+            wait_timeout=_format_wait(min(self._submit_wait, remaining)),
+            **options,
+        )
+
+        delay = self._poll_initial
+        while _state_value(result) in PENDING_STATES:
+            statement_id = result.statement_id
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                await self._cancel(ws, statement_id)
+                raise StatementTimeoutError(statement_id, timeout)
+
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, self._poll_max)
+            result = await asyncio.to_thread(
+                ws.statement_execution.get_statement,
+                statement_id=statement_id,
+            )
+            logger.debug(f"[SQL_EXECUTOR] Poll {statement_id}: {_state_value(result)}")
+
+        return result
+
+    async def _fetch_chunks(self, ws, result, deadline: float, timeout: float) -> None:
+        """Download all EXTERNAL_LINKS chunks in parallel and attach the rows.
+
+        Chunk 0's links come with the statement response; the remaining
+        chunks' links are requested from the API, then every presigned URL
+        is downloaded concurrently (without workspace auth headers). Link
+        requests and downloads share one CHUNK_DOWNLOAD_CONCURRENCY bound,
+        so a large result never fills the default thread pool. Fetching
+        must finish by the statement's deadline; chunks are decoded in a
+        worker thread.
+
+        Raises:
+            StatementTimeoutError: If the chunks are not fetched by ``deadline``
+        """
+        data = getattr(result, "result", None)
+        first_links = getattr(data, "external_links", None) if data else None
+        if not isinstance(first_links, list):
+            return  # INLINE response (or nothing to fetch)
+
+        manifest = getattr(result, "manifest", None)
+        total_chunks = getattr(manifest, "total_chunk_count", None) or 1
+        statement_id = result.statement_id
+
+        semaphore = asyncio.Semaphore(CHUNK_DOWNLOAD_CONCURRENCY)
+
+        async def download(client: httpx.AsyncClient, link) -> bytes:
+            async with semaphore:
+                response = await client.get(link.external_link, headers=link.http_headers or None)
+                response.raise_for_status()
+                return response.content
+
+        async def chunk_links(index: int) -> list:
+            async with semaphore:
+                return await self._chunk_links(ws, result, index)
+
+        async def fetch() -> tuple[list, list[bytes]]:
+            link_lists = await asyncio.gather(*[chunk_links(i) for i in range(total_chunks)])
+            links = sorted((link for group in link_lists for link in group), key=lambda link: link.chunk_index or 0)
+            async with httpx.AsyncClient(timeout=60) as client:
+                return links, await asyncio.gather(*[download(client, link) for link in links])
+
+        started = time.monotonic()
+        try:
+            links, bodies = await asyncio.wait_for(fetch(), timeout=max(deadline - started, 0))
+        except asyncio.TimeoutError:
+            logger.warning(f"[SQL_EXECUTOR] Result chunks of {statement_id} not fetched within {timeout:.0f}s")
+            raise StatementTimeoutError(statement_id, timeout) from None
+
+        if getattr(manifest, "format", None) == Format.ARROW_STREAM and pa is not None:
+            result.arrow_table = await asyncio.to_thread(_read_arrow_chunks, bodies)
+            row_count = result.arrow_table.num_rows if result.arrow_table is not None else 0
+        else:
+            data.data_array = await asyncio.to_thread(_read_json_chunks, bodies)
+            row_count = len(data.data_array)
+
+        logger.info(
+            f"[SQL_EXECUTOR] Fetched {len(links)} result chunks ({row_count} rows) "
+            f"for {statement_id} in {(time.monotonic() - started) * 1000:.0f}ms"
+        )
+
+    async def _chunk_links(self, ws, result, index: int) -> list:
+        """External links of one result chunk (chunk 0's come with the response)."""
+        if index == 0:
+            return result.result.external_links
+        chunk = await asyncio.to_thread(
+            ws.statement_execution.get_statement_result_chunk_n,
+            statement_id=result.statement_id,
+            chunk_index=index,
+        )
+        return chunk.external_links or []
+
+    async def iter_chunks(self, ws, result) -> AsyncIterator[ResultChunk]:
+        """Download the chunks of a ``defer_chunks`` result one at a time.
+
+        Only one chunk is held in memory, so a consumer that writes each
+        chunk out before asking for the next reads results of any size in
+        constant memory. An INLINE result is yielded as is.
+
+        Args:
+            ws: WorkspaceClient
+            result: Succeeded StatementResponse from ``execute(..., fetch_all=True, defer_chunks=True)``
+
+        Yields:
+            ResultChunk per downloaded chunk (or the inline result)
+        """
+        data = getattr(result, "result", None)
+        first_links = getattr(data, "external_links", None) if data else None
+        if not isinstance(first_links, list):
+            if data is not None:
+                yield result
+            return
+
+        manifest = getattr(result, "manifest", None)
+        total_chunks = getattr(manifest, "total_chunk_count", None) or 1
+        arrow = getattr(manifest, "format", None) == Format.ARROW_STREAM and pa is not None
+        async with httpx.AsyncClient(timeout=60) as client:
+            for index in range(total_chunks):
+                for link in await self._chunk_links(ws, result, index):
+                    response = await client.get(link.external_link, headers=link.http_headers or None)
+                    response.raise_for_status()
+                    if not response.content:
+                        continue
+                    if arrow:
+                        table = await asyncio.to_thread(_read_arrow_chunks, [response.content])
+                        yield ResultChunk(manifest, arrow_table=table)
+                    else:
+                        rows = await asyncio.to_thread(json.loads, response.content)
+                        yield ResultChunk(manifest, data_array=rows)
+
+    async def _cancel(self, ws, statement_id: str | None) -> None:
+        """Best-effort cancellation of an abandoned statement."""
+        if not statement_id:
+            return
+        try:
+            await asyncio.to_thread(ws.statement_execution.cancel_execution, statement_id=statement_id)
+            logger.info(f"[SQL_EXECUTOR] Cancelled statement {statement_id} after timeout")
+        except Exception as e:
+            logger.debug(f"[SQL_EXECUTOR] Cancel failed for {statement_id}: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Get executor statistics per warehouse.
+
+        Returns:
+            Dict with max_concurrency, in-flight coalescing keys and
+            per-warehouse in_flight, queued, counters, error classes and
+            latency percentiles
+        """
+        with self._lock:
+            warehouses = {}
+            for warehouse_id, s in self._stats.items():
+                latencies = sorted(s.latencies_ms)
+                waits = list(s.queue_wait_ms)
+                warehouses[warehouse_id] = {
+                    "in_flight": s.in_flight,
+                    "queued": s.queued,
+                    "max_queued": s.max_queued,
+                    "submitted": s.submitted,
+                    "succeeded": s.succeeded,
+                    "failed": s.failed,
+                    "timeouts": s.timeouts,
+                    "coalesced": s.coalesced,
+                    "errors_by_class": dict(s.errors_by_class),
+                    "latency_p50_ms": _percentile(latencies, 0.5),
+                    "latency_p95_ms": _percentile(latencies, 0.95),
+                    "avg_queue_wait_ms": round(sum(waits) / len(waits), 1) if waits else 0.0,
+                }
+            return {
+                "max_concurrency": self._max_concurrency,
+                "inflight_statements": len(self._inflight),
+                "warehouses": warehouses,
+            }
+
+
+def _read_arrow_chunks(bodies: list[bytes]):
+    """Concatenate Arrow IPC stream chunks into one table (None when all are empty)."""
+    tables = [pa_ipc.open_stream(pa.py_buffer(body)).read_all() for body in bodies if body]
+    return pa.concat_tables(tables) if tables else None
+
+
+def _read_json_chunks(bodies: list[bytes]) -> list:
+    """Concatenate the rows of JSON_ARRAY chunks."""
+    rows = []
+    for body in bodies:
+        rows.extend(json.loads(body) if body else [])
+    return rows
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return round(sorted_values[idx], 1)
+
+
+# Global executor instance shared by all routers and the Delta cache readers
+statement_executor = StatementExecutor(
+    max_concurrency=settings.sql_max_concurrency,
+    default_timeout=settings.sql_default_timeout,
+)
+
+
+# Convenience timeout constants (seconds)
+TIMEOUT_QUICK = 10   # metadata / existence checks
+TIMEOUT_CACHE = 30   # Delta cache table reads
+TIMEOUT_LIVE = 50    # system table aggregations
+TIMEOUT_HEAVY = 110  # large CTE queries (health metrics list)
@@ -0,0 +1,213 @@
+"""Pool of per-user WorkspaceClients keyed by OBO token hash.
+
+Building a WorkspaceClient (config resolution, HTTP session) and calling
+``current_user.me()`` on every request adds a REST round trip to each API
+call. The pool keeps one client per distinct user token for a bounded
+time, caches the decoded JWT claims and the resolved identity, so a
+repeat request costs a hash and a dictionary lookup.
+
+Features:
+- Keyed by SHA-256 of the token (raw tokens are never used as keys)
+- TTL bounded by the token's own ``exp`` claim
+- LRU eviction at a maximum pool size
+- Identity from JWT claims; ``current_user.me()`` only when claims lack it,
+  at most once per pooled client (and once for the service principal)
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+from databricks.sdk import WorkspaceClient
+
+from job_monitor.backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# How long a pooled client is reused (seconds), before token expiry applies
+CLIENT_TTL_SECONDS = 600
+# Drop a client this many seconds before its token's exp claim
+TOKEN_EXPIRY_SKEW_SECONDS = 30
+# Max distinct user tokens kept
+MAX_CLIENTS = 256
+
+
+def decode_jwt_claims(token: str) -> dict[str, Any]:
+    """Decode the (unverified) payload of a JWT.
+
+    The platform has already validated the forwarded token; claims are only
+    used for identity display and expiry. Returns {} for non-JWT tokens.
+    """
+    try:
+        parts = token.split(".")
+        if len(parts) < 2:
+            return {}
+        payload = parts[1]
+        padding = 4 - len(payload) % 4
+        if padding != 4:
+            payload += "=" * padding
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return claims if isinstance(claims, dict) else {}
+    except Exception:
+        return {}
+
+
+def identity_from_claims(claims: dict[str, Any]) -> str | None:
+    """Get the user's email/name from standard JWT claims."""
+    return claims.get("email") or claims.get("sub") or claims.get("preferred_username")
+
+
+def _token_key(token: str) -> str:
+    """Hash a token for use as a pool key."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@dataclass
+class _PooledClient:
+    """A pooled client with its cached claims and identity."""
+
+    client: WorkspaceClient
+    claims: dict[str, Any]
+    expires_at: float
+    identity: str | None = None
+    hits: int = field(default=0)
+
+
+class WorkspaceClientPool:
+    """TTL/LRU-bounded pool of OBO WorkspaceClients.
+
+    Thread-safe: FastAPI runs sync dependencies in a thread pool.
+    """
+
+    def __init__(self, max_clients: int = MAX_CLIENTS, ttl_seconds: float = CLIENT_TTL_SECONDS):
+        """Initialize pool.
+
+        Args:
+            max_clients: Maximum number of pooled user clients
+            ttl_seconds: Maximum reuse time of a client
+        """
+        self._max_clients = max_clients
+        self._ttl = ttl_seconds
+        self._clients: OrderedDict[str, _PooledClient] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._sp_identity: dict[int, str] = {}
+
+    def _expires_at(self, claims: dict[str, Any], now: float) -> float:
+        """Client expiry: pool TTL, capped by the token's exp claim."""
+        expires_at = now + self._ttl
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp - TOKEN_EXPIRY_SKEW_SECONDS)
+        return expires_at
+
+    def _entry(self, token: str) -> _PooledClient:
+        """Get or create the pooled entry for a token."""
+        key = _token_key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and entry.expires_at > now:
+                self._clients.move_to_end(key)
+                entry.hits += 1
+                self._hits += 1
+                return entry
+            if entry is not None:
+                del self._clients[key]
+
+        # Build outside the lock; a concurrent duplicate just replaces it
+        claims = decode_jwt_claims(token)
+        client = WorkspaceClient(host=settings.databricks_host, token=token)
+        entry = _PooledClient(
+            client=client,
+            claims=claims,
+            expires_at=self._expires_at(claims, now),
+            identity=identity_from_claims(claims),
+        )
+        with self._lock:
+            self._misses += 1
+            self._clients[key] = entry
+            self._clients.move_to_end(key)
+            while len(self._clients) > self._max_clients:
+                self._clients.popitem(last=False)
+                self._evictions += 1
+        logger.info(f"[WS_POOL] Created OBO WorkspaceClient for {entry.identity or 'unknown user'}")
+        return entry
+
+    def get(self, token: str) -> WorkspaceClient:
+        """Get a (possibly pooled) WorkspaceClient for an OBO token."""
+        return self._entry(token).client
+
+    def claims(self, token: str) -> dict[str, Any]:
+        """Get cached JWT claims for a token (decoded once per pooled client)."""
+        key = _token_key(token)
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and entry.expires_at > time.time():
+                return entry.claims
+        return decode_jwt_claims(token)
+
+    def identity(self, token: str) -> str | None:
+        """Get the user identity for a token.
+
+        Uses JWT claims; falls back to one ``current_user.me()`` call per
+        pooled client when the token carries no identity claim.
+        """
+        entry = self._entry(token)
+        if entry.identity is None:
+            try:
+                entry.identity = entry.client.current_user.me().user_name
+            except Exception as e:
+                logger.warning(f"[WS_POOL] Could not resolve OBO identity: {e}")
+                entry.identity = "unknown"
+        return entry.identity
+
+    def service_principal_identity(self, ws) -> str:
+        """Get the service principal's identity, resolved once per client."""
+        cached = self._sp_identity.get(id(ws))
+        if cached is not None:
+            return cached
+        try:
+            identity = ws.current_user.me().user_name
+        except Exception as e:
+            logger.warning(f"[WS_POOL] Could not get SP identity: {e}")
+            identity = "unknown"
+        self._sp_identity[id(ws)] = identity
+        return identity
+
+    def clear(self) -> None:
+        """Drop all pooled clients."""
+        with self._lock:
+            self._clients.clear()
+            self._sp_identity.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dict with size, max_clients, ttl_seconds, hits, misses,
+            evictions and hit_rate
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._clients),
+                "max_clients": self._max_clients,
+                "ttl_seconds": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / total, 3) if total else 0.0,
+            }
+
+
+# Global pool instance
+workspace_client_pool = WorkspaceClientPool()
@@ -7,9 +7,27 @@ Tables created:
 - {catalog}.{schema}.job_health_cache: Pre-computed job health metrics
 - {catalog}.{schema}.cost_cache: Pre-computed cost data by job and team
 - {catalog}.{schema}.alerts_cache: Pre-computed alert conditions
+- {catalog}.{schema}.cache_watermarks: Last refresh watermark per incrementally refreshed table
+- {catalog}.{schema}.job_team_map: Team, owner, SLA and budget tags of every job
+- {catalog}.{schema}.cluster_utilization_cache: Per-job DBU/hour utilization proxy and right-sizing hints
+- {catalog}.{schema}.refresh_version: Version marker bumped after every refresh run
+- {catalog}.{schema}.refresh_log: One row per refresh stage (duration, rows, Spark metrics)
+
+job_health_cache is refreshed incrementally (MERGE of changed jobs) once
+it exists; pass --full-refresh or set cache.incremental_refresh: false to
+rewrite it completely.
 """
 
 import argparse
+import contextlib
+import io
+import json
+import re
+import time
+import urllib.request
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -51,21 +69,157 @@ def get_spark() -> SparkSession:
     return SparkSession.builder.getOrCreate()
 
 
-def refresh_job_health_cache(spark: SparkSession, catalog: str, schema: str) -> int:
-    """Refresh job health metrics cache.
+# Refresh stages run concurrently; warn when the whole refresh exceeds this
+# (the job is scheduled every 5-10 minutes)
+REFRESH_TIME_BUDGET_SECONDS = 240
 
-    Computes:
-    - Success rates (7-day and 30-day windows)
-    - Priority flags (P1/P2/P3)
-    - Consecutive failure detection
-    - Retry counts
+# Cache tables are clustered by workspace so workspace-filtered reads skip other workspaces' files
+CACHE_CLUSTER_COLUMNS = ["workspace_id"]
 
-    Returns number of jobs cached.
+# Job health windows (days) and incremental refresh settings
+HEALTH_WINDOW_DAYS = 30
+HEALTH_SHORT_WINDOW_DAYS = 7
+# Re-read timeline rows this far behind the watermark (late-arriving / still-running periods)
+WATERMARK_LOOKBACK_MINUTES = 120
+WATERMARKS_TABLE = "cache_watermarks"
+# Single-row table whose version is bumped after every refresh; the backend
+# polls it to invalidate responses built from the cache tables
+VERSION_TABLE = "refresh_version"
+# Per-stage refresh history read by /api/cache/status
+REFRESH_LOG_TABLE = "refresh_log"
+REFRESH_LOG_RETENTION_DAYS = 30
+# Spark stage metrics (monitoring REST API field -> refresh_log column), summed per refresh stage
+SPARK_STAGE_METRICS = {
+    "inputRecords": "input_rows",
+    "inputBytes": "input_bytes",
+    "outputRecords": "output_rows",
+    "shuffleReadBytes": "shuffle_read_bytes",
+    "shuffleWriteBytes": "shuffle_write_bytes",
+    "executorRunTime": "executor_run_time_ms",
+    "numCompleteTasks": "spark_tasks",
+}
+
+# Daily rollup: history kept (90-day charts plus their previous period) and
+# trailing days recomputed each run (billing usage arrives up to ~2 days late)
+DAILY_STATS_RETENTION_DAYS = 180
+DAILY_STATS_RECOMPUTE_DAYS = 3
+# Completed runs kept per job for sparklines and row expansion
+RECENT_RUNS_PER_JOB = 10
+RECENT_RUNS_LOOKBACK_DAYS = 30
+
+# Cluster utilization: per-run DBU/hour kept per job (cluster-metrics endpoint allows up
+# to 10) and the run window of the precomputed utilization/recommendation columns
+UTILIZATION_RUNS_KEPT = 10
+UTILIZATION_DEFAULT_RUNS = 5
+
+# Log2 duration histogram buckets: bucket b counts runs of [2^b, 2^(b+1)) seconds
+DURATION_HISTOGRAM_BUCKETS = 24
+
+
+def build_job_health_query(runs_source: str = "system.lakeflow.job_run_timeline") -> str:
+    """Build the job health aggregation query.
+
+    Reads the timeline once: every metric is a conditional aggregate over
+    the 30-day rows, and the latest-run state comes from a single window
+    pass partitioned by (workspace_id, job_id), the same partitioning as
+    the aggregate, so both share one shuffle. Retries per day are derived as 7-day runs
+    minus distinct 7-day run dates, which equals the per-day
+    SUM(run_count - 1). The previous-run state only sees 7-day runs, as
+    in the legacy 7-day window, so an older failure never makes a P1.
+
+    Args:
+        runs_source: Table or view with job_run_timeline rows; incremental
+            refreshes pass a view restricted to the jobs being recomputed
     """
-    print(f"[{datetime.now()}] Refreshing job health cache...")
+    return f"""
+    WITH latest_jobs AS (
+        SELECT *,
+            ROW_NUMBER() OVER(
+                PARTITION BY workspace_id, job_id
+                ORDER BY change_time DESC
+            ) as rn
+        FROM system.lakeflow.jobs
+        WHERE delete_time IS NULL
+    ),
+    runs AS (
+        SELECT
+            workspace_id,
+            job_id,
+            period_start_time,
+            result_state,
+            run_duration_seconds,
+            period_start_time >= current_date() - INTERVAL {HEALTH_SHORT_WINDOW_DAYS} DAYS as in_7d,
+            -- Only 7-day runs count as the previous run (the legacy window held no older rows)
+            LAG(CASE
+                WHEN period_start_time >= current_date() - INTERVAL {HEALTH_SHORT_WINDOW_DAYS} DAYS THEN result_state
+            END) OVER latest_first as prev_state,
+            ROW_NUMBER() OVER latest_first as rn
+        FROM {runs_source}
+        WHERE period_start_time >= current_date() - INTERVAL {HEALTH_WINDOW_DAYS} DAYS
+        WINDOW latest_first AS (PARTITION BY workspace_id, job_id ORDER BY period_start_time DESC)
+    ),
+    job_stats AS (
+        SELECT
+            workspace_id,
+            job_id,
+            COUNT(*) as total_runs_30d,
+            COUNT(CASE WHEN result_state = 'SUCCESS' THEN 1 END) as success_count_30d,
+            COUNT(CASE WHEN in_7d THEN 1 END) as total_runs_7d,
+            COUNT(CASE WHEN in_7d AND result_state = 'SUCCESS' THEN 1 END) as success_count_7d,
+            MAX(period_start_time) as last_run_time,
+            MAX(CASE WHEN result_state IS NOT NULL THEN run_duration_seconds END) as last_duration,
+            MAX(CASE
+                WHEN rn = 1 AND in_7d AND result_state = 'FAILED' AND prev_state = 'FAILED' THEN 'P1'
+                WHEN rn = 1 AND in_7d AND result_state = 'FAILED' THEN 'P2'
+            END) as failure_priority,
+            COUNT(CASE WHEN in_7d THEN 1 END)
+                - SIZE(COLLECT_SET(CASE WHEN in_7d THEN DATE(period_start_time) END)) as retry_count,
+            PERCENTILE_CONT(0.5) WITHIN GROUP (
+                ORDER BY CASE WHEN result_state IS NOT NULL THEN run_duration_seconds END
+            ) as median_duration,
+            PERCENTILE_CONT(0.9) WITHIN GROUP (
+                ORDER BY CASE WHEN result_state IS NOT NULL THEN run_duration_seconds END
+            ) as p90_duration,
+            AVG(CASE WHEN result_state IS NOT NULL THEN run_duration_seconds END) as avg_duration,
+            MAX(CASE WHEN result_state IS NOT NULL THEN run_duration_seconds END) as max_duration
+        FROM runs
+        GROUP BY workspace_id, job_id
+    )
+    SELECT
+        js.workspace_id,
+        js.job_id,
+        lj.name as job_name,
+        js.total_runs_30d,
+        js.success_count_30d,
+        ROUND(100.0 * js.success_count_30d / NULLIF(js.total_runs_30d, 0), 1) as success_rate_30d,
+        js.total_runs_7d,
+        js.success_count_7d,
+        ROUND(100.0 * js.success_count_7d / NULLIF(js.total_runs_7d, 0), 1) as success_rate_7d,
+        js.last_run_time,
+        js.last_duration as last_duration_seconds,
+        CASE
+            WHEN js.failure_priority IS NOT NULL THEN js.failure_priority
+            WHEN ROUND(100.0 * js.success_count_7d / NULLIF(js.total_runs_7d, 0), 1) BETWEEN 70 AND 89.9 THEN 'P3'
+            ELSE NULL
+        END as priority,
+        js.retry_count,
+        js.median_duration as median_duration_seconds,
+        js.p90_duration as p90_duration_seconds,
+        js.avg_duration as avg_duration_seconds,
+        js.max_duration as max_duration_seconds,
+        current_timestamp() as refreshed_at
+    FROM job_stats js
+    LEFT JOIN latest_jobs lj ON js.workspace_id = lj.workspace_id AND js.job_id = lj.job_id AND lj.rn = 1
+    """
+
 
-    # Query for 30-day window (covers both 7 and 30 day views)
-    health_query = """
+def build_legacy_job_health_query(runs_source: str = "system.lakeflow.job_run_timeline") -> str:
+    """Previous job health query (five job_run_timeline scans).
+
+    Kept only as the baseline for --benchmark (keyed by workspace_id, job_id
+    like the current query so results can be compared).
+    """
+    return f"""
     WITH latest_jobs AS (
         SELECT *,
             ROW_NUMBER() OVER(
@@ -77,35 +231,39 @@ def refresh_job_health_cache(spark: SparkSession, catalog: str, schema: str) ->
     ),
     run_stats_30d AS (
         SELECT
+            workspace_id,
             job_id,
             COUNT(*) as total_runs_30d,
             COUNT(CASE WHEN result_state = 'SUCCESS' THEN 1 END) as success_count_30d,
             MAX(period_start_time) as last_run_time,
             MAX(CASE WHEN result_state IS NOT NULL THEN run_duration_seconds END) as last_duration
-        FROM system.lakeflow.job_run_timeline
+        FROM {runs_source}
         WHERE period_start_time >= current_date() - INTERVAL 30 DAYS
-        GROUP BY job_id
+        GROUP BY workspace_id, job_id
     ),
     run_stats_7d AS (
         SELECT
+            workspace_id,
             job_id,
             COUNT(*) as total_runs_7d,
             COUNT(CASE WHEN result_state = 'SUCCESS' THEN 1 END) as success_count_7d
-        FROM system.lakeflow.job_run_timeline
+        FROM {runs_source}
         WHERE period_start_time >= current_date() - INTERVAL 7 DAYS
-        GROUP BY job_id
+        GROUP BY workspace_id, job_id
     ),
     consecutive_check AS (
         SELECT
+            workspace_id,
             job_id,
             result_state,
-            LAG(result_state) OVER (PARTITION BY job_id ORDER BY period_start_time DESC) as prev_state,
-            ROW_NUMBER() OVER (PARTITION BY job_id ORDER BY period_start_time DESC) as rn
-        FROM system.lakeflow.job_run_timeline
+            LAG(result_state) OVER (PARTITION BY workspace_id, job_id ORDER BY period_start_time DESC) as prev_state,
+            ROW_NUMBER() OVER (PARTITION BY workspace_id, job_id ORDER BY period_start_time DESC) as rn
+        FROM {runs_source}
         WHERE period_start_time >= current_date() - INTERVAL 7 DAYS
     ),
     priority_flags AS (
         SELECT
+            cc.workspace_id,
             cc.job_id,
             CASE
                 WHEN cc.result_state = 'FAILED' AND cc.prev_state = 'FAILED' THEN 'P1'
@@ -117,30 +275,33 @@ def refresh_job_health_cache(spark: SparkSession, catalog: str, schema: str) ->
     ),
     retry_counts AS (
         SELECT
+            workspace_id,
             job_id,
             SUM(CASE WHEN run_count > 1 THEN run_count - 1 ELSE 0 END) as retry_count
         FROM (
-            SELECT job_id, DATE(period_start_time) as run_date, COUNT(*) as run_count
-            FROM system.lakeflow.job_run_timeline
+            SELECT workspace_id, job_id, DATE(period_start_time) as run_date, COUNT(*) as run_count
+            FROM {runs_source}
             WHERE period_start_time >= current_date() - INTERVAL 7 DAYS
-            GROUP BY job_id, DATE(period_start_time)
+            GROUP BY workspace_id, job_id, DATE(period_start_time)
         )
-        GROUP BY job_id
+        GROUP BY workspace_id, job_id
     ),
     duration_stats AS (
         SELECT
+            workspace_id,
             job_id,
             PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY run_duration_seconds) as median_duration,
             PERCENTILE_CONT(0.9) WITHIN GROUP (ORDER BY run_duration_seconds) as p90_duration,
             AVG(run_duration_seconds) as avg_duration,
             MAX(run_duration_seconds) as max_duration
-        FROM system.lakeflow.job_run_timeline
+        FROM {runs_source}
         WHERE period_start_time >= current_date() - INTERVAL 30 DAYS
           AND run_duration_seconds IS NOT NULL
           AND result_state IS NOT NULL
-        GROUP BY job_id
+        GROUP BY workspace_id, job_id
     )
     SELECT
+        rs30.workspace_id,
         rs30.job_id,
         lj.name as job_name,
         rs30.total_runs_30d,
@@ -163,21 +324,260 @@ def refresh_job_health_cache(spark: SparkSession, catalog: str, schema: str) ->
         ds.max_duration as max_duration_seconds,
         current_timestamp() as refreshed_at
     FROM run_stats_30d rs30
-    LEFT JOIN run_stats_7d rs7 ON rs30.job_id = rs7.job_id
-    LEFT JOIN latest_jobs lj ON rs30.job_id = lj.job_id AND lj.rn = 1
-    LEFT JOIN priority_flags pf ON rs30.job_id = pf.job_id
-    LEFT JOIN retry_counts rc ON rs30.job_id = rc.job_id
-    LEFT JOIN duration_stats ds ON rs30.job_id = ds.job_id
+    LEFT JOIN run_stats_7d rs7 ON rs30.workspace_id = rs7.workspace_id AND rs30.job_id = rs7.job_id
+    LEFT JOIN latest_jobs lj ON rs30.workspace_id = lj.workspace_id AND rs30.job_id = lj.job_id AND lj.rn = 1
+    LEFT JOIN priority_flags pf ON rs30.workspace_id = pf.workspace_id AND rs30.job_id = pf.job_id
+    LEFT JOIN retry_counts rc ON rs30.workspace_id = rc.workspace_id AND rs30.job_id = rc.job_id
+    LEFT JOIN duration_stats ds ON rs30.workspace_id = ds.workspace_id AND rs30.job_id = ds.job_id
+    """
+
+
+def ensure_watermarks_table(spark: SparkSession, catalog: str, schema: str) -> None:
+    """Create the table holding per-cache refresh watermarks."""
+    spark.sql(f"""
+    CREATE TABLE IF NOT EXISTS {catalog}.{schema}.{WATERMARKS_TABLE} (
+        table_name STRING,
+        watermark TIMESTAMP,
+        window_date DATE,
+        mode STRING,
+        rows_written BIGINT,
+        refreshed_at TIMESTAMP
+    ) USING DELTA
+    """)
+
+
+def get_watermark(spark: SparkSession, catalog: str, schema: str, table: str):
+    """Get the last refresh watermark of a cache table.
+
+    Returns:
+        Row with watermark (max period_end_time read) and window_date
+        (current_date() of that refresh), or None if never refreshed
+    """
+    rows = spark.sql(f"""
+    SELECT watermark, window_date FROM {catalog}.{schema}.{WATERMARKS_TABLE}
+    WHERE table_name = '{table}' AND watermark IS NOT NULL
+    """).collect()
+    return rows[0] if rows else None
+
+
+def set_watermark(
+    spark: SparkSession, catalog: str, schema: str, table: str,
+    watermark: datetime, window_date, mode: str, rows_written: int,
+) -> None:
+    """Record a successful refresh of a cache table."""
+    spark.sql(f"""
+    MERGE INTO {catalog}.{schema}.{WATERMARKS_TABLE} t
+    USING (
+        SELECT '{table}' as table_name, TIMESTAMP'{watermark}' as watermark,
+            DATE'{window_date}' as window_date, '{mode}' as mode,
+            CAST({rows_written} AS BIGINT) as rows_written, current_timestamp() as refreshed_at
+    ) s
+    ON t.table_name = s.table_name
+    WHEN MATCHED THEN UPDATE SET *
+    WHEN NOT MATCHED THEN INSERT *
+    """)
+
+
+def publish_refresh_version(spark: SparkSession, catalog: str, schema: str) -> int:
+    """Bump the refresh version marker once the cache tables were rewritten.
+
+    Returns:
+        The new version
+    """
+    table_name = f"{catalog}.{schema}.{VERSION_TABLE}"
+    spark.sql(f"""
+    CREATE TABLE IF NOT EXISTS {table_name} (
+        name STRING,
+        version BIGINT,
+        refreshed_at TIMESTAMP
+    ) USING DELTA
+    """)
+    spark.sql(f"""
+    MERGE INTO {table_name} t
+    USING (SELECT 'metrics_cache' as name) s
+    ON t.name = s.name
+    WHEN MATCHED THEN UPDATE SET version = t.version + 1, refreshed_at = current_timestamp()
+    WHEN NOT MATCHED THEN INSERT (name, version, refreshed_at) VALUES (s.name, 1, current_timestamp())
+    """)
+    version = spark.sql(f"SELECT version FROM {table_name} WHERE name = 'metrics_cache'").collect()[0][0]
+    print(f"[{datetime.now()}] Published refresh version {version}")
+    return version
+
+
+def write_table(
+    spark: SparkSession, df, table_name: str, overwrite_schema: bool = False,
+    cluster_by: list[str] | None = None,
+) -> int:
+    """Overwrite a Delta table and return the rows written.
+
+    The row count comes from the Delta commit's operation metrics, so the
+    query is computed once (no separate df.count() action).
+
+    Args:
+        overwrite_schema: Allow the table schema to change
+        cluster_by: Liquid clustering columns; the table is replaced with
+            CREATE OR REPLACE ... CLUSTER BY (which also replaces the schema)
+    """
+    if cluster_by:
+        view = f"_refresh_{table_name.replace('.', '_')}"
+        df.createOrReplaceTempView(view)
+        spark.sql(
+            f"CREATE OR REPLACE TABLE {table_name} CLUSTER BY ({', '.join(cluster_by)}) "
+            f"AS SELECT * FROM {view}"
+        )
+    else:
+        writer = df.write.format("delta").mode("overwrite")
+        if overwrite_schema:
+            writer = writer.option("overwriteSchema", "true")
+        writer.saveAsTable(table_name)
+
+    history = spark.sql(f"DESCRIBE HISTORY {table_name} LIMIT 1").first()
+    metrics = (history["operationMetrics"] if history else None) or {}
+    if "numOutputRows" in metrics:
+        return int(metrics["numOutputRows"])
+    # Metrics unavailable: count the written table (answered from Delta file stats)
+    return spark.table(table_name).count()
+
+
+def _merge_metric(result, name: str) -> int:
+    """Read a row count from a MERGE result (0 if not reported)."""
+    row = result.first()
+    if row is None:
+        return 0
+    return int(row.asDict().get(name) or 0)
+
+
+def _full_refresh_job_health(spark: SparkSession, table_name: str) -> tuple[int, datetime | None]:
+    """Recompute all jobs and overwrite the job health table.
+
+    Returns:
+        Tuple of (jobs written, new watermark)
     """
+    print(f"[{datetime.now()}] Refreshing job health cache (full)...")
+    # Watermark first: rows arriving while the refresh runs are re-read next time
+    watermark = spark.sql(f"""
+    SELECT MAX(period_end_time) FROM system.lakeflow.job_run_timeline
+    WHERE period_start_time >= current_date() - INTERVAL {HEALTH_WINDOW_DAYS} DAYS
+    """).first()[0]
 
-    df = spark.sql(health_query)
-    row_count = df.count()
+    df = spark.sql(build_job_health_query())
 
     # Write to Delta table (overwrite for full refresh)
-    table_name = f"{catalog}.{schema}.job_health_cache"
-    df.write.format("delta").mode("overwrite").saveAsTable(table_name)
+    row_count = write_table(spark, df, table_name, cluster_by=CACHE_CLUSTER_COLUMNS)
 
     print(f"[{datetime.now()}] Wrote {row_count} jobs to {table_name}")
+    return row_count, watermark
+
+
+def _incremental_refresh_job_health(spark: SparkSession, table_name: str, state) -> tuple[int, datetime | None]:
+    """Recompute jobs changed since the last watermark and MERGE them.
+
+    Returns:
+        Tuple of (jobs recomputed or deleted, new watermark)
+    """
+    since = f"TIMESTAMP'{state.watermark}' - INTERVAL {WATERMARK_LOOKBACK_MINUTES} MINUTES"
+    print(f"[{datetime.now()}] Refreshing job health cache (incremental since {state.watermark})...")
+    watermark = spark.sql(f"""
+    SELECT MAX(period_end_time) FROM system.lakeflow.job_run_timeline
+    WHERE period_end_time >= {since}
+    """).first()[0] or state.watermark
+
+    # Jobs whose 7/30-day aggregates can differ from the cached row
+    spark.sql(f"""
+    CREATE OR REPLACE TEMP VIEW health_affected_jobs AS
+    SELECT workspace_id, job_id FROM system.lakeflow.job_run_timeline
+    WHERE period_end_time >= {since}
+    UNION
+    SELECT workspace_id, job_id FROM system.lakeflow.job_run_timeline
+    WHERE (period_start_time >= DATE'{state.window_date}' - INTERVAL {HEALTH_WINDOW_DAYS} DAYS
+           AND period_start_time < current_date() - INTERVAL {HEALTH_WINDOW_DAYS} DAYS)
+       OR (period_start_time >= DATE'{state.window_date}' - INTERVAL {HEALTH_SHORT_WINDOW_DAYS} DAYS
+           AND period_start_time < current_date() - INTERVAL {HEALTH_SHORT_WINDOW_DAYS} DAYS)
+    UNION
+    SELECT workspace_id, job_id FROM system.lakeflow.jobs
+    WHERE change_time >= {since}
+    """)
+    spark.sql(f"""
+    CREATE OR REPLACE TEMP VIEW health_scoped_runs AS
+    SELECT r.* FROM system.lakeflow.job_run_timeline r
+    LEFT SEMI JOIN health_affected_jobs a ON r.workspace_id = a.workspace_id AND r.job_id = a.job_id
+    WHERE r.period_start_time >= current_date() - INTERVAL {HEALTH_WINDOW_DAYS} DAYS
+    """)
+    updates = spark.sql(build_job_health_query("health_scoped_runs"))
+    updates.createOrReplaceTempView("health_updates")
+
+    # One MERGE: upsert recomputed jobs, delete affected jobs with no runs left in the window
+    columns = updates.columns
+    update_set = ", ".join(f"t.{c} = s.{c}" for c in columns)
+    insert_values = ", ".join(f"s.{c}" for c in columns)
+    result = spark.sql(f"""
+    MERGE INTO {table_name} t
+    USING (
+        SELECT a.workspace_id as merge_workspace_id, a.job_id as merge_job_id, u.*
+        FROM health_affected_jobs a
+        LEFT JOIN health_updates u ON a.workspace_id = u.workspace_id AND a.job_id = u.job_id
+    ) s
+    ON t.workspace_id = s.merge_workspace_id AND t.job_id = s.merge_job_id
+    WHEN MATCHED AND s.job_id IS NULL THEN DELETE
+    WHEN MATCHED THEN UPDATE SET {update_set}
+    WHEN NOT MATCHED AND s.job_id IS NOT NULL THEN INSERT ({", ".join(columns)}) VALUES ({insert_values})
+    """)
+    row_count = _merge_metric(result, "num_affected_rows")
+
+    print(
+        f"[{datetime.now()}] Merged {row_count} jobs into {table_name} "
+        f"(updated {_merge_metric(result, 'num_updated_rows')}, "
+        f"inserted {_merge_metric(result, 'num_inserted_rows')}, "
+        f"deleted {_merge_metric(result, 'num_deleted_rows')})"
+    )
+    return row_count, watermark
+
+
+def refresh_job_health_cache(
+    spark: SparkSession, catalog: str, schema: str, incremental: bool = True
+) -> int:
+    """Refresh job health metrics cache.
+
+    Computes:
+    - Success rates (7-day and 30-day windows)
+    - Priority flags (P1/P2/P3)
+    - Consecutive failure detection
+    - Retry counts
+
+    In incremental mode only jobs whose metrics can have changed since the
+    last refresh are recomputed and MERGEd into the table:
+    - jobs with timeline rows ending after the watermark (minus a lookback)
+    - jobs with runs that aged out of the 7/30-day windows since then
+    - jobs renamed or deleted since then
+    Jobs left without runs in the 30-day window are deleted. The first
+    refresh (no table or watermark) and any failed incremental refresh
+    fall back to a full overwrite.
+
+    Args:
+        incremental: MERGE changed jobs instead of rewriting the table
+
+    Returns number of jobs written (full) or recomputed (incremental).
+    """
+    table_name = f"{catalog}.{schema}.job_health_cache"
+    ensure_watermarks_table(spark, catalog, schema)
+    window_date = spark.sql("SELECT current_date() as window_date").first()[0]
+
+    state = None
+    if incremental and spark.catalog.tableExists(table_name):
+        state = get_watermark(spark, catalog, schema, "job_health_cache")
+
+    mode = "full"
+    if state is not None:
+        try:
+            row_count, watermark = _incremental_refresh_job_health(spark, table_name, state)
+            mode = "incremental"
+        except Exception as e:
+            print(f"[{datetime.now()}] Incremental job health refresh failed, running full refresh: {e}")
+    if mode == "full":
+        row_count, watermark = _full_refresh_job_health(spark, table_name)
+
+    if watermark is not None:
+        set_watermark(spark, catalog, schema, "job_health_cache", watermark, window_date, mode, row_count)
     return row_count
 
 
@@ -191,6 +591,7 @@ def refresh_cost_cache(spark: SparkSession, catalog: str, schema: str) -> int:
     cost_query = """
     WITH job_costs AS (
         SELECT
+            workspace_id,
             usage_metadata.job_id as job_id,
             sku_name,
             SUM(usage_quantity) as total_dbus,
@@ -199,44 +600,48 @@ def refresh_cost_cache(spark: SparkSession, catalog: str, schema: str) -> int:
         FROM system.billing.usage
         WHERE usage_date >= current_date() - INTERVAL 30 DAYS
           AND usage_metadata.job_id IS NOT NULL
-        GROUP BY usage_metadata.job_id, sku_name
+        GROUP BY workspace_id, usage_metadata.job_id, sku_name
         HAVING SUM(usage_quantity) != 0
     ),
     job_totals AS (
         SELECT
+            workspace_id,
             job_id,
             SUM(total_dbus) as total_dbus_30d,
             SUM(current_7d) as current_7d_dbus,
             SUM(prev_7d) as prev_7d_dbus,
             CONCAT_WS(',', COLLECT_LIST(CONCAT(sku_name, ':', CAST(total_dbus AS STRING)))) as sku_breakdown
         FROM job_costs
-        GROUP BY job_id
+        GROUP BY workspace_id, job_id
     ),
     job_p90 AS (
         SELECT
+            workspace_id,
             job_id,
             PERCENTILE_CONT(0.9) WITHIN GROUP (ORDER BY daily_dbus) as p90_dbus
         FROM (
             SELECT
+                workspace_id,
                 usage_metadata.job_id as job_id,
                 usage_date,
                 SUM(usage_quantity) as daily_dbus
             FROM system.billing.usage
             WHERE usage_date >= current_date() - INTERVAL 30 DAYS
               AND usage_metadata.job_id IS NOT NULL
-            GROUP BY usage_metadata.job_id, usage_date
+            GROUP BY workspace_id, usage_metadata.job_id, usage_date
             HAVING SUM(usage_quantity) != 0
         )
-        GROUP BY job_id
+        GROUP BY workspace_id, job_id
         HAVING COUNT(*) >= 5
     ),
     job_names AS (
-        SELECT job_id, name,
+        SELECT workspace_id, job_id, name,
             ROW_NUMBER() OVER(PARTITION BY workspace_id, job_id ORDER BY change_time DESC) as rn
         FROM system.lakeflow.jobs
         WHERE delete_time IS NULL
     )
     SELECT
+        jt.workspace_id,
         jt.job_id,
         COALESCE(jn.name, CONCAT('job-', jt.job_id)) as job_name,
         jt.total_dbus_30d,
@@ -254,16 +659,491 @@ def refresh_cost_cache(spark: SparkSession, catalog: str, schema: str) -> int:
         CASE WHEN jp.p90_dbus IS NOT NULL AND jt.current_7d_dbus > (2 * jp.p90_dbus) THEN true ELSE false END as is_anomaly,
         current_timestamp() as refreshed_at
     FROM job_totals jt
-    LEFT JOIN job_names jn ON jt.job_id = jn.job_id AND jn.rn = 1
-    LEFT JOIN job_p90 jp ON jt.job_id = jp.job_id
+    LEFT JOIN job_names jn ON jt.workspace_id = jn.workspace_id AND jt.job_id = jn.job_id AND jn.rn = 1
+    LEFT JOIN job_p90 jp ON jt.workspace_id = jp.workspace_id AND jt.job_id = jp.job_id
     ORDER BY jt.total_dbus_30d DESC
     """
 
     df = spark.sql(cost_query)
-    row_count = df.count()
 
     table_name = f"{catalog}.{schema}.cost_cache"
-    df.write.format("delta").mode("overwrite").saveAsTable(table_name)
+    row_count = write_table(spark, df, table_name, cluster_by=CACHE_CLUSTER_COLUMNS)
+
+    print(f"[{datetime.now()}] Wrote {row_count} jobs to {table_name}")
+    return row_count
+
+
+def refresh_job_team_map(
+    spark: SparkSession, catalog: str, schema: str, tag_keys: dict[str, str] | None = None
+) -> int:
+    """Refresh the job attribution tags (job_team_map).
+
+    One row per existing job (latest system.lakeflow.jobs version), with the
+    team, owner, SLA and budget tags read from its ``tags`` map in a single
+    pass. Untagged jobs are kept with NULL tags so joins by job_id also
+    return their name. Clustered by team and job_id for team filters.
+
+    Args:
+        tag_keys: config.yaml ``tags`` section (team, owner, sla, budget tag names)
+
+    Returns number of jobs cached.
+    """
+    print(f"[{datetime.now()}] Refreshing job team map...")
+
+    tag_keys = tag_keys or {}
+    team_key = tag_keys.get("team", "team")
+    owner_key = tag_keys.get("owner", "owner")
+    sla_key = tag_keys.get("sla", "sla_minutes")
+    budget_key = tag_keys.get("budget", "budget_monthly_dbus")
+
+    query = f"""
+    WITH latest_jobs AS (
+        SELECT workspace_id, CAST(job_id AS STRING) as job_id, name, tags,
+            ROW_NUMBER() OVER(PARTITION BY workspace_id, job_id ORDER BY change_time DESC) as rn
+        FROM system.lakeflow.jobs
+        WHERE delete_time IS NULL
+    )
+    SELECT
+        workspace_id,
+        job_id,
+        COALESCE(name, CONCAT('job-', job_id)) as job_name,
+        NULLIF(TRIM(tags['{team_key}']), '') as team,
+        NULLIF(TRIM(tags['{owner_key}']), '') as owner,
+        TRY_CAST(tags['{sla_key}'] AS INT) as sla_minutes,
+        TRY_CAST(tags['{budget_key}'] AS DOUBLE) as budget_monthly_dbus,
+        current_timestamp() as refreshed_at
+    FROM latest_jobs
+    WHERE rn = 1
+    """
+    df = spark.sql(query)
+
+    table_name = f"{catalog}.{schema}.job_team_map"
+    row_count = write_table(spark, df, table_name, cluster_by=["team", "job_id"])
+
+    print(f"[{datetime.now()}] Wrote {row_count} jobs to {table_name}")
+    return row_count
+
+
+def build_job_daily_stats_query(days: int, sla_tag_key: str = "sla_minutes") -> str:
+    """Build the per-job, per-day rollup query for the last `days` days.
+
+    Runs are bucketed by the day their final timeline row started (the
+    same rows and dates the historical charts count); DBUs by usage_date.
+    The states of the day's last two runs are kept so the latest-run
+    priority flags can be derived for any window.
+    Every column is additive across days, so any window or bucket is a
+    SUM over rows; the duration histogram is merged by element-wise sum.
+
+    Args:
+        days: Days to compute, counting back from today
+        sla_tag_key: Job tag holding the SLA target in minutes
+    """
+    return f"""
+    WITH latest_jobs AS (
+        SELECT workspace_id, job_id, tags,
+            ROW_NUMBER() OVER(PARTITION BY workspace_id, job_id ORDER BY change_time DESC) as rn
+        FROM system.lakeflow.jobs
+        WHERE delete_time IS NULL
+    ),
+    sla_targets AS (
+        SELECT workspace_id, job_id, TRY_CAST(tags['{sla_tag_key}'] AS INT) * 60 as sla_seconds
+        FROM latest_jobs
+        WHERE rn = 1 AND TRY_CAST(tags['{sla_tag_key}'] AS INT) IS NOT NULL
+    ),
+    runs AS (
+        SELECT
+            r.workspace_id,
+            CAST(r.job_id AS STRING) as job_id,
+            DATE(r.period_start_time) as stat_date,
+            r.period_start_time,
+            UPPER(r.result_state) as result_state,
+            r.run_duration_seconds,
+            LEAST(
+                CAST(FLOOR(LOG2(GREATEST(r.run_duration_seconds, 1))) AS INT),
+                {DURATION_HISTOGRAM_BUCKETS - 1}
+            ) as duration_bucket,
+            r.run_duration_seconds > st.sla_seconds as sla_breached,
+            ROW_NUMBER() OVER (
+                PARTITION BY r.workspace_id, r.job_id, DATE(r.period_start_time)
+                ORDER BY r.period_start_time DESC
+            ) as day_rank
+        FROM system.lakeflow.job_run_timeline r
+        LEFT JOIN sla_targets st ON r.workspace_id = st.workspace_id AND r.job_id = st.job_id
+        WHERE r.period_start_time >= current_date() - INTERVAL {days} DAYS
+          AND r.result_state IS NOT NULL
+    ),
+    run_days AS (
+        SELECT
+            workspace_id,
+            job_id,
+            stat_date,
+            COUNT(*) as run_count,
+            COUNT(CASE WHEN UPPER(result_state) IN ('SUCCESS', 'SUCCEEDED') THEN 1 END) as success_count,
+            COUNT(CASE WHEN UPPER(result_state) IN ('FAILED', 'FAILURE') THEN 1 END) as failure_count,
+            COUNT(run_duration_seconds) as duration_count,
+            SUM(run_duration_seconds) as duration_sum_seconds,
+            MAX(run_duration_seconds) as duration_max_seconds,
+            COLLECT_LIST(duration_bucket) as duration_buckets,
+            COUNT(CASE WHEN sla_breached THEN 1 END) as sla_breach_count,
+            MAX(period_start_time) as last_run_time,
+            MAX(CASE WHEN day_rank = 1 THEN result_state END) as last_result_state,
+            MAX(CASE WHEN day_rank = 2 THEN result_state END) as prev_result_state
+        FROM runs
+        GROUP BY workspace_id, job_id, stat_date
+    ),
+    dbu_days AS (
+        SELECT
+            workspace_id,
+            usage_metadata.job_id as job_id,
+            usage_date as stat_date,
+            SUM(usage_quantity) as dbus
+        FROM system.billing.usage
+        WHERE usage_date >= current_date() - INTERVAL {days} DAYS
+          AND usage_metadata.job_id IS NOT NULL
+        GROUP BY workspace_id, usage_metadata.job_id, usage_date
+    )
+    SELECT
+        COALESCE(rd.workspace_id, dd.workspace_id) as workspace_id,
+        COALESCE(rd.job_id, dd.job_id) as job_id,
+        COALESCE(rd.stat_date, dd.stat_date) as stat_date,
+        COALESCE(rd.run_count, 0) as run_count,
+        COALESCE(rd.success_count, 0) as success_count,
+        COALESCE(rd.failure_count, 0) as failure_count,
+        COALESCE(rd.duration_count, 0) as duration_count,
+        COALESCE(rd.duration_sum_seconds, 0) as duration_sum_seconds,
+        rd.duration_max_seconds,
+        TRANSFORM(
+            SEQUENCE(0, {DURATION_HISTOGRAM_BUCKETS - 1}),
+            b -> CAST(SIZE(FILTER(COALESCE(rd.duration_buckets, ARRAY()), x -> x = b)) AS BIGINT)
+        ) as duration_histogram,
+        COALESCE(rd.sla_breach_count, 0) as sla_breach_count,
+        rd.last_run_time,
+        rd.last_result_state,
+        rd.prev_result_state,
+        dd.dbus,
+        current_timestamp() as refreshed_at
+    FROM run_days rd
+    FULL OUTER JOIN dbu_days dd
+        ON rd.workspace_id = dd.workspace_id AND rd.job_id = dd.job_id AND rd.stat_date = dd.stat_date
+    """
+
+
+def refresh_job_daily_stats(
+    spark: SparkSession, catalog: str, schema: str, sla_tag_key: str = "sla_minutes", incremental: bool = True
+) -> int:
+    """Refresh the job_daily_stats rollup (one row per job and day).
+
+    The first refresh (or a full refresh) computes DAILY_STATS_RETENTION_DAYS
+    days. Later refreshes recompute only the last DAILY_STATS_RECOMPUTE_DAYS
+    days and MERGE them, deleting rows that aged out of the retention.
+
+    Returns number of job-days written (full) or merged (incremental).
+    """
+    table_name = f"{catalog}.{schema}.job_daily_stats"
+
+    if incremental and spark.catalog.tableExists(table_name):
+        print(f"[{datetime.now()}] Refreshing job daily stats (last {DAILY_STATS_RECOMPUTE_DAYS} days)...")
+        updates = spark.sql(build_job_daily_stats_query(DAILY_STATS_RECOMPUTE_DAYS, sla_tag_key))
+        updates.createOrReplaceTempView("daily_stats_updates")
+        result = spark.sql(f"""
+        MERGE INTO {table_name} t
+        USING daily_stats_updates s
+        ON t.workspace_id = s.workspace_id AND t.job_id = s.job_id AND t.stat_date = s.stat_date
+        WHEN MATCHED THEN UPDATE SET *
+        WHEN NOT MATCHED THEN INSERT *
+        WHEN NOT MATCHED BY SOURCE
+            AND (t.stat_date >= current_date() - INTERVAL {DAILY_STATS_RECOMPUTE_DAYS} DAYS
+                 OR t.stat_date < current_date() - INTERVAL {DAILY_STATS_RETENTION_DAYS} DAYS)
+            THEN DELETE
+        """)
+        row_count = _merge_metric(result, "num_affected_rows")
+        print(f"[{datetime.now()}] Merged {row_count} job-days into {table_name}")
+        return row_count
+
+    print(f"[{datetime.now()}] Refreshing job daily stats (full, {DAILY_STATS_RETENTION_DAYS} days)...")
+    df = spark.sql(build_job_daily_stats_query(DAILY_STATS_RETENTION_DAYS, sla_tag_key))
+    row_count = write_table(spark, df, table_name, cluster_by=["stat_date", "workspace_id"])
+    print(f"[{datetime.now()}] Wrote {row_count} job-days to {table_name}")
+    return row_count
+
+
+def refresh_recent_runs_cache(spark: SparkSession, catalog: str, schema: str) -> int:
+    """Refresh the last completed runs of each job (job_recent_runs).
+
+    One row per run: timeline periods are collapsed to the run's first
+    start and last end. Durations fall back to end - start when
+    run_duration_seconds is 0 (serverless). The table is clustered by
+    job_id so readers do point lookups.
+
+    Returns number of runs cached.
+    """
+    print(f"[{datetime.now()}] Refreshing recent runs cache...")
+
+    query = f"""
+    WITH runs AS (
+        SELECT
+            workspace_id,
+            CAST(job_id AS STRING) as job_id,
+            CAST(run_id AS STRING) as run_id,
+            MAX(result_state) as result_state,
+            MIN(period_start_time) as start_time,
+            MAX(period_end_time) as end_time,
+            MAX(run_duration_seconds) as run_duration_seconds
+        FROM system.lakeflow.job_run_timeline
+        WHERE period_start_time >= current_date() - INTERVAL {RECENT_RUNS_LOOKBACK_DAYS} DAYS
+        GROUP BY workspace_id, job_id, run_id
+        HAVING MAX(result_state) IS NOT NULL
+    ),
+    ranked_runs AS (
+        SELECT *,
+            ROW_NUMBER() OVER (PARTITION BY workspace_id, job_id ORDER BY start_time DESC) as run_rank
+        FROM runs
+    )
+    SELECT
+        workspace_id,
+        job_id,
+        run_rank,
+        run_id,
+        result_state,
+        start_time,
+        end_time,
+        CASE
+            WHEN run_duration_seconds IS NULL OR run_duration_seconds = 0
+            THEN TIMESTAMPDIFF(SECOND, start_time, end_time)
+            ELSE run_duration_seconds
+        END as duration_seconds,
+        current_timestamp() as refreshed_at
+    FROM ranked_runs
+    WHERE run_rank <= {RECENT_RUNS_PER_JOB}
+    """
+    df = spark.sql(query)
+
+    table_name = f"{catalog}.{schema}.job_recent_runs"
+    row_count = write_table(spark, df, table_name, cluster_by=["job_id"])
+
+    print(f"[{datetime.now()}] Wrote {row_count} runs to {table_name}")
+    return row_count
+
+
+def refresh_cluster_utilization_cache(spark: SparkSession, catalog: str, schema: str) -> int:
+    """Refresh the per-job cluster utilization proxy (cluster_utilization_cache).
+
+    One row per job with completed runs in the last 30 days. DBU/hour of a
+    run is the job's billed DBUs on the run's start date divided by the run
+    duration (same proxy as the cluster-metrics endpoint and cluster
+    alerts). Stores the last UTILIZATION_RUNS_KEPT per-run rates (newest
+    first) for the endpoint, the 30-day average for alerts, and the
+    estimated utilization / over-provisioning / recommendation of the last
+    UTILIZATION_DEFAULT_RUNS runs using the backend's heuristic
+    (<1 DBU/h ~20%, <2 ~40%, <4 ~60%, else 80%+). Clustered by job_id and
+    workspace_id.
+
+    Returns number of jobs cached.
+    """
+    print(f"[{datetime.now()}] Refreshing cluster utilization cache...")
+
+    n = UTILIZATION_DEFAULT_RUNS
+    query = f"""
+    WITH runs AS (
+        SELECT
+            workspace_id,
+            CAST(job_id AS STRING) as job_id,
+            run_id,
+            MIN(period_start_time) as start_time,
+            MAX(period_end_time) as end_time,
+            MAX(run_duration_seconds) as run_duration_seconds
+        FROM system.lakeflow.job_run_timeline
+        WHERE period_start_time >= current_date() - INTERVAL 30 DAYS
+        GROUP BY workspace_id, job_id, run_id
+        HAVING MAX(result_state) IS NOT NULL AND MAX(period_end_time) IS NOT NULL
+    ),
+    valid_runs AS (
+        SELECT * FROM (
+            SELECT
+                workspace_id, job_id, run_id, start_time,
+                CASE
+                    WHEN run_duration_seconds IS NULL OR run_duration_seconds = 0
+                    THEN TIMESTAMPDIFF(SECOND, start_time, end_time)
+                    ELSE run_duration_seconds
+                END as duration_seconds
+            FROM runs
+        ) WHERE duration_seconds > 0
+    ),
+    billing AS (
+        SELECT
+            workspace_id,
+            usage_metadata.job_id as job_id,
+            usage_date,
+            SUM(usage_quantity) as total_dbus
+        FROM system.billing.usage
+        WHERE usage_date >= current_date() - INTERVAL 30 DAYS
+            AND usage_metadata.job_id IS NOT NULL
+        GROUP BY workspace_id, usage_metadata.job_id, usage_date
+        HAVING SUM(usage_quantity) > 0
+    ),
+    run_rates AS (
+        SELECT
+            r.workspace_id,
+            r.job_id,
+            r.start_time,
+            COALESCE(b.total_dbus, 0) / (r.duration_seconds / 3600.0) as dbus_per_hour,
+            ROW_NUMBER() OVER (PARTITION BY r.workspace_id, r.job_id ORDER BY r.start_time DESC) as run_rank
+        FROM valid_runs r
+        LEFT JOIN billing b
+            ON r.workspace_id = b.workspace_id AND r.job_id = b.job_id AND DATE(r.start_time) = b.usage_date
+    ),
+    job_rates AS (
+        SELECT
+            workspace_id,
+            job_id,
+            MAX(start_time) as last_run_time,
+            COUNT(*) as runs_analyzed,
+            AVG(dbus_per_hour) as avg_dbus_per_hour,
+            TRANSFORM(
+                ARRAY_SORT(
+                    COLLECT_LIST(CASE WHEN run_rank <= {UTILIZATION_RUNS_KEPT} THEN STRUCT(run_rank, dbus_per_hour) END)
+                ),
+                r -> r.dbus_per_hour
+            ) as recent_dbus_per_hour,
+            AVG(CASE WHEN run_rank <= {n} AND dbus_per_hour > 0 THEN dbus_per_hour END) as recent_avg_dbus_per_hour,
+            COUNT(CASE WHEN run_rank <= {n} THEN 1 END) as recent_runs,
+            COUNT(CASE WHEN run_rank <= {n} AND dbus_per_hour > 0 AND dbus_per_hour < 2 THEN 1 END) as recent_low_runs
+        FROM run_rates
+        GROUP BY workspace_id, job_id
+    ),
+    job_names AS (
+        SELECT workspace_id, CAST(job_id AS STRING) as job_id, name,
+            ROW_NUMBER() OVER (PARTITION BY workspace_id, job_id ORDER BY change_time DESC) as rn
+        FROM system.lakeflow.jobs
+        WHERE delete_time IS NULL
+    ),
+    estimated AS (
+        SELECT
+            jr.*,
+            COALESCE(jn.name, CONCAT('job-', jr.job_id)) as job_name,
+            CASE
+                WHEN recent_avg_dbus_per_hour IS NULL THEN NULL
+                WHEN recent_avg_dbus_per_hour < 1 THEN 20.0
+                WHEN recent_avg_dbus_per_hour < 2 THEN 40.0
+                WHEN recent_avg_dbus_per_hour < 4 THEN 60.0
+                ELSE LEAST(80.0 + (recent_avg_dbus_per_hour - 4) * 2, 95.0)
+            END as estimated_utilization_percent
+        FROM job_rates jr
+        LEFT JOIN job_names jn ON jr.workspace_id = jn.workspace_id AND jr.job_id = jn.job_id AND jn.rn = 1
+    )
+    SELECT
+        workspace_id,
+        job_id,
+        job_name,
+        last_run_time,
+        runs_analyzed,
+        avg_dbus_per_hour,
+        recent_dbus_per_hour,
+        recent_avg_dbus_per_hour,
+        estimated_utilization_percent,
+        -- Sustained: every one of the last {n} runs below ~40% (driver/worker average < 40%)
+        COALESCE(recent_runs >= {n} AND recent_low_runs = recent_runs AND estimated_utilization_percent * 0.925 < 40, false)
+            as is_over_provisioned,
+        CASE
+            WHEN NOT COALESCE(recent_runs >= {n} AND recent_low_runs = recent_runs AND estimated_utilization_percent * 0.925 < 40, false)
+                THEN NULL
+            WHEN estimated_utilization_percent * 0.925 < 20 THEN 'Consider reducing workers by 50% or using smaller node types'
+            WHEN estimated_utilization_percent * 0.925 < 30 THEN 'Consider reducing to fewer workers'
+            ELSE 'Consider using smaller node types'
+        END as recommendation,
+        current_timestamp() as refreshed_at
+    FROM estimated
+    """
+    df = spark.sql(query)
+
+    table_name = f"{catalog}.{schema}.cluster_utilization_cache"
+    row_count = write_table(spark, df, table_name, cluster_by=["job_id", "workspace_id"])
+
+    print(f"[{datetime.now()}] Wrote {row_count} jobs to {table_name}")
+    return row_count
+
+
+def refresh_job_detail_cache(spark: SparkSession, catalog: str, schema: str) -> int:
+    """Refresh the per-job record behind the expanded health row (job_detail_cache).
+
+    One row per job_id (across workspaces, like the live endpoint) with
+    30-day duration stats (0-second serverless durations replaced by
+    end - start), retries in the last 7 days, up to 10 distinct failure
+    termination codes and the latest job name. Clustered by job_id for
+    point lookups.
+
+    Returns number of jobs cached.
+    """
+    print(f"[{datetime.now()}] Refreshing job detail cache...")
+
+    query = f"""
+    WITH latest_jobs AS (
+        SELECT CAST(job_id AS STRING) as job_id, name,
+            ROW_NUMBER() OVER(PARTITION BY job_id ORDER BY change_time DESC) as rn
+        FROM system.lakeflow.jobs
+        WHERE delete_time IS NULL
+    ),
+    runs AS (
+        SELECT
+            CAST(job_id AS STRING) as job_id,
+            period_start_time,
+            period_end_time,
+            result_state,
+            termination_code,
+            CASE
+                WHEN run_duration_seconds IS NULL OR run_duration_seconds = 0
+                THEN TIMESTAMPDIFF(SECOND, period_start_time, period_end_time)
+                ELSE run_duration_seconds
+            END as effective_duration,
+            period_start_time >= current_date() - INTERVAL {HEALTH_SHORT_WINDOW_DAYS} DAYS as in_7d
+        FROM system.lakeflow.job_run_timeline
+        WHERE period_start_time >= current_date() - INTERVAL {HEALTH_WINDOW_DAYS} DAYS
+          AND result_state IS NOT NULL
+    ),
+    job_stats AS (
+        SELECT
+            job_id,
+            PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY CASE
+                WHEN period_end_time IS NOT NULL AND effective_duration > 0 THEN effective_duration END
+            ) as median_duration_seconds,
+            PERCENTILE_CONT(0.9) WITHIN GROUP (ORDER BY CASE
+                WHEN period_end_time IS NOT NULL AND effective_duration > 0 THEN effective_duration END
+            ) as p90_duration_seconds,
+            AVG(CASE WHEN period_end_time IS NOT NULL AND effective_duration > 0 THEN effective_duration END)
+                as avg_duration_seconds,
+            MAX(CASE WHEN period_end_time IS NOT NULL AND effective_duration > 0 THEN effective_duration END)
+                as max_duration_seconds,
+            COUNT(CASE WHEN period_end_time IS NOT NULL AND effective_duration > 0 THEN 1 END) as run_count,
+            GREATEST(
+                COUNT(CASE WHEN in_7d THEN 1 END)
+                    - SIZE(COLLECT_SET(CASE WHEN in_7d THEN DATE(period_start_time) END)),
+                0
+            ) as retry_count_7d,
+            ARRAY_JOIN(
+                SLICE(ARRAY_SORT(COLLECT_SET(CASE WHEN result_state = 'FAILED' THEN termination_code END)), 1, 10),
+                ','
+            ) as failure_reasons
+        FROM runs
+        GROUP BY job_id
+    )
+    SELECT
+        js.job_id,
+        lj.name as job_name,
+        js.median_duration_seconds,
+        js.p90_duration_seconds,
+        js.avg_duration_seconds,
+        js.max_duration_seconds,
+        js.run_count,
+        js.retry_count_7d,
+        js.failure_reasons,
+        current_timestamp() as refreshed_at
+    FROM job_stats js
+    LEFT JOIN latest_jobs lj ON js.job_id = lj.job_id AND lj.rn = 1
+    """
+    df = spark.sql(query)
+
+    table_name = f"{catalog}.{schema}.job_detail_cache"
+    row_count = write_table(spark, df, table_name, cluster_by=["job_id"])
 
     print(f"[{datetime.now()}] Wrote {row_count} jobs to {table_name}")
     return row_count
@@ -407,16 +1287,75 @@ def refresh_alerts_cache(spark: SparkSession, catalog: str, schema: str) -> int:
     """
 
     df = spark.sql(alerts_query)
-    row_count = df.count()
 
     table_name = f"{catalog}.{schema}.alerts_cache"
     # Use overwriteSchema to allow schema evolution (e.g., adding workspace_id column)
-    df.write.format("delta").mode("overwrite").option("overwriteSchema", "true").saveAsTable(table_name)
+    row_count = write_table(spark, df, table_name, overwrite_schema=True, cluster_by=CACHE_CLUSTER_COLUMNS)
 
     print(f"[{datetime.now()}] Wrote {row_count} alerts to {table_name}")
     return row_count
 
 
+def _plan_stats(df) -> dict:
+    """Count timeline scans and shuffles in a DataFrame's physical plan."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        df.explain(mode="formatted")
+    plan = buffer.getvalue()
+    # Formatted plans list each operator once as "(n) Name ..." in the overview tree
+    operators = re.findall(r"^\(\d+\) (\w+(?: \w+)*)", plan, flags=re.MULTILINE)
+    return {
+        "timeline_scans": sum(
+            1 for m in re.finditer(r"^\(\d+\) Scan .*$", plan, flags=re.MULTILINE)
+            if "job_run_timeline" in m.group(0)
+        ),
+        # Exchange / ShuffleExchange / PhotonShuffleExchangeSink; broadcasts and reuses are not shuffles
+        "shuffles": sum(
+            1 for op in operators
+            if "Exchange" in op and not any(x in op for x in ("Broadcast", "Reused", "Source"))
+        ),
+        "operators": len(operators),
+    }
+
+
+def benchmark_job_health_query(spark: SparkSession) -> dict:
+    """Compare the single-scan job health query with the previous one.
+
+    Runs both queries end to end (noop sink, nothing written), reports
+    timeline scans, shuffles and wall time, and checks both return the
+    same rows (ignoring refreshed_at).
+
+    Returns:
+        Dict with "legacy" and "single_scan" stats and "mismatched_rows"
+    """
+    print(f"[{datetime.now()}] Benchmarking job health query...")
+    results = {}
+    frames = {}
+    for name, query in (
+        ("legacy", build_legacy_job_health_query()),
+        ("single_scan", build_job_health_query()),
+    ):
+        df = spark.sql(query).drop("refreshed_at")
+        stats = _plan_stats(df)
+        started = time.time()
+        df.write.format("noop").mode("overwrite").save()
+        stats["seconds"] = round(time.time() - started, 1)
+        results[name] = stats
+        frames[name] = df
+        print(f"[{datetime.now()}]   {name}: {stats}")
+
+    legacy, single = frames["legacy"], frames["single_scan"]
+    results["mismatched_rows"] = legacy.exceptAll(single).count() + single.exceptAll(legacy).count()
+
+    before, after = results["legacy"], results["single_scan"]
+    print(f"[{datetime.now()}] Benchmark results:")
+    print(f"  - Timeline scans: {before['timeline_scans']} -> {after['timeline_scans']}")
+    print(f"  - Shuffles: {before['shuffles']} -> {after['shuffles']}")
+    print(f"  - Wall time: {before['seconds']}s -> {after['seconds']}s")
+    print(f"  - Mismatched rows: {results['mismatched_rows']}")
+    return results
+
+
 def ensure_schema_exists(spark: SparkSession, catalog: str, schema: str):
     """Create catalog and schema if they don't exist."""
     # Skip catalog creation for 'main' - it's a system catalog that always exists
@@ -426,6 +1365,151 @@ def ensure_schema_exists(spark: SparkSession, catalog: str, schema: str):
     print(f"[{datetime.now()}] Ensured {catalog}.{schema} exists")
 
 
+def _spark_stage_metrics(spark: SparkSession, group: str) -> dict:
+    """Sum the Spark stage metrics of the jobs run under a job group.
+
+    Reads the driver's monitoring REST API (input rows/bytes, shuffle
+    bytes, executor time, tasks). Best effort: returns {} where the
+    SparkContext or the UI is not available (e.g. Spark Connect).
+    """
+    try:
+        sc = spark.sparkContext
+        tracker = sc.statusTracker()
+        stage_ids = []
+        for job_id in tracker.getJobIdsForGroup(group):
+            info = tracker.getJobInfo(job_id)
+            if info:
+                stage_ids.extend(info.stageIds)
+        base = f"{sc.uiWebUrl}/api/v1/applications/{sc.applicationId}/stages"
+        totals = dict.fromkeys(SPARK_STAGE_METRICS.values(), 0)
+        for stage_id in stage_ids:
+            with urllib.request.urlopen(f"{base}/{stage_id}", timeout=5) as response:
+                for attempt in json.load(response):
+                    for field, column in SPARK_STAGE_METRICS.items():
+                        totals[column] += int(attempt.get(field) or 0)
+        totals["spark_jobs"] = len(tracker.getJobIdsForGroup(group))
+        return totals
+    except Exception as e:
+        print(f"[{datetime.now()}] Spark metrics unavailable for {group}: {e}")
+        return {}
+
+
+def run_stages(
+    stages: list[tuple[str, str, Callable[[], int]]], spark: SparkSession | None = None,
+) -> list[dict]:
+    """Run refresh stages concurrently from the driver.
+
+    Each stage is an independent Spark query and write; submitting them
+    from separate threads lets the cluster run their jobs side by side.
+    A failing stage does not stop the others. With ``spark`` given, each
+    stage runs under its own job group and its Spark metrics are collected.
+
+    Args:
+        stages: (name, unit, function returning a row count) tuples
+        spark: Session used to tag and measure each stage's Spark jobs
+
+    Returns:
+        One record per stage (stage, started_at, duration_seconds,
+        rows_written, error, Spark metrics), in stage order
+    """
+    run_tag = uuid.uuid4().hex[:8]
+
+    def timed(name, fn):
+        group = f"refresh-{run_tag}-{name}"
+        started_at = datetime.now()
+        started = time.time()
+        if spark is not None:
+            with contextlib.suppress(Exception):
+                spark.sparkContext.setJobGroup(group, f"Cache refresh: {name}")
+        try:
+            count, error = fn(), None
+        except Exception as e:
+            count, error = None, e
+        seconds = time.time() - started
+        metrics = _spark_stage_metrics(spark, group) if spark is not None else {}
+        return {
+            "stage": name,
+            "started_at": started_at,
+            "duration_seconds": seconds,
+            "rows_written": count,
+            "error": None if error is None else str(error)[:1000],
+            **metrics,
+        }
+
+    started = time.time()
+    with ThreadPoolExecutor(max_workers=len(stages), thread_name_prefix="refresh") as pool:
+        futures = [pool.submit(timed, name, fn) for name, _, fn in stages]
+        records = [future.result() for future in futures]
+    total = time.time() - started
+
+    print(f"[{datetime.now()}] Stage timings:")
+    for (_, unit, _), record in zip(stages, records):
+        status = f"{record['rows_written']} {unit}" if record["error"] is None else f"FAILED: {record['error']}"
+        scanned = f", {record['input_rows']} input rows" if "input_rows" in record else ""
+        print(f"  - {record['stage']}: {record['duration_seconds']:.1f}s ({status}{scanned})")
+    print(f"  - total (concurrent): {total:.1f}s, sum of stages: {sum(r['duration_seconds'] for r in records):.1f}s")
+    if total > REFRESH_TIME_BUDGET_SECONDS:
+        print(f"[{datetime.now()}] WARNING: refresh took {total:.0f}s, over the {REFRESH_TIME_BUDGET_SECONDS}s budget")
+    return records
+
+
+def write_refresh_log(
+    spark: SparkSession, catalog: str, schema: str, records: list[dict],
+    started_at: datetime, refresh_version: int | None,
+) -> None:
+    """Append one row per stage, plus a 'total' row for the run, to refresh_log.
+
+    Rows older than REFRESH_LOG_RETENTION_DAYS are deleted.
+    """
+    table_name = f"{catalog}.{schema}.{REFRESH_LOG_TABLE}"
+    columns = [
+        ("run_id", "STRING"),
+        ("refresh_version", "BIGINT"),
+        ("stage", "STRING"),
+        ("started_at", "TIMESTAMP"),
+        ("duration_seconds", "DOUBLE"),
+        ("rows_written", "BIGINT"),
+        *((column, "BIGINT") for column in SPARK_STAGE_METRICS.values()),
+        ("spark_jobs", "BIGINT"),
+        ("status", "STRING"),
+        ("error", "STRING"),
+        ("logged_at", "TIMESTAMP"),
+    ]
+    ddl = ", ".join(f"{name} {type_name}" for name, type_name in columns)
+    spark.sql(f"CREATE TABLE IF NOT EXISTS {table_name} ({ddl}) USING DELTA")
+
+    run_id = f"{started_at:%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+    logged_at = datetime.now()
+    failed = [r["stage"] for r in records if r["error"]]
+    total = {
+        "stage": "total",
+        "started_at": started_at,
+        "duration_seconds": (logged_at - started_at).total_seconds(),
+        "rows_written": sum(r["rows_written"] or 0 for r in records),
+        "error": f"Failed stages: {', '.join(failed)}" if failed else None,
+    }
+    for column in (*SPARK_STAGE_METRICS.values(), "spark_jobs"):
+        if any(column in r for r in records):
+            total[column] = sum(r.get(column) or 0 for r in records)
+
+    rows = []
+    for record in [*records, total]:
+        values = {
+            **record,
+            "run_id": run_id,
+            "refresh_version": refresh_version,
+            "status": "failed" if record["error"] else "success",
+            "logged_at": logged_at,
+        }
+        rows.append(tuple(values.get(name) for name, _ in columns))
+    spark.createDataFrame(rows, ddl).write.format("delta").mode("append").saveAsTable(table_name)
+    spark.sql(f"""
+    DELETE FROM {table_name}
+    WHERE logged_at < current_timestamp() - INTERVAL {REFRESH_LOG_RETENTION_DAYS} DAYS
+    """)
+    print(f"[{datetime.now()}] Logged {len(rows)} refresh stages to {table_name} (run {run_id})")
+
+
 def main():
     # Load config from YAML file first
     config = load_config()
@@ -443,10 +1527,25 @@ def main():
         default=cache_config.get("schema", "cache"),
         help="Schema name for cache tables (default from config.yaml)"
     )
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        default=not cache_config.get("incremental_refresh", True),
+        help="Recompute job health and daily stats from scratch instead of merging changes"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare the job health query against the previous multi-scan query and exit (writes nothing)"
+    )
     args = parser.parse_args()
 
     spark = get_spark()
 
+    if args.benchmark:
+        benchmark_job_health_query(spark)
+        return
+
     print(f"[{datetime.now()}] Starting metrics cache refresh")
     print(f"[{datetime.now()}] Target: {args.catalog}.{args.schema}")
     print(f"[{datetime.now()}] Config: catalog={cache_config.get('catalog')}, schema={cache_config.get('schema')}, cron={cache_config.get('refresh_cron')}")
@@ -454,15 +1553,42 @@ def main():
     # Ensure schema exists
     ensure_schema_exists(spark, args.catalog, args.schema)
 
-    # Refresh all caches
-    health_count = refresh_job_health_cache(spark, args.catalog, args.schema)
-    cost_count = refresh_cost_cache(spark, args.catalog, args.schema)
-    alerts_count = refresh_alerts_cache(spark, args.catalog, args.schema)
+    # Refresh all caches (independent stages, run concurrently)
+    catalog, schema = args.catalog, args.schema
+    tag_keys = config.get("tags", {})
+    sla_tag_key = tag_keys.get("sla", "sla_minutes")
+    started_at = datetime.now()
+    records = run_stages([
+        ("Job health", "jobs", lambda: refresh_job_health_cache(spark, catalog, schema, incremental=not args.full_refresh)),
+        ("Cost data", "jobs", lambda: refresh_cost_cache(spark, catalog, schema)),
+        ("Daily stats", "job-days", lambda: refresh_job_daily_stats(
+            spark, catalog, schema, sla_tag_key, incremental=not args.full_refresh
+        )),
+        ("Alerts", "alerts", lambda: refresh_alerts_cache(spark, catalog, schema)),
+        ("Recent runs", "runs", lambda: refresh_recent_runs_cache(spark, catalog, schema)),
+        ("Job details", "jobs", lambda: refresh_job_detail_cache(spark, catalog, schema)),
+        ("Cluster utilization", "jobs", lambda: refresh_cluster_utilization_cache(spark, catalog, schema)),
+        ("Job team map", "jobs", lambda: refresh_job_team_map(spark, catalog, schema, tag_keys)),
+    ], spark)
+
+    # Stages that succeeded rewrote their tables even if another failed; when
+    # none did, no table changed and moving the version would only make every
+    # backend drop its caches and reload its snapshots
+    version = None
+    if any(r["error"] is None for r in records):
+        version = publish_refresh_version(spark, catalog, schema)
+    else:
+        print(f"[{datetime.now()}] Every stage failed - refresh version not published")
+    try:
+        write_refresh_log(spark, catalog, schema, records, started_at, version)
+    except Exception as e:
+        print(f"[{datetime.now()}] WARNING: could not write refresh log: {e}")
+
+    failed = [r["stage"] for r in records if r["error"]]
+    if failed:
+        raise RuntimeError(f"Cache refresh stages failed: {', '.join(failed)}")
 
     print(f"[{datetime.now()}] Cache refresh complete!")
-    print(f"  - Job health: {health_count} jobs")
-    print(f"  - Cost data: {cost_count} jobs")
-    print(f"  - Alerts: {alerts_count} alerts")
 
 
 if __name__ == "__main__":
@@ -8,10 +8,12 @@ Tests:
 - Severity filtering
 - Category filtering
 - Acknowledgment TTL
+- Cluster alerts from the cluster utilization cache
+- Typed decoding of live failure alert rows
 """
 
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import ANY, Mock, patch, AsyncMock
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 
@@ -363,3 +365,141 @@ class TestAlertDeduplication:
 
         result = _deduplicate_alerts(alerts)
         assert len(result) == 2
+
+
+class TestAlertDatasetPaging:
+    """Tests for serving filters and pages from a cached alert dataset."""
+
+    def _dataset(self):
+        from job_monitor.backend.response_cache import CachedDataset
+        from job_monitor.backend.routers.alerts import (
+            Alert, AlertCategory, AlertSeverity, _count_by_severity, _sort_alerts,
+        )
+
+        alerts = _sort_alerts([
+            Alert(
+                id=f"a{i}", job_id=str(i), job_name=f"job{i}",
+                category=AlertCategory.FAILURE if i % 2 else AlertCategory.COST,
+                severity=[AlertSeverity.P1, AlertSeverity.P2, AlertSeverity.P3][i % 3],
+                title="t", description="d", remediation="r",
+                created_at=datetime.now(), condition_key=f"key{i}",
+            )
+            for i in range(30)
+        ])
+        return CachedDataset(items=alerts, aggregates=_count_by_severity(alerts))
+
+    def test_pages_sliced_from_dataset(self):
+        """Test that pages come from the dataset with full-dataset counts."""
+        from job_monitor.backend.routers.alerts import _page_from_dataset
+
+        dataset = self._dataset()
+        first = _page_from_dataset(dataset, None, None, None, 1, 20)
+        second = _page_from_dataset(dataset, None, None, None, 2, 20)
+
+        assert [a.id for a in first.alerts + second.alerts] == [a.id for a in dataset.items]
+        assert first.has_more is True
+        assert second.has_more is False
+        assert first.total == 30
+        assert first.by_severity == {"P1": 10, "P2": 10, "P3": 10}
+
+    def test_filter_views_are_memoized(self):
+        """Test that severity/category views are computed once per filter."""
+        from job_monitor.backend.routers.alerts import _page_from_dataset
+
+        dataset = self._dataset()
+        result = _page_from_dataset(dataset, ["p1"], ["failure"], None, 1, 50)
+        _page_from_dataset(dataset, ["P1"], ["FAILURE"], None, 2, 10)
+
+        assert all(a.severity.value == "P1" and a.category.value == "failure" for a in result.alerts)
+        assert result.by_severity == {"P1": result.total, "P2": 0, "P3": 0}
+        assert len(dataset._views) == 1
+
+    def test_acknowledgment_reflected_without_rebuild(self):
+        """Test that acknowledgments made after caching show up in pages."""
+        from job_monitor.backend.routers.alerts import _acknowledged, _page_from_dataset
+
+        dataset = self._dataset()
+        key = dataset.items[0].condition_key
+        _acknowledged[key] = datetime.now()
+        try:
+            acked = _page_from_dataset(dataset, None, None, True, 1, 50)
+            first_page = _page_from_dataset(dataset, None, None, None, 1, 10)
+        finally:
+            del _acknowledged[key]
+
+        assert [a.condition_key for a in acked.alerts] == [key]
+        assert first_page.alerts[0].acknowledged is True
+        assert dataset.items[0].acknowledged is False
+
+
+class TestClusterAlertsFromCache:
+    """Tests for cluster alerts served from cluster_utilization_cache."""
+
+    @pytest.mark.asyncio
+    async def test_alerts_built_from_cached_jobs(self):
+        """Test that cached jobs become alerts without the live fleet scan."""
+        from job_monitor.backend.routers.alerts import _generate_cluster_alerts
+
+        cached_jobs = [
+            {"job_id": "1", "job_name": "idle", "runs_analyzed": 12, "avg_dbus_per_hour": 0.4},
+            {"job_id": "2", "job_name": None, "runs_analyzed": 5, "avg_dbus_per_hour": 1.5},
+        ]
+
+        with patch('job_monitor.backend.routers.alerts.settings') as mock_settings:
+            mock_settings.use_cache = True
+            with patch('job_monitor.backend.routers.alerts.query_underutilized_jobs_cache',
+                       new_callable=AsyncMock, return_value=cached_jobs) as mock_query:
+                with patch('job_monitor.backend.routers.alerts.statement_executor') as mock_executor:
+                    alerts = await _generate_cluster_alerts(Mock(), "wh", "123")
+                    mock_executor.execute.assert_not_called()
+                mock_query.assert_awaited_once_with(ANY, "123")
+
+        assert [a.id for a in alerts] == ["cluster_1_overprov", "cluster_2_overprov"]
+        assert "~20%" in alerts[0].title
+        assert "~40%" in alerts[1].title
+        assert alerts[1].job_name == "job-2"
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_uses_live_query(self):
+        """Test that an unavailable cache falls back to the live query."""
+        from job_monitor.backend.routers.alerts import _generate_cluster_alerts
+
+        live_result = Mock()
+        live_result.result.data_array = [["7", "live-job", "0.5", "4"]]
+
+        with patch('job_monitor.backend.routers.alerts.settings') as mock_settings:
+            mock_settings.use_cache = True
+            with patch('job_monitor.backend.routers.alerts.query_underutilized_jobs_cache',
+                       new_callable=AsyncMock, return_value=None):
+                with patch('job_monitor.backend.routers.alerts.statement_executor') as mock_executor:
+                    mock_executor.execute = AsyncMock(return_value=live_result)
+                    alerts = await _generate_cluster_alerts(Mock(), "wh")
+
+        assert [a.job_id for a in alerts] == ["7"]
+
+
+class TestLiveFailureAlerts:
+    """Tests for failure alerts decoded from the live query."""
+
+    @pytest.mark.asyncio
+    async def test_failure_rows_decoded(self):
+        """Test that string rows decode and COLLECT_SET reasons reach the remediation."""
+        from job_monitor.backend.models import AlertSeverity
+        from job_monitor.backend.routers.alerts import _generate_failure_alerts
+
+        live_result = Mock()
+        live_result.status.error = None
+        live_result.result.data_array = [
+            ["1", None, "4", "2", "50.0", "2026-01-01T10:00:00Z", "FAILED", "FAILED", '["DRIVER_OOM"]'],
+            ["2", "etl", "10", "8", None, "2026-01-01T09:00:00Z", "SUCCESS", "FAILED", None],
+        ]
+
+        with patch('job_monitor.backend.routers.alerts.statement_executor') as mock_executor:
+            mock_executor.execute = AsyncMock(return_value=live_result)
+            alerts = await _generate_failure_alerts(Mock(), "wh")
+
+        assert [a.severity for a in alerts] == [AlertSeverity.P1, AlertSeverity.P3]
+        assert alerts[0].job_name == "job-1"
+        assert alerts[0].remediation.startswith("Memory issue detected")
+        assert alerts[1].title == "Success rate at 100.0%"
+
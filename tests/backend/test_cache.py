@@ -8,6 +8,13 @@ Tests:
 - query_cost_cache function
 - query_alerts_cache function
 - query_job_duration_cache function
+- Workspace filter pushdown into cache table queries
+- query_job_daily_health function (job_daily_stats rollup)
+- query_recent_runs_cache function (job_recent_runs point lookups)
+- query_job_detail_cache function
+- query_job_team_map and team_predicate
+- query_cluster_utilization_cache and query_underutilized_jobs_cache
+- query_refresh_log and summarize_refresh_log (refresh run history and trend)
 - Error handling and fallbacks
 """
 
@@ -284,6 +291,217 @@ class TestQueryCostCache:
                 assert result is None
 
 
+class TestWorkspaceFilterPushdown:
+    """Tests for workspace filtering in cache table queries."""
+
+    def test_workspace_predicate(self):
+        """Test predicate for all, numeric and non-numeric workspace IDs."""
+        from job_monitor.backend.cache import workspace_predicate
+
+        assert workspace_predicate(None) == ""
+        assert workspace_predicate("all") == ""
+        assert workspace_predicate("123") == "workspace_id = 123"
+        assert workspace_predicate("1 OR 1=1") is None
+
+    @pytest.mark.asyncio
+    async def test_filter_pushed_into_health_and_cost_queries(self):
+        """Test that a workspace ID becomes a WHERE predicate of the cache queries."""
+        from job_monitor.backend.cache import query_cost_cache, query_job_health_cache
+
+        mock_result = Mock()
+        mock_result.status = Mock()
+        mock_result.status.error = None
+        mock_result.result = Mock()
+        mock_result.result.data_array = []
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+
+                await query_job_health_cache(Mock(), days=7, workspace_id="123")
+                await query_cost_cache(Mock(), workspace_id="123")
+                await query_cost_cache(Mock())
+
+                statements = [c.kwargs["statement"] for c in mock_thread.call_args_list]
+                assert "AND workspace_id = 123" in statements[0]
+                assert "WHERE workspace_id = 123" in statements[1]
+                assert "workspace_id =" not in statements[2]
+
+    @pytest.mark.asyncio
+    async def test_non_numeric_workspace_skips_cache(self):
+        """Test that a non-numeric workspace ID is never sent to the warehouse."""
+        from job_monitor.backend.cache import query_job_health_cache
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                result = await query_job_health_cache(Mock(), days=7, workspace_id="abc")
+
+                assert result is None
+                mock_thread.assert_not_called()
+
+
+class TestQueryJobDailyHealth:
+    """Tests for query_job_daily_health function."""
+
+    @pytest.mark.asyncio
+    async def test_sums_window_from_rollup(self):
+        """Test that the requested window and workspace filter reach the rollup query."""
+        from job_monitor.backend.cache import query_job_daily_health
+
+        mock_result = Mock()
+        mock_result.status = Mock()
+        mock_result.status.error = None
+        mock_result.result = Mock()
+        mock_result.result.data_array = [["123", 14, 12, 85.7, "P3"]]
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                result = await query_job_daily_health(Mock(), days=14, workspace_id="42")
+
+                statement = mock_thread.call_args.kwargs["statement"]
+                assert "job_monitor.cache.job_daily_stats" in statement
+                assert "INTERVAL 14 DAYS" in statement
+                assert "AND workspace_id = 42" in statement
+                assert result == [{
+                    "job_id": "123", "total_runs": 14, "success_count": 12,
+                    "success_rate": 85.7, "priority": "P3",
+                }]
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_query_error(self):
+        """Test that a missing rollup table is a cache miss."""
+        from job_monitor.backend.cache import query_job_daily_health
+
+        mock_result = Mock()
+        mock_result.status = Mock()
+        mock_result.status.error = Mock(message="TABLE_OR_VIEW_NOT_FOUND")
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                assert await query_job_daily_health(Mock(), days=14) is None
+
+
+class TestQueryRecentRunsCache:
+    """Tests for query_recent_runs_cache function."""
+
+    @pytest.mark.asyncio
+    async def test_point_lookup_grouped_by_job(self):
+        """Test that runs are looked up by job ID and grouped newest first."""
+        from job_monitor.backend.cache import query_recent_runs_cache
+
+        start = datetime(2026, 3, 1, 10, 0)
+        mock_result = Mock()
+        mock_result.status = Mock()
+        mock_result.status.error = None
+        mock_result.result = Mock()
+        mock_result.result.data_array = [
+            ["1", "11", "SUCCEEDED", start, start + timedelta(minutes=5), 300],
+            ["1", "10", "FAILED", start - timedelta(days=1), start - timedelta(days=1), 0],
+            ["2", "20", "SUCCEEDED", start, start + timedelta(minutes=1), 60],
+        ]
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                result = await query_recent_runs_cache(Mock(), ["1", "2", "3"], limit=5)
+
+                statement = mock_thread.call_args.kwargs["statement"]
+                assert "job_id IN ('1', '2', '3')" in statement
+                assert "run_rank <= 5" in statement
+                assert [r["run_id"] for r in result["1"]] == ["11", "10"]
+                assert result["2"][0]["duration_seconds"] == 60
+                assert "3" not in result
+
+    @pytest.mark.asyncio
+    async def test_limits_the_cache_cannot_serve(self):
+        """Test that more runs than cached, or non-numeric IDs, skip the cache."""
+        from job_monitor.backend.cache import query_recent_runs_cache
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                assert await query_recent_runs_cache(Mock(), ["1"], limit=50) is None
+                assert await query_recent_runs_cache(Mock(), ["1' OR '1'='1"], limit=5) is None
+                mock_thread.assert_not_called()
+
+
+class TestQueryJobDetailCache:
+    """Tests for query_job_detail_cache function."""
+
+    @pytest.mark.asyncio
+    async def test_detail_row_joined_with_runs(self):
+        """Test that one statement returns the detail record and its runs."""
+        from job_monitor.backend.cache import query_job_detail_cache
+
+        start = datetime(2026, 3, 1, 10, 0)
+        detail = ["etl", 100.0, 150.0, 110.0, 400.0, 12, 2, "DRIVER_ERROR,TIMEOUT"]
+        mock_result = Mock()
+        mock_result.status = Mock()
+        mock_result.status.error = None
+        mock_result.result = Mock()
+        mock_result.result.data_array = [
+            detail + ["9", "FAILED", start, start + timedelta(seconds=400), 400],
+            detail + ["8", "SUCCEEDED", start - timedelta(days=1), start - timedelta(days=1), 90],
+        ]
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                result = await query_job_detail_cache(Mock(), "123")
+
+                assert mock_thread.call_count == 1
+                assert "WHERE d.job_id = '123'" in mock_thread.call_args.kwargs["statement"]
+                assert result["job_name"] == "etl"
+                assert result["retry_count_7d"] == 2
+                assert result["failure_reasons"] == ["DRIVER_ERROR", "TIMEOUT"]
+                assert [r["run_id"] for r in result["recent_runs"]] == ["9", "8"]
+
+    @pytest.mark.asyncio
+    async def test_job_without_runs_and_missing_job(self):
+        """Test a cached job without runs, and a job missing from the cache."""
+        from job_monitor.backend.cache import query_job_detail_cache
+
+        mock_result = Mock()
+        mock_result.status = Mock()
+        mock_result.status.error = None
+        mock_result.result = Mock()
+        mock_result.result.data_array = [["etl", None, None, None, None, 0, 0, None, None, None, None, None, None]]
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                result = await query_job_detail_cache(Mock(), "123")
+                assert result["recent_runs"] == []
+                assert result["failure_reasons"] == []
+
+                mock_result.result.data_array = []
+                assert await query_job_detail_cache(Mock(), "456") is None
+
+
 class TestQueryAlertsCache:
     """Tests for query_alerts_cache function."""
 
@@ -407,6 +625,210 @@ class TestQueryJobDurationCache:
                 assert result is None
 
 
+class TestJobTeamMap:
+    """Tests for job_team_map readers."""
+
+    @pytest.mark.asyncio
+    async def test_team_map_of_tagged_jobs(self):
+        """Test that tagged jobs are mapped to their team."""
+        from job_monitor.backend.cache import query_job_team_map
+
+        mock_result = Mock()
+        mock_result.status.error = None
+        mock_result.manifest = None
+        mock_result.result.data_array = [["1", "data-eng"], ["2", "ml"]]
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                teams = await query_job_team_map(Mock(), workspace_id="123")
+                statement = mock_thread.call_args.kwargs["statement"]
+
+        assert teams == {"1": "data-eng", "2": "ml"}
+        assert "job_monitor.cache.job_team_map" in statement
+        assert "team IS NOT NULL" in statement
+        assert "workspace_id = 123" in statement
+
+    @pytest.mark.asyncio
+    async def test_query_error_returns_none(self):
+        """Test that a missing table returns None so callers can fall back."""
+        from job_monitor.backend.cache import query_job_team_map
+
+        mock_result = Mock()
+        mock_result.status.error = "TABLE_OR_VIEW_NOT_FOUND"
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                assert await query_job_team_map(Mock()) is None
+
+    def test_team_predicate_escapes_quotes(self):
+        """Test that team values are escaped in the semi-join predicate."""
+        from job_monitor.backend.cache import team_predicate
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            predicate = team_predicate("o'brien", "usage_metadata.job_id")
+
+        assert predicate == (
+            "usage_metadata.job_id IN (SELECT job_id FROM job_monitor.cache.job_team_map "
+            "WHERE team = 'o\\'brien')"
+        )
+
+
+class TestClusterUtilizationCache:
+    """Tests for cluster_utilization_cache readers."""
+
+    @pytest.mark.asyncio
+    async def test_recent_rates_for_job(self):
+        """Test that the per-run DBU/hour array is decoded for one job."""
+        from job_monitor.backend.cache import query_cluster_utilization_cache
+
+        mock_result = Mock()
+        mock_result.status.error = None
+        mock_result.manifest = None
+        mock_result.result.data_array = [["42", "etl", "12", "0.8", "[0.5,null,1.2]"]]
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                rates = await query_cluster_utilization_cache(Mock(), "42")
+                statement = mock_thread.call_args.kwargs["statement"]
+
+        assert rates == [0.5, None, 1.2]
+        assert "job_id = '42'" in statement
+
+    @pytest.mark.asyncio
+    async def test_non_numeric_job_id_skips_query(self):
+        """Test that non-numeric job IDs never reach the warehouse."""
+        from job_monitor.backend.cache import query_cluster_utilization_cache
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                assert await query_cluster_utilization_cache(Mock(), "1' OR '1'='1") is None
+                mock_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_underutilized_jobs_filtered_in_query(self):
+        """Test that thresholds and the workspace filter are pushed into the query."""
+        from job_monitor.backend.cache import query_underutilized_jobs_cache
+
+        mock_result = Mock()
+        mock_result.status.error = None
+        mock_result.manifest = None
+        mock_result.result.data_array = [["1", "idle", "8", "0.3"]]
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                jobs = await query_underutilized_jobs_cache(Mock(), workspace_id="123")
+                statement = mock_thread.call_args.kwargs["statement"]
+
+        assert jobs == [{"job_id": "1", "job_name": "idle", "runs_analyzed": 8, "avg_dbus_per_hour": 0.3}]
+        assert "avg_dbus_per_hour < 1.0" in statement
+        assert "runs_analyzed >= 3" in statement
+        assert "workspace_id = 123" in statement
+
+
+class TestRefreshLog:
+    """Tests for refresh run history from refresh_log."""
+
+    @pytest.mark.asyncio
+    async def test_query_reads_most_recent_runs(self):
+        """Test that the query limits to the most recent runs' rows."""
+        from job_monitor.backend.cache import query_refresh_log
+
+        mock_result = Mock()
+        mock_result.status.error = None
+        mock_result.manifest = None
+        mock_result.result.data_array = [
+            ["r1", "7", "total", "2026-03-01T15:00:00", "42.5", "900", "1000000",
+             None, None, None, None, "success", None],
+        ]
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                rows = await query_refresh_log(Mock(), runs=10)
+                statement = mock_thread.call_args.kwargs["statement"]
+
+        assert "job_monitor.cache.refresh_log" in statement
+        assert "LIMIT 10" in statement
+        assert rows[0]["duration_seconds"] == 42.5
+        assert rows[0]["refresh_version"] == 7
+
+    @pytest.mark.asyncio
+    async def test_query_returns_none_when_table_missing(self):
+        """Test that a missing refresh_log table returns None."""
+        from job_monitor.backend.cache import query_refresh_log
+
+        mock_result = Mock()
+        mock_result.status.error = Mock(message="TABLE_OR_VIEW_NOT_FOUND")
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                mock_thread.return_value = mock_result
+                assert await query_refresh_log(Mock()) is None
+
+    def test_summary_groups_runs_and_flags_slowdown(self):
+        """Test that runs are nested newest first and a slowdown is flagged."""
+        from job_monitor.backend.cache import REFRESH_TREND_RUNS, summarize_refresh_log
+
+        rows = []
+        for i in range(2 * REFRESH_TREND_RUNS):
+            # Newest runs (i < N) take 120s, older ones 60s; input grows 50%
+            slow = i < REFRESH_TREND_RUNS
+            started_at = datetime(2026, 3, 1, 15, 0) - timedelta(minutes=10 * i)
+            rows.append({
+                "run_id": f"r{i}", "stage": "total", "started_at": started_at,
+                "duration_seconds": 120.0 if slow else 60.0, "input_rows": 150 if slow else 100,
+            })
+            rows.append({
+                "run_id": f"r{i}", "stage": "Job health", "started_at": started_at,
+                "duration_seconds": 100.0 if slow else 50.0, "input_rows": None,
+            })
+
+        summary = summarize_refresh_log(rows)
+
+        assert [run["run_id"] for run in summary["runs"][:2]] == ["r0", "r1"]
+        assert summary["runs"][0]["stages"][0]["stage"] == "Job health"
+        trend = summary["trend"]
+        assert trend["duration_change_percent"] == 100.0
+        assert trend["input_rows_change_percent"] == 50.0
+        assert trend["stages"] == {"Job health": 100.0}
+        assert trend["slowing"] is True
+
+    def test_summary_without_history(self):
+        """Test that a single run has no trend to compare."""
+        from job_monitor.backend.cache import summarize_refresh_log
+
+        summary = summarize_refresh_log([
+            {"run_id": "r0", "stage": "total", "started_at": datetime(2026, 3, 1), "duration_seconds": 30.0},
+        ])
+
+        assert len(summary["runs"]) == 1
+        assert summary["trend"]["duration_change_percent"] is None
+        assert summary["trend"]["slowing"] is False
+
+
 class TestCacheStalenessThreshold:
     """Tests for cache staleness threshold."""
 
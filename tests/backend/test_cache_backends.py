@@ -0,0 +1,246 @@
+"""
+Unit tests for shared L2 response cache backends.
+
+Tests:
+- Serialization round trip (pydantic models, datasets, compression)
+- SQLite and Redis-protocol backends (Redis against an in-memory stand-in)
+- Two ResponseCache instances ("processes") sharing results through L2
+- Cross-process invalidation
+- L2 reads and writes kept off the event loop
+"""
+
+import fnmatch
+import time
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis-py client methods used."""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value, px=None):
+        self.data[name] = value
+
+    def delete(self, *names):
+        for name in names:
+            self.data.pop(name, None)
+
+    def scan_iter(self, match="*"):
+        # Redis glob escapes (\*) match the literal character, as in fnmatch's [*]
+        pattern = match.replace("\\*", "[*]").replace("\\?", "[?]")
+        return [k for k in list(self.data) if fnmatch.fnmatchcase(k, pattern)]
+
+    def incr(self, name):
+        self.data[name] = int(self.data.get(name, 0)) + 1
+        return self.data[name]
+
+    def rpush(self, name, value):
+        self.data.setdefault(name, []).append(value.encode())
+
+    def lrange(self, name, start, end):
+        items = self.data.get(name, [])
+        end = len(items) if end == -1 else end + 1
+        return items[start:end]
+
+    def ltrim(self, name, start, end):
+        self.data[name] = self.lrange(name, start, end)
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def backend(request, tmp_path):
+    """Each shared backend implementation."""
+    from job_monitor.backend.cache_backends import RedisBackend, SQLiteBackend
+
+    if request.param == "sqlite":
+        return SQLiteBackend(str(tmp_path / "cache.sqlite"))
+    return RedisBackend(client=FakeRedis())
+
+
+def _job(job_id: str):
+    from job_monitor.backend.models import JobHealthOut
+
+    return JobHealthOut(
+        job_id=job_id, job_name=f"job{job_id}", total_runs=1, success_count=1,
+        success_rate=100.0, last_run_time=datetime(2024, 1, 15, 10, 0),
+    )
+
+
+class TestSerialization:
+    """Tests for value serialization."""
+
+    def test_round_trip_models_and_datasets(self):
+        """Test that models and cached datasets survive serialization."""
+        from job_monitor.backend.cache_backends import deserialize, serialize
+        from job_monitor.backend.response_cache import CachedDataset
+
+        dataset = CachedDataset(items=[_job(str(i)) for i in range(50)], aggregates={"p1_count": 2})
+        dataset.view("x", lambda j: True)
+        dataset.indexed("health", lambda items: lambda: None)
+
+        restored = deserialize(serialize(dataset))
+        assert restored.items == dataset.items
+        assert restored.aggregates == {"p1_count": 2}
+        assert restored._views == {}
+        assert restored._indexes == {}
+        assert "health" in dataset._indexes
+
+    def test_large_payloads_compressed(self):
+        """Test that large payloads are stored compressed."""
+        from job_monitor.backend.cache_backends import deserialize, serialize
+
+        value = {"rows": [f"run-{i}-" + "x" * 100 for i in range(100)]}
+        data = serialize(value)
+
+        assert data[:1] == b"Z"
+        assert len(data) < 10_000
+        assert deserialize(data) == value
+
+
+class TestBackends:
+    """Tests common to all backends."""
+
+    def test_set_get_delete(self, backend):
+        """Test basic storage operations."""
+        from job_monitor.backend.cache_backends import BackendEntry
+
+        now = time.time()
+        backend.set("health_metrics:7:all", BackendEntry(b"Pdata", now + 10, now + 100, now))
+        entry = backend.get("health_metrics:7:all")
+
+        assert entry.payload == b"Pdata"
+        assert entry.stale_until == pytest.approx(now + 100)
+        backend.delete("health_metrics:7:all")
+        assert backend.get("health_metrics:7:all") is None
+
+    def test_delete_prefix(self, backend):
+        """Test prefix deletion only hits matching keys."""
+        from job_monitor.backend.cache_backends import BackendEntry
+
+        now = time.time()
+        for key in ("alerts:all:x", "alerts:123:x", "cost_summary:30:False:all"):
+            backend.set(key, BackendEntry(b"P", now + 10, now + 10, now))
+        backend.delete_prefix("alerts:")
+
+        assert backend.get("alerts:all:x") is None
+        assert backend.get("cost_summary:30:False:all") is not None
+
+    def test_dead_entries_not_returned(self, backend):
+        """Test that entries past their stale window read as missing."""
+        from job_monitor.backend.cache_backends import BackendEntry
+
+        now = time.time()
+        backend.set("k", BackendEntry(b"P", now - 20, now - 10, now - 30))
+
+        assert backend.get("k") is None
+
+    def test_invalidation_log(self, backend):
+        """Test that invalidations are read back in order after a sequence."""
+        first = backend.publish_invalidation("key", "filter_presets")
+        second = backend.publish_invalidation("prefix", "alerts:")
+
+        latest, entries = backend.invalidations_since(0)
+        assert latest == second
+        assert [(k, v) for _, k, v in entries] == [("key", "filter_presets"), ("prefix", "alerts:")]
+        assert backend.invalidations_since(first)[1] == [(second, "prefix", "alerts:")]
+        assert backend.latest_invalidation() == second
+
+
+class TestSharedResponseCache:
+    """Tests for ResponseCache instances sharing a backend."""
+
+    def _pair(self, backend):
+        from job_monitor.backend.response_cache import ResponseCache
+
+        return ResponseCache(backend=backend), ResponseCache(backend=backend)
+
+    def test_result_computed_once_shared_by_other_process(self, backend):
+        """Test that a value set in one process is a hit in another."""
+        from job_monitor.backend.response_cache import CachedDataset
+
+        worker_a, worker_b = self._pair(backend)
+        worker_a.set("health_metrics:7:current", CachedDataset(items=[_job("1")]), ttl_seconds=60)
+
+        shared = worker_b.get("health_metrics:7:current")
+        assert shared.items[0].job_id == "1"
+        assert worker_b.stats()["l2"]["hits"] == 1
+        # Second read is served from worker B's memory
+        worker_b.get("health_metrics:7:current")
+        assert worker_b.stats()["l2"]["hits"] == 1
+
+    def test_stale_local_entry_replaced_by_fresher_shared_entry(self, backend):
+        """Test that a worker prefers another worker's refreshed value."""
+        worker_a, worker_b = self._pair(backend)
+        worker_b.set("cost_summary:30:False:all", "old", ttl_seconds=-1, stale_ttl=600)
+        worker_a.set("cost_summary:30:False:all", "new", ttl_seconds=60, stale_ttl=600)
+
+        assert worker_b.get_swr("cost_summary:30:False:all") == ("new", False)
+
+    def test_invalidation_reaches_other_process(self, backend):
+        """Test that invalidate() in one process drops the copy in another."""
+        worker_a, worker_b = self._pair(backend)
+        worker_a.set("filter_presets", ["p1"], ttl_seconds=60)
+        assert worker_b.get("filter_presets") == ["p1"]
+
+        worker_a.invalidate("filter_presets")
+        with patch("job_monitor.backend.response_cache.time.time", return_value=time.time() + 2):
+            assert worker_b.get("filter_presets") is None
+
+    def test_backend_errors_do_not_break_cache(self):
+        """Test that a failing backend degrades to memory-only caching."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        class BrokenBackend(FakeRedis):
+            def get(self, name):
+                raise ConnectionError("down")
+
+        from job_monitor.backend.cache_backends import RedisBackend
+
+        cache = ResponseCache(backend=RedisBackend(client=BrokenBackend()))
+        cache.set("k", "v")
+
+        assert cache.get("k") == "v"
+        assert cache.get("missing") is None
+        assert cache.stats()["l2"]["errors"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_off_event_loop(self, backend):
+        """Test that aget and sets from a coroutine use L2 from worker threads."""
+        import threading
+
+        from job_monitor.backend.response_cache import ResponseCache
+
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def record(method):
+            def wrapper(*args, **kwargs):
+                threads.append((method.__name__, threading.get_ident()))
+                return method(*args, **kwargs)
+            return wrapper
+
+        backend.get = record(backend.get)
+        backend.set = record(backend.set)
+        worker_a, worker_b = ResponseCache(backend=backend), ResponseCache(backend=backend)
+
+        worker_a.set("alerts:all:x", ["a1"], ttl_seconds=60)
+        worker_a.flush_backend_writes()
+        assert await worker_b.aget("alerts:all:x") == ["a1"]
+
+        assert {name for name, _ in threads} == {"get", "set"}
+        assert all(ident != loop_thread for _, ident in threads)
+
+    def test_create_backend(self, tmp_path):
+        """Test backend selection from configuration."""
+        from job_monitor.backend.cache_backends import SQLiteBackend, create_backend
+
+        assert create_backend("none") is None
+        assert isinstance(create_backend("sqlite", path=str(tmp_path / "c.sqlite")), SQLiteBackend)
+        assert create_backend("unknown") is None
@@ -0,0 +1,150 @@
+"""
+Unit tests for the hot-key cache refresher.
+
+Tests:
+- Hot key selection from observed reads
+- Lead-time based refresh of about-to-expire keys
+- Concurrency budget
+- Access count decay
+"""
+
+import asyncio
+
+import pytest
+
+
+def _refresher(cache, keys, **kwargs):
+    """Build a refresher whose loaders record calls and store a value."""
+    from job_monitor.backend.cache_refresher import HotKeyRefresher, RefreshTarget
+
+    calls = []
+
+    def make_loader(key):
+        async def loader(ws):
+            calls.append(key)
+            await asyncio.sleep(0)
+            cache.set(key, "fresh", ttl_seconds=300)
+        return loader
+
+    targets = [RefreshTarget(key, make_loader(key)) for key in keys]
+    return HotKeyRefresher(cache=cache, targets=targets, **kwargs), calls
+
+
+class TestHotKeySelection:
+    """Tests for choosing keys to refresh."""
+
+    def test_unread_keys_not_refreshed(self):
+        """Test that views nobody reads are never refreshed."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        refresher, _ = _refresher(cache, ["health_metrics:7:current"])
+
+        assert refresher.due() == []
+
+    def test_hot_missing_and_expiring_keys_are_due(self):
+        """Test that read keys are due when missing or within the lead time."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        keys = ["health_metrics:7:current", "health_metrics:30:current", "cost_summary:30:False:all"]
+        refresher, _ = _refresher(cache, keys, lead_seconds=60)
+        cache.set(keys[0], "v", ttl_seconds=30)    # expiring soon
+        cache.set(keys[1], "v", ttl_seconds=600)   # fresh
+        for key in keys:
+            cache.get(key)                          # cost key read but missing
+
+        due = {t.key for t in refresher.due()}
+        assert due == {keys[0], keys[2]}
+
+    def test_top_n_by_read_count(self):
+        """Test that only the top-N most read keys are considered."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        keys = ["health_summary:7:current", "health_summary:30:current"]
+        refresher, _ = _refresher(cache, keys, top_n=1)
+        for _ in range(3):
+            cache.get(keys[1])
+        cache.get(keys[0])
+
+        assert [t.key for t in refresher.due()] == [keys[1]]
+
+    def test_access_counts_decay(self):
+        """Test that read counts fade when a key is no longer requested."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.get("alerts:all:x")
+        for _ in range(4):
+            cache.decay_access_counts(0.5)
+
+        assert cache.hot_keys() == []
+
+
+class TestRefreshCycle:
+    """Tests for running refresh cycles."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_once_recomputes_due_keys(self):
+        """Test that due keys are recomputed and stored."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        refresher, calls = _refresher(cache, ["health_metrics:7:current"])
+        cache.get("health_metrics:7:current")
+
+        assert await refresher.refresh_once(ws=object()) == 1
+        assert calls == ["health_metrics:7:current"]
+        assert cache.get("health_metrics:7:current") == "fresh"
+        assert refresher.stats()["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_budget(self):
+        """Test that no more than max_concurrency refreshes run at once."""
+        from job_monitor.backend.cache_refresher import HotKeyRefresher, RefreshTarget
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        running = 0
+        peak = 0
+
+        async def loader(ws):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        targets = [RefreshTarget(f"health_metrics:{i}:current", loader) for i in range(5)]
+        refresher = HotKeyRefresher(cache=cache, targets=targets, max_concurrency=2)
+
+        assert await refresher.warm_up(ws=object()) == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_does_not_raise(self):
+        """Test that a failing loader does not break the cycle."""
+        from job_monitor.backend.cache_refresher import HotKeyRefresher, RefreshTarget
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+
+        async def loader(ws):
+            raise RuntimeError("warehouse stopped")
+
+        refresher = HotKeyRefresher(cache=cache, targets=[RefreshTarget("cost_summary:30:False:all", loader)])
+        cache.get("cost_summary:30:False:all")
+
+        assert await refresher.refresh_once(ws=object()) == 1
+        assert cache.stats()["revalidation_errors"] == 1
+
+    def test_default_targets_match_endpoint_keys(self):
+        """Test that default targets use the keys the endpoints write."""
+        from job_monitor.backend.cache_refresher import default_targets
+
+        keys = {t.key for t in default_targets()}
+        assert "health_metrics:7:current" in keys
+        assert "alerts:all:cluster,cost,failure,sla" in keys
+        assert "cost_summary:30:False:all" in keys
+        assert "active_runs_all" in keys
@@ -0,0 +1,233 @@
+"""
+Unit tests for in-memory cache table snapshots.
+
+Tests:
+- Row-position indexes and column selection
+- Version checks re-load only tables whose refreshed_at changed
+- Cache readers served from a loaded snapshot (health, cost, alerts, duration)
+- Snapshots not served before the first check or once unconfirmed too long
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+
+def _result(rows):
+    """Build a JSON_ARRAY statement result carrying ``rows``."""
+    result = Mock()
+    result.status.error = None
+    result.manifest = None
+    result.arrow_table = None
+    result.result.data_array = rows
+    return result
+
+
+def _health_snapshot():
+    """Build a job_health_cache snapshot with four jobs in two workspaces."""
+    from job_monitor.backend.cache_snapshot import SNAPSHOT_TABLES, TableSnapshot
+    from job_monitor.backend.result_decoder import ColumnarResult
+
+    table = SNAPSHOT_TABLES[0]
+    rows = [
+        # workspace_id, job_id, job_name, runs/success/rate 7d, runs/success/rate 30d
+        ["1", "10", "ok", 5, 5, 100.0, 20, 20, 100.0],
+        ["1", "11", "failing", 4, 1, 25.0, 10, 2, 20.0],
+        ["2", "12", "flaky", 4, 3, 75.0, 10, 7, 70.0],
+        ["2", "13", "old", 0, 0, None, 3, 3, 100.0],
+    ]
+    priorities = [None, "P1", "P2", None]
+    columns = {name: [] for name, _ in table.columns}
+    for row, priority in zip(rows, priorities):
+        for name, value in zip([n for n, _ in table.columns], row):
+            columns[name].append(value)
+        columns["priority"].append(priority)
+    for name, values in columns.items():
+        if not values:
+            columns[name] = [None] * len(rows)
+    columns["median_duration_seconds"] = [60.0, 120.0, 0.0, None]
+    data = ColumnarResult(list(columns), list(columns.values()))
+    return TableSnapshot(table.name, data, ("2026-01-01 00:00:00", 4), table.indexes)
+
+
+def _store(*snapshots):
+    """Build a snapshot store holding ``snapshots``, confirmed current now."""
+    import time
+
+    from job_monitor.backend.cache_snapshot import CacheSnapshots
+
+    store = CacheSnapshots()
+    for snapshot in snapshots:
+        store._snapshots[snapshot.name] = snapshot
+    store._checked_at = time.time()
+    return store
+
+
+class TestTableSnapshot:
+    """Tests for snapshot indexes."""
+
+    def test_indexes_by_job_priority_and_workspace(self):
+        """Test that index lookups return row positions."""
+        snapshot = _health_snapshot()
+
+        assert snapshot.positions("job_id", "12") == [2]
+        assert snapshot.positions("priority", "P1") == [1]
+        assert snapshot.positions("workspace_id", "2") == [2, 3]
+        assert snapshot.positions("workspace_id", "9") == []
+
+    def test_select_gathers_and_renames(self):
+        """Test that select builds a ColumnarResult of the requested rows."""
+        snapshot = _health_snapshot()
+
+        cols = snapshot.select([3, 0], ["job_id", "total_runs_30d"], {"total_runs_30d": "total_runs"})
+
+        assert cols.names == ["job_id", "total_runs"]
+        assert cols.to_dicts() == [
+            {"job_id": "13", "total_runs": 3},
+            {"job_id": "10", "total_runs": 20},
+        ]
+
+
+class TestSnapshotSync:
+    """Tests for version checks and re-loading."""
+
+    @pytest.mark.asyncio
+    async def test_reloads_only_changed_tables(self):
+        """Test that an unchanged version does not re-load the table."""
+        from job_monitor.backend.cache_snapshot import CacheSnapshots, SnapshotTable
+
+        store = CacheSnapshots(tables=[SnapshotTable("alerts_cache", [("job_id", "STRING")], ("job_id",))])
+        versions = _result([["alerts_cache", "2026-01-01 00:00:00", "2"]])
+        table = _result([["1"], ["2"]])
+
+        with patch('job_monitor.backend.cache_snapshot.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('job_monitor.backend.cache_snapshot.statement_executor') as mock_executor:
+                mock_executor.execute = AsyncMock(side_effect=[versions, table, versions])
+
+                assert await store.sync(Mock()) == ["alerts_cache"]
+                assert await store.sync(Mock()) == []
+
+                assert mock_executor.execute.call_count == 3
+                assert len(store.get("alerts_cache")) == 2
+                assert store.stats()["loads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_version_reloads(self):
+        """Test that a new refreshed_at re-loads the table."""
+        from job_monitor.backend.cache_snapshot import CacheSnapshots, SnapshotTable
+
+        store = CacheSnapshots(tables=[SnapshotTable("alerts_cache", [("job_id", "STRING")], ("job_id",))])
+
+        with patch('job_monitor.backend.cache_snapshot.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_settings.cache_table_prefix = "job_monitor.cache"
+            with patch('job_monitor.backend.cache_snapshot.statement_executor') as mock_executor:
+                mock_executor.execute = AsyncMock(side_effect=[
+                    _result([["alerts_cache", "2026-01-01 00:00:00", "1"]]),
+                    _result([["1"]]),
+                    _result([["alerts_cache", "2026-01-01 00:15:00", "2"]]),
+                    _result([["1"], ["2"]]),
+                ])
+
+                await store.sync(Mock())
+                assert await store.sync(Mock()) == ["alerts_cache"]
+                assert store.get("alerts_cache").positions("job_id", "2") == [1]
+
+    def test_not_served_before_first_check_or_when_unconfirmed(self):
+        """Test that snapshots are only served while their version is confirmed."""
+        store = _store(_health_snapshot())
+        assert store.get("job_health_cache") is not None
+
+        store._checked_at = None
+        assert store.get("job_health_cache") is None
+
+        store._checked_at = 0.0
+        assert store.get("job_health_cache") is None
+
+
+class TestReadersFromSnapshot:
+    """Tests for cache readers served from a loaded snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_health_sorted_by_priority_then_success_rate(self):
+        """Test that health reads skip the warehouse and keep the SQL ordering."""
+        from job_monitor.backend.cache import query_job_health_cache
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            with patch('job_monitor.backend.cache.cache_snapshots', _store(_health_snapshot())):
+                with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
+                    jobs = await query_job_health_cache(None, days=7)
+                    mock_thread.assert_not_called()
+
+        assert [j["job_id"] for j in jobs] == ["11", "12", "10"]
+        assert jobs[0]["success_rate"] == 25.0
+        assert jobs[0]["total_runs"] == 4
+        assert jobs[2]["priority"] is None
+
+    @pytest.mark.asyncio
+    async def test_health_workspace_filter(self):
+        """Test that the workspace index filters health rows."""
+        from job_monitor.backend.cache import query_job_health_cache
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            with patch('job_monitor.backend.cache.cache_snapshots', _store(_health_snapshot())):
+                jobs = await query_job_health_cache(None, days=30, workspace_id="2")
+                missing = await query_job_health_cache(None, days=30, workspace_id="9")
+                invalid = await query_job_health_cache(None, days=30, workspace_id="abc")
+
+        assert [j["job_id"] for j in jobs] == ["12", "13"]
+        assert missing is None
+        assert invalid is None
+
+    @pytest.mark.asyncio
+    async def test_duration_lookup_by_job_id(self):
+        """Test that duration stats come from the job_id index."""
+        from job_monitor.backend.cache import query_job_duration_cache
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            with patch('job_monitor.backend.cache.cache_snapshots', _store(_health_snapshot())):
+                stats = await query_job_duration_cache(None, "11")
+                zero = await query_job_duration_cache(None, "12")
+                missing = await query_job_duration_cache(None, "99")
+
+        assert stats["median_duration_seconds"] == 120.0
+        assert stats["run_count"] == 10
+        assert zero["median_duration_seconds"] is None
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_alerts_sorted_by_severity(self):
+        """Test that alerts are served from the snapshot in severity order."""
+        from job_monitor.backend.cache import ALERTS_CACHE_COLUMNS, query_alerts_cache
+        from job_monitor.backend.cache_snapshot import TableSnapshot
+        from job_monitor.backend.result_decoder import ColumnarResult
+
+        names = [name for name, _ in ALERTS_CACHE_COLUMNS]
+        columns = {name: [None, None, None] for name in names}
+        columns.update({
+            "alert_id": ["a", "b", "c"],
+            "workspace_id": ["1", "1", "2"],
+            "severity": ["P3", "P1", "P2"],
+        })
+        snapshot = TableSnapshot(
+            "alerts_cache",
+            ColumnarResult(names, [columns[n] for n in names]),
+            ("2026-01-01 00:00:00", 3),
+            ("job_id", "severity", "workspace_id"),
+        )
+
+        with patch('job_monitor.backend.cache.settings') as mock_settings:
+            mock_settings.use_cache = True
+            with patch('job_monitor.backend.cache.cache_snapshots', _store(snapshot)):
+                alerts = await query_alerts_cache(None)
+                filtered = await query_alerts_cache(None, workspace_id="1")
+
+        assert [a["alert_id"] for a in alerts] == ["b", "c", "a"]
+        assert [a["alert_id"] for a in filtered] == ["b", "a"]
+        assert alerts[0]["category"] == "failure"
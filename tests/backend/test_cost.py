@@ -8,6 +8,7 @@ Tests:
 - SKU categorization
 - Job cost parsing
 - Team rollup calculations
+- Team tag lookup from job_team_map
 - Anomaly detection
 """
 
@@ -422,6 +423,44 @@ class TestTeamRollupCalculation:
         assert team_costs["Untagged"]["job_count"] == 2
 
 
+class TestJobTeamLookup:
+    """Tests for team tag lookup."""
+
+    @pytest.mark.asyncio
+    async def test_teams_from_job_team_map(self):
+        """Test that team tags come from job_team_map without Jobs API calls."""
+        from job_monitor.backend.routers.cost import _get_job_teams
+
+        mock_ws = Mock()
+        with patch('job_monitor.backend.routers.cost.settings') as mock_settings:
+            mock_settings.use_cache = True
+            with patch('job_monitor.backend.routers.cost.query_job_team_map',
+                       new_callable=AsyncMock,
+                       return_value={"1": "data-eng", "2": "ml", "9": "other"}) as mock_query:
+                teams = await _get_job_teams(mock_ws, ["1", "2", "3"], "123")
+
+        assert teams == {"1": "data-eng", "2": "ml"}
+        mock_query.assert_awaited_once_with(mock_ws, "123")
+        mock_ws.jobs.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_jobs_api(self):
+        """Test that the Jobs API is used when job_team_map is unavailable."""
+        from job_monitor.backend.routers.cost import _get_job_teams
+
+        mock_ws = Mock()
+        mock_ws.jobs.get.return_value.settings.tags = {"team": "data-eng"}
+        with patch('job_monitor.backend.routers.cost.settings') as mock_settings:
+            mock_settings.use_cache = True
+            mock_settings.team_tag_key = "team"
+            with patch('job_monitor.backend.routers.cost.query_job_team_map',
+                       new_callable=AsyncMock, return_value=None):
+                teams = await _get_job_teams(mock_ws, ["1"])
+
+        assert teams == {"1": "data-eng"}
+        mock_ws.jobs.get.assert_called_once_with(job_id=1)
+
+
 class TestAnomalyTypesDetection:
     """Tests for different anomaly types detection."""
 
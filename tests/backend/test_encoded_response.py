@@ -0,0 +1,146 @@
+"""
+Unit tests for pre-encoded, pre-compressed responses.
+
+Tests:
+- Encoded responses served without re-running the endpoint
+- gzip variants and ETag / If-None-Match 304 handling
+- Invalidation when a dependency entry changes
+- Stale or uncached responses are not stored
+"""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def setup():
+    """Build a small app whose endpoint reads a dataset from its own cache."""
+    from job_monitor.backend.encoded_response import EncodedResponseMiddleware
+    from job_monitor.backend.response_cache import ResponseCache
+
+    cache = ResponseCache()
+    calls = []
+    app = FastAPI()
+
+    @app.get("/api/items")
+    async def items(n: int = 100):
+        calls.append(n)
+        value, _ = cache.get_swr("items")
+        if value is None:
+            value = [{"id": i, "name": f"job-{i}"} for i in range(n)]
+            cache.set("items", value, ttl_seconds=60)
+        return {"items": value}
+
+    @app.get("/api/live")
+    async def live():
+        calls.append("live")
+        return {"items": [{"id": i} for i in range(100)]}
+
+    app.add_middleware(EncodedResponseMiddleware, cache=cache, paths=frozenset({"/api/items", "/api/live"}))
+    return TestClient(app), cache, calls
+
+
+class TestEncodedResponses:
+    """Tests for serving pre-encoded bytes."""
+
+    def test_hit_skips_endpoint(self, setup):
+        """Test that a repeat request is served from the encoded bytes."""
+        client, _, calls = setup
+
+        first = client.get("/api/items")
+        second = client.get("/api/items")
+
+        assert first.headers["x-response-cache"] == "MISS"
+        assert second.headers["x-response-cache"] == "HIT"
+        assert second.json() == first.json()
+        assert len(calls) == 1
+
+    def test_gzip_variant(self, setup):
+        """Test that clients accepting gzip get the pre-compressed body."""
+        client, cache, _ = setup
+        client.get("/api/items")
+
+        response = client.get("/api/items", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+
+        encoded = cache.get("encoded:/api/items?")
+        assert gzip.decompress(encoded.gzip) == encoded.body
+
+    def test_identity_when_gzip_refused(self, setup):
+        """Test that gzip;q=0 gets the uncompressed body."""
+        client, _, _ = setup
+
+        response = client.get("/api/items", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "content-encoding" not in response.headers
+
+    def test_if_none_match_returns_304(self, setup):
+        """Test conditional requests with a matching ETag."""
+        client, _, _ = setup
+        etag = client.get("/api/items").headers["etag"]
+
+        response = client.get("/api/items", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_dependency_change_invalidates(self, setup):
+        """Test that a new version of a dependency entry is re-encoded."""
+        client, cache, calls = setup
+        etag = client.get("/api/items").headers["etag"]
+
+        cache.set("items", [{"id": 1}], ttl_seconds=60)
+        response = client.get("/api/items", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json() == {"items": [{"id": 1}]}
+        assert len(calls) == 2
+
+    def test_query_params_are_separate_entries(self, setup):
+        """Test that different queries do not share encoded bytes."""
+        from job_monitor.backend.encoded_response import encoded_key
+
+        assert encoded_key("/api/items", "n=1&a=2") == encoded_key("/api/items", "a=2&n=1")
+        assert encoded_key("/api/items", "n=1") != encoded_key("/api/items", "n=2")
+
+    def test_responses_without_cache_reads_not_stored(self, setup):
+        """Test that live (uncached) responses are compressed but never stored."""
+        client, cache, calls = setup
+
+        client.get("/api/live")
+        response = client.get("/api/live")
+
+        assert response.headers["x-response-cache"] == "MISS"
+        assert calls == ["live", "live"]
+        assert cache.get("encoded:/api/live?") is None
+
+    def test_stale_responses_not_stored(self, setup):
+        """Test that responses built from stale entries are not stored."""
+        client, cache, calls = setup
+        cache.set("items", [{"id": 1}], ttl_seconds=-1, stale_ttl=600)
+
+        client.get("/api/items")
+
+        assert cache.get("encoded:/api/items?") is None
+
+
+class TestHeaderParsing:
+    """Tests for header helpers."""
+
+    def test_accepted_encodings(self):
+        """Test Accept-Encoding parsing with q-values."""
+        from job_monitor.backend.encoded_response import accepted_encodings
+
+        assert accepted_encodings("gzip, deflate, br;q=0") == {"gzip", "deflate"}
+        assert accepted_encodings("") == set()
+
+    def test_etag_matches(self):
+        """Test If-None-Match comparison including weak tags and lists."""
+        from job_monitor.backend.encoded_response import etag_matches
+
+        assert etag_matches('"a", W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
@@ -0,0 +1,141 @@
+"""
+Unit tests for the in-memory job health index.
+
+Tests:
+- Sort spec parsing
+- Sorted-column range bitmaps across block boundaries
+- Search, priority, success-rate, run-count and last-run-age filters
+- Multi-key sorting with NULLs last and early-stopping pages
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+
+def _jobs(count: int = 10):
+    """Build jobs with predictable names, rates, runs, run times and durations (job 0 has none)."""
+    from job_monitor.backend.models import JobHealthOut
+
+    priorities = ["P1", "P2", "P3", None]
+    return [
+        JobHealthOut(
+            job_id=str(100 + i),
+            job_name=f"etl_{'orders' if i % 2 else 'users'}_{i}",
+            total_runs=i,
+            success_count=i,
+            success_rate=float(i * 10),
+            last_run_time=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(hours=i),
+            last_duration_seconds=i * 60 if i else None,
+            priority=priorities[i % 4],
+            retry_count=i % 3,
+        )
+        for i in range(count)
+    ]
+
+
+class TestParseSort:
+    """Tests for sort spec parsing."""
+
+    def test_parses_direction_prefixes(self):
+        """Test that '-' marks descending keys and blanks are ignored."""
+        from job_monitor.backend.health_index import parse_sort
+
+        assert parse_sort("-success_rate, job_name,") == (("success_rate", True), ("job_name", False))
+        assert parse_sort(None) == ()
+
+    def test_rejects_unknown_key(self):
+        """Test that unknown sort keys raise ValueError."""
+        from job_monitor.backend.health_index import parse_sort
+
+        with pytest.raises(ValueError):
+            parse_sort("owner")
+
+
+class TestSortedColumnRange:
+    """Tests for range bitmaps of sorted columns."""
+
+    def test_range_matches_scan_across_blocks(self):
+        """Test that range bitmaps equal a full scan, NULLs excluded."""
+        from job_monitor.backend.health_index import BITMAP_BLOCK, SortedColumn
+
+        values = [(i * 7919) % 5000 if i % 11 else None for i in range(3 * BITMAP_BLOCK + 17)]
+        column = SortedColumn(values)
+        for low, high in [(None, None), (100, 4200), (2500, None), (None, 30), (4999, 4999), (6000, None)]:
+            expected = sum(
+                1 << p for p, v in enumerate(values)
+                if v is not None and (low is None or v >= low) and (high is None or v <= high)
+            )
+            assert column.range(low, high) == expected
+
+
+class TestJobHealthIndexFilters:
+    """Tests for filter evaluation."""
+
+    def test_search_substring_and_glob(self):
+        """Test case-insensitive substring and glob matching on name and ID."""
+        from job_monitor.backend.health_index import HealthQuery, JobHealthIndex
+
+        index = JobHealthIndex(_jobs())
+        positions, total, _ = index.search(HealthQuery(search="ORDERS"), 1, 50)
+        assert total == 5
+        assert positions == [1, 3, 5, 7, 9]
+
+        positions, _, _ = index.search(HealthQuery(search="etl_users_*"), 1, 50)
+        assert positions == [0, 2, 4, 6, 8]
+
+        positions, _, _ = index.search(HealthQuery(search="105"), 1, 50)
+        assert positions == [5]
+
+    def test_combined_filters_and_counts(self):
+        """Test that filters intersect and counts cover only the matches."""
+        from job_monitor.backend.health_index import HealthQuery, JobHealthIndex
+
+        index = JobHealthIndex(_jobs())
+        query = HealthQuery(priorities=frozenset({"P1", "healthy"}), min_success_rate=20, min_runs=3)
+        positions, total, counts = index.search(query, 1, 50)
+
+        assert positions == [3, 4, 7, 8]
+        assert total == 4
+        assert counts == {"p1_count": 2, "p2_count": 0, "p3_count": 0, "healthy_count": 2}
+
+    def test_last_run_age_filter(self):
+        """Test that age bounds filter on last run time."""
+        from job_monitor.backend.health_index import HealthQuery, JobHealthIndex
+
+        index = JobHealthIndex(_jobs())
+        now = datetime(2026, 1, 1, 10, tzinfo=timezone.utc).timestamp()
+        positions, _, _ = index.search(HealthQuery(max_last_run_age_hours=3), 1, 50, now=now)
+        assert positions == [7, 8, 9]
+
+        positions, _, _ = index.search(HealthQuery(min_last_run_age_hours=8), 1, 50, now=now)
+        assert positions == [0, 1, 2]
+
+
+class TestJobHealthIndexSort:
+    """Tests for sort orders and paging."""
+
+    def test_multi_key_sort_with_nulls_last(self):
+        """Test descending keys, tie-breaking keys and NULL placement."""
+        from job_monitor.backend.health_index import HealthQuery, JobHealthIndex, parse_sort
+
+        index = JobHealthIndex(_jobs())
+        positions, _, _ = index.search(HealthQuery(sort=parse_sort("-retry_count,job_id")), 1, 50)
+        assert positions == [2, 5, 8, 1, 4, 7, 0, 3, 6, 9]
+
+        positions, _, _ = index.search(HealthQuery(sort=parse_sort("-last_duration_seconds")), 1, 50)
+        assert positions[0] == 9
+        assert positions[-1] == 0
+
+    def test_pages_of_filtered_sorted_results(self):
+        """Test that pages follow the sort order over the matching jobs only."""
+        from job_monitor.backend.health_index import HealthQuery, JobHealthIndex, parse_sort
+
+        index = JobHealthIndex(_jobs(25))
+        query = HealthQuery(search="orders", sort=parse_sort("-success_rate"))
+        first, total, _ = index.search(query, 1, 5)
+        third, _, _ = index.search(query, 3, 5)
+
+        assert total == 12
+        assert first == [23, 21, 19, 17, 15]
+        assert third == [3, 1]
+        assert index.search(query, 4, 5)[0] == []
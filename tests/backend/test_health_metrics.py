@@ -7,11 +7,17 @@ Tests:
 - GET /api/jobs/{job_id}/expanded endpoint
 - Parameter validation
 - Error handling
+- Statement timeouts degrading duration stats and job details
 - Mock data fallback
+- Dataset response caching and stale-while-revalidate
+- Server-side search, filters and sorting on cached, Delta cache and live paths
+- Health summary windows served from the daily rollup
+- Expanded job details served from job_detail_cache / job_recent_runs or decoded live
+- Streaming NDJSON/CSV export of the full health dataset
 """
 
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import ANY, Mock, patch, AsyncMock
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
@@ -306,6 +312,53 @@ class TestHealthMetricsErrorHandling:
             assert response.status_code in [200, 500, 503, 504]
 
 
+
+class TestStatementTimeoutFallbacks:
+    """Tests for statement timeouts on the per-job endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_duration_stats_timeout_returns_empty_stats(self):
+        """Test that a timed-out duration query returns stats without data."""
+        from job_monitor.backend.routers.health_metrics import get_duration_stats
+        from job_monitor.backend.statement_executor import StatementTimeoutError
+
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.health_metrics.statement_executor') as mock_executor:
+            mock_settings.use_cache = False
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_executor.execute = AsyncMock(side_effect=StatementTimeoutError("stmt-1", 30))
+            stats = await get_duration_stats("123", ws=Mock())
+
+        assert stats.run_count == 0
+        assert stats.has_sufficient_data is False
+
+    @pytest.mark.asyncio
+    async def test_job_details_degrade_per_section(self):
+        """Test that a timed-out section is empty while the others are kept."""
+        from job_monitor.backend.routers.health_metrics import get_job_details
+        from job_monitor.backend.statement_executor import StatementTimeoutError
+
+        name_result = create_sql_result(["name"], [["nightly_etl"]])
+        reasons_result = create_sql_result(["termination_code"], [["DRIVER_ERROR"]])
+        timeout = StatementTimeoutError("stmt-1", 30)
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.health_metrics._fetch_recent_runs',
+                   AsyncMock(side_effect=timeout)), \
+             patch('job_monitor.backend.routers.health_metrics.statement_executor') as mock_executor:
+            mock_settings.use_cache = False
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_executor.execute = AsyncMock(side_effect=[timeout, name_result, timeout, reasons_result])
+            details = await get_job_details("123", ws=Mock())
+
+        assert details.job_name == "nightly_etl"
+        assert details.recent_runs == []
+        assert details.duration_stats.run_count == 0
+        assert details.retry_count_7d == 0
+        assert details.failure_reasons == ["DRIVER_ERROR"]
+
+
 class TestDurationStatsEndpoint:
     """Tests for GET /api/health-metrics/{job_id}/duration."""
 
@@ -339,3 +392,429 @@ class TestExpandedDetailsEndpoint:
             if response.status_code == 200:
                 data = response.json()
                 assert "job_id" in data
+
+
+class TestHealthMetricsResponseCache:
+    """Tests for dataset caching and stale-while-revalidate on /api/health-metrics."""
+
+    def _dataset(self):
+        from job_monitor.backend.models import JobHealthOut
+        from job_monitor.backend.response_cache import CachedDataset
+
+        jobs = [
+            JobHealthOut(
+                job_id=str(i), job_name=f"job{i}", total_runs=10, success_count=10,
+                success_rate=100.0, last_run_time=datetime.now(),
+            )
+            for i in range(15)
+        ]
+        return CachedDataset(items=jobs, aggregates={"healthy_count": 15})
+
+    @pytest.mark.asyncio
+    async def test_pages_served_from_cached_dataset(self):
+        """Test that any page is sliced from the cached dataset without a query."""
+        from job_monitor.backend.response_cache import ResponseCache
+        from job_monitor.backend.routers.health_metrics import get_health_metrics
+
+        cache = ResponseCache()
+        cache.set("health_metrics:7:current", self._dataset())
+        ws = Mock()
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.response_cache', cache):
+            second = await get_health_metrics(days=7, page=2, page_size=10, ws=ws)
+
+        assert [j.job_id for j in second.jobs] == [str(i) for i in range(10, 15)]
+        assert second.total_count == 15
+        assert second.healthy_count == 15
+        assert second.has_more is False
+        assert second.stale is False
+        ws.statement_execution.execute_statement.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_dataset_served_and_revalidated(self):
+        """Test that an expired dataset is served flagged stale and refreshed."""
+        from job_monitor.backend.response_cache import ResponseCache
+        from job_monitor.backend.routers.health_metrics import get_health_metrics
+
+        cache = ResponseCache()
+        cache.set("health_metrics:7:current", self._dataset(), ttl_seconds=-1, stale_ttl=600)
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.response_cache', cache), \
+             patch.object(cache, 'revalidate') as mock_revalidate:
+            result = await get_health_metrics(days=7, page=1, page_size=10, ws=Mock())
+
+        assert result.stale is True
+        assert len(result.jobs) == 10
+        mock_revalidate.assert_called_once()
+        assert mock_revalidate.call_args[0][0] == "health_metrics:7:current"
+
+
+
+class TestHealthMetricsSearch:
+    """Tests for search, filter and sort parameters on /api/health-metrics."""
+
+    def _dataset(self):
+        from job_monitor.backend.models import JobHealthOut
+        from job_monitor.backend.response_cache import CachedDataset
+
+        jobs = [
+            JobHealthOut(
+                job_id=str(i), job_name=f"{'nightly' if i % 2 else 'hourly'}_job{i}", total_runs=i + 1,
+                success_count=i, success_rate=float(i * 5), last_run_time=datetime.now(),
+                priority="P3" if i % 3 == 0 else None,
+            )
+            for i in range(20)
+        ]
+        return CachedDataset(items=jobs, aggregates={"healthy_count": 13, "p3_count": 7})
+
+    @pytest.mark.asyncio
+    async def test_filtered_sorted_page_from_cached_dataset(self):
+        """Test that filters, sort and counts are served from the dataset index."""
+        from job_monitor.backend.response_cache import ResponseCache
+        from job_monitor.backend.routers.health_metrics import get_health_metrics
+
+        cache = ResponseCache()
+        dataset = self._dataset()
+        cache.set("health_metrics:7:current", dataset)
+        ws = Mock()
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.response_cache', cache):
+            result = await get_health_metrics(
+                days=7, page=1, page_size=10, search="NIGHTLY", min_runs=5, sort="-success_rate", ws=ws,
+            )
+            again = await get_health_metrics(days=7, page=1, page_size=10, priority=["p3"], ws=ws)
+
+        assert [j.job_id for j in result.jobs] == ["19", "17", "15", "13", "11", "9", "7", "5"]
+        assert result.total_count == 8
+        assert result.p3_count == 2
+        assert result.healthy_count == 6
+        assert result.has_more is False
+        assert [j.job_id for j in again.jobs] == ["0", "3", "6", "9", "12", "15", "18"]
+        assert list(dataset._indexes) == ["health"]
+        ws.statement_execution.execute_statement.assert_not_called()
+
+    def _live_result(self):
+        now = datetime.now().isoformat()
+        return create_sql_result(
+            ["job_id", "job_name", "total_runs", "success_count", "success_rate",
+             "last_run_time", "last_duration_seconds", "priority", "retry_count"],
+            [
+                ["1", "nightly_a", "10", "5", "50.0", now, "60", "P1", "2"],
+                ["2", "hourly_b", "10", "8", "80.0", now, "30", "P3", "0"],
+                ["3", "nightly_c", "10", "10", "100.0", now, "45", None, "0"],
+            ],
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("params,expected", [
+        ({}, ["1", "2", "3"]),
+        ({"search": "nightly", "sort": "-success_rate"}, ["3", "1"]),
+        ({"priority": ["P3"], "min_success_rate": 60.0}, ["2"]),
+    ])
+    async def test_live_query_path(self, params, expected):
+        """Test that the live query path pages with and without search params."""
+        from job_monitor.backend.response_cache import ResponseCache
+        from job_monitor.backend.routers.health_metrics import get_health_metrics
+
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.response_cache', ResponseCache()), \
+             patch('job_monitor.backend.routers.health_metrics.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.health_metrics.statement_executor') as mock_executor:
+            mock_settings.use_cache = False
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_executor.execute = AsyncMock(return_value=self._live_result())
+            result = await get_health_metrics(days=7, page=1, page_size=10, ws=Mock(), **params)
+
+        assert [j.job_id for j in result.jobs] == expected
+        assert result.total_count == len(expected)
+        mock_executor.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("params", [{}, {"search": "nightly", "priority": ["P1"]}])
+    async def test_delta_cache_path(self, params):
+        """Test that a Delta cache hit pages with and without search params."""
+        from job_monitor.backend.response_cache import ResponseCache
+        from job_monitor.backend.routers.health_metrics import get_health_metrics
+
+        rows = [
+            {"job_id": str(i), "job_name": f"nightly_{i}", "total_runs": 5, "success_count": 5,
+             "success_rate": 100.0, "last_run_time": datetime.now(), "last_duration_seconds": 10,
+             "priority": "P1" if i == 2 else None, "retry_count": 0}
+            for i in range(3)
+        ]
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.response_cache', ResponseCache()), \
+             patch('job_monitor.backend.routers.health_metrics.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.health_metrics.query_job_health_cache',
+                   AsyncMock(return_value=rows)):
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            result = await get_health_metrics(days=7, page=1, page_size=10, ws=Mock(), **params)
+
+        assert result.from_cache is True
+        assert result.total_count == (1 if params else 3)
+
+    @pytest.mark.asyncio
+    async def test_live_timeout_without_cache(self):
+        """Test that a timed-out live query with filters returns an empty page."""
+        from job_monitor.backend.response_cache import ResponseCache
+        from job_monitor.backend.routers.health_metrics import get_health_metrics
+        from job_monitor.backend.statement_executor import StatementTimeoutError
+
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.response_cache', ResponseCache()), \
+             patch('job_monitor.backend.routers.health_metrics.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.health_metrics.statement_executor') as mock_executor:
+            mock_settings.use_cache = False
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_executor.execute = AsyncMock(side_effect=StatementTimeoutError("stmt-1", 120))
+            result = await get_health_metrics(days=7, page=1, page_size=10, ws=Mock(), search="x")
+
+        assert result.jobs == []
+        assert result.total_count == 0
+
+    def test_rejects_unknown_priority_and_sort_key(self, client):
+        """Test that unknown priorities and sort keys return 422."""
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=True):
+            assert client.get("/api/health-metrics?priority=P9").status_code == 422
+            assert client.get("/api/health-metrics?sort=-owner").status_code == 422
+
+    def test_mock_mode_applies_filters(self, client):
+        """Test that mock data is filtered and counted like cached data."""
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=True):
+            response = client.get("/api/health-metrics?priority=P1&sort=job_name")
+
+        data = response.json()
+        assert response.status_code == 200
+        assert all(job["priority"] == "P1" for job in data["jobs"])
+        assert data["total_count"] == data["p1_count"] == len(data["jobs"])
+        names = [job["job_name"].lower() for job in data["jobs"]]
+        assert names == sorted(names)
+
+class TestHealthSummaryWindows:
+    """Tests for /api/health-metrics/summary window handling."""
+
+    @pytest.mark.asyncio
+    async def test_non_standard_window_summed_from_daily_rollup(self):
+        """Test that a 14-day summary is served from job_daily_stats, not coerced to 7 days."""
+        from job_monitor.backend.response_cache import ResponseCache
+        from job_monitor.backend.routers.health_metrics import get_health_summary
+
+        rollup = [
+            {"job_id": "1", "total_runs": 10, "success_count": 8, "success_rate": 80.0, "priority": "P3"},
+            {"job_id": "2", "total_runs": 4, "success_count": 2, "success_rate": 50.0, "priority": "P1"},
+        ]
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.response_cache', ResponseCache()), \
+             patch('job_monitor.backend.routers.health_metrics.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.health_metrics.query_job_health_cache', new_callable=AsyncMock) as mock_cache, \
+             patch('job_monitor.backend.routers.health_metrics.query_job_daily_health', new_callable=AsyncMock) as mock_rollup:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_rollup.return_value = rollup
+            summary = await get_health_summary(days=14, workspace_id="123", ws=Mock())
+
+        mock_rollup.assert_awaited_once_with(ANY, 14, "123")
+        mock_cache.assert_not_called()
+        assert summary.window_days == 14
+        assert (summary.total_count, summary.p1_count, summary.p3_count) == (2, 1, 1)
+        assert summary.from_cache is True
+
+
+class TestJobDetailsRecentRuns:
+    """Tests for recent runs in GET /api/health-metrics/{job_id}/details."""
+
+    @pytest.mark.asyncio
+    async def test_recent_runs_read_from_cache_table(self):
+        """Test that cached runs replace the live recent runs query for jobs missing from job_detail_cache."""
+        from job_monitor.backend.routers.health_metrics import get_job_details
+
+        start = datetime(2026, 3, 1, 10, 0)
+        cached = {"123": [{
+            "job_id": "123", "run_id": "9", "result_state": "SUCCEEDED",
+            "start_time": start, "end_time": start + timedelta(minutes=5), "duration_seconds": 300,
+        }]}
+        empty = Mock()
+        empty.result = None
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.health_metrics.query_job_detail_cache', new_callable=AsyncMock) as mock_detail, \
+             patch('job_monitor.backend.routers.health_metrics.query_recent_runs_cache', new_callable=AsyncMock) as mock_runs, \
+             patch('job_monitor.backend.routers.health_metrics.statement_executor') as mock_executor:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_detail.return_value = None
+            mock_runs.return_value = cached
+            mock_executor.execute = AsyncMock(return_value=empty)
+            details = await get_job_details(job_id="123", ws=Mock())
+
+        mock_runs.assert_awaited_once_with(ANY, ["123"], 10)
+        assert [r.run_id for r in details.recent_runs] == ["9"]
+        assert details.recent_runs[0].duration_seconds == 300
+        # Stats, name, retries and failure reasons only
+        assert mock_executor.execute.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_details_served_by_single_cache_lookup(self):
+        """Test that a cached job needs no live statements."""
+        from job_monitor.backend.routers.health_metrics import get_job_details
+
+        start = datetime(2026, 3, 1, 10, 0)
+        cached = {
+            "job_name": "nightly-etl",
+            "median_duration_seconds": 100.0, "p90_duration_seconds": 150.0,
+            "avg_duration_seconds": 110.0, "max_duration_seconds": 400.0,
+            "run_count": 12, "retry_count_7d": 2, "failure_reasons": ["DRIVER_ERROR"],
+            "recent_runs": [
+                {"run_id": "9", "result_state": "FAILED", "start_time": start,
+                 "end_time": start + timedelta(seconds=400), "duration_seconds": 400},
+            ],
+        }
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.health_metrics.query_job_detail_cache', new_callable=AsyncMock) as mock_detail, \
+             patch('job_monitor.backend.routers.health_metrics.statement_executor') as mock_executor:
+            mock_settings.use_cache = True
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_detail.return_value = cached
+            mock_executor.execute = AsyncMock()
+            details = await get_job_details(job_id="123", ws=Mock())
+
+        mock_executor.execute.assert_not_called()
+        assert details.job_name == "nightly-etl"
+        assert details.retry_count_7d == 2
+        assert details.failure_reasons == ["DRIVER_ERROR"]
+        assert details.duration_stats.has_sufficient_data is True
+        # 400s > 2x the 100s median
+        assert details.recent_runs[0].is_anomaly is True
+
+    @pytest.mark.asyncio
+    async def test_live_details_decoded_from_string_rows(self):
+        """Test that every live details section is decoded into typed values."""
+        from job_monitor.backend.routers.health_metrics import get_job_details
+
+        stats_result = create_sql_result(
+            ["median_duration", "p90_duration", "avg_duration", "max_duration", "run_count"],
+            [["100.0", "150.0", "110.0", "400", "12"]],
+        )
+        runs_result = create_sql_result(
+            ["run_id", "job_id", "period_start_time", "period_end_time", "run_duration_seconds", "result_state"],
+            [["9", "123", "2026-03-01T10:00:00Z", "2026-03-01T10:06:40Z", "400", "FAILED"],
+             ["8", "123", "2026-03-01T09:00:00Z", None, None, None]],
+        )
+        name_result = create_sql_result(["name"], [["nightly-etl"]])
+        retry_result = create_sql_result(["retry_count"], [["-1"]])
+        reasons_result = create_sql_result(["termination_code"], [["DRIVER_ERROR"], [None]])
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+             patch('job_monitor.backend.routers.health_metrics.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.health_metrics.query_recent_runs_cache',
+                   new_callable=AsyncMock, return_value=None), \
+             patch('job_monitor.backend.routers.health_metrics.statement_executor') as mock_executor:
+            mock_settings.use_cache = False
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_executor.execute = AsyncMock(
+                side_effect=[stats_result, runs_result, name_result, retry_result, reasons_result]
+            )
+            details = await get_job_details(job_id="123", ws=Mock())
+
+        assert details.duration_stats.median_duration_seconds == 100.0
+        assert details.duration_stats.run_count == 12
+        assert [(r.run_id, r.duration_seconds, r.is_anomaly) for r in details.recent_runs] == [
+            ("9", 400, True), ("8", None, False),
+        ]
+        assert details.recent_runs[0].start_time.year == 2026
+        assert details.job_name == "nightly-etl"
+        assert details.retry_count_7d == 0
+        assert details.failure_reasons == ["DRIVER_ERROR"]
+
+
+class TestHealthMetricsExport:
+    """Tests for GET /api/health-metrics/export."""
+
+    @staticmethod
+    def _snapshot():
+        """Build a job_health_cache snapshot of three jobs (one without 7d runs)."""
+        from job_monitor.backend.cache_snapshot import SNAPSHOT_TABLES, TableSnapshot
+        from job_monitor.backend.result_decoder import ColumnarResult
+
+        table = SNAPSHOT_TABLES[0]
+        columns = {name: [None, None, None] for name, _ in table.columns}
+        columns.update({
+            "workspace_id": ["1", "1", "2"],
+            "job_id": ["10", "11", "12"],
+            "job_name": ["etl", "idle", "report"],
+            "total_runs_7d": [4, 0, 2],
+            "success_count_7d": [3, 0, 2],
+            "success_rate_7d": [75.0, None, 100.0],
+            "priority": ["P3", None, None],
+            "median_duration_seconds": [120.0, None, 0.0],
+            "last_run_time": [datetime(2026, 3, 1, 12, 0), None, None],
+        })
+        data = ColumnarResult(list(columns), list(columns.values()))
+        return TableSnapshot(table.name, data, ("2026-03-01 12:00:00", 3), table.indexes)
+
+    def _store(self):
+        """Build a snapshot store holding the test snapshot, confirmed current."""
+        import time
+
+        from job_monitor.backend.cache_snapshot import CacheSnapshots
+
+        store = CacheSnapshots()
+        store._snapshots["job_health_cache"] = self._snapshot()
+        store._checked_at = time.time()
+        return store
+
+    def test_ndjson_streamed_from_snapshot(self, client):
+        """Test that every job with runs in the window is exported as one JSON line."""
+        import json
+
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+                patch('job_monitor.backend.routers.health_metrics.settings') as router_settings, \
+                patch('job_monitor.backend.cache.settings') as cache_settings, \
+                patch('job_monitor.backend.cache.cache_snapshots', self._store()):
+            router_settings.warehouse_id = "test-warehouse"
+            cache_settings.use_cache = True
+            response = client.get("/api/health-metrics/export?days=7")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["job_id"] for r in records] == ["10", "12"]
+        assert records[0]["workspace_id"] == "1"
+        assert records[0]["last_run_time"] == "2026-03-01T12:00:00"
+        assert records[1]["median_duration_seconds"] is None
+
+    def test_csv_with_workspace_filter(self, client):
+        """Test that CSV exports have a header row and honor the workspace filter."""
+        import csv
+        import io
+
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+                patch('job_monitor.backend.routers.health_metrics.settings') as router_settings, \
+                patch('job_monitor.backend.cache.settings') as cache_settings, \
+                patch('job_monitor.backend.cache.cache_snapshots', self._store()):
+            router_settings.warehouse_id = "test-warehouse"
+            cache_settings.use_cache = True
+            response = client.get("/api/health-metrics/export?format=csv&days=7&workspace_id=2")
+
+        assert response.status_code == 200
+        assert 'filename="job_health_7d.csv"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [r["job_id"] for r in rows] == ["12"]
+        assert rows[0]["success_rate"] == "100.0"
+
+    def test_export_unavailable_without_cache(self, client):
+        """Test that the export returns 503 when no cache source is available."""
+        with patch('job_monitor.backend.routers.health_metrics.is_mock_mode', return_value=False), \
+                patch('job_monitor.backend.routers.health_metrics.settings') as router_settings, \
+                patch('job_monitor.backend.routers.health_metrics.open_job_health_export',
+                      new_callable=AsyncMock, return_value=None):
+            router_settings.warehouse_id = "test-warehouse"
+            response = client.get("/api/health-metrics/export")
+
+        assert response.status_code == 503
+
+    def test_export_validates_days(self, client):
+        """Test that only the cached 7 and 30 day windows can be exported."""
+        response = client.get("/api/health-metrics/export?days=14")
+        assert response.status_code == 422
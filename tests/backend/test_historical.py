@@ -0,0 +1,63 @@
+"""
+Unit tests for historical router.
+
+Tests:
+- Series served from the job_daily_stats rollup, including empty series
+- System table fallback when the rollup cannot be read
+"""
+
+import pytest
+from unittest.mock import Mock, patch, AsyncMock
+
+
+def _statement(state: str, columns: list[str] | None = None, rows: list[list] | None = None) -> Mock:
+    """Build a mock statement result in the given state."""
+    from databricks.sdk.service.sql import StatementState
+
+    result = Mock()
+    result.status.state = StatementState(state)
+    result.status.error = None if state == "SUCCEEDED" else Mock(message="TABLE_OR_VIEW_NOT_FOUND")
+    result.manifest.schema.columns = [Mock() for _ in columns or []]
+    for col, name in zip(result.manifest.schema.columns, columns or []):
+        col.name = name
+    result.result.data_array = rows or []
+    return result
+
+
+async def _success_rate(executor_results: list[Mock]):
+    """Call the success-rate endpoint (30 days, daily buckets) against mock results."""
+    from job_monitor.backend.response_cache import ResponseCache
+    from job_monitor.backend.routers.historical import get_historical_success_rate
+
+    with patch('job_monitor.backend.routers.historical.response_cache', ResponseCache()), \
+         patch('job_monitor.backend.routers.historical.get_settings') as mock_settings, \
+         patch('job_monitor.backend.routers.historical.statement_executor') as mock_executor:
+        mock_settings.return_value.use_cache = True
+        mock_settings.return_value.warehouse_id = "test-warehouse"
+        mock_settings.return_value.cache_table_prefix = "job_monitor.cache"
+        mock_executor.execute = AsyncMock(side_effect=executor_results)
+        response = await get_historical_success_rate(days=30, job_id="42", ws=Mock())
+    return response, mock_executor.execute
+
+
+class TestRollupSeries:
+    """Tests for historical series answered by job_daily_stats."""
+
+    @pytest.mark.asyncio
+    async def test_empty_rollup_is_an_empty_series(self):
+        """Test that a filter with no rollup rows does not scan the system tables."""
+        response, execute = await _success_rate([_statement("SUCCEEDED")])
+
+        assert response.data == []
+        assert execute.await_count == 1
+        assert "job_daily_stats" in execute.await_args.args[1]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_rollup_falls_back_to_system_tables(self):
+        """Test that a missing rollup table falls back to the live query."""
+        live = _statement("SUCCEEDED", ["period", "current_rate", "previous_rate"], [["2026-01-05", "90.0", "80.0"]])
+        response, execute = await _success_rate([_statement("FAILED"), live])
+
+        assert execute.await_count == 2
+        assert "system.lakeflow.job_run_timeline" in execute.await_args.args[1]
+        assert [(d.current, d.previous) for d in response.data] == [(90.0, 80.0)]
@@ -0,0 +1,27 @@
+"""
+Unit tests for jobs router.
+
+Tests:
+- Statement timeouts on GET /api/jobs and GET /api/jobs/runs
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+class TestJobsTimeouts:
+    """Tests for statement timeouts on the jobs endpoints."""
+
+    @pytest.mark.parametrize("path", ["/api/jobs", "/api/jobs/runs"])
+    def test_timeout_returns_empty_list(self, client, path):
+        """Test that a timed-out statement returns no records instead of a 500."""
+        from job_monitor.backend.statement_executor import StatementTimeoutError
+
+        with patch('job_monitor.backend.routers.jobs.settings') as mock_settings, \
+             patch('job_monitor.backend.routers.jobs.statement_executor') as mock_executor:
+            mock_settings.warehouse_id = "test-warehouse"
+            mock_executor.execute = AsyncMock(side_effect=StatementTimeoutError("stmt-1", 30))
+            response = client.get(path)
+
+        assert response.status_code == 200
+        assert response.json() == []
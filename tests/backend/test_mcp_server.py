@@ -16,6 +16,7 @@ from fastapi.testclient import TestClient
 from job_monitor.backend.app import app
 from job_monitor.backend.mcp_server import (
     _call_api,
+    export_job_health,
     get_active_jobs,
     get_active_jobs_summary,
     get_alerts,
@@ -148,6 +149,26 @@ class TestGetHealthMetrics:
             assert mcp_result.get("error") is True
 
 
+class TestExportJobHealth:
+    """Tests for export_job_health MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_returns_ndjson_records(self):
+        from unittest.mock import patch
+
+        with patch("job_monitor.backend.routers.health_metrics.is_mock_mode", return_value=True):
+            result = await export_job_health(days=7)
+        records = [json.loads(line) for line in result.splitlines()]
+        assert records
+        assert all("job_id" in r and "success_rate" in r for r in records)
+
+    @pytest.mark.asyncio
+    async def test_invalid_window_returns_error(self):
+        result = _parse_mcp(await export_job_health(days=14))
+        assert result.get("error") is True
+        assert result["status_code"] == 422
+
+
 class TestGetHealthMetricsSummary:
     """Tests for get_health_metrics_summary MCP tool."""
 
@@ -0,0 +1,133 @@
+"""
+Unit tests for refresh-version change detection.
+
+Tests:
+- First poll records the version without invalidating
+- A new version re-syncs snapshots, rebuilds hot keys and drops the rest
+- Unchanged versions only confirm snapshots
+- Long TTLs only while the version is tracked
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+
+def _watcher(cache, versions, hot_keys=()):
+    """Build a watcher reading ``versions`` in turn, with a recording refresher."""
+    from job_monitor.backend.cache_refresher import HotKeyRefresher, RefreshTarget
+    from job_monitor.backend.refresh_version import RefreshVersionWatcher
+
+    calls = []
+
+    def make_loader(key):
+        async def loader(ws):
+            calls.append(key)
+            await asyncio.sleep(0)
+            cache.set(key, "fresh", ttl_seconds=300)
+        return loader
+
+    targets = [RefreshTarget(key, make_loader(key)) for key in hot_keys]
+    refresher = HotKeyRefresher(cache=cache, targets=targets)
+    snapshots = Mock()
+    snapshots.sync = AsyncMock(return_value=[])
+    watcher = RefreshVersionWatcher(cache=cache, snapshots=snapshots, refresher=refresher)
+    watcher.fetch_version = AsyncMock(side_effect=versions)
+    return watcher, snapshots, calls
+
+
+@pytest.fixture
+def cache_settings():
+    """Enable the cache with a warehouse configured."""
+    with patch('job_monitor.backend.refresh_version.settings') as mock_settings:
+        mock_settings.use_cache = True
+        mock_settings.warehouse_id = "test-warehouse"
+        yield mock_settings
+
+
+class TestVersionChanges:
+    """Tests for reacting to refresh version changes."""
+
+    @pytest.mark.asyncio
+    async def test_first_poll_does_not_invalidate(self, cache_settings):
+        """Test that the first version seen only loads snapshots."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.set("health_metrics:7:all", "cached")
+        watcher, snapshots, _ = _watcher(cache, [5])
+
+        assert await watcher.check(Mock()) is False
+        assert watcher.version == 5
+        assert cache.get("health_metrics:7:all") == "cached"
+        snapshots.sync.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_new_version_rebuilds_hot_and_drops_rest(self, cache_settings):
+        """Test that dependent namespaces are rebuilt or dropped, others kept."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        hot = "health_metrics:7:current"
+        cache.set(hot, "old")
+        cache.set("health_summary:30:123", "old")
+        cache.set("active_runs_all", "live")
+        watcher, snapshots, calls = _watcher(cache, [5, 6], hot_keys=[hot])
+        cache.get(hot)
+
+        await watcher.check(Mock())
+        assert await watcher.check(Mock()) is True
+
+        assert calls == [hot]
+        assert cache.get(hot) == "fresh"
+        assert cache.get("health_summary:30:123") is None
+        assert cache.get("active_runs_all") == "live"
+        assert snapshots.sync.await_count == 2
+        assert watcher.stats()["changes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_confirms_snapshots(self, cache_settings):
+        """Test that an unchanged version keeps every cached entry."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.set("alerts:all:x", "cached")
+        watcher, snapshots, _ = _watcher(cache, [5, 5])
+
+        await watcher.check(Mock())
+        assert await watcher.check(Mock()) is False
+
+        assert cache.get("alerts:all:x") == "cached"
+        snapshots.confirm.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_marker_falls_back_to_snapshot_sync(self, cache_settings):
+        """Test that snapshots still re-sync when the marker table is missing."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        watcher, snapshots, _ = _watcher(ResponseCache(), [None])
+
+        assert await watcher.check(Mock()) is False
+        assert watcher.version is None
+        snapshots.sync.assert_awaited_once()
+
+
+class TestVersionedTtl:
+    """Tests for TTLs of responses built from the cache tables."""
+
+    @pytest.mark.asyncio
+    async def test_long_ttl_only_while_tracking(self, cache_settings):
+        """Test that blind TTLs apply until the version has been read."""
+        from job_monitor.backend.refresh_version import TTL_UNTIL_REFRESH
+        from job_monitor.backend.response_cache import ResponseCache
+
+        watcher, _, _ = _watcher(ResponseCache(), [5])
+        assert watcher.ttl(300) == 300
+
+        await watcher.check(Mock())
+        assert watcher.ttl(300) == TTL_UNTIL_REFRESH
+
+        watcher._checked_at = 0.0
+        assert watcher.tracking is False
+        assert watcher.ttl(300) == 300
@@ -0,0 +1,286 @@
+"""
+Unit tests for the in-memory response cache.
+
+Tests:
+- TTL expiry and hit/miss accounting
+- O(1) LRU eviction, byte accounting and namespace quotas
+- Namespace invalidation
+- Stale-while-revalidate serving and background refresh
+- Page slicing of cached datasets
+- Memoized filtered dataset views
+"""
+
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch
+
+
+class TestResponseCache:
+    """Tests for ResponseCache get/set."""
+
+    def test_set_and_get(self):
+        """Test that a stored value is returned until it expires."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache(max_entries=10, default_ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        with patch("job_monitor.backend.response_cache.time.time", return_value=time.time() + 61):
+            assert cache.get("key") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+
+class TestLruAndQuotas:
+    """Tests for LRU eviction, byte bounds and namespace quotas."""
+
+    def test_lru_evicts_least_recently_used(self):
+        """Test that a read refreshes recency and the LRU entry is evicted."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_namespace_quota_only_evicts_own_namespace(self):
+        """Test that paginated health entries cannot push out cost entries."""
+        from job_monitor.backend.response_cache import NamespaceQuota, ResponseCache
+
+        quotas = {
+            "health": NamespaceQuota(max_entries=2, max_bytes=10_000),
+            "cost": NamespaceQuota(max_entries=2, max_bytes=10_000),
+            "default": NamespaceQuota(max_entries=2, max_bytes=10_000),
+        }
+        cache = ResponseCache(max_entries=100, quotas=quotas)
+        cache.set("cost_summary:30:False:all", "costs")
+        for days in range(5):
+            cache.set(f"health_metrics:{days}:all", "jobs")
+
+        stats = cache.stats()
+        assert cache.get("cost_summary:30:False:all") == "costs"
+        assert stats["namespaces"]["health"]["size"] == 2
+        assert stats["namespaces"]["health"]["evictions"] == 3
+        assert stats["namespaces"]["cost"]["evictions"] == 0
+
+    def test_byte_bound_evicts(self):
+        """Test that the byte bound evicts entries and tracks sizes."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache(max_entries=100, max_bytes=250)
+        cache.set("a", "x" * 100)
+        cache.set("b", "x" * 100)
+        cache.set("c", "x" * 100)
+
+        stats = cache.stats()
+        assert stats["bytes"] == 200
+        assert cache.get("a") is None
+
+    def test_oversized_value_not_cached(self):
+        """Test that a value larger than its quota is skipped."""
+        from job_monitor.backend.response_cache import NamespaceQuota, ResponseCache
+
+        cache = ResponseCache(quotas={"default": NamespaceQuota(max_entries=10, max_bytes=10)})
+        cache.set("big", "x" * 100)
+
+        assert cache.get("big") is None
+        assert cache.stats()["bytes"] == 0
+
+    def test_overwrite_and_invalidate_keep_accounting(self):
+        """Test that replacing and removing entries keeps byte totals right."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.set("alerts:all:x", "x" * 10)
+        cache.set("alerts:all:x", "x" * 20)
+        assert cache.stats()["namespaces"]["alerts"]["bytes"] == 20
+
+        cache.invalidate_pattern("alerts:")
+        assert cache.stats()["bytes"] == 0
+        assert cache.stats()["size"] == 0
+
+    def test_invalidate_namespace(self):
+        """Test that a namespace is dropped except entries created after the cutoff."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.set("health_metrics:7:all", "old")
+        cache.set("cost_summary:30:False:all", "cost")
+        cutoff = time.time() + 1
+        with patch("job_monitor.backend.response_cache.time.time", return_value=cutoff + 1):
+            cache.set("health_summary:7:all", "rebuilt")
+
+        assert cache.invalidate_namespace("health", created_before=cutoff) == 1
+        assert cache.get("health_metrics:7:all") is None
+        assert cache.stats()["namespaces"]["health"]["size"] == 1
+        assert cache.get("cost_summary:30:False:all") == "cost"
+
+    def test_estimate_size_of_models(self):
+        """Test that models and datasets are sized by their JSON payload."""
+        from job_monitor.backend.models import JobHealthOut
+        from job_monitor.backend.response_cache import CachedDataset, estimate_size
+
+        job = JobHealthOut(
+            job_id="1", job_name="job", total_runs=1, success_count=1,
+            success_rate=100.0, last_run_time=datetime.now(),
+        )
+        dataset = CachedDataset(items=[job, job])
+
+        assert estimate_size(job) == len(job.model_dump_json())
+        assert estimate_size(dataset) > 2 * estimate_size(job)
+
+    def test_estimate_size_samples_long_lists(self):
+        """Test that long lists are sized from a sample of their items."""
+        from job_monitor.backend.models import JobHealthOut
+        from job_monitor.backend.response_cache import SIZE_SAMPLE, estimate_size
+
+        jobs = [
+            JobHealthOut(
+                job_id=str(i), job_name=f"job_{i}", total_runs=1, success_count=1,
+                success_rate=100.0, last_run_time=datetime.now(),
+            )
+            for i in range(SIZE_SAMPLE * 10)
+        ]
+        exact = sum(len(job.model_dump_json()) for job in jobs)
+
+        dump_json = JobHealthOut.model_dump_json
+        with patch.object(JobHealthOut, "model_dump_json", autospec=True, side_effect=dump_json) as dump:
+            size = estimate_size(jobs)
+
+        assert dump.call_count == SIZE_SAMPLE
+        assert abs(size - exact) < exact * 0.05
+
+    def test_namespace_for(self):
+        """Test key prefix to namespace mapping."""
+        from job_monitor.backend.response_cache import namespace_for
+
+        assert namespace_for("health_summary:7:all") == "health"
+        assert namespace_for("historical:costs:30:None:None:None") == "historical"
+        assert namespace_for("active_runs_all") == "active_runs"
+        assert namespace_for("something_else") == "default"
+
+
+class TestStaleWhileRevalidate:
+    """Tests for stale-while-revalidate."""
+
+    def _expire(self, seconds: float):
+        """Patch the cache clock forward."""
+        return patch("job_monitor.backend.response_cache.time.time", return_value=time.time() + seconds)
+
+    def test_stale_value_served_within_bound(self):
+        """Test that get_swr serves expired values until the stale bound."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.set("health_metrics:7:all", "data", ttl_seconds=10, stale_ttl=100)
+
+        assert cache.get_swr("health_metrics:7:all") == ("data", False)
+        with self._expire(50):
+            assert cache.get_swr("health_metrics:7:all") == ("data", True)
+            # Plain get() never returns stale values
+            assert cache.get("health_metrics:7:all") is None
+        with self._expire(200):
+            assert cache.get_swr("health_metrics:7:all") == (None, False)
+        assert cache.stats()["stale_hits"] == 1
+
+    def test_without_stale_ttl_entries_expire(self):
+        """Test that entries without stale_ttl behave as before."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.set("key", "data", ttl_seconds=10)
+
+        with self._expire(11):
+            assert cache.get_swr("key") == (None, False)
+
+    @pytest.mark.asyncio
+    async def test_revalidate_runs_once_and_bypasses_stale_value(self):
+        """Test that concurrent revalidations share one task that recomputes."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.set("key", "old", ttl_seconds=10, stale_ttl=100)
+        calls = []
+
+        async def loader():
+            # Inside the refresh, the stale entry must read as a miss
+            calls.append(cache.get_swr("key"))
+            await asyncio.sleep(0)
+            cache.set("key", "new", ttl_seconds=10, stale_ttl=100)
+
+        assert cache.revalidate("key", loader) is True
+        assert cache.revalidate("key", loader) is False
+        await asyncio.sleep(0.01)
+
+        assert calls == [(None, False)]
+        assert cache.get("key") == "new"
+        assert cache.stats()["revalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_revalidate_failure_keeps_stale_value(self):
+        """Test that a failed refresh is counted and the stale value kept."""
+        from job_monitor.backend.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.set("key", "old", ttl_seconds=10, stale_ttl=100)
+
+        async def loader():
+            raise RuntimeError("warehouse down")
+
+        with self._expire(20):
+            cache.revalidate("key", loader)
+            await asyncio.sleep(0.01)
+            assert cache.get_swr("key") == ("old", True)
+        assert cache.stats()["revalidation_errors"] == 1
+
+
+class TestCachedDataset:
+    """Tests for dataset-level caching helpers."""
+
+    def test_paginate(self):
+        """Test page slicing and has_more."""
+        from job_monitor.backend.response_cache import paginate
+
+        items = list(range(25))
+        assert paginate(items, 1, 10) == (list(range(10)), True)
+        assert paginate(items, 3, 10) == ([20, 21, 22, 23, 24], False)
+        assert paginate(items, 4, 10) == ([], False)
+
+    def test_any_page_size_from_one_dataset(self):
+        """Test that different page sizes are served from the same items."""
+        from job_monitor.backend.response_cache import CachedDataset
+
+        dataset = CachedDataset(items=list(range(100)), aggregates={"even": 50})
+
+        assert dataset.total == 100
+        assert dataset.page(2, 50) == (list(range(50, 100)), False)
+        assert dataset.page(1, 200) == (list(range(100)), False)
+
+    def test_view_is_memoized(self):
+        """Test that a filtered view is built once per key and keeps order."""
+        from job_monitor.backend.response_cache import CachedDataset
+
+        dataset = CachedDataset(items=list(range(10)), from_cache=True)
+        calls = []
+
+        def is_even(item):
+            calls.append(item)
+            return item % 2 == 0
+
+        view = dataset.view("even", is_even, lambda items: {"count": len(items)})
+        again = dataset.view("even", is_even)
+
+        assert view is again
+        assert view.items == [0, 2, 4, 6, 8]
+        assert view.aggregates == {"count": 5}
+        assert view.from_cache is True
+        assert len(calls) == 10
@@ -0,0 +1,239 @@
+"""
+Unit tests for the result decoder module.
+
+Tests:
+- Type conversion driven by manifest.schema
+- Schema hints overriding / filling in manifest types
+- NULL handling and default helpers
+- Row materialization
+- Row helpers for inline and Arrow results
+- Column-wise Arrow casts with per-cell fallback
+- ARRAY/MAP/STRUCT values decoded as JSON text
+"""
+
+from datetime import date, datetime
+
+import pytest
+from unittest.mock import Mock
+
+
+def _column(name: str, type_name: str) -> Mock:
+    """Build a mock manifest ColumnInfo."""
+    col = Mock()
+    col.name = name
+    col.type_name = Mock()
+    col.type_name.value = type_name
+    return col
+
+
+def _result(columns: list[tuple[str, str]] | None, data: list[list]) -> Mock:
+    """Build a mock StatementResponse with an optional manifest schema."""
+    result = Mock()
+    if columns is None:
+        result.manifest = None
+    else:
+        result.manifest = Mock()
+        result.manifest.schema = Mock()
+        result.manifest.schema.columns = [_column(n, t) for n, t in columns]
+    result.result = Mock()
+    result.result.data_array = data
+    return result
+
+
+class TestDecodeResult:
+    """Tests for decode_result function."""
+
+    def test_decodes_types_from_manifest(self):
+        """Test that JSON_ARRAY strings are converted using manifest types."""
+        from job_monitor.backend.result_decoder import decode_result
+
+        result = _result(
+            [("job_id", "STRING"), ("runs", "LONG"), ("rate", "DOUBLE"),
+             ("flag", "BOOLEAN"), ("last_run", "TIMESTAMP"), ("day", "DATE")],
+            [["123", "10", "95.5", "true", "2024-01-15T10:30:00.000Z", "2024-01-15"]],
+        )
+
+        cols = decode_result(result)
+        assert cols["job_id"] == ["123"]
+        assert cols["runs"] == [10]
+        assert cols["rate"] == [95.5]
+        assert cols["flag"] == [True]
+        assert isinstance(cols["last_run"][0], datetime)
+        assert cols["day"] == [date(2024, 1, 15)]
+
+    def test_nulls_are_preserved(self):
+        """Test that NULL values stay None regardless of type."""
+        from job_monitor.backend.result_decoder import decode_result
+
+        result = _result([("runs", "LONG"), ("rate", "DOUBLE")], [[None, None], ["5", "1.0"]])
+
+        cols = decode_result(result)
+        assert cols["runs"] == [None, 5]
+        assert cols["rate"] == [None, 1.0]
+
+    def test_schema_names_and_types_without_manifest(self):
+        """Test that schema hints are used when the manifest is missing."""
+        from job_monitor.backend.result_decoder import decode_result
+
+        result = _result(None, [["1", "3.0"]])
+
+        cols = decode_result(result, [("a", "LONG"), ("b", "DOUBLE")])
+        assert cols.names == ["a", "b"]
+        assert cols["a"] == [1]
+        assert cols["b"] == [3.0]
+
+    def test_schema_type_overrides_manifest(self):
+        """Test that an explicit schema type wins over the manifest type."""
+        from job_monitor.backend.result_decoder import decode_result
+
+        result = _result([("workspace_id", "LONG")], [["1234567890"]])
+
+        cols = decode_result(result, [("workspace_id", "STRING")])
+        assert cols["workspace_id"] == ["1234567890"]
+
+    def test_none_schema_type_defers_to_manifest(self):
+        """Test that a None schema type uses the manifest type."""
+        from job_monitor.backend.result_decoder import decode_result
+
+        result = _result([("total", "DECIMAL")], [["12.50"]])
+
+        cols = decode_result(result, [("total", None)])
+        assert cols["total"] == [12.5]
+
+    def test_short_rows_padded_with_nulls(self):
+        """Test that rows shorter than the schema decode as NULL."""
+        from job_monitor.backend.result_decoder import decode_result
+
+        result = _result(None, [["1"]])
+
+        cols = decode_result(result, [("a", "LONG"), ("b", "DOUBLE")])
+        assert cols["b"] == [None]
+
+    def test_empty_result(self):
+        """Test that an empty result decodes to empty columns."""
+        from job_monitor.backend.result_decoder import decode_result
+
+        result = _result(None, [])
+
+        cols = decode_result(result, [("a", "LONG")])
+        assert len(cols) == 0
+        assert not cols
+        assert cols["a"] == []
+
+    def test_already_typed_values_pass_through(self):
+        """Test that already typed values (e.g. from tests) are accepted."""
+        from job_monitor.backend.result_decoder import decode_result
+
+        now = datetime.now()
+        result = _result(None, [[10, 80.0, now, True]])
+
+        cols = decode_result(result, [("a", "LONG"), ("b", "DOUBLE"), ("c", "TIMESTAMP"), ("d", "BOOLEAN")])
+        assert cols.to_dicts() == [{"a": 10, "b": 80.0, "c": now, "d": True}]
+
+
+class TestColumnHelpers:
+    """Tests for NULL default helpers."""
+
+    def test_fill_null(self):
+        """Test that only None is replaced."""
+        from job_monitor.backend.result_decoder import fill_null
+
+        assert fill_null([None, 0, 3], -1) == [-1, 0, 3]
+
+    def test_falsy_to(self):
+        """Test that None, 0 and empty strings are replaced."""
+        from job_monitor.backend.result_decoder import falsy_to
+
+        assert falsy_to([None, 0, "", 2.5], None) == [None, None, None, 2.5]
+
+    def test_get_missing_column(self):
+        """Test that get() returns a default-filled column for unknown names."""
+        from job_monitor.backend.result_decoder import ColumnarResult
+
+        cols = ColumnarResult(["a"], [[1, 2]])
+        assert cols.get("b", 0) == [0, 0]
+
+
+class TestRowHelpers:
+    """Tests for has_rows / result_rows helpers."""
+
+    def test_rows_from_data_array(self):
+        """Test that inline JSON rows are returned as is."""
+        from job_monitor.backend.result_decoder import has_rows, result_rows
+
+        result = _result(None, [["1", "a"], ["2", "b"]])
+
+        assert has_rows(result) is True
+        assert result_rows(result) == [["1", "a"], ["2", "b"]]
+
+    def test_no_rows(self):
+        """Test empty and missing results."""
+        from job_monitor.backend.result_decoder import has_rows, result_rows
+
+        assert has_rows(None) is False
+        assert has_rows(_result(None, [])) is False
+        assert result_rows(None) == []
+
+    def test_rows_from_arrow_table(self):
+        """Test that an attached Arrow table is decoded column-wise."""
+        pa = pytest.importorskip("pyarrow")
+        from job_monitor.backend.result_decoder import decode_result, has_rows, result_rows
+
+        result = _result(None, [])
+        result.arrow_table = pa.table({"job_id": ["1", "2"], "runs": [10, 20]})
+
+        assert has_rows(result) is True
+        assert result_rows(result) == [("1", 10), ("2", 20)]
+        cols = decode_result(result, [("job_id", "STRING"), ("runs", "LONG")])
+        assert cols["runs"] == [10, 20]
+
+
+class TestArrowColumns:
+    """Tests for column-wise decoding of Arrow results."""
+
+    def test_casts_columns_and_falls_back_per_cell(self):
+        """Test that whole columns are cast and uncastable values still decode."""
+        pa = pytest.importorskip("pyarrow")
+        from decimal import Decimal
+        from job_monitor.backend.result_decoder import decode_result
+
+        result = _result(None, [])
+        result.arrow_table = pa.table({
+            "runs": pa.array(["3", None, "12"]),
+            "retries": pa.array(["1.0", "2", None]),
+            "dbus": pa.array([Decimal("1.50"), None, Decimal("2.25")], type=pa.decimal128(10, 2)),
+            "ok": pa.array(["true", "FALSE", None]),
+        })
+        cols = decode_result(result, [("runs", "LONG"), ("retries", "INT"), ("dbus", "DOUBLE"), ("ok", "BOOLEAN")])
+
+        assert cols["runs"] == [3, None, 12]
+        assert cols["retries"] == [1, 2, None]
+        assert cols["dbus"] == [1.5, None, 2.25]
+        assert cols["ok"] == [True, False, None]
+
+    def test_nested_columns_as_json(self):
+        """Test that ARRAY/MAP/STRUCT values are JSON text, even when pinned to STRING."""
+        import json
+
+        pa = pytest.importorskip("pyarrow")
+        from job_monitor.backend.result_decoder import decode_result
+
+        result = _result(None, [])
+        result.arrow_table = pa.table({
+            "skus": pa.array([[{"a": 1}], None]),
+            "tags": pa.array([[("team", "data")], []], type=pa.map_(pa.string(), pa.string())),
+        })
+        cols = decode_result(result, [("skus", "STRING"), ("tags", "MAP")])
+
+        assert json.loads(cols["skus"][0]) == [{"a": 1}]
+        assert cols["skus"][1] is None
+        assert json.loads(cols["tags"][0]) == {"team": "data"}
+        assert cols["tags"][1] == "{}"
+
+    def test_json_array_nested_values_unchanged(self):
+        """Test that JSON_ARRAY nested values (already JSON text) pass through."""
+        from job_monitor.backend.result_decoder import decode_result
+
+        cols = decode_result(_result([("skus", "ARRAY")], [['[{"a": 1}]'], [None]]))
+
+        assert cols["skus"] == ['[{"a": 1}]', None]
@@ -0,0 +1,599 @@
+"""
+Unit tests for the SQL statement executor.
+
+Tests:
+- Submission and passthrough of statement results
+- Async polling of PENDING/RUNNING statements
+- Timeout with cancellation
+- Per-warehouse concurrency limit
+- Single-flight coalescing of identical queries
+- Parallel EXTERNAL_LINKS chunk download (fetch_all), bounded link requests,
+  download deadline and warehouse slot release
+- Deferred one-chunk-at-a-time reads (defer_chunks / iter_chunks)
+- Error classification
+- Statistics
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+
+def _result(state: str, statement_id: str = "stmt-1", error=None):
+    """Build a mock StatementResponse in the given state."""
+    result = Mock()
+    result.statement_id = statement_id
+    result.status = Mock()
+    result.status.state = Mock()
+    result.status.state.value = state
+    result.status.error = error
+    return result
+
+
+def _executor(**kwargs):
+    """Create an executor with fast polling for tests."""
+    from job_monitor.backend.statement_executor import StatementExecutor
+
+    kwargs.setdefault("poll_initial_seconds", 0.01)
+    kwargs.setdefault("poll_max_seconds", 0.02)
+    return StatementExecutor(**kwargs)
+
+
+class TestExecute:
+    """Tests for StatementExecutor.execute."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result_when_finished_on_submit(self):
+        """Test that a statement finishing on submit is returned unchanged."""
+        executor = _executor()
+        mock_ws = Mock()
+        done = _result("SUCCEEDED")
+        mock_ws.statement_execution.execute_statement.return_value = done
+
+        result = await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10)
+
+        assert result is done
+        call = mock_ws.statement_execution.execute_statement.call_args
+        assert call.kwargs["warehouse_id"] == "wh-1"
+        assert call.kwargs["statement"] == "SELECT 1"
+        assert call.kwargs["wait_timeout"] == "10s"
+        mock_ws.statement_execution.get_statement.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_polls_until_terminal_state(self):
+        """Test that RUNNING statements are polled until they finish."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("PENDING")
+        done = _result("SUCCEEDED")
+        mock_ws.statement_execution.get_statement.side_effect = [_result("RUNNING"), done]
+
+        result = await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10)
+
+        assert result is done
+        assert mock_ws.statement_execution.get_statement.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_statement_error_is_returned_not_raised(self):
+        """Test that SQL errors stay in result.status.error for callers."""
+        executor = _executor()
+        mock_ws = Mock()
+        error = Mock()
+        error.message = "INSUFFICIENT_PERMISSIONS: User does not have USE SCHEMA"
+        failed = _result("FAILED", error=error)
+        mock_ws.statement_execution.execute_statement.return_value = failed
+
+        result = await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10)
+
+        assert result is failed
+        stats = executor.stats()["warehouses"]["wh-1"]
+        assert stats["failed"] == 1
+        assert stats["errors_by_class"] == {"permission": 1}
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_statement(self):
+        """Test that a statement still running at the deadline is cancelled."""
+        from job_monitor.backend.statement_executor import StatementTimeoutError
+
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("RUNNING", "stmt-slow")
+        mock_ws.statement_execution.get_statement.return_value = _result("RUNNING", "stmt-slow")
+
+        with pytest.raises(StatementTimeoutError) as exc_info:
+            await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=0.05)
+
+        assert exc_info.value.statement_id == "stmt-slow"
+        mock_ws.statement_execution.cancel_execution.assert_called_once_with(statement_id="stmt-slow")
+        assert executor.stats()["warehouses"]["wh-1"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_exception_propagates(self):
+        """Test that SDK exceptions are counted and re-raised."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.side_effect = Exception("Connection reset")
+
+        with pytest.raises(Exception, match="Connection reset"):
+            await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10)
+
+        stats = executor.stats()["warehouses"]["wh-1"]
+        assert stats["failed"] == 1
+        assert stats["in_flight"] == 0
+
+
+class TestConcurrency:
+    """Tests for per-warehouse concurrency limits."""
+
+    @pytest.mark.asyncio
+    async def test_limits_in_flight_statements(self):
+        """Test that no more than max_concurrency statements run at once."""
+        executor = _executor(max_concurrency=2)
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("RUNNING")
+
+        in_flight = 0
+        peak = 0
+
+        def slow_get_statement(statement_id):
+            return _result("SUCCEEDED", statement_id)
+
+        original_to_thread = asyncio.to_thread
+
+        async def tracking_to_thread(func, *args, **kwargs):
+            nonlocal in_flight, peak
+            if func is mock_ws.statement_execution.execute_statement:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            result = await original_to_thread(func, *args, **kwargs)
+            if func is mock_ws.statement_execution.get_statement:
+                in_flight -= 1
+            return result
+
+        mock_ws.statement_execution.get_statement.side_effect = slow_get_statement
+        asyncio.to_thread = tracking_to_thread
+        try:
+            await asyncio.gather(*[
+                executor.execute(mock_ws, f"SELECT {i}", warehouse_id="wh-1", timeout=10)
+                for i in range(6)
+            ])
+        finally:
+            asyncio.to_thread = original_to_thread
+
+        assert peak <= 2
+        stats = executor.stats()["warehouses"]["wh-1"]
+        assert stats["submitted"] == 6
+        assert stats["succeeded"] == 6
+        assert stats["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_warehouses_are_limited_independently(self):
+        """Test that each warehouse gets its own stats bucket."""
+        executor = _executor(max_concurrency=1)
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("SUCCEEDED")
+
+        await asyncio.gather(
+            executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-a", timeout=10),
+            executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-b", timeout=10),
+        )
+
+        warehouses = executor.stats()["warehouses"]
+        assert set(warehouses) == {"wh-a", "wh-b"}
+
+
+class TestCoalescing:
+    """Tests for single-flight coalescing of identical statements."""
+
+    @pytest.mark.asyncio
+    async def test_identical_selects_share_one_execution(self):
+        """Test that concurrent identical queries execute once."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("RUNNING")
+        done = _result("SUCCEEDED")
+        mock_ws.statement_execution.get_statement.return_value = done
+
+        results = await asyncio.gather(*[
+            executor.execute(mock_ws, "SELECT *\n  FROM t", warehouse_id="wh-1", timeout=10)
+            for _ in range(5)
+        ] + [executor.execute(mock_ws, "SELECT * FROM t", warehouse_id="wh-1", timeout=10)])
+
+        assert all(r is done for r in results)
+        assert mock_ws.statement_execution.execute_statement.call_count == 1
+        stats = executor.stats()
+        assert stats["warehouses"]["wh-1"]["coalesced"] == 5
+        assert stats["inflight_statements"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_warehouses_not_coalesced(self):
+        """Test that the same query on two warehouses runs twice."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("SUCCEEDED")
+
+        await asyncio.gather(
+            executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-a", timeout=10),
+            executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-b", timeout=10),
+        )
+
+        assert mock_ws.statement_execution.execute_statement.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_are_never_coalesced(self):
+        """Test that DML statements always execute individually."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("SUCCEEDED")
+
+        await asyncio.gather(*[
+            executor.execute(mock_ws, "DELETE FROM t WHERE id = '1'", warehouse_id="wh-1", timeout=10)
+            for _ in range(3)
+        ])
+
+        assert mock_ws.statement_execution.execute_statement.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared_with_waiters(self):
+        """Test that all coalesced callers see the leader's exception."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.side_effect = Exception("Connection reset")
+
+        results = await asyncio.gather(*[
+            executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10)
+            for _ in range(3)
+        ], return_exceptions=True)
+
+        assert all(isinstance(r, Exception) for r in results)
+        assert mock_ws.statement_execution.execute_statement.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_execute_again(self):
+        """Test that a finished execution is not reused (no result caching)."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("SUCCEEDED")
+
+        await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10)
+        await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10)
+
+        assert mock_ws.statement_execution.execute_statement.call_count == 2
+
+
+def _link(index: int, url: str) -> Mock:
+    """Build a mock ExternalLink for a result chunk."""
+    link = Mock()
+    link.chunk_index = index
+    link.external_link = url
+    link.http_headers = None
+    return link
+
+
+def _http_client(bodies: dict[str, list]) -> Mock:
+    """Build a mock httpx.AsyncClient serving JSON chunk bodies by URL."""
+    async def get(url, headers=None):
+        response = Mock()
+        response.content = json.dumps(bodies[url]).encode()
+        response.raise_for_status = Mock()
+        return response
+
+    client = Mock()
+    client.get = AsyncMock(side_effect=get)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
+class TestFetchAll:
+    """Tests for fetching complete results via EXTERNAL_LINKS."""
+
+    @pytest.mark.asyncio
+    async def test_requests_external_links_disposition(self):
+        """Test that fetch_all asks for the EXTERNAL_LINKS disposition."""
+        from databricks.sdk.service.sql import Disposition
+
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("SUCCEEDED")
+
+        await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10, fetch_all=True)
+
+        call = mock_ws.statement_execution.execute_statement.call_args
+        assert call.kwargs["disposition"] == Disposition.EXTERNAL_LINKS
+
+    @pytest.mark.asyncio
+    async def test_inline_by_default(self):
+        """Test that regular queries keep the default inline disposition."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("SUCCEEDED")
+
+        await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10)
+
+        call = mock_ws.statement_execution.execute_statement.call_args
+        assert "disposition" not in call.kwargs
+
+    @pytest.mark.asyncio
+    async def test_downloads_all_chunks_in_order(self):
+        """Test that every chunk is fetched and rows are concatenated in order."""
+        from databricks.sdk.service.sql import Format
+
+        executor = _executor()
+        mock_ws = Mock()
+        done = _result("SUCCEEDED", "stmt-big")
+        done.manifest = Mock()
+        done.manifest.total_chunk_count = 3
+        done.manifest.format = Format.JSON_ARRAY
+        done.result = Mock()
+        done.result.data_array = None
+        done.result.external_links = [_link(0, "https://chunk/0")]
+        mock_ws.statement_execution.execute_statement.return_value = done
+
+        def chunk_n(statement_id, chunk_index):
+            chunk = Mock()
+            chunk.external_links = [_link(chunk_index, f"https://chunk/{chunk_index}")]
+            return chunk
+
+        mock_ws.statement_execution.get_statement_result_chunk_n.side_effect = chunk_n
+        client = _http_client({
+            "https://chunk/0": [["1"], ["2"]],
+            "https://chunk/1": [["3"]],
+            "https://chunk/2": [["4"], ["5"]],
+        })
+
+        with patch("job_monitor.backend.statement_executor.pa", None), \
+                patch("job_monitor.backend.statement_executor.httpx.AsyncClient", return_value=client):
+            result = await executor.execute(
+                mock_ws, "SELECT id FROM t", warehouse_id="wh-1", timeout=10, fetch_all=True
+            )
+
+        assert result.result.data_array == [["1"], ["2"], ["3"], ["4"], ["5"]]
+        assert mock_ws.statement_execution.get_statement_result_chunk_n.call_count == 2
+        assert client.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_chunk_link_requests_are_bounded(self):
+        """Test that chunk link requests share the download concurrency limit."""
+        import threading
+        import time
+        from databricks.sdk.service.sql import Format
+
+        executor = _executor()
+        mock_ws = Mock()
+        done = _result("SUCCEEDED", "stmt-big")
+        done.manifest = Mock()
+        done.manifest.total_chunk_count = 9
+        done.manifest.format = Format.JSON_ARRAY
+        done.result = Mock()
+        done.result.data_array = None
+        done.result.external_links = [_link(0, "https://chunk/0")]
+        mock_ws.statement_execution.execute_statement.return_value = done
+
+        lock = threading.Lock()
+        in_flight = {"now": 0, "max": 0}
+
+        def chunk_n(statement_id, chunk_index):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.02)
+            with lock:
+                in_flight["now"] -= 1
+            chunk = Mock()
+            chunk.external_links = [_link(chunk_index, f"https://chunk/{chunk_index}")]
+            return chunk
+
+        mock_ws.statement_execution.get_statement_result_chunk_n.side_effect = chunk_n
+        client = _http_client({f"https://chunk/{i}": [[str(i)]] for i in range(9)})
+
+        with patch("job_monitor.backend.statement_executor.pa", None), \
+                patch("job_monitor.backend.statement_executor.CHUNK_DOWNLOAD_CONCURRENCY", 2), \
+                patch("job_monitor.backend.statement_executor.httpx.AsyncClient", return_value=client):
+            result = await executor.execute(
+                mock_ws, "SELECT id FROM t", warehouse_id="wh-1", timeout=10, fetch_all=True
+            )
+
+        assert result.result.data_array == [[str(i)] for i in range(9)]
+        assert in_flight["max"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_download_past_deadline_times_out(self):
+        """Test that chunk downloads are bounded by the statement timeout."""
+        from databricks.sdk.service.sql import Format
+        from job_monitor.backend.statement_executor import StatementTimeoutError
+
+        executor = _executor()
+        mock_ws = Mock()
+        done = _result("SUCCEEDED", "stmt-big")
+        done.manifest = Mock()
+        done.manifest.total_chunk_count = 1
+        done.manifest.format = Format.JSON_ARRAY
+        done.result = Mock()
+        done.result.external_links = [_link(0, "https://chunk/0")]
+        mock_ws.statement_execution.execute_statement.return_value = done
+
+        async def get(url, headers=None):
+            await asyncio.sleep(5)
+
+        client = _http_client({})
+        client.get = AsyncMock(side_effect=get)
+
+        with patch("job_monitor.backend.statement_executor.pa", None), \
+                patch("job_monitor.backend.statement_executor.httpx.AsyncClient", return_value=client):
+            with pytest.raises(StatementTimeoutError):
+                await executor.execute(
+                    mock_ws, "SELECT id FROM t", warehouse_id="wh-1", timeout=0.1, fetch_all=True
+                )
+
+        assert executor.stats()["warehouses"]["wh-1"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_downloads_do_not_hold_warehouse_slot(self):
+        """Test that a statement can run while another one's chunks download."""
+        from databricks.sdk.service.sql import Format
+
+        executor = _executor(max_concurrency=1)
+        mock_ws = Mock()
+        done = _result("SUCCEEDED", "stmt-big")
+        done.manifest = Mock()
+        done.manifest.total_chunk_count = 1
+        done.manifest.format = Format.JSON_ARRAY
+        done.result = Mock()
+        done.result.external_links = [_link(0, "https://chunk/0")]
+        mock_ws.statement_execution.execute_statement.side_effect = [done, _result("SUCCEEDED", "stmt-2")]
+
+        release = asyncio.Event()
+
+        async def get(url, headers=None):
+            await release.wait()
+            response = Mock()
+            response.content = b'[["1"]]'
+            response.raise_for_status = Mock()
+            return response
+
+        client = _http_client({})
+        client.get = AsyncMock(side_effect=get)
+
+        with patch("job_monitor.backend.statement_executor.pa", None), \
+                patch("job_monitor.backend.statement_executor.httpx.AsyncClient", return_value=client):
+            big = asyncio.create_task(
+                executor.execute(mock_ws, "SELECT id FROM t", warehouse_id="wh-1", timeout=10, fetch_all=True)
+            )
+            while client.get.call_count == 0:
+                await asyncio.sleep(0.01)
+            other = await asyncio.wait_for(
+                executor.execute(mock_ws, "SELECT 2", warehouse_id="wh-1", timeout=10), timeout=1
+            )
+            release.set()
+            result = await big
+
+        assert other.statement_id == "stmt-2"
+        assert result.result.data_array == [["1"]]
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_not_coalesced_with_inline(self):
+        """Test that fetch_all and inline executions of one query are separate."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("SUCCEEDED")
+
+        await asyncio.gather(
+            executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10),
+            executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10, fetch_all=True),
+        )
+
+        assert mock_ws.statement_execution.execute_statement.call_count == 2
+
+
+class TestIterChunks:
+    """Tests for deferred chunk reads."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_read_one_at_a_time(self):
+        """Test that defer_chunks skips the download and iter_chunks yields each chunk in order."""
+        from databricks.sdk.service.sql import Format
+        from job_monitor.backend.result_decoder import result_rows
+
+        executor = _executor()
+        mock_ws = Mock()
+        done = _result("SUCCEEDED", "stmt-export")
+        done.manifest = Mock()
+        done.manifest.total_chunk_count = 2
+        done.manifest.format = Format.JSON_ARRAY
+        done.result = Mock()
+        done.result.data_array = None
+        done.result.external_links = [_link(0, "https://chunk/0")]
+        mock_ws.statement_execution.execute_statement.return_value = done
+        chunk = Mock()
+        chunk.external_links = [_link(1, "https://chunk/1")]
+        mock_ws.statement_execution.get_statement_result_chunk_n.return_value = chunk
+        client = _http_client({"https://chunk/0": [["1"], ["2"]], "https://chunk/1": [["3"]]})
+
+        with patch("job_monitor.backend.statement_executor.pa", None), \
+                patch("job_monitor.backend.statement_executor.httpx.AsyncClient", return_value=client):
+            result = await executor.execute(
+                mock_ws, "SELECT id FROM t", warehouse_id="wh-1", timeout=10, fetch_all=True, defer_chunks=True
+            )
+            assert client.get.call_count == 0
+
+            chunks = [result_rows(c) async for c in executor.iter_chunks(mock_ws, result)]
+
+        assert chunks == [[["1"], ["2"]], [["3"]]]
+        assert client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_inline_result_yielded_as_is(self):
+        """Test that an inline result is a single chunk."""
+        executor = _executor()
+        inline = _result("SUCCEEDED")
+        inline.result.data_array = [["1"]]
+        inline.result.external_links = None
+
+        chunks = [c async for c in executor.iter_chunks(Mock(), inline)]
+
+        assert chunks == [inline]
+
+
+class TestClassifyError:
+    """Tests for classify_error function."""
+
+    @pytest.mark.parametrize("message,expected", [
+        ("INSUFFICIENT_PERMISSIONS: no access", "permission"),
+        ("User does not have USE SCHEMA on system.billing", "permission"),
+        ("PERMISSION_DENIED: denied", "permission"),
+        ("[TABLE_OR_VIEW_NOT_FOUND] job_health_cache", "not_found"),
+        ("Schema cache does not exist", "not_found"),
+        ("Warehouse abc is STOPPED", "warehouse_unavailable"),
+        ("Endpoint does not have any running clusters", "warehouse_unavailable"),
+        ("[PARSE_SYNTAX_ERROR] Syntax error at or near", "syntax"),
+        ("Request timed out", "timeout"),
+        ("Something unexpected", "other"),
+    ])
+    def test_classifies_messages(self, message, expected):
+        """Test classification of common Databricks error messages."""
+        from job_monitor.backend.statement_executor import classify_error
+
+        assert classify_error(message) == expected
+
+    def test_classifies_error_objects(self):
+        """Test that status.error objects are classified by their message."""
+        from job_monitor.backend.statement_executor import classify_error
+
+        error = Mock()
+        error.message = "TABLE_OR_VIEW_NOT_FOUND"
+        assert classify_error(error) == "not_found"
+
+    def test_classifies_timeout_exception(self):
+        """Test that StatementTimeoutError is classified as timeout."""
+        from job_monitor.backend.statement_executor import StatementTimeoutError, classify_error
+
+        assert classify_error(StatementTimeoutError("stmt-1", 30)) == "timeout"
+
+
+class TestStats:
+    """Tests for executor statistics."""
+
+    def test_empty_stats(self):
+        """Test stats before any statement was executed."""
+        executor = _executor(max_concurrency=4)
+
+        stats = executor.stats()
+        assert stats == {"max_concurrency": 4, "inflight_statements": 0, "warehouses": {}}
+
+    @pytest.mark.asyncio
+    async def test_latency_percentiles_reported(self):
+        """Test that latency percentiles are populated after execution."""
+        executor = _executor()
+        mock_ws = Mock()
+        mock_ws.statement_execution.execute_statement.return_value = _result("SUCCEEDED")
+
+        for _ in range(3):
+            await executor.execute(mock_ws, "SELECT 1", warehouse_id="wh-1", timeout=10)
+
+        stats = executor.stats()["warehouses"]["wh-1"]
+        assert stats["succeeded"] == 3
+        assert stats["latency_p50_ms"] >= 0
+        assert stats["latency_p95_ms"] >= stats["latency_p50_ms"]
@@ -0,0 +1,160 @@
+"""
+Unit tests for the WorkspaceClient pool.
+
+Tests:
+- Client reuse per token and TTL / token-expiry bounds
+- LRU eviction
+- JWT claim decoding and identity caching
+- core dependencies using the pool
+"""
+
+import base64
+import json
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+def _jwt(claims: dict) -> str:
+    """Build an unsigned JWT-shaped token with the given claims."""
+    def encode(obj):
+        return base64.urlsafe_b64encode(json.dumps(obj).encode()).decode().rstrip("=")
+    return f"{encode({'alg': 'none'})}.{encode(claims)}.sig"
+
+
+@pytest.fixture
+def pool():
+    """Create a fresh pool with WorkspaceClient construction mocked."""
+    from job_monitor.backend.workspace_client_pool import WorkspaceClientPool
+
+    with patch("job_monitor.backend.workspace_client_pool.WorkspaceClient") as mock_client_cls:
+        mock_client_cls.side_effect = lambda **kwargs: Mock()
+        pool = WorkspaceClientPool(max_clients=2, ttl_seconds=600)
+        pool.client_cls = mock_client_cls
+        yield pool
+
+
+class TestClientReuse:
+    """Tests for pooled client reuse."""
+
+    def test_same_token_reuses_client(self, pool):
+        """Test that repeat requests with one token get the same client."""
+        token = _jwt({"email": "a@example.com"})
+
+        first = pool.get(token)
+        second = pool.get(token)
+
+        assert first is second
+        assert pool.client_cls.call_count == 1
+        stats = pool.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_different_tokens_get_different_clients(self, pool):
+        """Test that each user token gets its own client."""
+        a = pool.get(_jwt({"email": "a@example.com"}))
+        b = pool.get(_jwt({"email": "b@example.com"}))
+
+        assert a is not b
+
+    def test_expired_token_creates_new_client(self, pool):
+        """Test that a client is not reused past the token's exp claim."""
+        token = _jwt({"email": "a@example.com", "exp": time.time() + 10})
+
+        first = pool.get(token)
+        second = pool.get(token)
+
+        # exp - skew is already in the past, so nothing is reused
+        assert first is not second
+
+    def test_lru_eviction(self, pool):
+        """Test that the least recently used client is evicted at capacity."""
+        t1, t2, t3 = (_jwt({"email": f"{n}@example.com"}) for n in ("a", "b", "c"))
+        c1 = pool.get(t1)
+        pool.get(t2)
+        pool.get(t1)  # t1 most recently used
+        pool.get(t3)  # evicts t2
+
+        assert pool.stats()["size"] == 2
+        assert pool.stats()["evictions"] == 1
+        assert pool.get(t1) is c1
+
+    def test_raw_token_not_used_as_key(self, pool):
+        """Test that tokens are hashed before being stored."""
+        token = _jwt({"email": "a@example.com"})
+        pool.get(token)
+
+        assert token not in pool._clients
+
+
+class TestIdentity:
+    """Tests for claim decoding and identity caching."""
+
+    def test_decode_jwt_claims(self):
+        """Test decoding of the JWT payload."""
+        from job_monitor.backend.workspace_client_pool import decode_jwt_claims
+
+        assert decode_jwt_claims(_jwt({"sub": "user@example.com"})) == {"sub": "user@example.com"}
+        assert decode_jwt_claims("not-a-jwt") == {}
+
+    def test_identity_from_claims_without_network(self, pool):
+        """Test that identity comes from claims without calling current_user.me()."""
+        token = _jwt({"email": "a@example.com"})
+
+        assert pool.identity(token) == "a@example.com"
+        pool.get(token).current_user.me.assert_not_called()
+
+    def test_identity_falls_back_to_me_once(self, pool):
+        """Test that tokens without identity claims call me() only once."""
+        token = "opaque-token"
+        client = pool.get(token)
+        client.current_user.me.return_value = Mock(user_name="svc@example.com")
+
+        assert pool.identity(token) == "svc@example.com"
+        assert pool.identity(token) == "svc@example.com"
+        assert client.current_user.me.call_count == 1
+
+    def test_service_principal_identity_cached(self, pool):
+        """Test that the SP identity is resolved only once."""
+        sp = Mock()
+        sp.current_user.me.return_value = Mock(user_name="sp-app")
+
+        assert pool.service_principal_identity(sp) == "sp-app"
+        assert pool.service_principal_identity(sp) == "sp-app"
+        assert sp.current_user.me.call_count == 1
+
+
+class TestCoreDependencies:
+    """Tests for core dependencies backed by the pool."""
+
+    def test_get_current_user_from_claims(self):
+        """Test that get_current_user returns the email claim."""
+        from job_monitor.backend.core import get_current_user
+
+        assert get_current_user(_jwt({"email": "a@example.com"})) == "a@example.com"
+        assert get_current_user("opaque-token") == "authenticated-user@databricks.com"
+        assert get_current_user(None) == "local-dev-user"
+
+    def test_get_ws_prefer_user_uses_pool(self):
+        """Test that OBO requests reuse pooled clients and skip me()."""
+        from job_monitor.backend.core import get_ws_prefer_user
+
+        request = Mock()
+        token = _jwt({"email": "a@example.com"})
+        client = Mock()
+        with patch("job_monitor.backend.core.workspace_client_pool") as mock_pool:
+            mock_pool.get.return_value = client
+            assert get_ws_prefer_user(request, token) is client
+            assert get_ws_prefer_user(request, token) is client
+        client.current_user.me.assert_not_called()
+
+    def test_get_ws_prefer_user_falls_back_to_sp(self):
+        """Test that the SP client is returned without a user token."""
+        from job_monitor.backend.core import get_ws_prefer_user
+
+        request = Mock()
+        sp = Mock()
+        request.app.state.workspace_client = sp
+
+        assert get_ws_prefer_user(request, None) is sp